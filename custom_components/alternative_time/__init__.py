@@ -7,14 +7,22 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_ENTRY_UPDATED
+from .earth_orientation import DATA_EOP_STORE, get_eop_store
+from .iers_client import DATA_IERS_CLIENT
+from .load_monitor import DATA_LOAD_MONITOR, DATA_LOAD_SENSOR_OWNER
+from .render_pool import DATA_RENDER_POOL
+from .star_catalog import DATA_STAR_CATALOG
+from .timescales import async_load_leap_seconds
 
 _LOGGER = logging.getLogger(__name__)
 
 # Platform list - sensor.py must exist in the same directory as this file
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+# image.py serves pictures rendered by calendar sensors (e.g. solar system map)
+PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.IMAGE]
 
 # This integration is configured exclusively via the UI (config entries).
 # We declare a config_entry_only_config_schema to satisfy hassfest, since we
@@ -41,6 +49,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Store config entry data
     hass.data[DOMAIN][entry.entry_id] = entry.data
 
+    # Let the sensors pick up changed options without a reload
+    entry.async_on_unload(entry.add_update_listener(_async_entry_updated))
+
+    # Leap seconds and Earth orientation data (shared by all entries)
+    await async_load_leap_seconds(hass)
+    eop_store = get_eop_store(hass)
+    await eop_store.async_load()
+    hass.async_create_task(eop_store.async_refresh())
+
     # Forward setup to sensor platform
     # This will look for sensor.py in the same directory as __init__.py
     try:
@@ -53,6 +70,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_entry_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Notify the entry's sensors that its data or options changed."""
+    hass.data.get(DOMAIN, {})[entry.entry_id] = entry.data
+    async_dispatcher_send(hass, SIGNAL_ENTRY_UPDATED.format(entry.entry_id))
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug(f"Unloading Alternative Time integration for {entry.title}")
@@ -63,10 +86,25 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         # Remove config entry from hass.data
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        if hass.data.get(DATA_LOAD_SENSOR_OWNER) == entry.entry_id:
+            hass.data.pop(DATA_LOAD_SENSOR_OWNER)
 
         # Clean up domain if no more entries
         if not hass.data[DOMAIN]:
             hass.data.pop(DOMAIN)
+            monitor = hass.data.pop(DATA_LOAD_MONITOR, None)
+            if monitor:
+                monitor.async_stop()
+            pool = hass.data.pop(DATA_RENDER_POOL, None)
+            if pool:
+                await hass.async_add_executor_job(pool.shutdown)
+            eop_store = hass.data.pop(DATA_EOP_STORE, None)
+            if eop_store:
+                eop_store.close()
+            hass.data.pop(DATA_IERS_CLIENT, None)
+            star_catalog = hass.data.pop(DATA_STAR_CATALOG, None)
+            if star_catalog:
+                star_catalog.close()
 
     return unload_ok
 
@@ -0,0 +1,160 @@
+"""Content-addressed store for files generated by calendar plugins.
+
+Files live under /config/www/alternative_time and are served as
+/local/alternative_time/... by Home Assistant. For every asset name the
+store keeps
+
+- a stable file (e.g. solar_system_map.svg) for existing dashboards
+- versioned copies named after the content hash
+  (solar_system_map.1a2b3c4d5e6f.svg) whose URL changes with the content,
+  so browsers never show a stale cached picture
+
+Nothing is written while the content hash is unchanged, which spares SD
+cards the periodic rewrites. New content is written to a temporary file
+and renamed into place, so the frontend never reads a half-written file.
+Only the newest KEEP_VERSIONS versioned copies are kept.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+from typing import Any, Dict
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .log_helper import get_logger
+
+_LOGGER = get_logger(__name__)
+
+DATA_ASSET_STORE = f"{DOMAIN}_asset_store"
+
+ASSET_DIR = "www/alternative_time"
+ASSET_URL = "/local/alternative_time"
+
+# Versioned copies kept per asset name
+KEEP_VERSIONS = 3
+
+# Length of the content hash used in versioned file names
+HASH_LENGTH = 12
+
+
+class AssetStore:
+    """Write generated assets atomically and only when their content changes."""
+
+    def __init__(self, base_dir: str, base_url: str = ASSET_URL) -> None:
+        """Initialize the store."""
+        self._base_dir = base_dir
+        self._base_url = base_url
+        self._lock = threading.Lock()
+        # asset name -> hash of the content currently on disk
+        self._hashes: Dict[str, str] = {}
+
+    @staticmethod
+    def content_hash(data: bytes) -> str:
+        """Return the short content hash used for versioned names."""
+        return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+    def _versioned_name(self, name: str, digest: str) -> str:
+        stem, ext = os.path.splitext(name)
+        return f"{stem}.{digest}{ext}"
+
+    def _urls(self, name: str, digest: str) -> Dict[str, str]:
+        return {
+            "url": f"{self._base_url}/{name}",
+            "versioned_url": f"{self._base_url}/{self._versioned_name(name, digest)}",
+        }
+
+    def write(self, name: str, data: bytes) -> Dict[str, Any]:
+        """Store data under name (blocking; call from an executor).
+
+        Returns the stable and versioned URLs, the content hash and whether
+        anything was written.
+        """
+        digest = self.content_hash(data)
+        with self._lock:
+            known = self._hashes.get(name)
+            if known is None:
+                known = self._hash_on_disk(name)
+            versioned_path = os.path.join(self._base_dir, self._versioned_name(name, digest))
+            if known == digest and os.path.exists(versioned_path):
+                self._hashes[name] = digest
+                return {**self._urls(name, digest), "hash": digest, "changed": False}
+
+            os.makedirs(self._base_dir, exist_ok=True)
+            self._atomic_write(versioned_path, data)
+            self._publish_stable(name, versioned_path)
+            self._hashes[name] = digest
+            self._prune(name, keep=versioned_path)
+
+        _LOGGER.debug("Asset %s updated (%s)", name, digest)
+        return {**self._urls(name, digest), "hash": digest, "changed": True}
+
+    def _hash_on_disk(self, name: str) -> str | None:
+        """Hash the stable file left by a previous run, if any."""
+        try:
+            with open(os.path.join(self._base_dir, name), "rb") as f:
+                return self.content_hash(f.read())
+        except OSError:
+            return None
+
+    def _atomic_write(self, path: str, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self._base_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def _publish_stable(self, name: str, versioned_path: str) -> None:
+        """Point the stable name at the new version without rewriting the data."""
+        stable = os.path.join(self._base_dir, name)
+        tmp = os.path.join(self._base_dir, f".tmp-{name}")
+        try:
+            if os.path.lexists(tmp):
+                os.unlink(tmp)
+            os.link(versioned_path, tmp)
+        except OSError:
+            # File systems without hard links: fall back to a copy
+            shutil.copyfile(versioned_path, tmp)
+        os.replace(tmp, stable)
+
+    def _prune(self, name: str, keep: str) -> None:
+        stem, ext = os.path.splitext(name)
+        pattern = re.compile(rf"^{re.escape(stem)}\.[0-9a-f]{{{HASH_LENGTH}}}{re.escape(ext)}$")
+        try:
+            versions = [
+                os.path.join(self._base_dir, f)
+                for f in os.listdir(self._base_dir)
+                if pattern.match(f)
+            ]
+            versions.sort(key=os.path.getmtime, reverse=True)
+        except OSError:
+            return
+        for path in versions[KEEP_VERSIONS:]:
+            if path == keep:
+                continue
+            try:
+                os.unlink(path)
+            except OSError as e:
+                _LOGGER.debug("Could not remove old asset %s: %s", path, e)
+
+
+def get_asset_store(hass: HomeAssistant) -> AssetStore:
+    """Return the shared AssetStore, creating it on first use."""
+    store = hass.data.get(DATA_ASSET_STORE)
+    if store is None:
+        store = hass.data.setdefault(DATA_ASSET_STORE, AssetStore(hass.config.path(ASSET_DIR)))
+    return store
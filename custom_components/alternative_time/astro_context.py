@@ -0,0 +1,250 @@
+"""Per-tick astronomical context shared by the time plugins.
+
+Several plugins derive the same quantities from the current instant:
+Julian dates in UTC, TT and UT1, centuries since J2000, sidereal time,
+the Earth rotation angle, nutation, the mean longitudes of the Sun
+and Moon, and Mars time. The sensor scheduler hands every update an
+AstroContext for the tick; each quantity is computed on first access
+and memoized. The scheduler fires on whole seconds and contexts are
+keyed on the second of the tick, so a quantity is derived at most once
+per tick however many plugins and config entries read it.
+
+TAI-UTC is looked up in the leap second table (timescales) and DUT1 in
+the Earth orientation store (earth_orientation) when it covers the
+instant, otherwise FALLBACK_DUT1 as in the ut1 plugin. The module-level
+functions are the formulas themselves, for plugins that work with their
+own UT1-UTC or TAI-UTC values.
+
+The *_iau2006 properties are the high-precision variants: IAU 2006 GMST
+and IAU 2000B nutation, interpolated from the shared grid in nutation.
+"""
+from __future__ import annotations
+
+import math
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .earth_orientation import DATA_EOP_STORE, FALLBACK_DUT1
+from .mars_time import MarsTime
+from .nutation import INTERPOLATOR, gmst_iau2006, mean_obliquity_iau2006
+from .timescales import BUILTIN, TT_MINUS_TAI, get_leap_seconds, tdb_minus_tt
+
+DATA_ASTRO_CONTEXT = f"{DOMAIN}_astro_context"
+
+J2000_JD = 2451545.0
+UNIX_EPOCH_JD = 2440587.5
+MJD_OFFSET = 2400000.5
+SECONDS_PER_DAY = 86400.0
+DAYS_PER_CENTURY = 36525.0
+
+
+def datetime_to_jd(dt: datetime) -> float:
+    """Return the Julian Date (UTC) of a datetime; naive values are UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return UNIX_EPOCH_JD + dt.timestamp() / SECONDS_PER_DAY
+
+
+def greenwich_mean_sidereal_time(jd_ut1: float) -> float:
+    """Return GMST in hours [0, 24) (USNO Circular No. 179, 2.6.2)."""
+    jd0 = math.floor(jd_ut1 - 0.5) + 0.5
+    h = (jd_ut1 - jd0) * 24.0
+    d_ut = jd0 - J2000_JD
+    t = (jd_ut1 - J2000_JD) / DAYS_PER_CENTURY
+    return (6.697375 + 0.065709824279 * d_ut + 1.0027379 * h + 0.0000258 * t * t) % 24.0
+
+
+def earth_rotation_angle(jd_ut1: float) -> float:
+    """Return the Earth rotation angle in degrees [0, 360) (IAU 2000)."""
+    tu = jd_ut1 - J2000_JD
+    return (360.0 * (0.7790572732640 + 1.00273781191135448 * tu)) % 360.0
+
+
+class AstroContext:
+    """Lazily evaluated astronomical quantities for one instant.
+
+    Angles are in degrees unless the name says otherwise. Instances are
+    shared between sensors and threads; treat them as read-only.
+    """
+
+    def __init__(
+        self,
+        when: datetime,
+        tai_minus_utc: Optional[float] = None,
+        dut1: float = FALLBACK_DUT1,
+    ) -> None:
+        """Initialize the context for an aware (or naive UTC) datetime.
+
+        TAI-UTC defaults to the built-in leap second table, DUT1 to
+        FALLBACK_DUT1.
+        """
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        self.when = when.astimezone(timezone.utc)
+        self.timestamp = self.when.timestamp()
+        self.tai_minus_utc = BUILTIN.tai_minus_utc(self.timestamp) if tai_minus_utc is None else tai_minus_utc
+        self.dut1 = dut1
+
+    # -------------- time scales --------------
+    @cached_property
+    def jd_utc(self) -> float:
+        """Julian Date in UTC."""
+        return UNIX_EPOCH_JD + self.timestamp / SECONDS_PER_DAY
+
+    @cached_property
+    def jd_tai(self) -> float:
+        """Julian Date in International Atomic Time."""
+        return self.jd_utc + self.tai_minus_utc / SECONDS_PER_DAY
+
+    @cached_property
+    def jd_tt(self) -> float:
+        """Julian Date in Terrestrial Time."""
+        return self.jd_tai + TT_MINUS_TAI / SECONDS_PER_DAY
+
+    @cached_property
+    def jd_tdb(self) -> float:
+        """Julian Date in Barycentric Dynamical Time (see timescales)."""
+        tt = (self.jd_tt - UNIX_EPOCH_JD) * SECONDS_PER_DAY
+        return self.jd_tt + tdb_minus_tt(tt) / SECONDS_PER_DAY
+
+    @cached_property
+    def jd_ut1(self) -> float:
+        """Julian Date in UT1 (UTC + DUT1)."""
+        return self.jd_utc + self.dut1 / SECONDS_PER_DAY
+
+    @cached_property
+    def t_tt(self) -> float:
+        """Julian centuries (TT) since J2000.0."""
+        return (self.jd_tt - J2000_JD) / DAYS_PER_CENTURY
+
+    # -------------- Earth rotation --------------
+    @cached_property
+    def gmst_hours(self) -> float:
+        """Greenwich mean sidereal time in hours."""
+        return greenwich_mean_sidereal_time(self.jd_ut1)
+
+    @cached_property
+    def era_degrees(self) -> float:
+        """Earth rotation angle."""
+        return earth_rotation_angle(self.jd_ut1)
+
+    @cached_property
+    def equation_of_equinoxes_hours(self) -> float:
+        """GAST - GMST in hours (nutation in right ascension)."""
+        dpsi, _ = self.nutation
+        return dpsi * math.cos(math.radians(self.true_obliquity)) / 15.0
+
+    @cached_property
+    def gast_hours(self) -> float:
+        """Greenwich apparent sidereal time in hours."""
+        return (self.gmst_hours + self.equation_of_equinoxes_hours) % 24.0
+
+    @cached_property
+    def gmst_iau2006_hours(self) -> float:
+        """Greenwich mean sidereal time in hours (IAU 2006, from the ERA)."""
+        return gmst_iau2006(self.era_degrees, self.t_tt) / 15.0
+
+    @cached_property
+    def equation_of_equinoxes_iau2006_hours(self) -> float:
+        """GAST - GMST in hours from IAU 2000B nutation (IAU 2006 obliquity)."""
+        dpsi, _, complementary = self._nutation_iau2000b
+        eps = math.radians(mean_obliquity_iau2006(self.t_tt) / 3600.0)
+        return (dpsi * math.cos(eps) + complementary) / 54000.0
+
+    @cached_property
+    def gast_iau2006_hours(self) -> float:
+        """Greenwich apparent sidereal time in hours (IAU 2006/2000B)."""
+        return (self.gmst_iau2006_hours + self.equation_of_equinoxes_iau2006_hours) % 24.0
+
+    # -------------- precession and nutation --------------
+    @cached_property
+    def mean_obliquity(self) -> float:
+        """Mean obliquity of the ecliptic (Meeus 22.2)."""
+        t = self.t_tt
+        return 23.4392911111 - (46.8150 * t + 0.00059 * t * t - 0.001813 * t * t * t) / 3600.0
+
+    @cached_property
+    def nutation(self) -> Tuple[float, float]:
+        """(Δψ, Δε): nutation in longitude and obliquity (Meeus ch. 22, ~0.5")."""
+        omega = math.radians(self.moon_node_longitude)
+        l_sun = math.radians(self.sun_mean_longitude)
+        l_moon = math.radians(self.moon_mean_longitude)
+        dpsi = (
+            -17.20 * math.sin(omega)
+            - 1.32 * math.sin(2.0 * l_sun)
+            - 0.23 * math.sin(2.0 * l_moon)
+            + 0.21 * math.sin(2.0 * omega)
+        )
+        deps = (
+            9.20 * math.cos(omega)
+            + 0.57 * math.cos(2.0 * l_sun)
+            + 0.10 * math.cos(2.0 * l_moon)
+            - 0.09 * math.cos(2.0 * omega)
+        )
+        return dpsi / 3600.0, deps / 3600.0
+
+    @cached_property
+    def _nutation_iau2000b(self) -> Tuple[float, float, float]:
+        """(Δψ, Δε, equinox complementary terms) in arcseconds."""
+        return INTERPOLATOR(self.jd_tt)
+
+    @cached_property
+    def nutation_iau2000b(self) -> Tuple[float, float]:
+        """(Δψ, Δε) from the IAU 2000B series (~1 mas)."""
+        dpsi, deps, _ = self._nutation_iau2000b
+        return dpsi / 3600.0, deps / 3600.0
+
+    @cached_property
+    def true_obliquity(self) -> float:
+        """True obliquity of the ecliptic (mean + Δε)."""
+        return self.mean_obliquity + self.nutation[1]
+
+    # -------------- mean longitudes --------------
+    @cached_property
+    def sun_mean_longitude(self) -> float:
+        """Geometric mean longitude of the Sun (Meeus 25.2)."""
+        t = self.t_tt
+        return (280.46646 + 36000.76983 * t + 0.0003032 * t * t) % 360.0
+
+    @cached_property
+    def moon_mean_longitude(self) -> float:
+        """Mean longitude of the Moon (Meeus 47.1)."""
+        t = self.t_tt
+        return (218.3164477 + 481267.88123421 * t - 0.0015786 * t * t) % 360.0
+
+    @cached_property
+    def moon_node_longitude(self) -> float:
+        """Longitude of the Moon's mean ascending node (Meeus 22)."""
+        t = self.t_tt
+        return (125.04452 - 1934.136261 * t + 0.0020708 * t * t) % 360.0
+
+    # -------------- other bodies --------------
+    @cached_property
+    def mars(self) -> MarsTime:
+        """Mars Sol Date, Coordinated Mars Time and Ls (see mars_time)."""
+        return MarsTime(self.jd_tt)
+
+
+def get_astro_context(hass: HomeAssistant, now: Optional[datetime] = None) -> AstroContext:
+    """Return the shared context for the tick at now, truncated to the second.
+
+    Every sensor ticking in the same second gets the same context. TAI-UTC
+    comes from the loaded leap second table, DUT1 from the Earth
+    orientation store when it covers the instant (else FALLBACK_DUT1).
+    """
+    if now is None:
+        now = dt_util.utcnow()
+    now = now.replace(microsecond=0)
+    context = hass.data.get(DATA_ASTRO_CONTEXT)
+    if context is None or context.timestamp != now.timestamp():
+        eop_store = hass.data.get(DATA_EOP_STORE)
+        dut1 = eop_store.dut1(datetime_to_jd(now) - MJD_OFFSET) if eop_store else None
+        tai_minus_utc = get_leap_seconds(hass).tai_minus_utc(now.timestamp())
+        context = AstroContext(now, tai_minus_utc, dut1 if dut1 is not None else FALLBACK_DUT1)
+        hass.data[DATA_ASTRO_CONTEXT] = context
+    return context
@@ -1,15 +1,15 @@
 """Attic Calendar (Ancient Athens) implementation - Version 2.5."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -367,7 +367,7 @@ class AtticCalendarSensor(AlternativeTimeSensorBase):
         # Track if options have been loaded
         self._options_loaded = False
 
-        _LOGGER.debug(f"Initialized Attic Calendar sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Attic Calendar sensor: %s", self._attr_name)
 
     def _load_options(self) -> None:
         """Load configuration options from config entry."""
@@ -385,16 +385,21 @@ class AtticCalendarSensor(AlternativeTimeSensorBase):
                 self._archon_list = options.get("archon_list", self._archon_list)
                 self._show_season = options.get("show_season", self._show_season)
 
-                _LOGGER.debug(f"Attic sensor loaded options: greek={self._show_greek}, "
-                            f"festivals={self._show_festivals}, meanings={self._show_meanings}, "
-                            f"format={self._format}, archon_list={self._archon_list}, "
-                            f"season={self._show_season}")
+                _LOGGER.debug(
+                    "Attic sensor loaded options: greek=%s, festivals=%s, meanings=%s, format=%s, archon_list=%s, season=%s",
+                    self._show_greek,
+                    self._show_festivals,
+                    self._show_meanings,
+                    self._format,
+                    self._archon_list,
+                    self._show_season,
+                )
             else:
                 _LOGGER.debug("Attic sensor using default options - no custom options found")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"Attic sensor could not load options yet: {e}")
+            _LOGGER.debug("Attic sensor could not load options yet: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -561,4 +566,4 @@ class AtticCalendarSensor(AlternativeTimeSensorBase):
         # Set state to full Attic date
         self._state = self._attic_date["full_date"]
 
-        _LOGGER.debug(f"Updated Attic Calendar to {self._state}")
+        _LOGGER.debug("Updated Attic Calendar to %s", self._state)
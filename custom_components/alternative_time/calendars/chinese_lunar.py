@@ -6,15 +6,15 @@ It has been used for thousands of years to determine festivals and agricultural
 """
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # Try to import the lunar calendar library
 try:
@@ -357,7 +357,7 @@ class ChineseLunarCalendarSensor(AlternativeTimeSensorBase):
             _LOGGER.error("lunarcalendar library not installed. Please install it.")
             self._state = "Library Missing"
 
-        _LOGGER.debug(f"Initialized Chinese Lunar Calendar sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Chinese Lunar Calendar sensor: %s", self._attr_name)
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -368,7 +368,7 @@ class ChineseLunarCalendarSensor(AlternativeTimeSensorBase):
         plugin_options = self._get_plugin_options()
 
         if plugin_options:
-            _LOGGER.debug(f"Loading Chinese Lunar options: {plugin_options}")
+            _LOGGER.debug("Loading Chinese Lunar options: %s", plugin_options)
 
             # Apply options using set_options method
             self.set_options(
@@ -387,9 +387,10 @@ class ChineseLunarCalendarSensor(AlternativeTimeSensorBase):
         # Load options after entity is registered
         self._load_options()
 
-        _LOGGER.debug(f"Chinese Lunar sensor added to hass with options: "
-                     f"zodiac={self._show_zodiac}, festivals={self._show_festivals}, "
-                     f"solar_terms={self._show_solar_terms}, format={self._display_format}")
+        _LOGGER.debug(
+            "Chinese Lunar sensor added to hass with options: zodiac=%s, festivals=%s, solar_terms=%s, format=%s",
+            self._show_zodiac, self._show_festivals, self._show_solar_terms, self._display_format,
+        )
 
     def set_options(
         self,
@@ -402,19 +403,19 @@ class ChineseLunarCalendarSensor(AlternativeTimeSensorBase):
         """Set calendar options from config flow."""
         if show_zodiac is not None:
             self._show_zodiac = bool(show_zodiac)
-            _LOGGER.debug(f"Set show_zodiac to: {show_zodiac}")
+            _LOGGER.debug("Set show_zodiac to: %s", show_zodiac)
 
         if show_festivals is not None:
             self._show_festivals = bool(show_festivals)
-            _LOGGER.debug(f"Set show_festivals to: {show_festivals}")
+            _LOGGER.debug("Set show_festivals to: %s", show_festivals)
 
         if show_solar_terms is not None:
             self._show_solar_terms = bool(show_solar_terms)
-            _LOGGER.debug(f"Set show_solar_terms to: {show_solar_terms}")
+            _LOGGER.debug("Set show_solar_terms to: %s", show_solar_terms)
 
         if display_format is not None and display_format in ["chinese", "english", "both"]:
             self._display_format = display_format
-            _LOGGER.debug(f"Set display_format to: {display_format}")
+            _LOGGER.debug("Set display_format to: %s", display_format)
 
     @property
     def state(self):
@@ -603,7 +604,7 @@ class ChineseLunarCalendarSensor(AlternativeTimeSensorBase):
             return result
 
         except Exception as e:
-            _LOGGER.error(f"Error calculating Chinese date: {e}")
+            _LOGGER.debug("Error calculating Chinese date: %s", e)
             return {"error": str(e)}
 
     def update(self) -> None:
@@ -614,7 +615,8 @@ class ChineseLunarCalendarSensor(AlternativeTimeSensorBase):
 
         if not HAS_LUNAR:
             self._state = "Library Missing - Install lunarcalendar"
-            return
+            # Let the base class back off instead of retrying every tick
+            raise RuntimeError("lunarcalendar library not installed")
 
         now = datetime.now()
         self._chinese_date = self._calculate_chinese_date(now)
@@ -622,10 +624,11 @@ class ChineseLunarCalendarSensor(AlternativeTimeSensorBase):
         # Set state to formatted Chinese date
         if "error" in self._chinese_date:
             self._state = f"Error: {self._chinese_date['error']}"
+            raise RuntimeError(self._chinese_date["error"])
         else:
             self._state = self._chinese_date.get("formatted", "Unknown")
 
-        _LOGGER.debug(f"Updated Chinese Lunar Calendar to {self._state}")
+        _LOGGER.debug("Updated Chinese Lunar Calendar to %s", self._state)
 
 
 # ============================================
@@ -5,15 +5,15 @@
 
 from __future__ import annotations
 
-import logging
 import math
 from typing import Any, Dict, Optional, Tuple
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -1075,7 +1075,7 @@ class CosmicSpeedometerSensor(AlternativeTimeSensorBase):
         self._options_loaded = False
         self._first_update = True
 
-        _LOGGER.debug(f"Initialized Cosmic Speedometer sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Cosmic Speedometer sensor: %s", self._attr_name)
 
     def _lang(self) -> str:
         """Get user's language code."""
@@ -1129,7 +1129,7 @@ class CosmicSpeedometerSensor(AlternativeTimeSensorBase):
         plugin_options = self.get_plugin_options()
 
         if plugin_options:
-            _LOGGER.debug(f"Loading Cosmic Speedometer options: {plugin_options}")
+            _LOGGER.debug("Loading Cosmic Speedometer options: %s", plugin_options)
 
             self._speed_unit = plugin_options.get("speed_unit", self._speed_unit)
             self._use_observer_location = plugin_options.get("use_observer_location", self._use_observer_location)
@@ -1633,7 +1633,7 @@ class CosmicSpeedometerSensor(AlternativeTimeSensorBase):
         if self._first_update:
             options = self.get_plugin_options()
             if options:
-                _LOGGER.info(f"Cosmic Speedometer options on first update: {options}")
+                _LOGGER.info("Cosmic Speedometer options on first update: %s", options)
             else:
                 _LOGGER.debug("Cosmic Speedometer using defaults")
             self._first_update = False
@@ -1652,7 +1652,7 @@ class CosmicSpeedometerSensor(AlternativeTimeSensorBase):
         # If unit is invalid, show error message as state
         if not is_valid_unit:
             self._state = f"⚠️ {self._get_invalid_unit_message()}"
-            _LOGGER.debug(f"Updated Cosmic Speedometer with invalid unit: {self._speed_unit}")
+            _LOGGER.debug("Updated Cosmic Speedometer with invalid unit: %s", self._speed_unit)
             return
 
         # Set state based on display mode
@@ -1676,7 +1676,7 @@ class CosmicSpeedometerSensor(AlternativeTimeSensorBase):
             else:
                 self._state = "Active"
 
-        _LOGGER.debug(f"Updated Cosmic Speedometer to {self._state}")
+        _LOGGER.debug("Updated Cosmic Speedometer to %s", self._state)
 
 
 __all__ = ["CosmicSpeedometerSensor", "CALENDAR_INFO"]
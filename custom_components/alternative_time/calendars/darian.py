@@ -1,15 +1,15 @@
 """Darian Calendar (Mars) implementation - Version 2.5.1."""
 from __future__ import annotations
 
-import logging
-from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..astro_context import AstroContext
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -158,10 +158,6 @@ CALENDAR_INFO = {
             {"name": "Sol Veneris", "meaning": "Venus' day"},
             {"name": "Sol Saturni", "meaning": "Saturn's day"}
         ],
-
-        # MSD epoch for calculations
-        "msd_epoch_jd": 2405522.0,  # December 29, 1873
-        "j2000_jd": 2451545.0  # January 1, 2000, 12:00 UTC
     },
 
     # Configuration options for this calendar
@@ -293,8 +289,11 @@ class DarianCalendarSensor(AlternativeTimeSensorBase):
         # Flag to track if options have been loaded
         self._options_loaded = False
 
-        _LOGGER.debug(f"Initialized Darian Calendar sensor: {self._attr_name}")
-        _LOGGER.debug(f"  Default settings: month_names={self._month_names}, week_sol={self._show_week_sol}, msd={self._show_msd}")
+        _LOGGER.debug("Initialized Darian Calendar sensor: %s", self._attr_name)
+        _LOGGER.debug(
+            "  Default settings: month_names=%s, week_sol=%s, msd=%s",
+            self._month_names, self._show_week_sol, self._show_msd,
+        )
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -309,13 +308,16 @@ class DarianCalendarSensor(AlternativeTimeSensorBase):
                 self._show_week_sol = options.get("show_week_sol", self._show_week_sol)
                 self._show_msd = options.get("show_msd", self._show_msd)
 
-                _LOGGER.debug(f"Darian sensor loaded options: month_names={self._month_names}, week_sol={self._show_week_sol}, msd={self._show_msd}")
+                _LOGGER.debug(
+                    "Darian sensor loaded options: month_names=%s, week_sol=%s, msd=%s",
+                    self._month_names, self._show_week_sol, self._show_msd,
+                )
             else:
                 _LOGGER.debug("Darian sensor using default options - no custom options found")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"Darian sensor could not load options yet: {e}")
+            _LOGGER.debug("Darian sensor could not load options yet: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -324,9 +326,6 @@ class DarianCalendarSensor(AlternativeTimeSensorBase):
         # Try to load options now that IDs should be set
         self._load_options()
 
-        # Perform initial update
-        self.update()
-
     @property
     def state(self):
         """Return the state of the sensor."""
@@ -351,21 +350,12 @@ class DarianCalendarSensor(AlternativeTimeSensorBase):
 
         return attrs
 
-    def _calculate_darian_date(self, earth_date: datetime) -> Dict[str, Any]:
-        """Calculate Darian calendar date from Earth date."""
-
-        # Calculate days since J2000 epoch
-        j2000_epoch = datetime(2000, 1, 1, 12, 0, 0)
-        delta = earth_date - j2000_epoch
-        days_since_j2000 = delta.total_seconds() / self._darian_data["earth_day_seconds"]
+    def _calculate_darian_date(self, context: AstroContext) -> Dict[str, Any]:
+        """Calculate Darian calendar date from the tick's astronomical context."""
+        earth_date = context.when
 
-        # Calculate current Julian Date
-        current_jd = self._darian_data["j2000_jd"] + days_since_j2000
-
-        # Calculate Mars Sol Date (MSD)
-        # MSD = (JD - 2405522.0) / 1.02749125
-        sol_per_earth_day = self._darian_data["earth_day_seconds"] / self._darian_data["mars_sol_seconds"]
-        msd = (current_jd - self._darian_data["msd_epoch_jd"]) / sol_per_earth_day
+        # Mars Sol Date from the shared Mars time kernel
+        msd = context.mars.msd
         total_sols = int(msd)
 
         # Calculate Darian date
@@ -422,8 +412,8 @@ class DarianCalendarSensor(AlternativeTimeSensorBase):
         # Determine season
         season = month_data["season"]
 
-        # Calculate approximate Ls (solar longitude)
-        ls = (sols_in_current_year / self._darian_data["sols_per_year"]) * 360
+        # Areocentric solar longitude (Allison & McEwen 2000)
+        ls = context.mars.solar_longitude
 
         # Format the date
         full_date = f"{current_sol} {month_name} {mars_years_elapsed}"
@@ -463,16 +453,15 @@ class DarianCalendarSensor(AlternativeTimeSensorBase):
             self._load_options()
 
         try:
-            now = datetime.now()
-            self._darian_date = self._calculate_darian_date(now)
+            self._darian_date = self._calculate_darian_date(self.astro_context())
 
             # Set state to formatted Darian date
             self._state = self._darian_date.get("full_date", "0 Sagittarius 1")
 
-            _LOGGER.debug(f"Updated Darian Calendar to {self._state}")
-        except Exception as e:
-            _LOGGER.error(f"Error updating Darian calendar: {e}", exc_info=True)
+            _LOGGER.debug("Updated Darian Calendar to %s", self._state)
+        except Exception:
             self._state = "ERROR"
+            raise
 
     async def async_update(self) -> None:
         """Update sensor asynchronously."""
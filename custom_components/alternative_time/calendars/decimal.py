@@ -1,15 +1,15 @@
 """Decimal Time (French Revolutionary Time) implementation - Version 2.5.1."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -323,8 +323,11 @@ class DecimalTimeSensor(AlternativeTimeSensorBase):
         # Flag to track if options have been loaded
         self._options_loaded = False
 
-        _LOGGER.debug(f"Initialized Decimal Time sensor: {self._attr_name}")
-        _LOGGER.debug(f"  Default settings: precision={self._precision}, show_conversion={self._show_conversion}, show_period={self._show_period_name}")
+        _LOGGER.debug("Initialized Decimal Time sensor: %s", self._attr_name)
+        _LOGGER.debug(
+            "  Default settings: precision=%s, show_conversion=%s, show_period=%s",
+            self._precision, self._show_conversion, self._show_period_name,
+        )
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -339,13 +342,16 @@ class DecimalTimeSensor(AlternativeTimeSensorBase):
                 self._precision = options.get("precision", self._precision)
                 self._show_period_name = options.get("show_period_name", self._show_period_name)
 
-                _LOGGER.debug(f"Decimal sensor loaded options: precision={self._precision}, conversion={self._show_conversion}, period={self._show_period_name}")
+                _LOGGER.debug(
+                    "Decimal sensor loaded options: precision=%s, conversion=%s, period=%s",
+                    self._precision, self._show_conversion, self._show_period_name,
+                )
             else:
                 _LOGGER.debug("Decimal sensor using default options - no custom options found")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"Decimal sensor could not load options yet: {e}")
+            _LOGGER.debug("Decimal sensor could not load options yet: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -354,9 +360,6 @@ class DecimalTimeSensor(AlternativeTimeSensorBase):
         # Try to load options now that IDs should be set
         self._load_options()
 
-        # Perform initial update
-        self.update()
-
     @property
     def state(self):
         """Return the state of the sensor."""
@@ -402,6 +405,16 @@ class DecimalTimeSensor(AlternativeTimeSensorBase):
                 return name
         return "Night"
 
+    def state_resolution(self) -> float:
+        """Return standard seconds per displayed decimal unit."""
+        data = self._decimal_data
+        step = data["standard_seconds"] / data["total_seconds"]
+        if self._precision == "hour":
+            return step * data["minutes_per_hour"] * data["seconds_per_minute"]
+        if self._precision == "minute":
+            return step * data["seconds_per_minute"]
+        return step
+
     def _calculate_decimal_time(self, earth_time: datetime) -> Dict[str, Any]:
         """Calculate decimal time from standard time."""
         # Get local time
@@ -498,10 +511,10 @@ class DecimalTimeSensor(AlternativeTimeSensorBase):
             else:
                 self._state = self._decimal_time.get("formatted", "0:00:00")
 
-            _LOGGER.debug(f"Updated Decimal Time to {self._state}")
-        except Exception as e:
-            _LOGGER.error(f"Error updating Decimal time: {e}", exc_info=True)
+            _LOGGER.debug("Updated Decimal Time to %s", self._state)
+        except Exception:
             self._state = "ERROR"
+            raise
 
     async def async_update(self) -> None:
         """Update sensor asynchronously."""
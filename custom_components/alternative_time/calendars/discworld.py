@@ -1,15 +1,15 @@
 """Discworld Calendar (Terry Pratchett) implementation - Version 3.0."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -469,7 +469,7 @@ class DiscworldCalendarSensor(AlternativeTimeSensorBase):
         self._state = None
         self._discworld_date = {}
 
-        _LOGGER.debug(f"Initialized Discworld Calendar sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Discworld Calendar sensor: %s", self._attr_name)
 
     def set_options(self, options: Dict[str, Any]) -> None:
         """Set options from config flow."""
@@ -480,9 +480,14 @@ class DiscworldCalendarSensor(AlternativeTimeSensorBase):
             self._detect_l_space = options.get("detect_l_space", self._detect_l_space)
             self._century = options.get("century", self._century)
 
-            _LOGGER.debug(f"Discworld sensor options updated: show_death_quotes={self._show_death_quotes}, "
-                         f"show_guild={self._show_guild}, show_location={self._show_location}, "
-                         f"detect_l_space={self._detect_l_space}, century={self._century}")
+            _LOGGER.debug(
+                "Discworld sensor options updated: show_death_quotes=%s, show_guild=%s, show_location=%s, detect_l_space=%s, century=%s",
+                self._show_death_quotes,
+                self._show_guild,
+                self._show_location,
+                self._detect_l_space,
+                self._century,
+            )
 
     @property
     def state(self):
@@ -633,4 +638,4 @@ class DiscworldCalendarSensor(AlternativeTimeSensorBase):
 
         self._state = " ".join(state_parts)
 
-        _LOGGER.debug(f"Updated Discworld Calendar to {self._state}")
+        _LOGGER.debug("Updated Discworld Calendar to %s", self._state)
@@ -6,15 +6,15 @@ Example: 241530Z DEC 25 (24th day, 15:30 Zulu time, December 2025)
 """
 from __future__ import annotations
 
-import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 try:
     import pytz
@@ -762,7 +762,7 @@ class DTGSensor(AlternativeTimeSensorBase):
                 self._timezone = pytz.timezone("UTC")
                 self._timezone_initialized = True
             except Exception as e:
-                _LOGGER.error(f"Failed to initialize default timezone: {e}")
+                _LOGGER.error("Failed to initialize default timezone: %s", e)
 
         # DTG data storage
         self._dtg_info = {}
@@ -808,6 +808,10 @@ class DTGSensor(AlternativeTimeSensorBase):
 
         return attrs
 
+    def state_resolution(self) -> float:
+        """DTG is shown to the minute."""
+        return 60
+
     def _format_dtg(self, dt: datetime) -> str:
         """Format datetime as NATO DTG."""
         # Format: DDHHMM[Z]MONYY
@@ -897,7 +901,7 @@ class DTGSensor(AlternativeTimeSensorBase):
         # Debug on first update
         if self._first_update:
             if options:
-                _LOGGER.info(f"DTG sensor options in first update: {options}")
+                _LOGGER.info("DTG sensor options in first update: %s", options)
             else:
                 _LOGGER.debug("DTG sensor using defaults (no options configured)")
             self._first_update = False
@@ -911,7 +915,7 @@ class DTGSensor(AlternativeTimeSensorBase):
 
             # Check if NATO zone changed
             if new_nato_zone != self._nato_zone:
-                _LOGGER.info(f"NATO zone changed from {self._nato_zone} to {new_nato_zone}")
+                _LOGGER.info("NATO zone changed from %s to %s", self._nato_zone, new_nato_zone)
                 self._nato_zone = new_nato_zone
 
                 # Update name
@@ -920,13 +924,13 @@ class DTGSensor(AlternativeTimeSensorBase):
 
             # Check if IANA zone changed (if enabled)
             if self._use_iana and new_iana_zone != self._iana_zone_str and HAS_PYTZ:
-                _LOGGER.info(f"IANA timezone changed from {self._iana_zone_str} to {new_iana_zone}")
+                _LOGGER.info("IANA timezone changed from %s to %s", self._iana_zone_str, new_iana_zone)
                 self._iana_zone_str = new_iana_zone
                 try:
                     self._timezone = pytz.timezone(self._iana_zone_str)
                     self._timezone_initialized = True
                 except Exception as e:
-                    _LOGGER.error(f"Failed to load IANA timezone {self._iana_zone_str}: {e}")
+                    _LOGGER.error("Failed to load IANA timezone %s: %s", self._iana_zone_str, e)
                     # Fallback to UTC
                     self._timezone = pytz.timezone("UTC")
                     self._iana_zone_str = "UTC"
@@ -957,11 +961,11 @@ class DTGSensor(AlternativeTimeSensorBase):
             self._state = self._dtg_info["dtg"]
 
         except Exception as e:
-            _LOGGER.error(f"Error calculating DTG: {e}")
             self._state = f"Error: {self._nato_zone}"
             self._dtg_info = {"error": str(e)}
+            raise
 
-        _LOGGER.debug(f"Updated DTG to {self._state}")
+        _LOGGER.debug("Updated DTG to %s", self._state)
 
 
 # Required for Home Assistant to discover this calendar
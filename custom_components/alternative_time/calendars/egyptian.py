@@ -1,15 +1,15 @@
 """Ancient Egyptian Calendar implementation - Version 2.5."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -356,7 +356,7 @@ class EgyptianCalendarSensor(AlternativeTimeSensorBase):
         # Track if options have been loaded
         self._options_loaded = False
 
-        _LOGGER.debug(f"Initialized Egyptian Calendar sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Egyptian Calendar sensor: %s", self._attr_name)
 
     def _load_options(self) -> None:
         """Load configuration options from config entry."""
@@ -373,15 +373,20 @@ class EgyptianCalendarSensor(AlternativeTimeSensorBase):
                 self._format = options.get("format", self._format)
                 self._dynasty_offset = options.get("dynasty_offset", self._dynasty_offset)
 
-                _LOGGER.debug(f"Egyptian sensor loaded options: hieroglyphs={self._show_hieroglyphs}, "
-                            f"dynasty={self._show_dynasty}, nile={self._show_nile_status}, "
-                            f"format={self._format}, dynasty_offset={self._dynasty_offset}")
+                _LOGGER.debug(
+                    "Egyptian sensor loaded options: hieroglyphs=%s, dynasty=%s, nile=%s, format=%s, dynasty_offset=%s",
+                    self._show_hieroglyphs,
+                    self._show_dynasty,
+                    self._show_nile_status,
+                    self._format,
+                    self._dynasty_offset,
+                )
             else:
                 _LOGGER.debug("Egyptian sensor using default options - no custom options found")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"Egyptian sensor could not load options yet: {e}")
+            _LOGGER.debug("Egyptian sensor could not load options yet: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -584,4 +589,4 @@ class EgyptianCalendarSensor(AlternativeTimeSensorBase):
         # Set state to full Egyptian date
         self._state = self._egyptian_date["full_date"]
 
-        _LOGGER.debug(f"Updated Egyptian Calendar to {self._state}")
+        _LOGGER.debug("Updated Egyptian Calendar to %s", self._state)
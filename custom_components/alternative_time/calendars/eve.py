@@ -1,15 +1,15 @@
 """EVE Online Time (New Eden Standard Time) implementation - Version 3.0."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -425,7 +425,7 @@ class EveOnlineTimeSensor(AlternativeTimeSensorBase):
         self._current_empire_index = 0
         self._current_system_index = 0
 
-        _LOGGER.debug(f"Initialized EVE Online Time sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized EVE Online Time sensor: %s", self._attr_name)
 
     def set_options(self, options: Dict[str, Any]) -> None:
         """Set options from config flow."""
@@ -436,9 +436,10 @@ class EveOnlineTimeSensor(AlternativeTimeSensorBase):
             self._show_system = options.get("show_system", self._show_system)
             self._format = options.get("format", self._format)
 
-            _LOGGER.debug(f"EVE sensor options updated: show_nest={self._show_nest}, "
-                         f"show_event={self._show_event}, show_empire={self._show_empire}, "
-                         f"show_system={self._show_system}, format={self._format}")
+            _LOGGER.debug(
+                "EVE sensor options updated: show_nest=%s, show_event=%s, show_empire=%s, show_system=%s, format=%s",
+                self._show_nest, self._show_event, self._show_empire, self._show_system, self._format,
+            )
 
     @property
     def state(self):
@@ -569,4 +570,4 @@ class EveOnlineTimeSensor(AlternativeTimeSensorBase):
         # Set state to formatted EVE time
         self._state = self._eve_time["formatted"]
 
-        _LOGGER.debug(f"Updated EVE Online Time to {self._state}")
+        _LOGGER.debug("Updated EVE Online Time to %s", self._state)
@@ -1,15 +1,15 @@
 """Ge'ez (Ethiopian) Calendar implementation - Version 1.0."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -447,7 +447,7 @@ class GeezCalendarSensor(AlternativeTimeSensorBase):
         # Ethiopian data
         self._ethiopian_data = CALENDAR_INFO["ethiopian_data"]
 
-        _LOGGER.debug(f"Initialized Ge'ez Calendar sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Ge'ez Calendar sensor: %s", self._attr_name)
 
     @property
     def state(self):
@@ -692,9 +692,9 @@ class GeezCalendarSensor(AlternativeTimeSensorBase):
             self._ethiopian_date = self._calculate_ethiopian_date(now)
             # State shown on the badge
             self._state = self._ethiopian_date.get("state_text")
-        except Exception as exc:
-            _LOGGER.exception("Failed to calculate Ethiopian date: %s", exc)
+        except Exception:
             self._state = "error"
+            raise
 
     # ===============================
     # Config handling (optional hooks)
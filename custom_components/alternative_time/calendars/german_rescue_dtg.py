@@ -7,15 +7,15 @@ Used by German emergency services, fire departments, and rescue organizations.
 """
 from __future__ import annotations
 
-import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 try:
     import pytz
@@ -488,7 +488,7 @@ class GermanRescueDTGSensor(AlternativeTimeSensorBase):
                 self._timezone = pytz.timezone(self._timezone_str)
                 self._timezone_initialized = True
             except Exception as e:
-                _LOGGER.error(f"Failed to initialize default timezone: {e}")
+                _LOGGER.error("Failed to initialize default timezone: %s", e)
 
         # DTG data storage
         self._dtg_info = {}
@@ -554,6 +554,10 @@ class GermanRescueDTGSensor(AlternativeTimeSensorBase):
 
         return months.get(month_key, "UNK")
 
+    def state_resolution(self) -> float:
+        """Return 1 s with seconds shown, otherwise one minute."""
+        return 1 if self._show_seconds else 60
+
     def _format_rescue_dtg(self, dt: datetime) -> str:
         """Format datetime as German Rescue DTG."""
         # Format: DD HHMM MON YYYY or DD HHMMSS MON YYYY
@@ -648,7 +652,7 @@ class GermanRescueDTGSensor(AlternativeTimeSensorBase):
         # Debug on first update
         if self._first_update:
             if options:
-                _LOGGER.info(f"German Rescue DTG sensor options in first update: {options}")
+                _LOGGER.info("German Rescue DTG sensor options in first update: %s", options)
             else:
                 _LOGGER.debug("German Rescue DTG sensor using defaults (no options configured)")
             self._first_update = False
@@ -662,7 +666,7 @@ class GermanRescueDTGSensor(AlternativeTimeSensorBase):
 
             # Check if timezone changed
             if new_timezone != self._timezone_str and HAS_PYTZ:
-                _LOGGER.info(f"Timezone changed from {self._timezone_str} to {new_timezone}")
+                _LOGGER.info("Timezone changed from %s to %s", self._timezone_str, new_timezone)
                 self._timezone_str = new_timezone
                 try:
                     self._timezone = pytz.timezone(self._timezone_str)
@@ -673,7 +677,7 @@ class GermanRescueDTGSensor(AlternativeTimeSensorBase):
                     tz_short = self._timezone_str.split('/')[-1]
                     self._attr_name = f"{self._base_name} {calendar_name} ({tz_short})"
                 except Exception as e:
-                    _LOGGER.error(f"Failed to load timezone {self._timezone_str}: {e}")
+                    _LOGGER.error("Failed to load timezone %s: %s", self._timezone_str, e)
                     # Fallback to Berlin
                     self._timezone = pytz.timezone("Europe/Berlin")
                     self._timezone_str = "Europe/Berlin"
@@ -692,11 +696,11 @@ class GermanRescueDTGSensor(AlternativeTimeSensorBase):
             self._state = self._dtg_info["dtg"]
 
         except Exception as e:
-            _LOGGER.error(f"Error calculating German Rescue DTG: {e}")
             self._state = "Error"
             self._dtg_info = {"error": str(e)}
+            raise
 
-        _LOGGER.debug(f"Updated German Rescue DTG to {self._state}")
+        _LOGGER.debug("Updated German Rescue DTG to %s", self._state)
 
 
 # Required for Home Assistant to discover this calendar
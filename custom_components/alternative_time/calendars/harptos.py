@@ -1,15 +1,15 @@
 """Harptos Calendar (Dungeons & Dragons / Forgotten Realms) implementation - Version 2.6.1."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -285,8 +285,11 @@ class HarptosCalendarSensor(AlternativeTimeSensorBase):
         # Flag to track if options have been loaded
         self._options_loaded = False
 
-        _LOGGER.debug(f"Initialized Harptos Calendar sensor: {self._attr_name}")
-        _LOGGER.debug(f"  Default settings: dr_offset={self._dr_offset}, common={self._show_common_name}, tenday={self._show_tenday}")
+        _LOGGER.debug("Initialized Harptos Calendar sensor: %s", self._attr_name)
+        _LOGGER.debug(
+            "  Default settings: dr_offset=%s, common=%s, tenday=%s",
+            self._dr_offset, self._show_common_name, self._show_tenday,
+        )
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -301,13 +304,16 @@ class HarptosCalendarSensor(AlternativeTimeSensorBase):
                 self._show_common_name = options.get("show_common_name", self._show_common_name)
                 self._show_tenday = options.get("show_tenday", self._show_tenday)
 
-                _LOGGER.debug(f"Harptos sensor loaded options: dr_offset={self._dr_offset}, common={self._show_common_name}, tenday={self._show_tenday}")
+                _LOGGER.debug(
+                    "Harptos sensor loaded options: dr_offset=%s, common=%s, tenday=%s",
+                    self._dr_offset, self._show_common_name, self._show_tenday,
+                )
             else:
                 _LOGGER.debug("Harptos sensor using default options - no custom options found")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"Harptos sensor could not load options yet: {e}")
+            _LOGGER.debug("Harptos sensor could not load options yet: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -316,9 +322,6 @@ class HarptosCalendarSensor(AlternativeTimeSensorBase):
         # Try to load options now that IDs should be set
         self._load_options()
 
-        # Perform initial update
-        self.update()
-
     @property
     def state(self):
         """Return the state of the sensor."""
@@ -462,10 +465,10 @@ class HarptosCalendarSensor(AlternativeTimeSensorBase):
             # Set state to formatted Harptos date
             self._state = self._harptos.get("formatted", "1 Hammer, 1494 DR")
 
-            _LOGGER.debug(f"Updated Harptos Calendar to {self._state}")
-        except Exception as e:
-            _LOGGER.error(f"Error updating Harptos calendar: {e}", exc_info=True)
+            _LOGGER.debug("Updated Harptos Calendar to %s", self._state)
+        except Exception:
             self._state = "ERROR"
+            raise
 
     async def async_update(self) -> None:
         """Update sensor asynchronously."""
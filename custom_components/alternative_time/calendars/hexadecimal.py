@@ -1,15 +1,15 @@
 """Hexadecimal Time implementation - Version 2.5.1."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -292,8 +292,11 @@ class HexadecimalTimeSensor(AlternativeTimeSensorBase):
         # Flag to track if options have been loaded
         self._options_loaded = False
 
-        _LOGGER.debug(f"Initialized Hexadecimal Time sensor: {self._attr_name}")
-        _LOGGER.debug(f"  Default settings: uppercase={self._uppercase}, decimal={self._show_decimal}, binary={self._show_binary}")
+        _LOGGER.debug("Initialized Hexadecimal Time sensor: %s", self._attr_name)
+        _LOGGER.debug(
+            "  Default settings: uppercase=%s, decimal=%s, binary=%s",
+            self._uppercase, self._show_decimal, self._show_binary,
+        )
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -308,13 +311,16 @@ class HexadecimalTimeSensor(AlternativeTimeSensorBase):
                 self._show_binary = options.get("show_binary", self._show_binary)
                 self._uppercase = options.get("uppercase", self._uppercase)
 
-                _LOGGER.debug(f"Hexadecimal sensor loaded options: uppercase={self._uppercase}, decimal={self._show_decimal}, binary={self._show_binary}")
+                _LOGGER.debug(
+                    "Hexadecimal sensor loaded options: uppercase=%s, decimal=%s, binary=%s",
+                    self._uppercase, self._show_decimal, self._show_binary,
+                )
             else:
                 _LOGGER.debug("Hexadecimal sensor using default options - no custom options found")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"Hexadecimal sensor could not load options yet: {e}")
+            _LOGGER.debug("Hexadecimal sensor could not load options yet: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -323,9 +329,6 @@ class HexadecimalTimeSensor(AlternativeTimeSensorBase):
         # Try to load options now that IDs should be set
         self._load_options()
 
-        # Perform initial update
-        self.update()
-
     @property
     def state(self):
         """Return the state of the sensor."""
@@ -430,10 +433,10 @@ class HexadecimalTimeSensor(AlternativeTimeSensorBase):
             else:
                 self._state = self._hex_time.get("formatted", ".0000")
 
-            _LOGGER.debug(f"Updated Hexadecimal Time to {self._state}")
-        except Exception as e:
-            _LOGGER.error(f"Error updating Hexadecimal time: {e}", exc_info=True)
+            _LOGGER.debug("Updated Hexadecimal Time to %s", self._state)
+        except Exception:
             self._state = ".ERROR"
+            raise
 
     async def async_update(self) -> None:
         """Update sensor asynchronously."""
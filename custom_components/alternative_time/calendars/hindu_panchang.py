@@ -1,16 +1,16 @@
 """Indian Hindu Calendar (पंचांग, Panchānga) implementation - Version 2.5."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -554,7 +554,7 @@ class HinduPanchangCalendarSensor(AlternativeTimeSensorBase):
         self._state = None
         self._panchang_date = {}
 
-        _LOGGER.debug(f"Initialized Hindu Panchang Calendar sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Hindu Panchang Calendar sensor: %s", self._attr_name)
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -565,7 +565,7 @@ class HinduPanchangCalendarSensor(AlternativeTimeSensorBase):
         plugin_options = self.get_plugin_options()
 
         if plugin_options:
-            _LOGGER.debug(f"Loading Hindu Panchang options: {plugin_options}")
+            _LOGGER.debug("Loading Hindu Panchang options: %s", plugin_options)
 
             # Apply options using set_options method
             self.set_options(
@@ -589,9 +589,10 @@ class HinduPanchangCalendarSensor(AlternativeTimeSensorBase):
         # Load options after entity is registered
         self._load_options()
 
-        _LOGGER.debug(f"Hindu Panchang sensor added to hass with options: "
-                     f"timezone={self._timezone}, system={self._calendar_system}, "
-                     f"language={self._display_language}")
+        _LOGGER.debug(
+            "Hindu Panchang sensor added to hass with options: timezone=%s, system=%s, language=%s",
+            self._timezone, self._calendar_system, self._display_language,
+        )
 
     def set_options(
         self,
@@ -609,39 +610,39 @@ class HinduPanchangCalendarSensor(AlternativeTimeSensorBase):
         """Set calendar options from config flow."""
         if timezone is not None and timezone in ["Asia/Kolkata", "local", "UTC"]:
             self._timezone = timezone
-            _LOGGER.debug(f"Set timezone to: {timezone}")
+            _LOGGER.debug("Set timezone to: %s", timezone)
 
         if calendar_system is not None and calendar_system in ["shalivahana", "vikram", "kali"]:
             self._calendar_system = calendar_system
-            _LOGGER.debug(f"Set calendar_system to: {calendar_system}")
+            _LOGGER.debug("Set calendar_system to: %s", calendar_system)
 
         if display_language is not None and display_language in ["auto", "sanskrit", "hindi", "english"]:
             self._display_language = display_language
-            _LOGGER.debug(f"Set display_language to: {display_language}")
+            _LOGGER.debug("Set display_language to: %s", display_language)
 
         if show_tithi is not None:
             self._show_tithi = bool(show_tithi)
-            _LOGGER.debug(f"Set show_tithi to: {show_tithi}")
+            _LOGGER.debug("Set show_tithi to: %s", show_tithi)
 
         if show_nakshatra is not None:
             self._show_nakshatra = bool(show_nakshatra)
-            _LOGGER.debug(f"Set show_nakshatra to: {show_nakshatra}")
+            _LOGGER.debug("Set show_nakshatra to: %s", show_nakshatra)
 
         if show_yoga is not None:
             self._show_yoga = bool(show_yoga)
-            _LOGGER.debug(f"Set show_yoga to: {show_yoga}")
+            _LOGGER.debug("Set show_yoga to: %s", show_yoga)
 
         if show_karana is not None:
             self._show_karana = bool(show_karana)
-            _LOGGER.debug(f"Set show_karana to: {show_karana}")
+            _LOGGER.debug("Set show_karana to: %s", show_karana)
 
         if show_festivals is not None:
             self._show_festivals = bool(show_festivals)
-            _LOGGER.debug(f"Set show_festivals to: {show_festivals}")
+            _LOGGER.debug("Set show_festivals to: %s", show_festivals)
 
         if show_rashi is not None:
             self._show_rashi = bool(show_rashi)
-            _LOGGER.debug(f"Set show_rashi to: {show_rashi}")
+            _LOGGER.debug("Set show_rashi to: %s", show_rashi)
 
     def _get_timezone(self) -> ZoneInfo:
         """Get the configured timezone."""
@@ -860,7 +861,7 @@ class HinduPanchangCalendarSensor(AlternativeTimeSensorBase):
         # Set state to formatted Panchang date
         self._state = self._panchang_date["formatted"]
 
-        _LOGGER.debug(f"Updated Hindu Panchang to {self._state}")
+        _LOGGER.debug("Updated Hindu Panchang to %s", self._state)
 
     @property
     def state(self) -> str:
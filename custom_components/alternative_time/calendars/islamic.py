@@ -1,16 +1,16 @@
 """Islamic (Hijri) Calendar implementation - Version 2.5."""
 from __future__ import annotations
 
-import logging
 import math
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -196,7 +196,7 @@ class IslamicCalendarSensor(AlternativeTimeSensorBase):
         # Islamic data
         self._islamic_data = CALENDAR_INFO["islamic_data"]
 
-        _LOGGER.debug(f"Initialized Islamic Calendar sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Islamic Calendar sensor: %s", self._attr_name)
 
     @property
     def state(self):
@@ -367,9 +367,9 @@ class IslamicCalendarSensor(AlternativeTimeSensorBase):
             self._islamic_date = self._calculate_islamic_date(now)
             # State shown on the badge
             self._state = self._islamic_date.get("state_text")
-        except Exception as exc:
-            _LOGGER.exception("Failed to calculate Islamic date: %s", exc)
+        except Exception:
             self._state = "error"
+            raise
 
     # ===============================
     # Config handling (optional hooks)
@@ -1,16 +1,16 @@
 """Japanese Era Calendar (和暦, Wareki) implementation - Version 2.5."""
 from __future__ import annotations
 
-import logging
 from datetime import date, datetime, timezone
 from typing import Any, Dict, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -427,7 +427,7 @@ class JapaneseEraCalendarSensor(AlternativeTimeSensorBase):
         self._state = None
         self._japanese_date = {}
 
-        _LOGGER.debug(f"Initialized Japanese Era Calendar sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Japanese Era Calendar sensor: %s", self._attr_name)
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -438,7 +438,7 @@ class JapaneseEraCalendarSensor(AlternativeTimeSensorBase):
         plugin_options = self.get_plugin_options()
 
         if plugin_options:
-            _LOGGER.debug(f"Loading Japanese Era options: {plugin_options}")
+            _LOGGER.debug("Loading Japanese Era options: %s", plugin_options)
 
             # Apply options using set_options method
             self.set_options(
@@ -460,9 +460,10 @@ class JapaneseEraCalendarSensor(AlternativeTimeSensorBase):
         # Load options after entity is registered
         self._load_options()
 
-        _LOGGER.debug(f"Japanese Era sensor added to hass with options: "
-                     f"timezone={self._timezone}, format={self._display_format}, "
-                     f"gregorian={self._show_gregorian}, time={self._show_time}")
+        _LOGGER.debug(
+            "Japanese Era sensor added to hass with options: timezone=%s, format=%s, gregorian=%s, time=%s",
+            self._timezone, self._display_format, self._show_gregorian, self._show_time,
+        )
 
     def set_options(
         self,
@@ -478,31 +479,31 @@ class JapaneseEraCalendarSensor(AlternativeTimeSensorBase):
         """Set calendar options from config flow."""
         if timezone is not None and timezone in ["Asia/Tokyo", "local", "UTC"]:
             self._timezone = timezone
-            _LOGGER.debug(f"Set timezone to: {timezone}")
+            _LOGGER.debug("Set timezone to: %s", timezone)
 
         if display_format is not None and display_format in ["full", "kanji", "romaji", "numeric"]:
             self._display_format = display_format
-            _LOGGER.debug(f"Set display_format to: {display_format}")
+            _LOGGER.debug("Set display_format to: %s", display_format)
 
         if show_gregorian is not None:
             self._show_gregorian = bool(show_gregorian)
-            _LOGGER.debug(f"Set show_gregorian to: {show_gregorian}")
+            _LOGGER.debug("Set show_gregorian to: %s", show_gregorian)
 
         if show_time is not None:
             self._show_time = bool(show_time)
-            _LOGGER.debug(f"Set show_time to: {show_time}")
+            _LOGGER.debug("Set show_time to: %s", show_time)
 
         if show_weekday is not None:
             self._show_weekday = bool(show_weekday)
-            _LOGGER.debug(f"Set show_weekday to: {show_weekday}")
+            _LOGGER.debug("Set show_weekday to: %s", show_weekday)
 
         if show_holidays is not None:
             self._show_holidays = bool(show_holidays)
-            _LOGGER.debug(f"Set show_holidays to: {show_holidays}")
+            _LOGGER.debug("Set show_holidays to: %s", show_holidays)
 
         if show_rokuyou is not None:
             self._show_rokuyou = bool(show_rokuyou)
-            _LOGGER.debug(f"Set show_rokuyou to: {show_rokuyou}")
+            _LOGGER.debug("Set show_rokuyou to: %s", show_rokuyou)
 
     def _get_timezone(self) -> ZoneInfo:
         """Get the configured timezone."""
@@ -643,7 +644,7 @@ class JapaneseEraCalendarSensor(AlternativeTimeSensorBase):
         # Set state to formatted Japanese date
         self._state = self._japanese_date["formatted"]
 
-        _LOGGER.debug(f"Updated Japanese Era Calendar to {self._state}")
+        _LOGGER.debug("Updated Japanese Era Calendar to %s", self._state)
 
     @property
     def state(self) -> str:
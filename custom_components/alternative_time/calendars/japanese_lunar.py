@@ -1,16 +1,17 @@
 """Japanese Traditional Lunar Calendar (旧暦, Kyūreki) implementation - Version 2.5."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
+from ..moon_phases import moon_phase
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -441,7 +442,7 @@ class JapaneseLunarCalendarSensor(AlternativeTimeSensorBase):
         self._state = None
         self._lunar_date = {}
 
-        _LOGGER.debug(f"Initialized Japanese Lunar Calendar sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Japanese Lunar Calendar sensor: %s", self._attr_name)
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -452,7 +453,7 @@ class JapaneseLunarCalendarSensor(AlternativeTimeSensorBase):
         plugin_options = self.get_plugin_options()
 
         if plugin_options:
-            _LOGGER.debug(f"Loading Japanese Lunar options: {plugin_options}")
+            _LOGGER.debug("Loading Japanese Lunar options: %s", plugin_options)
 
             # Apply options using set_options method
             self.set_options(
@@ -474,9 +475,10 @@ class JapaneseLunarCalendarSensor(AlternativeTimeSensorBase):
         # Load options after entity is registered
         self._load_options()
 
-        _LOGGER.debug(f"Japanese Lunar sensor added to hass with options: "
-                     f"timezone={self._timezone}, moon_phase={self._show_moon_phase}, "
-                     f"solar_terms={self._show_solar_terms}, events={self._show_traditional_events}")
+        _LOGGER.debug(
+            "Japanese Lunar sensor added to hass with options: timezone=%s, moon_phase=%s, solar_terms=%s, events=%s",
+            self._timezone, self._show_moon_phase, self._show_solar_terms, self._show_traditional_events,
+        )
 
     def set_options(
         self,
@@ -492,31 +494,31 @@ class JapaneseLunarCalendarSensor(AlternativeTimeSensorBase):
         """Set calendar options from config flow."""
         if timezone is not None and timezone in ["Asia/Tokyo", "local", "UTC"]:
             self._timezone = timezone
-            _LOGGER.debug(f"Set timezone to: {timezone}")
+            _LOGGER.debug("Set timezone to: %s", timezone)
 
         if display_language is not None and display_language in ["auto", "japanese", "english"]:
             self._display_language = display_language
-            _LOGGER.debug(f"Set display_language to: {display_language}")
+            _LOGGER.debug("Set display_language to: %s", display_language)
 
         if show_moon_phase is not None:
             self._show_moon_phase = bool(show_moon_phase)
-            _LOGGER.debug(f"Set show_moon_phase to: {show_moon_phase}")
+            _LOGGER.debug("Set show_moon_phase to: %s", show_moon_phase)
 
         if show_solar_terms is not None:
             self._show_solar_terms = bool(show_solar_terms)
-            _LOGGER.debug(f"Set show_solar_terms to: {show_solar_terms}")
+            _LOGGER.debug("Set show_solar_terms to: %s", show_solar_terms)
 
         if show_traditional_events is not None:
             self._show_traditional_events = bool(show_traditional_events)
-            _LOGGER.debug(f"Set show_traditional_events to: {show_traditional_events}")
+            _LOGGER.debug("Set show_traditional_events to: %s", show_traditional_events)
 
         if show_zodiac is not None:
             self._show_zodiac = bool(show_zodiac)
-            _LOGGER.debug(f"Set show_zodiac to: {show_zodiac}")
+            _LOGGER.debug("Set show_zodiac to: %s", show_zodiac)
 
         if display_format is not None and display_format in ["traditional", "modern", "numeric"]:
             self._display_format = display_format
-            _LOGGER.debug(f"Set display_format to: {display_format}")
+            _LOGGER.debug("Set display_format to: %s", display_format)
 
     def _get_timezone(self) -> ZoneInfo:
         """Get the configured timezone."""
@@ -533,20 +535,9 @@ class JapaneseLunarCalendarSensor(AlternativeTimeSensorBase):
                 return ZoneInfo("UTC")
 
     def _calculate_moon_phase(self, japan_date: datetime) -> Tuple[float, str, str]:
-        """Calculate moon phase for given date."""
-        # Simplified moon phase calculation
-        # Based on lunar synodic month of 29.53 days
-
-        # Reference new moon (January 6, 2000, 18:14 UTC)
-        ref_new_moon = datetime(2000, 1, 6, 18, 14, tzinfo=timezone.utc)
-
-        # Calculate days since reference
-        delta = japan_date.astimezone(timezone.utc) - ref_new_moon
-        days_since = delta.total_seconds() / 86400
-
-        # Calculate moon age (0-29.53)
-        synodic_month = 29.530588
-        moon_age = days_since % synodic_month
+        """Calculate moon age and phase name from the shared moon phase table."""
+        # Moon age in days since the last true new moon (0-29.8)
+        moon_age = moon_phase(japan_date.timestamp())["age_days"]
 
         # Determine phase name
         phase_index = int(moon_age / 2.1)
@@ -750,7 +741,7 @@ class JapaneseLunarCalendarSensor(AlternativeTimeSensorBase):
         # Set state to formatted lunar date
         self._state = self._lunar_date["formatted"]
 
-        _LOGGER.debug(f"Updated Japanese Lunar Calendar to {self._state}")
+        _LOGGER.debug("Updated Japanese Lunar Calendar to %s", self._state)
 
     @property
     def state(self) -> str:
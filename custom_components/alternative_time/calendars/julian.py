@@ -6,15 +6,16 @@ Example: JD 2460636.235417 (decimal days since epoch)
 """
 from __future__ import annotations
 
-import logging
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..astro_context import AstroContext
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -329,48 +330,14 @@ class JulianDateSensor(AlternativeTimeSensorBase):
 
         return attrs
 
-    def _gregorian_to_julian_date(self, dt: datetime) -> float:
-        """Convert Gregorian datetime to Julian Date.
-
-        Algorithm from Meeus, "Astronomical Algorithms"
-        """
-        # Ensure we're working with UTC
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        else:
-            dt = dt.astimezone(timezone.utc)
-
-        # Extract components
-        year = dt.year
-        month = dt.month
-        day = dt.day
-        hour = dt.hour
-        minute = dt.minute
-        second = dt.second
-        microsecond = dt.microsecond
-
-        # Calculate fractional day from noon UTC
-        # Julian Date starts at noon, so we need to adjust
-        fractional_day = (hour - 12) / 24.0 + minute / 1440.0 + second / 86400.0 + microsecond / 86400000000.0
-
-        # Algorithm from Meeus
-        if month <= 2:
-            year -= 1
-            month += 12
-
-        # Check if date is after Gregorian reform (October 15, 1582)
-        gregorian = (year > 1582) or (year == 1582 and month > 10) or (year == 1582 and month == 10 and day >= 15)
-
-        if gregorian:
-            a = int(year / 100)
-            b = 2 - a + int(a / 4)
-        else:
-            b = 0
-
-        jd = int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + b - 1524.5
-        jd += fractional_day
-
-        return jd
+    def state_resolution(self) -> float:
+        """Return seconds per last displayed decimal place (1 day = 86400 s)."""
+        return max(1.0, 86400.0 / (10 ** self._decimal_places))
+
+    def state_origin(self) -> datetime:
+        """JD days start at noon UTC; the display rounds, so it changes half a step earlier."""
+        noon = datetime.now(timezone.utc).replace(hour=12, minute=0, second=0, microsecond=0)
+        return noon - timedelta(seconds=self.state_resolution() / 2)
 
     def _fraction_to_time(self, fraction: float) -> str:
         """Convert fractional day to time string."""
@@ -423,10 +390,10 @@ class JulianDateSensor(AlternativeTimeSensorBase):
 
         return (nearest_jd, nearest_desc, jd - nearest_jd if nearest_jd else 0)
 
-    def _calculate_jd_info(self, dt: datetime) -> Dict[str, Any]:
+    def _calculate_jd_info(self, context: AstroContext) -> Dict[str, Any]:
         """Calculate Julian Date information."""
-        # Calculate Julian Date
-        jd = self._gregorian_to_julian_date(dt)
+        dt = context.when
+        jd = context.jd_utc
 
         # Get integer and fractional parts
         jd_integer = int(jd)
@@ -492,7 +459,7 @@ class JulianDateSensor(AlternativeTimeSensorBase):
         # Debug on first update
         if self._first_update:
             if options:
-                _LOGGER.info(f"Julian Date sensor options in first update: {options}")
+                _LOGGER.info("Julian Date sensor options in first update: %s", options)
             else:
                 _LOGGER.debug("Julian Date sensor using defaults (no options configured)")
             self._first_update = False
@@ -510,16 +477,15 @@ class JulianDateSensor(AlternativeTimeSensorBase):
 
         # Calculate Julian Date
         try:
-            now = datetime.now(timezone.utc)
-            self._jd_info = self._calculate_jd_info(now)
+            self._jd_info = self._calculate_jd_info(self.astro_context())
             self._state = self._jd_info["formatted"]
 
         except Exception as e:
-            _LOGGER.error(f"Error calculating Julian Date: {e}")
             self._state = "Error"
             self._jd_info = {"error": str(e)}
+            raise
 
-        _LOGGER.debug(f"Updated Julian Date to {self._state}")
+        _LOGGER.debug("Updated Julian Date to %s", self._state)
 
 
 # Required for Home Assistant to discover this calendar
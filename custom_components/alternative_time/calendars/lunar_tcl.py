@@ -11,16 +11,16 @@ GitHub: https://github.com/xlucn/LTE440
 """
 from __future__ import annotations
 
-import logging
 import math
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -529,7 +529,7 @@ class LunarTCLSensor(AlternativeTimeSensorBase):
         self._tcl_info: Dict[str, Any] = {}
         self._tcl_datetime: Optional[datetime] = None
 
-        _LOGGER.debug(f"Initialized Lunar TCL sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Lunar TCL sensor: %s", self._attr_name)
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -544,14 +544,16 @@ class LunarTCLSensor(AlternativeTimeSensorBase):
                 self._use_calibrated_drift = options.get("use_calibrated_drift", self._use_calibrated_drift)
                 self._precision_digits = int(options.get("precision_digits", self._precision_digits))
 
-                _LOGGER.debug(f"Lunar TCL sensor loaded options: format={self._display_format}, "
-                             f"periodic={self._show_periodic_terms}, calibrated={self._use_calibrated_drift}")
+                _LOGGER.debug(
+                    "Lunar TCL sensor loaded options: format=%s, periodic=%s, calibrated=%s",
+                    self._display_format, self._show_periodic_terms, self._use_calibrated_drift,
+                )
             else:
                 _LOGGER.debug("Lunar TCL sensor using default options")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"Lunar TCL sensor could not load options yet: {e}")
+            _LOGGER.debug("Lunar TCL sensor could not load options yet: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -560,9 +562,6 @@ class LunarTCLSensor(AlternativeTimeSensorBase):
         # Try to load options now that IDs should be set
         self._load_options()
 
-        # Perform initial update
-        self.update()
-
     @property
     def state(self):
         """Return the state of the sensor."""
@@ -597,30 +596,6 @@ class LunarTCLSensor(AlternativeTimeSensorBase):
 
         return attrs
 
-    def _datetime_to_jd(self, dt: datetime) -> float:
-        """Convert datetime to Julian Date."""
-        # Ensure UTC
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        else:
-            dt = dt.astimezone(timezone.utc)
-
-        # Julian Date calculation
-        year = dt.year
-        month = dt.month
-        day = dt.day + dt.hour / 24.0 + dt.minute / 1440.0 + dt.second / 86400.0 + dt.microsecond / 86400000000.0
-
-        if month <= 2:
-            year -= 1
-            month += 12
-
-        a = int(year / 100)
-        b = 2 - a + int(a / 4)
-
-        jd = int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + b - 1524.5
-
-        return jd
-
     def _calculate_periodic_variation(self, jd: float) -> float:
         """Calculate the sum of periodic variations at given Julian Date.
 
@@ -642,15 +617,13 @@ class LunarTCLSensor(AlternativeTimeSensorBase):
 
         return total_variation
 
-    def _calculate_tcl_tdb_difference(self, dt: datetime) -> Dict[str, Any]:
+    def _calculate_tcl_tdb_difference(self, jd: float) -> Dict[str, Any]:
         """Calculate TCL - TDB difference and related quantities.
 
         Based on equations from the LTE440 paper:
         - Secular drift: ⟨dTCL/dTDB⟩ = 1 + L_D^M
         - TCL - TDB ≈ (L_B/(1-L_B)) * (TDB - t0) + periodic terms
         """
-        jd = self._datetime_to_jd(dt)
-
         # Get constants
         L_B = self._lte_data["L_B"]
 
@@ -757,7 +730,7 @@ class LunarTCLSensor(AlternativeTimeSensorBase):
             "iau_resolution": "IAU 2024 Resolution II"
         }
 
-    def _format_state(self, tcl_info: Dict[str, Any]) -> str:
+    def _format_state(self, tcl_info: Dict[str, Any], now_utc: datetime) -> str:
         """Format the sensor state based on display format setting."""
         precision = self._precision_digits
 
@@ -765,7 +738,6 @@ class LunarTCLSensor(AlternativeTimeSensorBase):
         tcl_minus_tdb_seconds = tcl_info.get("tcl_minus_tdb_seconds", 0)
 
         # Calculate TCL time by adding the difference to current UTC
-        now_utc = datetime.now(timezone.utc)
         tcl_datetime = now_utc + timedelta(seconds=tcl_minus_tdb_seconds)
 
         # Store for attributes
@@ -815,34 +787,34 @@ class LunarTCLSensor(AlternativeTimeSensorBase):
             valid_formats = ["tcl_time", "tcl_datetime", "tcl_with_drift", "drift_microseconds", "drift_nanoseconds", "accumulated_ms"]
             if display_format in valid_formats:
                 self._display_format = display_format
-                _LOGGER.debug(f"Set display_format to: {display_format}")
+                _LOGGER.debug("Set display_format to: %s", display_format)
 
         if show_periodic_terms is not None:
             self._show_periodic_terms = bool(show_periodic_terms)
-            _LOGGER.debug(f"Set show_periodic_terms to: {show_periodic_terms}")
+            _LOGGER.debug("Set show_periodic_terms to: %s", show_periodic_terms)
 
         if use_calibrated_drift is not None:
             self._use_calibrated_drift = bool(use_calibrated_drift)
-            _LOGGER.debug(f"Set use_calibrated_drift to: {use_calibrated_drift}")
+            _LOGGER.debug("Set use_calibrated_drift to: %s", use_calibrated_drift)
 
         if precision_digits is not None:
             self._precision_digits = int(precision_digits)
-            _LOGGER.debug(f"Set precision_digits to: {precision_digits}")
+            _LOGGER.debug("Set precision_digits to: %s", precision_digits)
 
     def update(self) -> None:
         """Update the sensor."""
         try:
-            now = datetime.now(timezone.utc)
+            context = self.astro_context()
 
             # Calculate TCL information
-            self._tcl_info = self._calculate_tcl_tdb_difference(now)
+            self._tcl_info = self._calculate_tcl_tdb_difference(context.jd_tdb)
 
             # Format state
-            self._state = self._format_state(self._tcl_info)
+            self._state = self._format_state(self._tcl_info, context.when)
 
-            _LOGGER.debug(f"Lunar TCL updated: {self._state}")
+            _LOGGER.debug("Lunar TCL updated: %s", self._state)
 
         except Exception as e:
-            _LOGGER.error(f"Error updating Lunar TCL sensor: {e}")
             self._state = "Error"
             self._tcl_info = {"error": str(e)}
+            raise
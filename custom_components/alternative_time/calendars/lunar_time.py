@@ -6,16 +6,16 @@ Includes support for lunar timezones and notable landing sites.
 """
 from __future__ import annotations
 
-import logging
-import math
 from datetime import datetime, timezone
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
+from ..moon_phases import PHASE_KEYS, moon_phase
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -682,7 +682,7 @@ class LunarTimeSensor(AlternativeTimeSensorBase):
         self._state = None
         self._lunar_time = {}
 
-        _LOGGER.debug(f"Initialized Lunar Time sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Lunar Time sensor: %s", self._attr_name)
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -697,10 +697,10 @@ class LunarTimeSensor(AlternativeTimeSensorBase):
                 self._show_lunar_day = options.get("show_lunar_day", self._show_lunar_day)
                 self._show_earth_time = options.get("show_earth_time", self._show_earth_time)
                 self._show_time_dilation = options.get("show_time_dilation", self._show_time_dilation)
-                _LOGGER.debug(f"Lunar Time options loaded: timezone={self._timezone}")
+                _LOGGER.debug("Lunar Time options loaded: timezone=%s", self._timezone)
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"Could not load options: {e}")
+            _LOGGER.debug("Could not load options: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -744,56 +744,22 @@ class LunarTimeSensor(AlternativeTimeSensorBase):
         return attrs
 
     def _calculate_lunar_phase(self, earth_date: datetime) -> Dict[str, Any]:
-        """Calculate current lunar phase."""
-        # Lunar phase calculation (simplified)
-        # Using synodic month = 29.530588853 days
-
-        # Reference: New Moon on Jan 6, 2000, 18:14 UTC
-        reference = datetime(2000, 1, 6, 18, 14, 0, tzinfo=timezone.utc)
-
-        # Calculate days since reference
+        """Calculate current lunar phase from the shared moon phase table."""
         if earth_date.tzinfo is None:
             earth_date = earth_date.replace(tzinfo=timezone.utc)
+        moon = moon_phase(earth_date.timestamp())
 
-        diff = (earth_date - reference).total_seconds() / 86400
-
-        # Calculate phase (0 = new moon, 0.5 = full moon)
-        synodic_month = 29.530588853
-        phase = (diff % synodic_month) / synodic_month
-
-        # Determine phase name and emoji
-        phases = self._lunar_data["phases"]
-        if phase < 0.0625:
-            phase_data = phases[0]  # New Moon
-        elif phase < 0.1875:
-            phase_data = phases[1]  # Waxing Crescent
-        elif phase < 0.3125:
-            phase_data = phases[2]  # First Quarter
-        elif phase < 0.4375:
-            phase_data = phases[3]  # Waxing Gibbous
-        elif phase < 0.5625:
-            phase_data = phases[4]  # Full Moon
-        elif phase < 0.6875:
-            phase_data = phases[5]  # Waning Gibbous
-        elif phase < 0.8125:
-            phase_data = phases[6]  # Last Quarter
-        elif phase < 0.9375:
-            phase_data = phases[7]  # Waning Crescent
-        else:
-            phase_data = phases[0]  # New Moon
-
-        # Calculate lunar day (1-30)
-        lunar_day = int(phase * 29.53) + 1
-
-        # Calculate illumination percentage
-        illumination = abs(math.cos(phase * 2 * math.pi))
+        # Phase fraction 0 = new moon, 0.5 = full moon, in eight named parts
+        phase_data = self._lunar_data["phases"][moon["phase_octant"]]
 
         return {
-            "phase": phase,
+            "phase": moon["phase"],
             "phase_name": phase_data["name"],
             "phase_emoji": phase_data["emoji"],
-            "lunar_day": lunar_day,
-            "illumination": round(illumination * 100, 1)
+            "lunar_day": int(moon["age_days"]) + 1,
+            "illumination": round(moon["illumination"] * 100, 1),
+            "next_phase": PHASE_KEYS[moon["next_phase_index"]],
+            "next_phase_utc": datetime.fromtimestamp(moon["next_event_utc"], timezone.utc).strftime("%Y-%m-%d %H:%M UTC"),
         }
 
     def _calculate_lunar_time(self, earth_utc: datetime) -> Dict[str, Any]:
@@ -869,6 +835,8 @@ class LunarTimeSensor(AlternativeTimeSensorBase):
             result["phase_name"] = phase_info["phase_name"]
             result["phase_emoji"] = phase_info["phase_emoji"]
             result["illumination"] = phase_info["illumination"]
+            result["next_phase"] = phase_info["next_phase"]
+            result["next_phase_utc"] = phase_info["next_phase_utc"]
             result["full_display"] += f" | {phase_info['phase_emoji']}"
 
         # Add Earth time if enabled
@@ -895,7 +863,7 @@ class LunarTimeSensor(AlternativeTimeSensorBase):
         # Set state to formatted lunar time
         self._state = self._lunar_time.get("full_display", "Unknown")
 
-        _LOGGER.debug(f"Updated Lunar Time to {self._state}")
+        _LOGGER.debug("Updated Lunar Time to %s", self._state)
 
 
 # ============================================
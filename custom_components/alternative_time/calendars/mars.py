@@ -6,15 +6,24 @@ Includes mission sol counters for rover landing sites.
 """
 from __future__ import annotations
 
-import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 from homeassistant.core import HomeAssistant
 
+from ..astro_context import AstroContext
+from ..log_helper import get_logger
+from ..mars_time import SEASON_SPAN, format_hours, jd_tt_from_msd
 from ..sensor import AlternativeTimeSensorBase
+from ..timescales import (
+    SECONDS_PER_DAY,
+    TT_MINUS_TAI,
+    UNIX_EPOCH_JD,
+    get_leap_seconds,
+    tai_to_utc,
+)
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -67,8 +76,7 @@ CALENDAR_INFO = {
         # Physical constants
         "sol_duration_seconds": 88775.244147,  # Mars solar day in Earth seconds
         "tropical_year_sols": 668.5991,        # Mars year in sols
-        "j2000_epoch": 946727935.816,          # J2000 epoch in Unix timestamp
-        "mars_epoch_msd": 44796.0,             # MSD at J2000 epoch
+        # MSD, MTC and Ls come from the shared kernel (mars_time)
 
         # Mars timezones with full descriptions for dropdown
         "timezones": {
@@ -439,6 +447,36 @@ CALENDAR_INFO = {
                 "ko": "지구 UTC 시간도 표시",
             },
         },
+        "show_all_timezones": {
+            "type": "boolean",
+            "default": False,
+            "label": {
+                "en": "Show All Mars Timezones",
+                "de": "Alle Mars-Zeitzonen anzeigen",
+                "es": "Mostrar todas las zonas horarias de Marte",
+                "fr": "Afficher tous les fuseaux horaires martiens",
+                "it": "Mostra tutti i fusi orari marziani",
+                "nl": "Toon alle Mars tijdzones",
+                "pt": "Mostrar todos os fusos horários de Marte",
+                "ru": "Показать все часовые пояса Марса",
+                "ja": "すべての火星タイムゾーンを表示",
+                "zh": "显示所有火星时区",
+                "ko": "모든 화성 시간대 표시",
+            },
+            "description": {
+                "en": "Add the local time of every Mars timezone and all mission sols as attributes",
+                "de": "Ortszeit jeder Mars-Zeitzone und alle Missions-Sols als Attribute hinzufügen",
+                "es": "Añadir la hora local de cada zona horaria de Marte y todos los soles de misión como atributos",
+                "fr": "Ajouter l'heure locale de chaque fuseau martien et tous les sols de mission en attributs",
+                "it": "Aggiungi l'ora locale di ogni fuso marziano e tutti i sol delle missioni come attributi",
+                "nl": "Voeg de lokale tijd van elke Mars tijdzone en alle missie-sols toe als attributen",
+                "pt": "Adicionar a hora local de cada fuso de Marte e todos os sols de missão como atributos",
+                "ru": "Добавить местное время всех часовых поясов Марса и солы всех миссий в атрибуты",
+                "ja": "すべての火星タイムゾーンの地方時と全ミッションのソルを属性に追加",
+                "zh": "将每个火星时区的当地时间和所有任务火星日添加为属性",
+                "ko": "모든 화성 시간대의 현지 시간과 모든 임무 솔을 속성으로 추가",
+            },
+        },
     },
 
     # Additional metadata
@@ -505,6 +543,7 @@ class MarsTimeSensor(AlternativeTimeSensorBase):
         self._show_season = config_defaults.get("show_season", {}).get("default", True)
         self._show_mission_sol = config_defaults.get("show_mission_sol", {}).get("default", True)
         self._show_earth_time = config_defaults.get("show_earth_time", {}).get("default", False)
+        self._show_all_timezones = config_defaults.get("show_all_timezones", {}).get("default", False)
 
         # Mars data
         self._mars_data = CALENDAR_INFO["mars_data"]
@@ -515,8 +554,9 @@ class MarsTimeSensor(AlternativeTimeSensorBase):
         # Initialize state
         self._state = None
         self._mars_time_info: Dict[str, Any] = {}
+        self._next_season_utc: Optional[datetime] = None
 
-        _LOGGER.debug(f"Initialized Mars Time sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Mars Time sensor: %s", self._attr_name)
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -527,7 +567,7 @@ class MarsTimeSensor(AlternativeTimeSensorBase):
         plugin_options = self._get_plugin_options()
 
         if plugin_options:
-            _LOGGER.debug(f"Loading Mars options: {plugin_options}")
+            _LOGGER.debug("Loading Mars options: %s", plugin_options)
 
             # Apply options using set_options method
             self.set_options(
@@ -535,7 +575,8 @@ class MarsTimeSensor(AlternativeTimeSensorBase):
                 display_format=plugin_options.get("display_format"),
                 show_season=plugin_options.get("show_season"),
                 show_mission_sol=plugin_options.get("show_mission_sol"),
-                show_earth_time=plugin_options.get("show_earth_time")
+                show_earth_time=plugin_options.get("show_earth_time"),
+                show_all_timezones=plugin_options.get("show_all_timezones")
             )
 
         self._options_loaded = True
@@ -547,9 +588,10 @@ class MarsTimeSensor(AlternativeTimeSensorBase):
         # Load options after entity is registered
         self._load_options()
 
-        _LOGGER.debug(f"Mars sensor added to hass with options: "
-                     f"timezone={self._mars_timezone}, format={self._display_format}, "
-                     f"season={self._show_season}, mission_sol={self._show_mission_sol}")
+        _LOGGER.debug(
+            "Mars sensor added to hass with options: timezone=%s, format=%s, season=%s, mission_sol=%s",
+            self._mars_timezone, self._display_format, self._show_season, self._show_mission_sol,
+        )
 
     def set_options(
         self,
@@ -558,31 +600,36 @@ class MarsTimeSensor(AlternativeTimeSensorBase):
         display_format: Optional[str] = None,
         show_season: Optional[bool] = None,
         show_mission_sol: Optional[bool] = None,
-        show_earth_time: Optional[bool] = None
+        show_earth_time: Optional[bool] = None,
+        show_all_timezones: Optional[bool] = None
     ) -> None:
         """Set calendar options from config flow."""
         if timezone is not None:
             if timezone in self._mars_data.get("timezones", {}):
                 self._mars_timezone = timezone
-                _LOGGER.debug(f"Set timezone to: {timezone}")
+                _LOGGER.debug("Set timezone to: %s", timezone)
             else:
-                _LOGGER.warning(f"Invalid timezone: {timezone}, keeping {self._mars_timezone}")
+                _LOGGER.warning("Invalid timezone: %s, keeping %s", timezone, self._mars_timezone)
 
         if display_format is not None and display_format in ["time_only", "time_with_sol", "full_date"]:
             self._display_format = display_format
-            _LOGGER.debug(f"Set display_format to: {display_format}")
+            _LOGGER.debug("Set display_format to: %s", display_format)
 
         if show_season is not None:
             self._show_season = bool(show_season)
-            _LOGGER.debug(f"Set show_season to: {show_season}")
+            _LOGGER.debug("Set show_season to: %s", show_season)
 
         if show_mission_sol is not None:
             self._show_mission_sol = bool(show_mission_sol)
-            _LOGGER.debug(f"Set show_mission_sol to: {show_mission_sol}")
+            _LOGGER.debug("Set show_mission_sol to: %s", show_mission_sol)
 
         if show_earth_time is not None:
             self._show_earth_time = bool(show_earth_time)
-            _LOGGER.debug(f"Set show_earth_time to: {show_earth_time}")
+            _LOGGER.debug("Set show_earth_time to: %s", show_earth_time)
+
+        if show_all_timezones is not None:
+            self._show_all_timezones = bool(show_all_timezones)
+            _LOGGER.debug("Set show_all_timezones to: %s", show_all_timezones)
 
     # ---------- HA properties ----------
 
@@ -611,46 +658,35 @@ class MarsTimeSensor(AlternativeTimeSensorBase):
             attrs["config_show_season"] = self._show_season
             attrs["config_show_mission_sol"] = self._show_mission_sol
             attrs["config_show_earth_time"] = self._show_earth_time
+            attrs["config_show_all_timezones"] = self._show_all_timezones
 
         return attrs
 
     # ---------- Calculation methods ----------
 
-    def _calculate_mars_time(self, earth_utc: datetime) -> Dict[str, Any]:
-        """Calculate Mars time from Earth UTC."""
+    def _calculate_mars_time(self, context: AstroContext) -> Dict[str, Any]:
+        """Calculate Mars time from the tick's astronomical context."""
         # Get timezone data
         tz_data = self._mars_data["timezones"].get(self._mars_timezone, self._mars_data["timezones"]["MTC"])
         timezone_offset = tz_data["longitude"] / 15.0  # Convert degrees to hours
 
-        # Calculate MSD (Mars Sol Date)
-        unix_timestamp = earth_utc.timestamp()
-        seconds_since_j2000 = unix_timestamp - self._mars_data["j2000_epoch"]
-        sols_since_j2000 = seconds_since_j2000 / self._mars_data["sol_duration_seconds"]
-        msd = self._mars_data["mars_epoch_msd"] + sols_since_j2000
-
-        # Calculate MTC (Mars Coordinated Time)
-        sol_fraction = msd % 1.0
-        mtc_hours = int(sol_fraction * 24)
-        mtc_minutes = int((sol_fraction * 24 * 60) % 60)
-        mtc_seconds = int((sol_fraction * 24 * 60 * 60) % 60)
-        mtc_time = f"{mtc_hours:02d}:{mtc_minutes:02d}:{mtc_seconds:02d}"
-
-        # Calculate local Mars time
-        local_hours = int((sol_fraction * 24 + timezone_offset) % 24)
-        local_time = f"{local_hours:02d}:{mtc_minutes:02d}:{mtc_seconds:02d}"
-
-        # Calculate solar longitude (Ls) for seasons
-        # Simplified calculation
-        mars_year_fraction = (msd / self._mars_data["tropical_year_sols"]) % 1.0
-        ls = mars_year_fraction * 360.0
-
-        # Determine season
+        # MSD, MTC and Ls from the shared Mars time kernel
+        mars = context.mars
+        msd = mars.msd
+        mtc_time = format_hours(mars.mtc_hours)
+        local_time = format_hours(mars.local_mean_time(tz_data["longitude"]))
+
+        # Areocentric solar longitude (Allison & McEwen 2000)
+        ls = mars.solar_longitude
+
+        # Season and Mars year from the precomputed season-boundary table
         season = None
+        season_info = mars.season
+        season_index = season_info["season"] if season_info else int(ls // SEASON_SPAN) % 4
         if self._show_season:
-            for season_key, season_data in self._mars_data["seasons"].items():
-                if season_data["ls_start"] <= ls < season_data["ls_end"]:
-                    season = self._translate_dict(season_data["name"], "Northern Spring")
-                    break
+            season_data = list(self._mars_data["seasons"].values())[season_index]
+            season = self._translate_dict(season_data["name"], "Northern Spring")
+        self._next_season_utc = self._msd_to_utc(season_info["next_season_start"]) if season_info else None
 
         # Calculate mission sol if applicable
         mission_sol = None
@@ -671,20 +707,44 @@ class MarsTimeSensor(AlternativeTimeSensorBase):
             "timezone_name": tz_data["name"],
             "timezone_offset": round(timezone_offset, 2),
             "solar_longitude": round(ls, 1),
+            "local_true_solar_time": format_hours(mars.local_true_time(tz_data["longitude"])),
+            "equation_of_time_minutes": round(mars.equation_of_time_hours * 60.0, 2),
         }
 
         if season and self._show_season:
             result["season"] = season
+            if season_info:
+                result["mars_year"] = season_info["mars_year"]
+                result["sols_until_next_season"] = round(season_info["sols_until_next_season"], 2)
+                result["next_season_utc"] = self._next_season_utc.isoformat()
 
         if mission_sol is not None and mission_name and self._show_mission_sol:
             result["mission_sol"] = mission_sol
             result["mission_name"] = mission_name
 
+        if self._show_all_timezones:
+            # Every zone and mission from the same MSD
+            zones = self._mars_data["timezones"]
+            local_hours = mars.local_mean_times(zone["longitude"] for zone in zones.values())
+            result["all_timezones"] = {abbr: format_hours(hours) for abbr, hours in zip(zones, local_hours)}
+            result["mission_sols"] = {
+                name: int(msd - landing_msd) for name, landing_msd in self._mars_data["missions"].items()
+            }
+
         if self._show_earth_time:
-            result["earth_time_utc"] = earth_utc.strftime("%Y-%m-%d %H:%M:%S UTC")
+            result["earth_time_utc"] = context.when.strftime("%Y-%m-%d %H:%M:%S UTC")
 
         return result
 
+    def _msd_to_utc(self, msd: float) -> datetime:
+        """Convert a Mars Sol Date to an aware UTC datetime."""
+        tai = (jd_tt_from_msd(msd) - UNIX_EPOCH_JD) * SECONDS_PER_DAY - TT_MINUS_TAI
+        return datetime.fromtimestamp(tai_to_utc(tai, get_leap_seconds(self._hass)), timezone.utc)
+
+    def next_change(self) -> Optional[datetime]:
+        """Return the start of the next Mars season."""
+        return self._next_season_utc
+
     def _translate_dict(self, data: Dict[str, str], default: str) -> str:
         """Translate from a dictionary based on current language."""
         if isinstance(data, dict):
@@ -712,8 +772,7 @@ class MarsTimeSensor(AlternativeTimeSensorBase):
         if not self._options_loaded:
             self._load_options()
 
-        now = datetime.utcnow()
-        self._mars_time_info = self._calculate_mars_time(now)
+        self._mars_time_info = self._calculate_mars_time(self.astro_context())
 
         # Format state based on display_format
         if self._display_format == "time_only":
@@ -731,7 +790,7 @@ class MarsTimeSensor(AlternativeTimeSensorBase):
                 mission_info = f" (Sol {self._mars_time_info['mission_sol']})"
             self._state = f"MSD {sol}, {self._mars_time_info['local_time']} {self._mars_timezone}{mission_info}"
 
-        _LOGGER.debug(f"Updated Mars Time to {self._state}")
+        _LOGGER.debug("Updated Mars Time to %s", self._state)
 
 
 # ============================================
@@ -13,15 +13,15 @@ Galactic Standard Year (GSY):
 """
 from __future__ import annotations
 
-import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -393,7 +393,7 @@ class MassEffectGalacticStandardSensor(AlternativeTimeSensorBase):
         # Flag for options loading
         self._options_loaded = False
 
-        _LOGGER.debug(f"Initialized Mass Effect sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Mass Effect sensor: %s", self._attr_name)
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -404,7 +404,7 @@ class MassEffectGalacticStandardSensor(AlternativeTimeSensorBase):
         plugin_options = self._get_plugin_options()
 
         if plugin_options:
-            _LOGGER.debug(f"Loading Mass Effect options: {plugin_options}")
+            _LOGGER.debug("Loading Mass Effect options: %s", plugin_options)
 
             # Apply options using set_options method
             self.set_options(
@@ -426,9 +426,10 @@ class MassEffectGalacticStandardSensor(AlternativeTimeSensorBase):
         # Load options after entity is registered
         self._load_options()
 
-        _LOGGER.debug(f"Mass Effect sensor added to hass with options: "
-                     f"gst={self._enable_gst}, precision={self._precision}, "
-                     f"gsy={self._enable_gsy}, citadel={self._show_citadel_time}")
+        _LOGGER.debug(
+            "Mass Effect sensor added to hass with options: gst=%s, precision=%s, gsy=%s, citadel=%s",
+            self._enable_gst, self._precision, self._enable_gsy, self._show_citadel_time,
+        )
 
     @property
     def state(self):
@@ -461,34 +462,37 @@ class MassEffectGalacticStandardSensor(AlternativeTimeSensorBase):
         """Set calendar options from config flow."""
         if enable_gst is not None:
             self._enable_gst = bool(enable_gst)
-            _LOGGER.debug(f"Set enable_gst to: {enable_gst}")
+            _LOGGER.debug("Set enable_gst to: %s", enable_gst)
 
         if precision is not None and precision in ["second", "centisecond", "millisecond"]:
             self._precision = precision
-            _LOGGER.debug(f"Set precision to: {precision}")
+            _LOGGER.debug("Set precision to: %s", precision)
 
         if show_period is not None:
             self._show_period = bool(show_period)
-            _LOGGER.debug(f"Set show_period to: {show_period}")
+            _LOGGER.debug("Set show_period to: %s", show_period)
 
         if enable_gsy is not None:
             self._enable_gsy = bool(enable_gsy)
-            _LOGGER.debug(f"Set enable_gsy to: {enable_gsy}")
+            _LOGGER.debug("Set enable_gsy to: %s", enable_gsy)
 
         if epoch_gs0_utc is not None:
             self._epoch_gs0_utc = str(epoch_gs0_utc)
-            _LOGGER.debug(f"Set epoch_gs0_utc to: {epoch_gs0_utc}")
+            _LOGGER.debug("Set epoch_gs0_utc to: %s", epoch_gs0_utc)
 
         if gsy_length_days is not None:
             if 300 <= gsy_length_days <= 500:
                 self._gsy_length_days = float(gsy_length_days)
-                _LOGGER.debug(f"Set gsy_length_days to: {gsy_length_days}")
+                _LOGGER.debug("Set gsy_length_days to: %s", gsy_length_days)
             else:
-                _LOGGER.warning(f"Invalid gsy_length_days: {gsy_length_days}, keeping {self._gsy_length_days}")
+                _LOGGER.warning(
+                    "Invalid gsy_length_days: %s, keeping %s",
+                    gsy_length_days, self._gsy_length_days,
+                )
 
         if show_citadel_time is not None:
             self._show_citadel_time = bool(show_citadel_time)
-            _LOGGER.debug(f"Set show_citadel_time to: {show_citadel_time}")
+            _LOGGER.debug("Set show_citadel_time to: %s", show_citadel_time)
 
     # ---------- Helper methods ----------
     def _parse_epoch(self, txt: str) -> datetime:
@@ -645,12 +649,12 @@ class MassEffectGalacticStandardSensor(AlternativeTimeSensorBase):
 
             self._data = data
 
-            _LOGGER.debug(f"Updated Mass Effect to: {self._state}")
+            _LOGGER.debug("Updated Mass Effect to: %s", self._state)
 
         except Exception as exc:
-            _LOGGER.exception("Failed to update Mass Effect Galactic Standard: %s", exc)
             self._state = "Error"
             self._data = {"error": str(exc)}
+            raise
 
 
 # ============================================
@@ -1,15 +1,15 @@
 """Maya Calendar implementation - Version 2.6."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -343,7 +343,7 @@ class MayaCalendarSensor(AlternativeTimeSensorBase):
         self._maya_date = {}
         self._state = "Initializing..."
 
-        _LOGGER.debug(f"Initialized Maya Calendar sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Maya Calendar sensor: %s", self._attr_name)
 
     def _load_options(self) -> None:
         """Load configuration options from config entry."""
@@ -360,15 +360,20 @@ class MayaCalendarSensor(AlternativeTimeSensorBase):
                 self._correlation = options.get("correlation", self._correlation)
                 self._format = options.get("format", self._format)
 
-                _LOGGER.debug(f"Maya sensor loaded options: meanings={self._show_meanings}, "
-                            f"glyphs={self._show_glyphs}, venus={self._show_venus_cycle}, "
-                            f"correlation={self._correlation}, format={self._format}")
+                _LOGGER.debug(
+                    "Maya sensor loaded options: meanings=%s, glyphs=%s, venus=%s, correlation=%s, format=%s",
+                    self._show_meanings,
+                    self._show_glyphs,
+                    self._show_venus_cycle,
+                    self._correlation,
+                    self._format,
+                )
             else:
                 _LOGGER.debug("Maya sensor using default options - no custom options found")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"Maya sensor could not load options yet: {e}")
+            _LOGGER.debug("Maya sensor could not load options yet: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -601,4 +606,4 @@ class MayaCalendarSensor(AlternativeTimeSensorBase):
         # Set state to formatted Maya date
         self._state = self._maya_date["formatted"]
 
-        _LOGGER.debug(f"Updated Maya Calendar to {self._state}")
+        _LOGGER.debug("Updated Maya Calendar to %s", self._state)
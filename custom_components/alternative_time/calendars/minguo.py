@@ -1,15 +1,15 @@
 """Minguo Calendar (Republic of China/Taiwan) implementation - Version 2.5."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -331,7 +331,7 @@ class MinguoCalendarSensor(AlternativeTimeSensorBase):
         # Track if options have been loaded
         self._options_loaded = False
 
-        _LOGGER.debug(f"Initialized Minguo Calendar sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Minguo Calendar sensor: %s", self._attr_name)
 
     def _load_options(self) -> None:
         """Load configuration options from config entry."""
@@ -348,15 +348,20 @@ class MinguoCalendarSensor(AlternativeTimeSensorBase):
                 self._format = options.get("format", self._format)
                 self._show_before_epoch = options.get("show_before_epoch", self._show_before_epoch)
 
-                _LOGGER.debug(f"Minguo calendar loaded options: language={self._display_language}, "
-                            f"chinese_numbers={self._use_chinese_numbers}, holidays={self._show_holidays}, "
-                            f"format={self._format}, before_epoch={self._show_before_epoch}")
+                _LOGGER.debug(
+                    "Minguo calendar loaded options: language=%s, chinese_numbers=%s, holidays=%s, format=%s, before_epoch=%s",
+                    self._display_language,
+                    self._use_chinese_numbers,
+                    self._show_holidays,
+                    self._format,
+                    self._show_before_epoch,
+                )
             else:
                 _LOGGER.debug("Minguo calendar using default options - no custom options found")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"Minguo calendar could not load options yet: {e}")
+            _LOGGER.debug("Minguo calendar could not load options yet: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -561,4 +566,4 @@ class MinguoCalendarSensor(AlternativeTimeSensorBase):
         # Set state to formatted date
         self._state = self._minguo_date["formatted"]
 
-        _LOGGER.debug(f"Updated Minguo Calendar to {self._state}")
+        _LOGGER.debug("Updated Minguo Calendar to %s", self._state)
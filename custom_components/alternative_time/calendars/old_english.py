@@ -5,15 +5,15 @@ Used in England from 1155 to 1752 before the Gregorian calendar reform.
 """
 from __future__ import annotations
 
-import logging
 from datetime import date, datetime
 from typing import Any, Dict, Optional
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -466,15 +466,20 @@ class OldEnglishCalendarSensor(AlternativeTimeSensorBase):
                 self._show_events = options.get("show_events", self._show_events)
                 self._year_style = options.get("year_style", self._year_style)
 
-                _LOGGER.debug(f"Old English sensor loaded options: dual={self._show_dual_date}, "
-                            f"regnal={self._show_regnal_year}, quarter={self._show_quarter_days}, "
-                            f"events={self._show_events}, style={self._year_style}")
+                _LOGGER.debug(
+                    "Old English sensor loaded options: dual=%s, regnal=%s, quarter=%s, events=%s, style=%s",
+                    self._show_dual_date,
+                    self._show_regnal_year,
+                    self._show_quarter_days,
+                    self._show_events,
+                    self._year_style,
+                )
             else:
                 _LOGGER.debug("Old English sensor using default options")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"Old English sensor could not load options: {e}")
+            _LOGGER.debug("Old English sensor could not load options: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -796,4 +801,4 @@ class OldEnglishCalendarSensor(AlternativeTimeSensorBase):
         # Set state to formatted date
         self._state = self._old_english_date["formatted"]
 
-        _LOGGER.debug(f"Updated Old English Calendar to {self._state}")
+        _LOGGER.debug("Updated Old English Calendar to %s", self._state)
@@ -1,15 +1,16 @@
 """Rivendell Calendar (Elven/Imladris) implementation - Version 3.0."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
+from ..moon_phases import moon_phase
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -472,7 +473,7 @@ class RivendellCalendarSensor(AlternativeTimeSensorBase):
         self._state = None
         self._elven_date = {}
 
-        _LOGGER.debug(f"Initialized Rivendell Calendar sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Rivendell Calendar sensor: %s", self._attr_name)
 
     def set_options(self, options: Dict[str, Any]) -> None:
         """Set options from config flow."""
@@ -483,9 +484,14 @@ class RivendellCalendarSensor(AlternativeTimeSensorBase):
             self._show_moon_phases = options.get("show_moon_phases", self._show_moon_phases)
             self._age_reckoning = options.get("age_reckoning", self._age_reckoning)
 
-            _LOGGER.debug(f"Rivendell sensor options updated: language_mode={self._language_mode}, "
-                         f"show_yen={self._show_yen}, show_star_signs={self._show_star_signs}, "
-                         f"show_moon_phases={self._show_moon_phases}, age_reckoning={self._age_reckoning}")
+            _LOGGER.debug(
+                "Rivendell sensor options updated: language_mode=%s, show_yen=%s, show_star_signs=%s, show_moon_phases=%s, age_reckoning=%s",
+                self._language_mode,
+                self._show_yen,
+                self._show_star_signs,
+                self._show_moon_phases,
+                self._age_reckoning,
+            )
 
     @property
     def state(self):
@@ -581,30 +587,18 @@ class RivendellCalendarSensor(AlternativeTimeSensorBase):
     def _is_durins_day(self, date: datetime) -> bool:
         """Check if it's Durin's Day (first day of last moon of autumn)."""
         if date.month == 10 and 20 <= date.day <= 31:
-            day_in_lunar = date.day % 29.5
-            return day_in_lunar < 2
+            return moon_phase(date.timestamp())["age_days"] < 1.0
         return False
 
     def _get_sindarin_moon_phase(self, date: datetime) -> str:
-        """Get moon phase in Sindarin."""
-        day_in_lunar = date.day % 29.5
-
-        if day_in_lunar < 2:
-            return "🌑 Ithil Dû (Dark Moon)"
-        elif day_in_lunar < 7:
-            return "🌒 Ithil Orthad (Rising Moon)"
-        elif day_in_lunar < 9:
-            return "🌓 Ithil Perian (Half Moon)"
-        elif day_in_lunar < 14:
-            return "🌔 Ithil Síla (Bright Moon)"
-        elif day_in_lunar < 16:
-            return "🌕 Ithil Pennas (Full Moon)"
-        elif day_in_lunar < 21:
-            return "🌖 Ithil Dant (Falling Moon)"
-        elif day_in_lunar < 23:
-            return "🌗 Ithil Harn (Wounded Moon)"
-        else:
-            return "🌘 Ithil Fuin (Shadow Moon)"
+        """Get moon phase in Sindarin from the shared moon phase table."""
+        names = (
+            "🌑 Ithil Dû (Dark Moon)", "🌒 Ithil Orthad (Rising Moon)",
+            "🌓 Ithil Perian (Half Moon)", "🌔 Ithil Síla (Bright Moon)",
+            "🌕 Ithil Pennas (Full Moon)", "🌖 Ithil Dant (Falling Moon)",
+            "🌗 Ithil Harn (Wounded Moon)", "🌘 Ithil Fuin (Shadow Moon)",
+        )
+        return names[moon_phase(date.timestamp())["phase_octant"]]
 
     def _get_elven_greeting(self, hour: int) -> str:
         """Get appropriate Elven greeting for time of day."""
@@ -682,7 +676,7 @@ class RivendellCalendarSensor(AlternativeTimeSensorBase):
         star_sign = self._elven_data["star_signs"][earth_date.month - 1] if self._show_star_signs else ""
 
         # Moon phases in Sindarin
-        moon_phase = self._get_sindarin_moon_phase(earth_date) if self._show_moon_phases else ""
+        phase_name = self._get_sindarin_moon_phase(earth_date) if self._show_moon_phases else ""
 
         # Determine Age
         age_names = {
@@ -737,8 +731,8 @@ class RivendellCalendarSensor(AlternativeTimeSensorBase):
         if star_sign:
             result["star_sign"] = f"✨ {star_sign}"
 
-        if moon_phase:
-            result["moon_phase"] = moon_phase
+        if phase_name:
+            result["moon_phase"] = phase_name
 
         if special_day:
             result["special_day"] = special_day
@@ -759,4 +753,4 @@ class RivendellCalendarSensor(AlternativeTimeSensorBase):
         else:
             self._state = self._elven_date["full_date"]
 
-        _LOGGER.debug(f"Updated Rivendell calendar to {self._state}")
+        _LOGGER.debug("Updated Rivendell calendar to %s", self._state)
@@ -1,15 +1,15 @@
 """Roman Calendar implementation - Version 2.5."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -366,7 +366,7 @@ class RomanCalendarSensor(AlternativeTimeSensorBase):
         # Track if options have been loaded
         self._options_loaded = False
 
-        _LOGGER.debug(f"Initialized Roman Calendar sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Roman Calendar sensor: %s", self._attr_name)
 
     def _load_options(self) -> None:
         """Load configuration options from config entry."""
@@ -384,16 +384,21 @@ class RomanCalendarSensor(AlternativeTimeSensorBase):
                 self._format = options.get("format", self._format)
                 self._year_system = options.get("year_system", self._year_system)
 
-                _LOGGER.debug(f"Roman sensor loaded options: latin={self._show_latin}, "
-                            f"festivals={self._show_festivals}, hours={self._show_hours}, "
-                            f"nundinae={self._show_nundinae}, format={self._format}, "
-                            f"year_system={self._year_system}")
+                _LOGGER.debug(
+                    "Roman sensor loaded options: latin=%s, festivals=%s, hours=%s, nundinae=%s, format=%s, year_system=%s",
+                    self._show_latin,
+                    self._show_festivals,
+                    self._show_hours,
+                    self._show_nundinae,
+                    self._format,
+                    self._year_system,
+                )
             else:
                 _LOGGER.debug("Roman sensor using default options - no custom options found")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"Roman sensor could not load options yet: {e}")
+            _LOGGER.debug("Roman sensor could not load options yet: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -612,4 +617,4 @@ class RomanCalendarSensor(AlternativeTimeSensorBase):
         # Set state to formatted Roman date
         self._state = self._roman_date["full_date"]
 
-        _LOGGER.debug(f"Updated Roman Calendar to {self._state}")
+        _LOGGER.debug("Updated Roman Calendar to %s", self._state)
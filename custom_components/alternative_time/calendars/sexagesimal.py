@@ -1,15 +1,15 @@
 """Sexagesimal Cycle (干支/Ganzhi) Calendar implementation - Version 2.5.1."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -286,8 +286,11 @@ class SexagesimalCycleSensor(AlternativeTimeSensorBase):
         # Flag to track if options have been loaded
         self._options_loaded = False
 
-        _LOGGER.debug(f"Initialized Sexagesimal Cycle sensor: {self._attr_name}")
-        _LOGGER.debug(f"  Default settings: cycle={self._cycle_type}, format={self._display_format}, zodiac={self._show_zodiac}")
+        _LOGGER.debug("Initialized Sexagesimal Cycle sensor: %s", self._attr_name)
+        _LOGGER.debug(
+            "  Default settings: cycle=%s, format=%s, zodiac=%s",
+            self._cycle_type, self._display_format, self._show_zodiac,
+        )
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -302,13 +305,16 @@ class SexagesimalCycleSensor(AlternativeTimeSensorBase):
                 self._display_format = options.get("display_format", self._display_format)
                 self._show_zodiac = options.get("show_zodiac", self._show_zodiac)
 
-                _LOGGER.debug(f"Sexagesimal sensor loaded options: cycle={self._cycle_type}, format={self._display_format}, zodiac={self._show_zodiac}")
+                _LOGGER.debug(
+                    "Sexagesimal sensor loaded options: cycle=%s, format=%s, zodiac=%s",
+                    self._cycle_type, self._display_format, self._show_zodiac,
+                )
             else:
                 _LOGGER.debug("Sexagesimal sensor using default options - no custom options found")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"Sexagesimal sensor could not load options yet: {e}")
+            _LOGGER.debug("Sexagesimal sensor could not load options yet: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -317,9 +323,6 @@ class SexagesimalCycleSensor(AlternativeTimeSensorBase):
         # Try to load options now that IDs should be set
         self._load_options()
 
-        # Perform initial update
-        self.update()
-
     @property
     def state(self):
         """Return the state of the sensor."""
@@ -516,10 +519,10 @@ class SexagesimalCycleSensor(AlternativeTimeSensorBase):
             # Set state to formatted cycle
             self._state = self._cycle_info.get("formatted", "甲子")
 
-            _LOGGER.debug(f"Updated Sexagesimal Cycle to {self._state}")
-        except Exception as e:
-            _LOGGER.error(f"Error updating Sexagesimal cycle: {e}", exc_info=True)
+            _LOGGER.debug("Updated Sexagesimal Cycle to %s", self._state)
+        except Exception:
             self._state = "错误"
+            raise
 
     async def async_update(self) -> None:
         """Update sensor asynchronously."""
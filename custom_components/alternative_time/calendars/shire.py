@@ -1,15 +1,16 @@
 """Shire Calendar (Hobbit/LOTR) implementation - Version 3.0."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
+from ..moon_phases import moon_phase
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -396,7 +397,7 @@ class ShireCalendarSensor(AlternativeTimeSensorBase):
         self._state = None
         self._shire_date = {}
 
-        _LOGGER.debug(f"Initialized Shire Calendar sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Shire Calendar sensor: %s", self._attr_name)
 
     def set_options(self, options: Dict[str, Any]) -> None:
         """Set options from config flow."""
@@ -406,9 +407,10 @@ class ShireCalendarSensor(AlternativeTimeSensorBase):
             self._show_name_day = options.get("show_name_day", self._show_name_day)
             self._display_format = options.get("display_format", self._display_format)
 
-            _LOGGER.debug(f"Shire sensor options updated: show_meals={self._show_meals}, "
-                         f"show_moon={self._show_moon}, show_name_day={self._show_name_day}, "
-                         f"display_format={self._display_format}")
+            _LOGGER.debug(
+                "Shire sensor options updated: show_meals=%s, show_moon=%s, show_name_day=%s, display_format=%s",
+                self._show_meals, self._show_moon, self._show_name_day, self._display_format,
+            )
 
     @property
     def state(self):
@@ -454,25 +456,13 @@ class ShireCalendarSensor(AlternativeTimeSensorBase):
                 return period
         return "Time for adventures"
 
-    def _get_moon_phase(self, day: int) -> str:
-        """Calculate simplified moon phase."""
-        day_in_lunar = day % 29.5
-        if day_in_lunar < 2:
-            return "🌑 New Moon"
-        elif day_in_lunar < 7:
-            return "🌒 Waxing Crescent"
-        elif day_in_lunar < 9:
-            return "🌓 First Quarter"
-        elif day_in_lunar < 14:
-            return "🌔 Waxing Gibbous"
-        elif day_in_lunar < 16:
-            return "🌕 Full Moon"
-        elif day_in_lunar < 21:
-            return "🌖 Waning Gibbous"
-        elif day_in_lunar < 23:
-            return "🌗 Last Quarter"
-        else:
-            return "🌘 Waning Crescent"
+    def _get_moon_phase(self, date: datetime) -> str:
+        """Get the moon phase from the shared moon phase table."""
+        names = (
+            "🌑 New Moon", "🌒 Waxing Crescent", "🌓 First Quarter", "🌔 Waxing Gibbous",
+            "🌕 Full Moon", "🌖 Waning Gibbous", "🌗 Last Quarter", "🌘 Waning Crescent",
+        )
+        return names[moon_phase(date.timestamp())["phase_octant"]]
 
     def _format_date(self, shire_date: Dict[str, Any]) -> str:
         """Format the date according to display_format setting."""
@@ -516,7 +506,7 @@ class ShireCalendarSensor(AlternativeTimeSensorBase):
         time_of_day = self._get_time_period(earth_date.hour)
 
         # Moon phase
-        moon_phase = self._get_moon_phase(earth_date.day) if self._show_moon else ""
+        phase_name = self._get_moon_phase(earth_date) if self._show_moon else ""
 
         # Hobbit name day
         name_day = self._shire_data["name_days"].get(shire_day, "") if self._show_name_day else ""
@@ -538,8 +528,8 @@ class ShireCalendarSensor(AlternativeTimeSensorBase):
         if meal_data:
             result["meal_time"] = f"{meal_data['emoji']} {meal_data['name']}"
 
-        if moon_phase:
-            result["moon_phase"] = moon_phase
+        if phase_name:
+            result["moon_phase"] = phase_name
 
         if name_day:
             result["hobbit_name_day"] = f"Name day of {name_day}"
@@ -554,4 +544,4 @@ class ShireCalendarSensor(AlternativeTimeSensorBase):
         # Set state to formatted Shire date
         self._state = self._format_date(self._shire_date)
 
-        _LOGGER.debug(f"Updated Shire Calendar to {self._state}")
+        _LOGGER.debug("Updated Shire Calendar to %s", self._state)
@@ -9,16 +9,24 @@ Reference: https://aa.usno.navy.mil/faq/GAST
 """
 from __future__ import annotations
 
-import logging
 import math
-from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, List, Sequence, Tuple
 
 from homeassistant.core import HomeAssistant
 
+from ..astro_context import J2000_JD, AstroContext
+from ..log_helper import get_logger
+from ..nutation import NUTATION_IAU2000B, NUTATION_STANDARD
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - numpy ships with Home Assistant
+    np = None
+    HAS_NUMPY = False
+
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -27,9 +35,6 @@ _LOGGER = logging.getLogger(__name__)
 # Update interval in seconds (1 second for live sidereal time)
 UPDATE_INTERVAL = 1
 
-# J2000.0 epoch as Julian Date
-J2000_JD = 2451545.0
-
 # Complete calendar information for auto-discovery
 CALENDAR_INFO = {
     "id": "sidereal",
@@ -303,6 +308,38 @@ CALENDAR_INFO = {
                 "ko": "사용자 정의 경도(도 단위, -180~+180, 동쪽 양수). HA 위치가 비활성화된 경우에만 사용."
             }
         },
+        "observers": {
+            "type": "text",
+            "default": "",
+            "label": {
+                "en": "Additional Observers",
+                "de": "Weitere Beobachter",
+                "es": "Observadores Adicionales",
+                "fr": "Observateurs Supplémentaires",
+                "it": "Osservatori Aggiuntivi",
+                "nl": "Extra Waarnemers",
+                "pl": "Dodatkowi Obserwatorzy",
+                "pt": "Observadores Adicionais",
+                "ru": "Дополнительные наблюдатели",
+                "ja": "追加の観測地",
+                "zh": "其他观测点",
+                "ko": "추가 관측지"
+            },
+            "description": {
+                "en": "Named sites as name=longitude, separated by semicolons (East positive), e.g. La Palma=-17.88; Siding Spring=149.07",
+                "de": "Benannte Standorte als Name=Längengrad, durch Semikolons getrennt (Ost positiv), z. B. La Palma=-17.88; Siding Spring=149.07",
+                "es": "Sitios con nombre como nombre=longitud, separados por punto y coma (Este positivo), p. ej. La Palma=-17.88; Siding Spring=149.07",
+                "fr": "Sites nommés sous la forme nom=longitude, séparés par des points-virgules (Est positif), p. ex. La Palma=-17.88; Siding Spring=149.07",
+                "it": "Siti con nome come nome=longitudine, separati da punto e virgola (Est positivo), es. La Palma=-17.88; Siding Spring=149.07",
+                "nl": "Benoemde locaties als naam=lengtegraad, gescheiden door puntkomma's (Oost positief), bijv. La Palma=-17.88; Siding Spring=149.07",
+                "pl": "Nazwane miejsca jako nazwa=długość, oddzielone średnikami (wschód dodatni), np. La Palma=-17.88; Siding Spring=149.07",
+                "pt": "Locais com nome como nome=longitude, separados por ponto e vírgula (Leste positivo), ex. La Palma=-17.88; Siding Spring=149.07",
+                "ru": "Именованные места в виде имя=долгота через точку с запятой (восток положительный), например La Palma=-17.88; Siding Spring=149.07",
+                "ja": "名前=経度の形式でセミコロン区切り（東が正）、例: La Palma=-17.88; Siding Spring=149.07",
+                "zh": "以 名称=经度 表示的观测点，用分号分隔（东为正），例如 La Palma=-17.88; Siding Spring=149.07",
+                "ko": "이름=경도 형식, 세미콜론으로 구분(동쪽 양수), 예: La Palma=-17.88; Siding Spring=149.07"
+            }
+        },
         "display_format": {
             "type": "select",
             "default": "hms",
@@ -400,6 +437,42 @@ CALENDAR_INFO = {
                 "ko": "GAST와 GMST의 차이(장동 보정) 표시"
             }
         },
+        "nutation_model": {
+            "type": "select",
+            "default": NUTATION_STANDARD,
+            "options": [
+                {"value": NUTATION_STANDARD, "label": {"en": "Standard (4 terms)", "de": "Standard (4 Terme)", "es": "Estándar (4 términos)", "fr": "Standard (4 termes)", "it": "Standard (4 termini)", "nl": "Standaard (4 termen)", "pl": "Standardowy (4 wyrazy)", "pt": "Padrão (4 termos)", "ru": "Стандартная (4 члена)", "ja": "標準（4項）", "zh": "标准（4项）", "ko": "표준(4항)"}},
+                {"value": NUTATION_IAU2000B, "label": {"en": "IAU 2000B (77 terms)", "de": "IAU 2000B (77 Terme)", "es": "IAU 2000B (77 términos)", "fr": "UAI 2000B (77 termes)", "it": "IAU 2000B (77 termini)", "nl": "IAU 2000B (77 termen)", "pl": "IAU 2000B (77 wyrazów)", "pt": "IAU 2000B (77 termos)", "ru": "МАС 2000B (77 членов)", "ja": "IAU 2000B（77項）", "zh": "IAU 2000B（77项）", "ko": "IAU 2000B(77항)"}}
+            ],
+            "label": {
+                "en": "Nutation Model",
+                "de": "Nutationsmodell",
+                "es": "Modelo de Nutación",
+                "fr": "Modèle de Nutation",
+                "it": "Modello di Nutazione",
+                "nl": "Nutatiemodel",
+                "pl": "Model Nutacji",
+                "pt": "Modelo de Nutação",
+                "ru": "Модель нутации",
+                "ja": "章動モデル",
+                "zh": "章动模型",
+                "ko": "장동 모델"
+            },
+            "description": {
+                "en": "IAU 2000B uses IAU 2006 GMST and the 77-term nutation series (GAST to better than 1 ms)",
+                "de": "IAU 2000B nutzt IAU-2006-GMST und die Nutationsreihe mit 77 Termen (GAST besser als 1 ms)",
+                "es": "IAU 2000B usa GMST IAU 2006 y la serie de nutación de 77 términos (GAST mejor que 1 ms)",
+                "fr": "UAI 2000B utilise le GMST UAI 2006 et la série de nutation à 77 termes (GAST à mieux que 1 ms)",
+                "it": "IAU 2000B usa GMST IAU 2006 e la serie di nutazione a 77 termini (GAST entro 1 ms)",
+                "nl": "IAU 2000B gebruikt IAU 2006 GMST en de nutatiereeks met 77 termen (GAST beter dan 1 ms)",
+                "pl": "IAU 2000B używa GMST IAU 2006 i szeregu nutacji z 77 wyrazami (GAST lepiej niż 1 ms)",
+                "pt": "IAU 2000B usa GMST IAU 2006 e a série de nutação de 77 termos (GAST melhor que 1 ms)",
+                "ru": "МАС 2000B использует GMST МАС 2006 и ряд нутации из 77 членов (GAST точнее 1 мс)",
+                "ja": "IAU 2000BはIAU 2006 GMSTと77項の章動級数を使用（GAST誤差1ms未満）",
+                "zh": "IAU 2000B使用IAU 2006 GMST和77项章动级数（GAST优于1毫秒）",
+                "ko": "IAU 2000B는 IAU 2006 GMST와 77항 장동 급수 사용(GAST 1ms 이내)"
+            }
+        },
         "show_julian_date": {
             "type": "boolean",
             "default": False,
@@ -500,6 +573,10 @@ class SiderealTimeSensor(AlternativeTimeSensorBase):
         self._show_equation_of_equinoxes = config_defaults.get("show_equation_of_equinoxes", {}).get("default", True)
         self._show_julian_date = config_defaults.get("show_julian_date", {}).get("default", False)
         self._precision = config_defaults.get("precision", {}).get("default", "centisecond")
+        self._nutation_model = config_defaults.get("nutation_model", {}).get("default", NUTATION_STANDARD)
+        self._observers: List[Tuple[str, float]] = self._parse_observers(
+            config_defaults.get("observers", {}).get("default", "")
+        )
 
         # Initialize state
         self._state = None
@@ -508,7 +585,7 @@ class SiderealTimeSensor(AlternativeTimeSensorBase):
         # Flag to track if options have been loaded
         self._options_loaded = False
 
-        _LOGGER.debug(f"Initialized Sidereal Time sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Sidereal Time sensor: %s", self._attr_name)
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -527,15 +604,19 @@ class SiderealTimeSensor(AlternativeTimeSensorBase):
                 self._show_equation_of_equinoxes = options.get("show_equation_of_equinoxes", self._show_equation_of_equinoxes)
                 self._show_julian_date = options.get("show_julian_date", self._show_julian_date)
                 self._precision = options.get("precision", self._precision)
+                self._nutation_model = options.get("nutation_model", self._nutation_model)
+                self._observers = self._parse_observers(options.get("observers", ""))
 
-                _LOGGER.debug(f"Sidereal sensor loaded options: primary={self._primary_display}, "
-                            f"ha_location={self._use_ha_location}, format={self._display_format}")
+                _LOGGER.debug(
+                    "Sidereal sensor loaded options: primary=%s, ha_location=%s, format=%s",
+                    self._primary_display, self._use_ha_location, self._display_format,
+                )
             else:
                 _LOGGER.debug("Sidereal sensor using default options - no custom options found")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"Sidereal sensor could not load options yet: {e}")
+            _LOGGER.debug("Sidereal sensor could not load options yet: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -544,9 +625,6 @@ class SiderealTimeSensor(AlternativeTimeSensorBase):
         # Try to load options now that IDs should be set
         self._load_options()
 
-        # Perform initial update
-        self.update()
-
     @property
     def state(self):
         """Return the state of the sensor."""
@@ -577,11 +655,11 @@ class SiderealTimeSensor(AlternativeTimeSensorBase):
         if self._use_ha_location and self.hass:
             # Use Home Assistant configured location
             longitude = self.hass.config.longitude
-            _LOGGER.debug(f"Using HA longitude: {longitude}°")
+            _LOGGER.debug("Using HA longitude: %s°", longitude)
             return longitude
         else:
             # Use custom longitude
-            _LOGGER.debug(f"Using custom longitude: {self._custom_longitude}°")
+            _LOGGER.debug("Using custom longitude: %s°", self._custom_longitude)
             return self._custom_longitude
 
     def _get_latitude(self) -> float:
@@ -590,175 +668,43 @@ class SiderealTimeSensor(AlternativeTimeSensorBase):
             return self.hass.config.latitude
         return 0.0
 
-    def _datetime_to_jd(self, dt: datetime) -> float:
-        """Convert datetime to Julian Date.
-
-        Algorithm from Meeus, Astronomical Algorithms, Chapter 7.
-        """
-        # Ensure UTC
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        else:
-            dt = dt.astimezone(timezone.utc)
-
-        year = dt.year
-        month = dt.month
-        day = dt.day + (dt.hour + dt.minute / 60.0 + dt.second / 3600.0 +
-                        dt.microsecond / 3600000000.0) / 24.0
-
-        if month <= 2:
-            year -= 1
-            month += 12
-
-        a = int(year / 100)
-        b = 2 - a + int(a / 4)
-
-        jd = int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + b - 1524.5
-
-        return jd
-
-    def _calculate_gmst(self, jd_ut1: float) -> float:
-        """Calculate Greenwich Mean Sidereal Time (GMST).
-
-        Based on USNO Circular No. 179, Section 2.6.2.
-
-        Args:
-            jd_ut1: Julian Date in UT1
-
-        Returns:
-            GMST in hours (0-24)
-        """
-        # Calculate JD at 0h UT
-        jd0 = math.floor(jd_ut1 - 0.5) + 0.5
-
-        # Hours elapsed since 0h UT
-        h = (jd_ut1 - jd0) * 24.0
-
-        # Days since J2000.0 at 0h UT
-        d_ut = jd0 - J2000_JD
-
-        # Centuries since J2000.0 (for T² term)
-        t = (jd_ut1 - J2000_JD) / 36525.0
-
-        # GMST formula from USNO Circular No. 179
-        # GMST = 6.697375 + 0.065709824279 * D_UT + 1.0027379 * H + 0.0000258 * T²
-        gmst = 6.697375 + 0.065709824279 * d_ut + 1.0027379 * h + 0.0000258 * t * t
-
-        # Normalize to 0-24 hours
-        gmst = gmst % 24.0
-        if gmst < 0:
-            gmst += 24.0
-
-        return gmst
-
-    def _calculate_equation_of_equinoxes(self, jd_tt: float) -> float:
-        """Calculate the equation of equinoxes (nutation in right ascension).
-
-        Based on USNO Circular No. 179.
-
-        Args:
-            jd_tt: Julian Date in TT (Terrestrial Time)
-
-        Returns:
-            Equation of equinoxes in hours
-        """
-        # Days since J2000.0 in TT
-        d_tt = jd_tt - J2000_JD
-
-        # Longitude of ascending node of the Moon (degrees)
-        omega = 125.04 - 0.052954 * d_tt
-
-        # Mean longitude of the Sun (degrees)
-        l_sun = 280.47 + 0.98565 * d_tt
-
-        # Obliquity of the ecliptic (degrees)
-        epsilon = 23.4393 - 0.0000004 * d_tt
-
-        # Convert to radians for trig functions
-        omega_rad = math.radians(omega)
-        l_sun_rad = math.radians(l_sun)
-        epsilon_rad = math.radians(epsilon)
-
-        # Nutation in longitude (approximate, in hours)
-        delta_psi = -0.000319 * math.sin(omega_rad) - 0.000024 * math.sin(2 * l_sun_rad)
-
-        # Equation of equinoxes
-        eq_eq = delta_psi * math.cos(epsilon_rad)
-
-        return eq_eq
-
-    def _calculate_gast(self, gmst: float, eq_eq: float) -> float:
-        """Calculate Greenwich Apparent Sidereal Time (GAST).
-
-        GAST = GMST + equation_of_equinoxes
+    @staticmethod
+    def _parse_observers(value: Any) -> List[Tuple[str, float]]:
+        """Parse the observers option ("La Palma=-17.88; Siding Spring=149.07")."""
+        observers: Dict[str, float] = {}
+        for part in str(value or "").replace("\n", ";").split(";"):
+            name, sep, longitude = part.partition("=")
+            name = name.strip()
+            if not sep or not name:
+                continue
+            try:
+                longitude = float(longitude.strip().replace(",", "."))
+            except ValueError:
+                _LOGGER.warning("Ignoring observer %r: invalid longitude", part.strip())
+                continue
+            if not -180.0 <= longitude <= 360.0:
+                _LOGGER.warning("Ignoring observer %r: longitude out of range", part.strip())
+                continue
+            observers[name] = longitude
+        return list(observers.items())
+
+    @staticmethod
+    def _local_sidereal_times(greenwich: Sequence[float], longitudes: Sequence[float]) -> Any:
+        """Calculate local sidereal times for several sites at once.
+
+        LST = GST + longitude/15, for every pair in one step.
 
         Args:
-            gmst: Greenwich Mean Sidereal Time in hours
-            eq_eq: Equation of equinoxes in hours
+            greenwich: Greenwich sidereal times in hours (e.g. GMST, GAST)
+            longitudes: Observer longitudes in degrees (East positive)
 
         Returns:
-            GAST in hours (0-24)
+            Nested list [greenwich time][site] of hours (0-24)
         """
-        gast = gmst + eq_eq
-
-        # Normalize to 0-24 hours
-        gast = gast % 24.0
-        if gast < 0:
-            gast += 24.0
-
-        return gast
-
-    def _calculate_local_sidereal_time(self, greenwich_st: float, longitude: float) -> float:
-        """Calculate local sidereal time from Greenwich sidereal time.
-
-        LST = GST + longitude/15
-
-        Args:
-            greenwich_st: Greenwich sidereal time in hours
-            longitude: Observer's longitude in degrees (East positive)
-
-        Returns:
-            Local sidereal time in hours (0-24)
-        """
-        # Convert longitude from degrees to hours (15° = 1 hour)
-        longitude_hours = longitude / 15.0
-
-        lst = greenwich_st + longitude_hours
-
-        # Normalize to 0-24 hours
-        lst = lst % 24.0
-        if lst < 0:
-            lst += 24.0
-
-        return lst
-
-    def _calculate_era(self, jd_ut1: float) -> float:
-        """Calculate Earth Rotation Angle (ERA).
-
-        Based on IAU 2000 resolution.
-        ERA = 2π(0.7790572732640 + 1.00273781191135448 × Tu) radians
-        where Tu = JD(UT1) - 2451545.0
-
-        Args:
-            jd_ut1: Julian Date in UT1
-
-        Returns:
-            ERA in degrees (0-360)
-        """
-        tu = jd_ut1 - J2000_JD
-
-        # ERA in radians (full rotations)
-        era_radians = 2.0 * math.pi * (0.7790572732640 + 1.00273781191135448 * tu)
-
-        # Normalize to 0-2π
-        era_radians = era_radians % (2.0 * math.pi)
-        if era_radians < 0:
-            era_radians += 2.0 * math.pi
-
-        # Convert to degrees
-        era_degrees = math.degrees(era_radians)
-
-        return era_degrees
+        if HAS_NUMPY:
+            offsets = np.asarray(longitudes, dtype=float) / 15.0
+            return ((np.asarray(greenwich, dtype=float)[:, None] + offsets[None, :]) % 24.0).tolist()
+        return [[(gst + longitude / 15.0) % 24.0 for longitude in longitudes] for gst in greenwich]
 
     def _hours_to_hms(self, hours: float) -> tuple:
         """Convert decimal hours to hours, minutes, seconds.
@@ -801,48 +747,40 @@ class SiderealTimeSensor(AlternativeTimeSensorBase):
             else:  # second
                 return f"{h:02d}:{m:02d}:{int(s):02d} {suffix}".strip()
 
-    def _calculate_sidereal_time(self, utc_time: datetime) -> Dict[str, Any]:
+    def _calculate_sidereal_time(self, context: AstroContext) -> Dict[str, Any]:
         """Calculate all sidereal time values.
 
         Args:
-            utc_time: Current UTC time
+            context: Astronomical context of the current tick
 
         Returns:
             Dictionary with all sidereal time values
         """
-        # Ensure we're working with UTC
-        if utc_time.tzinfo is None:
-            utc_time = utc_time.replace(tzinfo=timezone.utc)
+        utc_time = context.when
+        jd = context.jd_utc
+
+        # GMST and ERA from UT1, the equation of equinoxes from TT
+        if self._nutation_model == NUTATION_IAU2000B:
+            gmst = context.gmst_iau2006_hours
+            eq_eq = context.equation_of_equinoxes_iau2006_hours
+            gast = context.gast_iau2006_hours
+            dpsi, deps = context.nutation_iau2000b
         else:
-            utc_time = utc_time.astimezone(timezone.utc)
-
-        # Get Julian Date
-        jd = self._datetime_to_jd(utc_time)
-
-        # For high precision, we should use UT1 and TT separately
-        # For this implementation, we'll use UTC ≈ UT1 ≈ TT (error < 1 second)
-        jd_ut1 = jd
-        jd_tt = jd  # TT ≈ UTC + 69.184s, but for ~1s accuracy this is fine
-
-        # Calculate GMST
-        gmst = self._calculate_gmst(jd_ut1)
-
-        # Calculate equation of equinoxes
-        eq_eq = self._calculate_equation_of_equinoxes(jd_tt)
-
-        # Calculate GAST
-        gast = self._calculate_gast(gmst, eq_eq)
+            gmst = context.gmst_hours
+            eq_eq = context.equation_of_equinoxes_hours
+            gast = context.gast_hours
+            dpsi, deps = context.nutation
 
         # Get longitude for local calculations
         longitude = self._get_longitude()
         latitude = self._get_latitude()
 
-        # Calculate local sidereal times
-        lmst = self._calculate_local_sidereal_time(gmst, longitude)
-        last = self._calculate_local_sidereal_time(gast, longitude)
+        # Local sidereal times for home and every named observer at once
+        longitudes = [longitude] + [lon for _, lon in self._observers]
+        lmst_all, last_all = self._local_sidereal_times((gmst, gast), longitudes)
+        lmst, last = lmst_all[0], last_all[0]
 
-        # Calculate ERA
-        era_degrees = self._calculate_era(jd_ut1)
+        era_degrees = context.era_degrees
         era_hours = era_degrees / 15.0  # Convert to hours for display
 
         # Build result dictionary
@@ -887,6 +825,9 @@ class SiderealTimeSensor(AlternativeTimeSensorBase):
             result["equation_of_equinoxes_seconds"] = round(eq_eq_seconds, 4)
             result["equation_of_equinoxes"] = f"{eq_eq_seconds:+.4f}s"
             result["gast_minus_gmst"] = result["equation_of_equinoxes"]
+            result["nutation_longitude_arcsec"] = round(dpsi * 3600.0, 4)
+            result["nutation_obliquity_arcsec"] = round(deps * 3600.0, 4)
+            result["nutation_model"] = self._nutation_model
 
         # Add Julian Date if enabled
         if self._show_julian_date:
@@ -894,6 +835,19 @@ class SiderealTimeSensor(AlternativeTimeSensorBase):
             result["modified_julian_date"] = round(jd - 2400000.5, 8)
             result["days_since_j2000"] = round(jd - J2000_JD, 8)
 
+        # Add named observers
+        if self._observers:
+            result["observers"] = {
+                name: {
+                    "longitude": round(lon, 6),
+                    "lmst": self._format_time(lmst_all[i], "LMST"),
+                    "lmst_hours": round(lmst_all[i], 8),
+                    "last": self._format_time(last_all[i], "LAST"),
+                    "last_hours": round(last_all[i], 8),
+                }
+                for i, (name, lon) in enumerate(self._observers, start=1)
+            }
+
         # Add sidereal day progress
         sidereal_day_progress = (lmst / 24.0) * 100.0
         result["sidereal_day_progress"] = f"{sidereal_day_progress:.2f}%"
@@ -918,16 +872,15 @@ class SiderealTimeSensor(AlternativeTimeSensorBase):
             self._load_options()
 
         try:
-            now = datetime.now(timezone.utc)
-            self._sidereal_data = self._calculate_sidereal_time(now)
+            self._sidereal_data = self._calculate_sidereal_time(self.astro_context())
 
             # Set state to primary display value
             self._state = self._sidereal_data.get("primary_display", "Sidereal ERROR")
 
-            _LOGGER.debug(f"Updated Sidereal Time: {self._state}")
-        except Exception as e:
-            _LOGGER.error(f"Error updating Sidereal Time: {e}", exc_info=True)
+            _LOGGER.debug("Updated Sidereal Time: %s", self._state)
+        except Exception:
             self._state = "Sidereal ERROR"
+            raise
 
     async def async_update(self) -> None:
         """Update sensor asynchronously."""
@@ -5,26 +5,29 @@
 
 from __future__ import annotations
 
-import base64
-import io
-import logging
-import math
-import os
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
-try:
-    from PIL import Image, ImageDraw, ImageFont  # optional
-except Exception:
-    Image = None
-    ImageDraw = None
-    ImageFont = None
-
 from homeassistant.core import HomeAssistant
-
+from homeassistant.util import dt as dt_util
+
+from ..asset_store import get_asset_store
+from ..astro_context import AstroContext, datetime_to_jd
+from ..ephemeris import ACCURACY_HIGH, ACCURACY_STANDARD, KeplerEphemeris
+from ..log_helper import get_logger
+from ..planet_events import get_planet_event_cache
+from ..render_pool import get_render_pool
+from ..rise_set import daily_rise_set
 from ..sensor import AlternativeTimeSensorBase
+from ..solar_map import (
+    DEFAULT_PIXEL_THRESHOLD,
+    MAP_SIZE,
+    PngMapRenderer,
+    SvgMapRenderer,
+    render_png_in_worker,
+)
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -32,6 +35,12 @@ _LOGGER = logging.getLogger(__name__)
 
 UPDATE_INTERVAL = 300  # seconds
 
+# Positions are memoized per minute (map, attributes and state share them)
+EPHEMERIS_QUANTUM = 60  # seconds
+
+# Entries in the upcoming_events attribute
+UPCOMING_EVENTS_SHOWN = 8
+
 CALENDAR_INFO = {
     "id": "solar_system",
     "version": "1.4.0",
@@ -349,12 +358,28 @@ CALENDAR_INFO = {
             "label": {"en": "Show Constellation", "de": "Sternbild anzeigen", "es": "Mostrar Constelación", "fr": "Afficher Constellation", "it": "Mostra Costellazione", "nl": "Toon Sterrenbeeld", "pl": "Pokaż Konstelację", "pt": "Mostrar Constelação", "ru": "Показать Созвездие", "ja": "星座を表示", "zh": "显示星座", "ko": "별자리 표시"},
             "description": {"en": "Display zodiac constellation", "de": "Tierkreiszeichen anzeigen", "es": "Mostrar constelación zodiacal", "fr": "Afficher constellation du zodiaque", "it": "Mostra costellazione zodiacale", "nl": "Toon sterrenbeeld", "pl": "Pokaż konstelację zodiaku", "pt": "Mostrar constelação zodiacal", "ru": "Показать созвездие зодиака", "ja": "黄道星座を表示", "zh": "显示黄道星座", "ko": "황도 별자리 표시"}
         },
+        "accuracy_mode": {
+            "type": "select",
+            "default": ACCURACY_STANDARD,
+            "label": {"en": "Calculation Accuracy", "de": "Berechnungsgenauigkeit", "es": "Precisión del Cálculo", "fr": "Précision du Calcul", "it": "Precisione del Calcolo", "nl": "Rekennauwkeurigheid", "pl": "Dokładność Obliczeń", "pt": "Precisão do Cálculo", "ru": "Точность Расчёта", "ja": "計算精度", "zh": "计算精度", "ko": "계산 정확도"},
+            "description": {"en": "High uses JPL orbital elements with secular rates and true geocentric directions; errors below 1′, Jupiter up to 7′, Saturn up to 10′", "de": "Hoch nutzt JPL-Bahnelemente mit säkularen Raten und echte geozentrische Richtungen; Fehler unter 1′, Jupiter bis 7′, Saturn bis 10′", "es": "Alta usa elementos orbitales de JPL con tasas seculares y direcciones geocéntricas reales; errores inferiores a 1′, Júpiter hasta 7′, Saturno hasta 10′", "fr": "Haute utilise les éléments orbitaux JPL avec taux séculaires et vraies directions géocentriques ; erreurs inférieures à 1′, Jupiter jusqu'à 7′, Saturne jusqu'à 10′", "it": "Alta usa elementi orbitali JPL con tassi secolari e direzioni geocentriche reali; errori sotto 1′, Giove fino a 7′, Saturno fino a 10′", "nl": "Hoog gebruikt JPL-baanelementen met seculaire snelheden en echte geocentrische richtingen; fouten onder 1′, Jupiter tot 7′, Saturnus tot 10′", "pl": "Wysoka używa elementów orbitalnych JPL z tempami wiekowymi i prawdziwymi kierunkami geocentrycznymi; błędy poniżej 1′, Jowisz do 7′, Saturn do 10′", "pt": "Alta usa elementos orbitais do JPL com taxas seculares e direções geocêntricas reais; erros abaixo de 1′, Júpiter até 7′, Saturno até 10′", "ru": "Высокая использует орбитальные элементы JPL с вековыми скоростями и истинные геоцентрические направления; ошибки менее 1′, Юпитер до 7′, Сатурн до 10′", "ja": "高はJPL軌道要素（永年変化付き）と真の地心方向を使用（誤差1′未満、木星は最大7′、土星は最大10′）", "zh": "高精度使用带长期变化率的JPL轨道根数和真实地心方向（误差小于1′，木星最多7′，土星最多10′）", "ko": "높음은 영년 변화율이 있는 JPL 궤도 요소와 실제 지구 중심 방향 사용(오차 1′ 미만, 목성 최대 7′, 토성 최대 10′)"},
+            "options": [
+                {"value": ACCURACY_STANDARD, "label": {"en": "Standard (fast)", "de": "Standard (schnell)", "es": "Estándar (rápido)", "fr": "Standard (rapide)", "it": "Standard (veloce)", "nl": "Standaard (snel)", "pl": "Standardowa (szybka)", "pt": "Padrão (rápido)", "ru": "Стандартная (быстрая)", "ja": "標準（高速）", "zh": "标准（快速）", "ko": "표준(빠름)"}},
+                {"value": ACCURACY_HIGH, "label": {"en": "High", "de": "Hoch", "es": "Alta", "fr": "Haute", "it": "Alta", "nl": "Hoog", "pl": "Wysoka", "pt": "Alta", "ru": "Высокая", "ja": "高", "zh": "高", "ko": "높음"}}
+            ]
+        },
         "show_retrograde": {
             "type": "boolean",
             "default": True,
             "label": {"en": "Show Retrograde Status", "de": "Retrograd-Status anzeigen", "es": "Mostrar Estado Retrógrado", "fr": "Afficher État Rétrograde", "it": "Mostra Stato Retrogrado", "nl": "Toon Retrograde Status", "pl": "Pokaż Status Retrograde", "pt": "Mostrar Estado Retrógrado", "ru": "Показать Ретроградный Статус", "ja": "逆行状態を表示", "zh": "显示逆行状态", "ko": "역행 상태 표시"},
             "description": {"en": "Indicate when planets appear to move backwards", "de": "Anzeigen, wenn Planeten rückwärts zu laufen scheinen", "es": "Indicar cuando los planetas parecen moverse hacia atrás", "fr": "Indiquer quand les planètes semblent reculer", "it": "Indicare quando i pianeti sembrano muoversi all'indietro", "nl": "Aangeven wanneer planeten achteruit lijken te bewegen", "pl": "Wskazać, gdy planety wydają się cofać", "pt": "Indicar quando os planetas parecem mover-se para trás", "ru": "Показывать, когда планеты движутся назад", "ja": "惑星が後退しているように見えるときを示す", "zh": "指示行星逆行", "ko": "행성이 뒤로 움직이는 것처럼 보일 때 표시"}
         },
+        "show_events": {
+            "type": "boolean",
+            "default": True,
+            "label": {"en": "Show Upcoming Events", "de": "Kommende Ereignisse anzeigen", "es": "Mostrar Próximos Eventos", "fr": "Afficher Événements à Venir", "it": "Mostra Prossimi Eventi", "nl": "Toon Komende Gebeurtenissen", "pl": "Pokaż Nadchodzące Zdarzenia", "pt": "Mostrar Próximos Eventos", "ru": "Показать Предстоящие События", "ja": "今後の現象を表示", "zh": "显示即将发生的天象", "ko": "다가오는 현상 표시"},
+            "description": {"en": "Oppositions, conjunctions, greatest elongations and retrograde periods for the next two years", "de": "Oppositionen, Konjunktionen, größte Elongationen und Rückläufigkeiten der nächsten zwei Jahre", "es": "Oposiciones, conjunciones, máximas elongaciones y retrogradaciones de los próximos dos años", "fr": "Oppositions, conjonctions, plus grandes élongations et rétrogradations des deux prochaines années", "it": "Opposizioni, congiunzioni, massime elongazioni e moti retrogradi dei prossimi due anni", "nl": "Opposities, conjuncties, grootste elongaties en retrograde perioden voor de komende twee jaar", "pl": "Opozycje, koniunkcje, największe elongacje i ruchy wsteczne na najbliższe dwa lata", "pt": "Oposições, conjunções, máximas elongações e retrogradações dos próximos dois anos", "ru": "Противостояния, соединения, наибольшие элонгации и попятные движения на два года вперёд", "ja": "今後2年間の衝・合・最大離角・逆行期間", "zh": "未来两年的冲、合、大距和逆行期", "ko": "향후 2년간의 충, 합, 최대 이각 및 역행 기간"}
+        },
         "show_visibility": {
             "type": "boolean",
             "default": True,
@@ -367,6 +392,26 @@ CALENDAR_INFO = {
             "label": {"en": "Enable Visualization", "de": "Visualisierung aktivieren", "es": "Habilitar Visualización", "fr": "Activer Visualisation", "it": "Abilita Visualizzazione", "nl": "Visualisatie Inschakelen", "pl": "Włącz Wizualizację", "pt": "Habilitar Visualização", "ru": "Включить Визуализацию", "ja": "視覚化を有効にする", "zh": "启用可视化", "ko": "시각화 활성화"},
             "description": {"en": "Generate SVG/PNG solar system map", "de": "SVG/PNG-Sonnensystemkarte generieren", "es": "Generar mapa del sistema solar SVG/PNG", "fr": "Générer carte système solaire SVG/PNG", "it": "Genera mappa sistema solare SVG/PNG", "nl": "Genereer SVG/PNG zonnestelselkaart", "pl": "Generuj mapę Układu Słonecznego SVG/PNG", "pt": "Gerar mapa do sistema solar SVG/PNG", "ru": "Создать карту солнечной системы SVG/PNG", "ja": "太陽系マップSVG/PNGを生成", "zh": "生成SVG/PNG太阳系地图", "ko": "SVG/PNG 태양계 지도 생성"}
         },
+        "map_pixel_threshold": {
+            "type": "float",
+            "default": 1.0,
+            "min": 0,
+            "max": 20,
+            "label": {"en": "Map Redraw Threshold (px)", "de": "Karten-Neuzeichnungsschwelle (px)", "es": "Umbral de Redibujado del Mapa (px)", "fr": "Seuil de Redessin de la Carte (px)", "it": "Soglia di Ridisegno Mappa (px)", "nl": "Drempel Kaart Hertekenen (px)", "pl": "Próg Przerysowania Mapy (px)", "pt": "Limite de Redesenho do Mapa (px)", "ru": "Порог Перерисовки Карты (пкс)", "ja": "マップ再描画しきい値 (px)", "zh": "地图重绘阈值 (像素)", "ko": "지도 다시 그리기 임계값 (px)"},
+            "description": {"en": "Only redraw the map when a planet moved more than this many pixels", "de": "Karte nur neu zeichnen, wenn sich ein Planet um mehr Pixel bewegt hat", "es": "Redibujar el mapa solo si un planeta se movió más de estos píxeles", "fr": "Redessiner la carte seulement si une planète a bougé de plus de pixels", "it": "Ridisegna la mappa solo se un pianeta si è spostato di più pixel", "nl": "Kaart alleen hertekenen als een planeet meer pixels bewoog", "pl": "Przerysuj mapę tylko, gdy planeta przesunęła się o więcej pikseli", "pt": "Redesenhar o mapa só quando um planeta se moveu mais pixels", "ru": "Перерисовывать карту, только если планета сместилась больше чем на столько пикселей", "ja": "惑星がこのピクセル数以上動いた場合のみ再描画", "zh": "仅当行星移动超过此像素数时重绘地图", "ko": "행성이 이 픽셀 이상 움직였을 때만 지도 다시 그리기"}
+        },
+        "map_png_sizes": {
+            "type": "text",
+            "default": "",
+            "label": {"en": "Additional PNG Map Sizes", "de": "Zusätzliche PNG-Kartengrößen", "es": "Tamaños PNG Adicionales del Mapa", "fr": "Tailles PNG Supplémentaires de la Carte", "it": "Dimensioni PNG Aggiuntive della Mappa", "nl": "Extra PNG-Kaartformaten", "pl": "Dodatkowe Rozmiary Mapy PNG", "pt": "Tamanhos PNG Adicionais do Mapa", "ru": "Дополнительные Размеры PNG-Карты", "ja": "追加のPNGマップサイズ", "zh": "额外的PNG地图尺寸", "ko": "추가 PNG 지도 크기"},
+            "description": {"en": "Comma separated pixel sizes (64-2048), e.g. 300,1024; written as solar_system_map_<size>.png", "de": "Kommagetrennte Pixelgrößen (64-2048), z. B. 300,1024; als solar_system_map_<Größe>.png gespeichert", "es": "Tamaños en píxeles separados por comas (64-2048), p. ej. 300,1024", "fr": "Tailles en pixels séparées par des virgules (64-2048), p. ex. 300,1024", "it": "Dimensioni in pixel separate da virgole (64-2048), es. 300,1024", "nl": "Kommagescheiden pixelformaten (64-2048), bijv. 300,1024", "pl": "Rozmiary w pikselach oddzielone przecinkami (64-2048), np. 300,1024", "pt": "Tamanhos em pixels separados por vírgulas (64-2048), ex. 300,1024", "ru": "Размеры в пикселях через запятую (64-2048), например 300,1024", "ja": "カンマ区切りのピクセルサイズ (64-2048)、例: 300,1024", "zh": "逗号分隔的像素尺寸 (64-2048)，例如 300,1024", "ko": "쉼표로 구분된 픽셀 크기 (64-2048), 예: 300,1024"}
+        },
+        "map_render_in_process": {
+            "type": "boolean",
+            "default": False,
+            "label": {"en": "Render Map in Separate Process", "de": "Karte in separatem Prozess rendern", "es": "Renderizar Mapa en Proceso Separado", "fr": "Rendre la Carte dans un Processus Séparé", "it": "Renderizza Mappa in Processo Separato", "nl": "Kaart in Apart Proces Renderen", "pl": "Renderuj Mapę w Osobnym Procesie", "pt": "Renderizar Mapa em Processo Separado", "ru": "Отрисовка Карты в Отдельном Процессе", "ja": "別プロセスでマップを描画", "zh": "在独立进程中渲染地图", "ko": "별도 프로세스에서 지도 렌더링"},
+            "description": {"en": "Draw the PNG map in a worker process so it cannot slow down Home Assistant (uses extra memory)", "de": "PNG-Karte in einem Arbeitsprozess zeichnen, damit Home Assistant nicht gebremst wird (mehr Speicher)", "es": "Dibujar el mapa PNG en un proceso aparte para no ralentizar Home Assistant (usa más memoria)", "fr": "Dessiner la carte PNG dans un processus séparé pour ne pas ralentir Home Assistant (plus de mémoire)", "it": "Disegna la mappa PNG in un processo separato per non rallentare Home Assistant (più memoria)", "nl": "Teken de PNG-kaart in een apart proces zodat Home Assistant niet vertraagt (meer geheugen)", "pl": "Rysuj mapę PNG w osobnym procesie, aby nie spowalniać Home Assistant (więcej pamięci)", "pt": "Desenhar o mapa PNG num processo separado para não atrasar o Home Assistant (usa mais memória)", "ru": "Рисовать PNG-карту в отдельном процессе, чтобы не замедлять Home Assistant (больше памяти)", "ja": "Home Assistantを遅くしないよう別プロセスでPNGマップを描画（メモリ使用増）", "zh": "在工作进程中绘制PNG地图，避免拖慢Home Assistant（占用更多内存）", "ko": "Home Assistant가 느려지지 않도록 별도 프로세스에서 PNG 지도 그리기 (메모리 추가 사용)"}
+        },
         "visualization_scale": {
             "type": "select",
             "default": "logarithmic",
@@ -388,6 +433,9 @@ class SolarSystemSensor(AlternativeTimeSensorBase):
     UPDATE_INTERVAL = UPDATE_INTERVAL
     AU_TO_KM = 149_597_870.7
 
+    # The map is served by the image platform; PNG needs Pillow
+    IMAGE_CONTENT_TYPE = "image/png" if PngMapRenderer.available() else "image/svg+xml"
+
     # -------------- ctor --------------
     def __init__(self, base_name: str, hass: HomeAssistant) -> None:
         # language must exist before anything else
@@ -409,6 +457,7 @@ class SolarSystemSensor(AlternativeTimeSensorBase):
         self._update_interval = timedelta(seconds=UPDATE_INTERVAL)
         self._solar_data = CALENDAR_INFO.get("solar_data", {})
         self._planets = self._solar_data.get("planets", {})
+        self._ephemeris = KeplerEphemeris(self._planets, ACCURACY_STANDARD, EPHEMERIS_QUANTUM)
         self._constellations = self._solar_data.get("constellations", [])
 
         default_latitude = 49.14
@@ -424,21 +473,39 @@ class SolarSystemSensor(AlternativeTimeSensorBase):
         self._show_constellation = True
         self._show_retrograde = True
         self._show_visibility = True
+        self._show_events = True
         self._enable_visualization = True
         self._visualization_scale = "logarithmic"
         self._show_kuiper_belt = True
+        self._map_pixel_threshold = DEFAULT_PIXEL_THRESHOLD
+        self._map_render_in_process = False
 
         self._observer_latitude = default_latitude
         self._observer_longitude = default_longitude
+        self._rise_set_key: Optional[Tuple] = None
+        self._rise_set: Dict[str, Dict[str, Any]] = {}
 
         self._positions_info: Dict[str, Any] = {}
         self._state = "Initializing..."
         self._first_update = True
 
-        # Pre-generated visualization data (generated in update(), used in extra_state_attributes)
+        # Pre-generated visualization data (generated in update(), served by the image entity)
         self._cached_svg: Optional[str] = None
-        self._cached_png_data_uri: Optional[str] = None
+        self._cached_png: Optional[bytes] = None
         self._cached_local_paths: Dict[str, str] = {}
+        self._svg_renderer = SvgMapRenderer()
+        self._png_renderer = PngMapRenderer()
+        self._map_timings: Dict[str, float] = {}
+        self._map_png_sizes: List[int] = []
+        self._cached_png_sizes: Dict[int, bytes] = {}
+
+    async def async_added_to_hass(self) -> None:
+        """Load the cached planetary events before the first update."""
+        try:
+            await get_planet_event_cache(self._hass).async_load()
+        except Exception as e:
+            _LOGGER.warning("Loading cached planet events failed: %s", e)
+        await super().async_added_to_hass()
 
     # -------------- helpers --------------
     def _lang(self) -> str:
@@ -497,112 +564,70 @@ class SolarSystemSensor(AlternativeTimeSensorBase):
 
     # -------------- positions --------------
     def _calculate_planet_position(self, planet_id: str, jd: float) -> Dict[str, Any]:
-        """
-        Calculate heliocentric position of a planet using Keplerian orbital elements.
-
-        FIXED in v1.4.0: Corrected the calculation of heliocentric longitude.
-        The previous version incorrectly calculated the mean anomaly and added
-        perihelion_longitude twice, resulting in incorrect positions.
+        """Heliocentric position of one body (see ephemeris.KeplerEphemeris).
 
-        The correct formulas (per JPL's "Approximate Positions of the Planets"):
-        1. L = L0 + n*d  (Mean Longitude)
-        2. M = L - ω     (Mean Anomaly, where ω = perihelion_longitude)
-        3. C = equation_of_center(M, e)
-        4. true_longitude = L + C  (NOT v + ω!)
+        Prefer self._ephemeris.at(jd) when several bodies are needed.
         """
-        p = self._planets[planet_id]
-
-        # Deep-space probes: radial outward (very rough), fixed longitude anchor
-        if p.get("special_type") == "probe":
-            # elapsed years since J2000 (JD 2451545.0 ~ 2000-01-01 12:00 TT)
-            years = (jd - 2451545.0) / 365.25
-            r = max(1.0, float(p.get("anchor_au", 100.0)) + years * float(p.get("speed_au_per_year", 3.5)))
-            longi = float(p.get("anchor_longitude", 300.0)) % 360.0
-            return {
-                "longitude": longi,
-                "distance": r,
-                "mean_anomaly": 0.0,
-                "true_anomaly": 0.0
-            }
-
-        # Planets - Standard Keplerian calculation (CORRECTED)
-        d = jd - 2451545.0  # Days since J2000.0
-        n = 360.0 / float(p["orbital_period"])  # Mean daily motion (degrees/day)
-
-        # Step 1: Calculate Mean Longitude (L)
-        # L = L0 + n*d, where L0 is mean_longitude_j2000
-        L = (float(p["mean_longitude_j2000"]) + n * d) % 360.0
-
-        # Step 2: Calculate Mean Anomaly (M)
-        # M = L - ω, where ω is the longitude of perihelion
-        omega = float(p["perihelion_longitude"])
-        M = (L - omega + 360.0) % 360.0
-
-        e = float(p["eccentricity"])
-
-        # Step 3: Equation of center (simplified series expansion)
-        # C ≈ (2e - e³/4)sin(M) + (5/4)e²sin(2M) + (13/12)e³sin(3M)
-        M_rad = math.radians(M)
-        C = (2.0 * e - (e**3) / 4.0) * math.sin(M_rad) * (180.0 / math.pi)
-        C += (5.0 / 4.0) * (e**2) * math.sin(2.0 * M_rad) * (180.0 / math.pi)
-        C += (13.0 / 12.0) * (e**3) * math.sin(3.0 * M_rad) * (180.0 / math.pi)
-
-        # True anomaly
-        v = M + C
-
-        # Step 4: Heliocentric ecliptic longitude = L + C (true longitude)
-        # This is the CORRECTED formula - we add C to L, not to v+ω
-        longitude = (L + C) % 360.0
-
-        # Distance from Sun (using the orbital equation)
-        a = float(p["semi_major_axis"])
-        v_rad = math.radians(v)
-        r = a * (1 - e**2) / (1 + e * math.cos(v_rad))
-
-        return {
-            "longitude": longitude,
-            "distance": r,
-            "mean_anomaly": M,
-            "true_anomaly": v,
-            "mean_longitude": L,
-            "equation_of_center": C
-        }
-
-    def _calculate_geocentric_position(self, planet_pos: Dict, earth_pos: Dict) -> Dict[str, Any]:
-        geo_longitude = (planet_pos["longitude"] - earth_pos["longitude"]) % 360.0
-        angle_diff = math.radians(planet_pos["longitude"] - earth_pos["longitude"])
-        r_p = float(planet_pos["distance"])
-        r_e = float(earth_pos["distance"])
-        distance = math.sqrt(r_p**2 + r_e**2 - 2.0 * r_p * r_e * math.cos(angle_diff))
-        return {"longitude": geo_longitude, "distance": distance}
-
-    def _calculate_visibility(self, planet_id: str, dt: datetime) -> Dict[str, Any]:
-        planet_pos = self._calculate_planet_position(planet_id, self._datetime_to_jd(dt))
-        earth_pos = self._calculate_planet_position("earth", self._datetime_to_jd(dt))
-        geo_pos = self._calculate_geocentric_position(planet_pos, earth_pos)
-        elong = abs(geo_pos["longitude"] - earth_pos["longitude"])
-        if elong > 180.0:
-            elong = 360.0 - elong
-
-        vis = {"elongation": elong, "visible": False, "rise_time": None, "set_time": None, "best_time": None, "visibility_period": None}
-        if planet_id in ["mercury", "venus"]:
-            if 15.0 < elong < 47.0:
-                vis["visible"] = True
-                if geo_pos["longitude"] < earth_pos["longitude"]:
-                    vis.update({"visibility_period": "Morning star", "best_time": "Before sunrise", "rise_time": "03:00", "set_time": "06:00"})
-                else:
-                    vis.update({"visibility_period": "Evening star", "best_time": "After sunset", "rise_time": "18:00", "set_time": "21:00"})
+        return self._ephemeris.at(jd)[planet_id]
+
+    def _calculate_visibility(
+        self,
+        planet_id: str,
+        helio: Dict[str, Dict[str, Any]],
+        geo: Dict[str, Dict[str, Any]],
+        daily: Dict[str, Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Combine the current elongation with today's rise/set sweep."""
+        earth_lon = helio["earth"]["longitude"]
+        geo_lon = geo[planet_id]["longitude"]
+        if self._ephemeris.accuracy == ACCURACY_HIGH:
+            # Angle from the Sun as seen from Earth
+            elong = abs((geo_lon - (earth_lon + 180.0) + 180.0) % 360.0 - 180.0)
         else:
-            if elong > 60.0:
-                vis["visible"] = True
-                if elong > 150.0:
-                    vis.update({"visibility_period": "All night", "best_time": "Midnight", "rise_time": "18:00", "set_time": "06:00"})
-                elif elong > 90.0:
-                    vis.update({"visibility_period": "Most of night", "best_time": "Late evening", "rise_time": "20:00", "set_time": "04:00"})
-                else:
-                    vis.update({"visibility_period": "Part of night", "best_time": "Evening", "rise_time": "20:00", "set_time": "23:00"})
+            elong = abs(geo_lon - earth_lon)
+            if elong > 180.0:
+                elong = 360.0 - elong
+
+        def hhmm(value: Optional[datetime]) -> Optional[str]:
+            return value.strftime("%H:%M") if value else None
+
+        day = daily.get(planet_id, {})
+        vis = {
+            "elongation": elong,
+            "visible": False,
+            "rise_time": hhmm(day.get("rise")),
+            "transit_time": hhmm(day.get("transit")),
+            "set_time": hhmm(day.get("set")),
+            "max_altitude": day.get("max_altitude"),
+            "best_time": None,
+            "visibility_period": None,
+        }
+        if day.get("best"):
+            # Above VISIBLE_ALTITUDE while the Sun is below civil twilight
+            vis["visible"] = True
+            vis["best_time"] = hhmm(day["best"])
+            fraction = day["dark_fraction_visible"]
+            if planet_id in ["mercury", "venus"]:
+                vis["visibility_period"] = "Evening star" if day["evening"] else "Morning star"
+            elif fraction >= 0.9:
+                vis["visibility_period"] = "All night"
+            elif fraction >= 0.6:
+                vis["visibility_period"] = "Most of night"
+            else:
+                vis["visibility_period"] = "Evening" if day["evening"] else "Morning"
         return vis
 
+    def _daily_rise_set(self, dt: datetime) -> Dict[str, Dict[str, Any]]:
+        """Return today's rise/transit/set sweep, recomputed once per local day."""
+        local = dt_util.as_local(dt)
+        key = (local.date(), self._observer_latitude, self._observer_longitude, self._ephemeris.accuracy)
+        if key != self._rise_set_key:
+            start = dt_util.start_of_local_day(local)
+            end = dt_util.start_of_local_day(local.date() + timedelta(days=1))
+            self._rise_set = daily_rise_set(self._ephemeris, start, end, self._observer_latitude, self._observer_longitude)
+            self._rise_set_key = key
+        return self._rise_set
+
     # -------------- SVG --------------
     def _get_earth_reference_angle(self, now: datetime) -> float:
         """
@@ -615,66 +640,44 @@ class SolarSystemSensor(AlternativeTimeSensorBase):
         """
         # Calculate Earth's position on January 1st of the current year
         jan1 = datetime(now.year, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        jd_jan1 = self._datetime_to_jd(jan1)
-        earth_jan1_pos = self._calculate_planet_position("earth", jd_jan1)
+        jd_jan1 = datetime_to_jd(jan1)
+        earth_jan1_pos = self._ephemeris.at(jd_jan1)["earth"]
 
         # This is the heliocentric longitude of Earth on Jan 1
         return earth_jan1_pos["longitude"]
 
-    def _generate_visualization_svg(self) -> str:
-        width, height = 600, 600
-        cx, cy = width / 2, height / 2
-        margin = 40
-        maxR = min(cx, cy) - margin
-        scale = self._visualization_scale
+    @staticmethod
+    def _parse_sizes(value: Any) -> List[int]:
+        """Parse the extra PNG sizes option ("300, 1024")."""
+        sizes = []
+        for part in str(value or "").replace(";", ",").split(","):
+            part = part.strip()
+            if part.isdigit() and 64 <= int(part) <= 2048 and int(part) != MAP_SIZE:
+                sizes.append(int(part))
+        return sorted(set(sizes))
 
-        now = datetime.now(timezone.utc)
-        jd = self._datetime_to_jd(now)
+    def _map_spec(self, context: AstroContext) -> Dict[str, Any]:
+        """Collect everything the map renderers need (see solar_map)."""
+        now, jd = context.when, context.jd_utc
 
         # Get the reference angle for January at top
         ref_angle = self._get_earth_reference_angle(now)
 
-        def scale_r(d: float) -> float:
-            d = max(0.0, float(d))
-            if scale == "logarithmic":
-                return math.log(d + 1.0) / math.log(50.0) * maxR
-            elif scale == "compressed":
-                return (d ** 0.5) / (50.0 ** 0.5) * maxR
-            else:
-                return (d / 50.0) * maxR
-
-        def angle_to_xy(angle_deg: float, radius: float) -> Tuple[float, float]:
-            """
-            Convert angle in degrees to x, y coordinates.
-            0° = top (12 o'clock), angles increase clockwise.
-            """
-            # In our coordinate system:
-            # - 0° is at the top (negative y direction)
-            # - Angles increase clockwise
-            # Standard math: angle from positive x-axis, CCW
-            # We want: angle from negative y-axis (top), CW
-            # So: math_angle = 90° - our_angle (but we use radians)
-            rad = math.radians(90.0 - angle_deg)
-            x = cx + math.cos(rad) * radius
-            y = cy - math.sin(rad) * radius
-            return x, y
-
-        # Prepare planet items for visualization
-        items = []
+        helio = self._ephemeris.at(jd)
+        markers = []
         for pid, pdata in self._planets.items():
             if pdata.get("special_type") == "space_telescope":
                 continue  # Skip JWST (removed)
 
-            pname = self._get_planet_name(pid)
-            pos_data = self._calculate_planet_position(pid, jd)
+            pos_data = helio[pid]
 
             # Adjust longitude relative to reference angle
             # This makes Earth at Jan 1 position appear at 0° (top)
             adjusted_lon = (pos_data["longitude"] - ref_angle + 360.0) % 360.0
 
-            items.append({
+            markers.append({
                 "id": pid,
-                "name": pname,
+                "name": self._get_planet_name(pid),
                 "lon": adjusted_lon,
                 "dist": float(pos_data.get("distance", 1.0)),
                 "color": self._get_planet_color(pid),
@@ -684,232 +687,57 @@ class SolarSystemSensor(AlternativeTimeSensorBase):
                 "is_probe": pdata.get("special_type") == "probe"
             })
 
-        # Get month names
-        month_names = self._get_month_names()
-
-        # SVG header
-        out = []
-        out.append(f'<svg xmlns="http://www.w3.org/2000/svg" width="{int(width)}" height="{int(height)}" viewBox="0 0 {int(width)} {int(height)}" role="img" aria-label="Solar System Map">')
-        out.append('<defs>')
-        out.append('<style><![CDATA[')
-        out.append('text{font-family:Arial,system-ui,Segoe UI,Roboto,sans-serif}')
-        out.append('.month-label{font-size:11px;fill:#AAAAAA}')
-        out.append('.planet-label{font-size:10px;fill:#FFFFFF}')
-        out.append('.earth-label{font-size:11px;fill:#4AE24A;font-weight:bold}')
-        out.append('.footer{font-size:10px;fill:#888888}')
-        out.append(']]></style>')
-        out.append('</defs>')
-
-        # Background
-        out.append(f'<rect x="0" y="0" width="{int(width)}" height="{int(height)}" fill="#000022"/>')
-
-        # Sun
-        out.append(f'<circle cx="{cx}" cy="{cy}" r="18" fill="#FFD700" stroke="#FFA500" stroke-width="2"/>')
-        out.append(f'<text x="{cx}" y="{cy + 5}" fill="#000000" font-size="16" text-anchor="middle">☉</text>')
-
-        # Kuiper Belt (if enabled)
-        if self._show_kuiper_belt:
-            kb_inner = scale_r(30.0)  # ~30 AU
-            kb_outer = scale_r(50.0)  # ~50 AU
-            kb_mid = (kb_inner + kb_outer) / 2
-            out.append(f'<circle cx="{cx}" cy="{cy}" r="{kb_inner:.2f}" fill="none" stroke="rgba(102,204,255,0.25)" stroke-width="1"/>')
-            out.append(f'<circle cx="{cx}" cy="{cy}" r="{kb_outer:.2f}" fill="none" stroke="rgba(102,204,255,0.25)" stroke-width="1"/>')
-            out.append(f'<circle cx="{cx}" cy="{cy}" r="{kb_mid:.2f}" fill="none" stroke="rgba(102,204,255,0.15)" stroke-width="{kb_outer - kb_inner:.0f}"/>')
-
-        # Month markers
-        for i in range(12):
-            angle = i * 30.0
-            x1, y1 = angle_to_xy(angle, 25)
-            x2, y2 = angle_to_xy(angle, maxR + 20)
-            out.append(f'<line x1="{x1:.2f}" y1="{y1:.2f}" x2="{x2:.2f}" y2="{y2:.2f}" stroke="#333333" stroke-width="1" stroke-dasharray="4,4"/>')
-            lx, ly = angle_to_xy(angle, maxR + 35)
-            out.append(f'<text x="{lx:.2f}" y="{ly:.2f}" class="month-label" text-anchor="middle" dominant-baseline="middle">{month_names[i]}</text>')
-
-        # Orbits and planets
-        for it in items:
-            r = scale_r(it["dist"])
-
-            # Draw orbit
-            stroke_dash = "4,2" if it["is_dwarf_planet"] else "none"
-            stroke_color = "#555555" if it["is_probe"] else "#444444"
-            out.append(f'<circle cx="{cx}" cy="{cy}" r="{r:.2f}" fill="none" stroke="{stroke_color}" stroke-width="0.8" stroke-dasharray="{stroke_dash}"/>')
-
-            # Draw planet
-            x, y = angle_to_xy(it["lon"], r)
-
-            if it["is_earth"]:
-                # Earth with special "You are here" marker
-                out.append(f'<circle cx="{x:.2f}" cy="{y:.2f}" r="8" fill="{it["color"]}" stroke="#00FF00" stroke-width="2"/>')
-                you_are_here = self._get_solar_data_text("you_are_here", "You are here")
-                # Position label based on where Earth is
-                label_offset_y = -18 if it["lon"] < 180 else 25
-                out.append(f'<text x="{x:.2f}" y="{y + label_offset_y:.2f}" class="earth-label" text-anchor="middle">{it["symbol"]} {you_are_here}</text>')
-            elif it["is_probe"]:
-                # Probes: smaller marker
-                out.append(f'<circle cx="{x:.2f}" cy="{y:.2f}" r="3" fill="{it["color"]}" stroke="#FFFFFF" stroke-width="0.5"/>')
-                out.append(f'<text x="{x:.2f}" y="{y - 8:.2f}" class="planet-label" text-anchor="middle" font-size="8">{it["name"]}</text>')
-            else:
-                # Regular planets
-                planet_radius = 6 if it["id"] in ["jupiter", "saturn"] else 5
-                out.append(f'<circle cx="{x:.2f}" cy="{y:.2f}" r="{planet_radius}" fill="{it["color"]}" stroke="#FFFFFF" stroke-width="1"/>')
-                label = f'{it["symbol"]} {it["name"]}'
-                out.append(f'<text x="{x:.2f}" y="{y - 10:.2f}" class="planet-label" text-anchor="middle">{label}</text>')
-
-        # Footer
-        footer_text = self._get_solar_data_text("footer", "Heliocentric · Sun at center · Jan at top")
-        footer_text += f" · {scale.title()}"
-        out.append(f'<text x="10" y="{height - 10}" class="footer">{footer_text}</text>')
+        return {
+            "size": MAP_SIZE,
+            "scale": self._visualization_scale,
+            "show_kuiper_belt": self._show_kuiper_belt,
+            "month_names": self._get_month_names(),
+            "footer": self._get_solar_data_text("footer", "Heliocentric · Sun at center · Jan at top"),
+            "you_are_here": self._get_solar_data_text("you_are_here", "You are here"),
+            "markers": markers,
+        }
 
-        out.append("</svg>")
-        return "\n".join(out)
+    def _generate_visualization_svg(self, spec: Dict[str, Any]) -> Tuple[str, bool]:
+        """Return (svg, changed); unchanged if no marker moved noticeably."""
+        return self._svg_renderer.render(spec, self._map_pixel_threshold)
 
     # -------------- PNG (optional) --------------
-    def _text_size(self, draw, text: str, font) -> Tuple[int, int]:
-        t = str(text)
-        try:
-            L, T, R, B = draw.textbbox((0, 0), t, font=font)
-            return (R - L, B - T)
-        except Exception:
-            try:
-                return font.getsize(t)
-            except Exception:
-                return (max(1, len(t) * 7), 12)
-
-    def _generate_visualization_png_data_uri(self) -> str:
-        if Image is None or ImageDraw is None:
-            return ""
-
-        width, height = 600, 600
-        cx, cy = width // 2, height // 2
-        margin = 40
-        maxR = min(cx, cy) - margin
-        scale = self._visualization_scale
-
-        now = datetime.now(timezone.utc)
-        jd = self._datetime_to_jd(now)
-        ref_angle = self._get_earth_reference_angle(now)
-
-        def scale_r(d: float) -> float:
-            d = max(0.0, float(d))
-            if scale == "logarithmic":
-                return math.log(d + 1.0) / math.log(50.0) * maxR
-            elif scale == "compressed":
-                return (d ** 0.5) / (50.0 ** 0.5) * maxR
-            else:
-                return (d / 50.0) * maxR
-
-        def angle_to_xy(angle_deg: float, radius: float) -> Tuple[int, int]:
-            rad = math.radians(90.0 - angle_deg)
-            x = cx + math.cos(rad) * radius
-            y = cy - math.sin(rad) * radius
-            return int(x), int(y)
-
-        def hex_to_rgb(h: str, a: int = 255) -> tuple[int, int, int, int]:
-            h = h.lstrip("#")
-            return (int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16), a)
-
-        # Prepare planet items
-        items = []
-        for pid, pdata in self._planets.items():
-            if pdata.get("special_type") == "space_telescope":
-                continue
-            pos_data = self._calculate_planet_position(pid, jd)
-            adjusted_lon = (pos_data["longitude"] - ref_angle + 360.0) % 360.0
-            items.append({
-                "id": pid,
-                "name": self._get_planet_name(pid),
-                "lon": adjusted_lon,
-                "dist": float(pos_data.get("distance", 1.0)),
-                "color": self._get_planet_color(pid),
-                "symbol": pdata.get("symbol", ""),
-                "is_earth": pid == "earth",
-                "is_dwarf_planet": pdata.get("is_dwarf_planet", False),
-                "is_probe": pdata.get("special_type") == "probe"
-            })
+    def _generate_visualization_png(self, spec: Dict[str, Any], size: Optional[int] = None) -> Optional[bytes]:
+        """Render the PNG map (None without Pillow) and log its cost.
 
-        # Create image
-        img = Image.new("RGBA", (width, height), (0, 0, 34, 255))
-        draw = ImageDraw.Draw(img)
-
-        # Load fonts
-        try:
-            font_label = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 10)
-            font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 9)
-        except Exception:
-            font_label = ImageFont.load_default()
-            font_small = font_label
-
-        # Sun
-        draw.ellipse((cx - 18, cy - 18, cx + 18, cy + 18), fill=(255, 215, 0, 255), outline=(255, 165, 0, 255), width=2)
-
-        # Kuiper Belt
-        if self._show_kuiper_belt:
-            kb_inner = int(scale_r(30.0))
-            kb_outer = int(scale_r(50.0))
-            draw.ellipse((cx - kb_inner, cy - kb_inner, cx + kb_inner, cy + kb_inner),
-                         outline=(102, 204, 255, 64), width=1)
-            draw.ellipse((cx - kb_outer, cy - kb_outer, cx + kb_outer, cy + kb_outer),
-                         outline=(102, 204, 255, 64), width=1)
-
-        # Month markers
-        month_names = self._get_month_names()
-        for i in range(12):
-            angle = i * 30.0
-            x1, y1 = angle_to_xy(angle, 25)
-            x2, y2 = angle_to_xy(angle, maxR + 20)
-            draw.line([(x1, y1), (x2, y2)], fill=(51, 51, 51, 255), width=1)
-            lx, ly = angle_to_xy(angle, maxR + 35)
-            tw, th = self._text_size(draw, month_names[i], font_small)
-            draw.text((lx - tw // 2, ly - th // 2), month_names[i], fill=(170, 170, 170, 255), font=font_small)
-
-        # Orbits and planets
-        for it in items:
-            r = int(scale_r(it["dist"]))
-            # Orbit
-            draw.ellipse((cx - r, cy - r, cx + r, cy + r), outline=(68, 68, 68, 255), width=1)
-            # Planet
-            x, y = angle_to_xy(it["lon"], r)
-            planet_r = 8 if it["is_earth"] else (3 if it["is_probe"] else (6 if it["id"] in ["jupiter", "saturn"] else 5))
-            if it["is_earth"]:
-                draw.ellipse((x - planet_r, y - planet_r, x + planet_r, y + planet_r),
-                             fill=hex_to_rgb(it["color"]),
-                             outline=(0, 255, 0, 255),
-                             width=2)
-                label = f'{it["symbol"]} {self._get_solar_data_text("you_are_here", "You are here")}'
-                tw, th = self._text_size(draw, label, font_label)
-                draw.text((x - tw // 2, y - 18 - th), label, fill=(74, 226, 74, 255), font=font_label)
-            else:
-                draw.ellipse((x - planet_r, y - planet_r, x + planet_r, y + planet_r),
-                             fill=hex_to_rgb(it["color"]),
-                             outline=(255, 255, 255, 255),
-                             width=1)
-                label = f'{it["symbol"]} {it["name"]}'
-                tw, th = self._text_size(draw, label, font_label)
-                draw.text((x - tw // 2, y - 12 - th), label, fill=(255, 255, 255, 255), font=font_label)
-
-        # Footer
-        footer_text = self._get_solar_data_text("footer", "Heliocentric · Sun at center · Jan at top")
-        footer_text += f" · {scale.title()}"
-        tw, th = self._text_size(draw, footer_text, font_small)
-        draw.text((10, height - 10 - th), footer_text, fill=(136, 136, 136, 255), font=font_small)
-
-        buf = io.BytesIO()
-        img.save(buf, format="PNG")
-        data = base64.b64encode(buf.getvalue()).decode("ascii")
-        return "data:image/png;base64," + data
+        With map_render_in_process the work goes to the shared render
+        worker; if that fails the map is drawn in this thread instead.
+        """
+        png = None
+        if self._map_render_in_process and self.hass is not None:
+            try:
+                png, self._map_timings = get_render_pool(self.hass).run(render_png_in_worker, spec, size)
+            except Exception as e:
+                _LOGGER.warning("Render worker failed, drawing the map in-thread: %s", e)
+                png = None
+        if png is None:
+            png = self._png_renderer.render(spec, size)
+            self._map_timings = self._png_renderer.last_timings
+        if png is not None:
+            _LOGGER.debug("Solar system PNG %spx rendered: %s", size or spec["size"], self._map_timings)
+        return png
 
     # -------------- positions collector --------------
-    def _calculate_positions(self, dt: datetime) -> Dict[str, Any]:
-        jd = self._datetime_to_jd(dt)
+    def _calculate_positions(self, context: AstroContext) -> Dict[str, Any]:
+        dt, jd = context.when, context.jd_utc
         result: Dict[str, Any] = {
             "julian_date": jd,
             "timestamp": dt.isoformat(),
             "observer_location": {"latitude": self._observer_latitude, "longitude": self._observer_longitude},
             "positions": {}
         }
-        earth_pos = None
-        if "earth" in self._planets:
-            earth_pos = self._calculate_planet_position("earth", jd)
+        # All bodies in one batch evaluation
+        helio = self._ephemeris.at(jd)
+        has_earth = "earth" in self._ephemeris.index
+        geo = self._ephemeris.geocentric_at(jd) if has_earth else {}
+        motion = self._ephemeris.apparent_motion(jd) if has_earth and self._show_retrograde else {}
+        events = self._upcoming_events(jd) if has_earth and self._show_events else []
+        daily = self._daily_rise_set(dt) if has_earth and self._show_visibility else {}
 
         planets_to_calc = list(self._planets.keys()) if self._display_planet == "all" else [self._display_planet]
         for planet_id in planets_to_calc:
@@ -918,8 +746,10 @@ class SolarSystemSensor(AlternativeTimeSensorBase):
             if self._planets.get(planet_id, {}).get("special_type") == "space_telescope":
                 continue  # Skip JWST
 
-            helio_pos = self._calculate_planet_position(planet_id, jd)
-            position = self._calculate_geocentric_position(helio_pos, earth_pos) if (self._coordinate_system == "geocentric" and earth_pos and planet_id != "earth") else helio_pos
+            if self._coordinate_system == "geocentric" and planet_id in geo:
+                position = dict(geo[planet_id])
+            else:
+                position = dict(helio[planet_id])
 
             cname, csym = self._get_constellation(position['longitude'])
             position['constellation'] = cname
@@ -931,32 +761,55 @@ class SolarSystemSensor(AlternativeTimeSensorBase):
 
             if self._show_visibility and self._planets.get(planet_id, {}).get("special_type") not in ("probe",):
                 if planet_id != "earth":
-                    position['visibility'] = self._calculate_visibility(planet_id, dt)
+                    position['visibility'] = self._calculate_visibility(planet_id, helio, geo, daily)
 
-            position['retrograde'] = False  # simplified placeholder
+            # Apparent motion along the ecliptic as seen from Earth (deg/day)
+            if planet_id in motion:
+                position['apparent_motion'] = round(motion[planet_id], 4)
+            position['retrograde'] = motion.get(planet_id, 0.0) < 0.0
+
+            # Next event of each type for this planet
+            next_events: Dict[str, str] = {}
+            for event in events:
+                if event["body"] == planet_id and event["type"] not in next_events:
+                    next_events[event["type"]] = self._jd_to_datetime(event["jd"]).isoformat()
+            if next_events:
+                position['next_events'] = next_events
 
             pname = self._get_planet_name(planet_id)
             result["positions"][pname] = position
 
+        sun = daily.get("sun")
+        if sun:
+            result["sun"] = {
+                name: sun[key].strftime("%H:%M") if sun[key] else None
+                for name, key in (("rise_time", "rise"), ("transit_time", "transit"), ("set_time", "set"))
+            }
+
+        if events:
+            result["upcoming_events"] = [
+                {
+                    "time": self._jd_to_datetime(event["jd"]).isoformat(),
+                    "planet": self._get_planet_name(event["body"]),
+                    "event": event["type"],
+                    **({"elongation": event["elongation"]} if "elongation" in event else {}),
+                }
+                for event in events[:UPCOMING_EVENTS_SHOWN]
+            ]
+
         return result
 
-    # -------------- time conversions --------------
-    def _datetime_to_jd(self, dt: datetime) -> float:
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        else:
-            dt = dt.astimezone(timezone.utc)
-        year = dt.year
-        month = dt.month
-        day = dt.day + (dt.hour + dt.minute / 60.0 + dt.second / 3600.0) / 24.0
-        if month <= 2:
-            year -= 1
-            month += 12
-        a = int(year / 100)
-        b = 2 - a + int(a / 4)
-        jd = int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + b - 1524.5
-        return float(jd)
+    def _upcoming_events(self, jd: float) -> List[Dict[str, Any]]:
+        """Return cached planetary events from jd on (see planet_events)."""
+        if self._hass is None:
+            return []
+        try:
+            return get_planet_event_cache(self._hass).events(self._ephemeris, jd)
+        except Exception as e:
+            _LOGGER.warning("Planet event search failed: %s", e)
+            return []
 
+    # -------------- time conversions --------------
     def _jd_to_datetime(self, jd: float) -> datetime:
         jd = float(jd) + 0.5
         z = int(jd)
@@ -975,29 +828,30 @@ class SolarSystemSensor(AlternativeTimeSensorBase):
         year = c - 4716 if month > 2 else c - 4715
         day_i = int(day)
         frac = day - day_i
+        # timedelta: rounding may carry into the next day
         seconds = int(round(frac * 86400.0))
-        hh = seconds // 3600
-        mm = (seconds % 3600) // 60
-        ss = seconds % 60
-        return datetime(year, int(month), int(day_i), hh, mm, ss, tzinfo=timezone.utc)
+        return datetime(year, int(month), int(day_i), tzinfo=timezone.utc) + timedelta(seconds=seconds)
 
     # -------------- asset writing (/local) --------------
-    def _write_local_assets(self, svg: str, png_data_uri: Optional[str]) -> Dict[str, str]:
-        """Write SVG/PNG under /config/www/alternative_time and return /local paths."""
+    def _write_local_assets(self, svg: str, png: Optional[bytes]) -> Dict[str, str]:
+        """Store SVG/PNG under /config/www/alternative_time and return /local paths.
+
+        Unchanged maps are not rewritten; the paths carry the content hash
+        so browsers pick up new renders without cache-busting tricks.
+        """
         out: Dict[str, str] = {}
         try:
-            base = self.hass.config.path("www/alternative_time")
-            os.makedirs(base, exist_ok=True)
-            svg_path = os.path.join(base, "solar_system_map.svg")
-            with open(svg_path, "w", encoding="utf-8") as f:
-                f.write(svg)
-            out["local_svg_path"] = "/local/alternative_time/solar_system_map.svg"
-
-            if png_data_uri and png_data_uri.startswith("data:image/png;base64,"):
-                png_path = os.path.join(base, "solar_system_map.png")
-                with open(png_path, "wb") as f:
-                    f.write(base64.b64decode(png_data_uri.split(",", 1)[1]))
-                out["local_png_path"] = "/local/alternative_time/solar_system_map.png"
+            store = get_asset_store(self.hass)
+            asset = store.write("solar_system_map.svg", svg.encode("utf-8"))
+            out["local_svg_path"] = asset["versioned_url"]
+
+            if png:
+                asset = store.write("solar_system_map.png", png)
+                out["local_png_path"] = asset["versioned_url"]
+
+            for size, data in self._cached_png_sizes.items():
+                asset = store.write(f"solar_system_map_{size}.png", data)
+                out[f"local_png_path_{size}"] = asset["versioned_url"]
         except Exception as e:
             _LOGGER.warning("Writing local assets failed: %s", e)
         return out
@@ -1007,6 +861,17 @@ class SolarSystemSensor(AlternativeTimeSensorBase):
     def state(self) -> str:
         return self._state
 
+    def image_bytes(self) -> Optional[bytes]:
+        """Return the map for the image entity (PNG, or SVG without Pillow)."""
+        if self._cached_png:
+            return self._cached_png
+        if self._cached_svg:
+            return self._cached_svg.encode("utf-8")
+        return None
+
+    def image_content_type(self) -> str:
+        return "image/png" if self._cached_png else "image/svg+xml"
+
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         attrs = super().extra_state_attributes
@@ -1018,28 +883,23 @@ class SolarSystemSensor(AlternativeTimeSensorBase):
             attrs["config"] = {
                 "display_planet": self._display_planet,
                 "coordinate_system": self._coordinate_system,
+                "accuracy_mode": self._ephemeris.accuracy,
                 "show_distance": self._show_distance,
                 "show_constellation": self._show_constellation,
                 "show_retrograde": self._show_retrograde,
                 "show_visibility": self._show_visibility,
+                "show_events": self._show_events,
                 "enable_visualization": self._enable_visualization,
                 "visualization_scale": self._visualization_scale
             }
 
-            # Use cached visualization data (generated in update() to avoid blocking)
+            # The map itself is served by the image entity; only reference it here
             if self._enable_visualization and self._cached_svg:
-                attrs["solar_system_map_svg"] = self._cached_svg
-
-                if self._cached_png_data_uri:
-                    attrs["solar_system_map_png"] = self._cached_png_data_uri
-
-                # entity_picture: prefer PNG, fallback to SVG data URI
-                if self._cached_png_data_uri:
-                    attrs["entity_picture"] = self._cached_png_data_uri
-                else:
-                    # SVG as data-uri
-                    svg_b64 = base64.b64encode(self._cached_svg.encode("utf-8")).decode("ascii")
-                    attrs["entity_picture"] = "data:image/svg+xml;base64," + svg_b64
+                if self.image_last_updated:
+                    attrs["map_last_updated"] = self.image_last_updated.isoformat()
+                if self._map_timings:
+                    attrs["map_render_ms"] = self._map_timings["total_ms"]
+                    attrs["map_encode_ms"] = self._map_timings["encode_ms"]
 
                 # Add local paths if available
                 attrs.update(self._cached_local_paths)
@@ -1062,17 +922,60 @@ class SolarSystemSensor(AlternativeTimeSensorBase):
         if self._show_visibility and "visibility" in position:
             vis = position["visibility"]
             if vis.get("visible"):
-                parts.append(f"👁 {vis.get('rise_time','N/A')}-{vis.get('set_time','N/A')}")
+                parts.append(f"👁 {vis.get('rise_time') or 'N/A'}-{vis.get('set_time') or 'N/A'}")
             else:
                 parts.append("🚫 Not visible")
         if self._show_retrograde and position.get("retrograde", False):
             parts.append("℞")
         return " | ".join(parts)
 
+    def _render_map(self, context: AstroContext) -> None:
+        """Render SVG/PNG maps and store them; skipped if nothing moved."""
+        spec = self._map_spec(context)
+        previous = self.image_bytes()
+        try:
+            svg, changed = self._generate_visualization_svg(spec)
+            self._cached_svg = svg
+        except Exception as e:
+            _LOGGER.warning("SVG generation failed: %s", e)
+            self._cached_svg = None
+            changed = True
+
+        if not changed and (self._cached_png or not PngMapRenderer.available()):
+            # No marker moved by more than the pixel threshold
+            _LOGGER.debug("Solar system map unchanged, skipping render")
+            return
+
+        try:
+            self._cached_png = self._generate_visualization_png(spec)
+            self._cached_png_sizes = {
+                size: png for size in self._map_png_sizes
+                if (png := self._generate_visualization_png(spec, size))
+            }
+        except Exception as e:
+            _LOGGER.debug("PNG generation failed: %s", e)
+            self._cached_png = None
+            self._cached_png_sizes = {}
+
+        current = self.image_bytes()
+        if current is not None and current != previous:
+            self._mark_image_updated()
+
+        # Write files to /local (blocking I/O is OK here in update())
+        if self._cached_svg:
+            try:
+                self._cached_local_paths = self._write_local_assets(self._cached_svg, self._cached_png)
+            except Exception as e:
+                _LOGGER.warning("Writing local assets failed: %s", e)
+                self._cached_local_paths = {}
+
     # -------------- HA update --------------
     def update(self) -> None:
         if self.hass and hasattr(self.hass, 'config'):
             self._user_language = getattr(self.hass.config, 'language', 'en') or 'en'
+            # Follow location changes (the rise/set sweep is keyed on them)
+            self._observer_latitude = self.hass.config.latitude
+            self._observer_longitude = self.hass.config.longitude
 
         options = self.get_plugin_options()
         if options:
@@ -1081,41 +984,31 @@ class SolarSystemSensor(AlternativeTimeSensorBase):
             self._show_distance = options.get("show_distance", self._show_distance)
             self._show_constellation = options.get("show_constellation", self._show_constellation)
             self._show_retrograde = options.get("show_retrograde", self._show_retrograde)
+            accuracy = options.get("accuracy_mode", self._ephemeris.accuracy)
+            if accuracy != self._ephemeris.accuracy:
+                self._ephemeris = KeplerEphemeris(self._planets, accuracy, EPHEMERIS_QUANTUM)
             self._show_visibility = options.get("show_visibility", self._show_visibility)
+            self._show_events = options.get("show_events", self._show_events)
             self._enable_visualization = options.get("enable_visualization", self._enable_visualization)
             self._visualization_scale = options.get("visualization_scale", self._visualization_scale)
+            self._map_pixel_threshold = float(options.get("map_pixel_threshold", self._map_pixel_threshold))
+            self._map_png_sizes = self._parse_sizes(options.get("map_png_sizes", ""))
+            self._map_render_in_process = options.get("map_render_in_process", self._map_render_in_process)
 
         try:
-            now = datetime.now(timezone.utc)
-            self._positions_info = self._calculate_positions(now)
+            context = self.astro_context()
+            self._positions_info = self._calculate_positions(context)
 
             # Generate visualizations here where blocking I/O is allowed
-            if self._enable_visualization:
-                try:
-                    self._cached_svg = self._generate_visualization_svg()
-                except Exception as e:
-                    _LOGGER.warning("SVG generation failed: %s", e)
-                    self._cached_svg = None
-
-                try:
-                    self._cached_png_data_uri = self._generate_visualization_png_data_uri()
-                except Exception as e:
-                    _LOGGER.debug("PNG generation failed: %s", e)
-                    self._cached_png_data_uri = None
-
-                # Write files to /local (blocking I/O is OK here in update())
-                if self._cached_svg:
-                    try:
-                        self._cached_local_paths = self._write_local_assets(
-                            self._cached_svg,
-                            self._cached_png_data_uri if self._cached_png_data_uri else None
-                        )
-                    except Exception as e:
-                        _LOGGER.warning("Writing local assets failed: %s", e)
-                        self._cached_local_paths = {}
+            if self._enable_visualization and self.visualization_enabled:
+                if self.render_deferred and self._cached_svg:
+                    # Event loop under load: keep the previous map for now
+                    _LOGGER.debug("Solar system map render deferred")
+                else:
+                    self._render_map(context)
             else:
                 self._cached_svg = None
-                self._cached_png_data_uri = None
+                self._cached_png = None
                 self._cached_local_paths = {}
 
             if self._display_planet == "all":
@@ -1126,9 +1019,9 @@ class SolarSystemSensor(AlternativeTimeSensorBase):
                 pos = self._positions_info.get("positions", {}).get(planet_name, {})
                 self._state = self._format_position(self._display_planet, pos) if pos else f"{planet_name}: No data"
         except Exception as e:
-            _LOGGER.exception("Error calculating solar system positions")
             self._state = "Error"
             self._positions_info = {"error": str(e)}
+            raise
 
         _LOGGER.debug("Updated Solar System to %s", self._state)
 
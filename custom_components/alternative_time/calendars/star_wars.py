@@ -1,15 +1,15 @@
 """Star Wars Galactic Calendar implementation - Version 2.6."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -261,7 +261,7 @@ class StarWarsCalendarSensor(AlternativeTimeSensorBase):
         self._state = None
         self._star_wars_date = {}
 
-        _LOGGER.debug(f"Initialized Star Wars Calendar sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Star Wars Calendar sensor: %s", self._attr_name)
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -277,14 +277,16 @@ class StarWarsCalendarSensor(AlternativeTimeSensorBase):
                 self._show_festivals = options.get("show_festivals", self._show_festivals)
                 self._planet_time = options.get("planet_time", self._planet_time)
 
-                _LOGGER.debug(f"Star Wars sensor loaded options: era={self._era_system}, "
-                            f"planet={self._planet_time}, show_week={self._show_week}")
+                _LOGGER.debug(
+                    "Star Wars sensor loaded options: era=%s, planet=%s, show_week=%s",
+                    self._era_system, self._planet_time, self._show_week,
+                )
             else:
                 _LOGGER.debug("Star Wars sensor using default options - no custom options found")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"Star Wars sensor could not load options yet: {e}")
+            _LOGGER.debug("Star Wars sensor could not load options yet: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -463,4 +465,4 @@ class StarWarsCalendarSensor(AlternativeTimeSensorBase):
         # Set state to formatted Star Wars date
         self._state = self._star_wars_date["formatted"]
 
-        _LOGGER.debug(f"Updated Star Wars Calendar to {self._state}")
+        _LOGGER.debug("Updated Star Wars Calendar to %s", self._state)
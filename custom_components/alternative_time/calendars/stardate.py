@@ -1,15 +1,15 @@
 """Star Trek Stardate implementation - Version 3.0."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -463,7 +463,10 @@ class StardateSensor(AlternativeTimeSensorBase):
         # Ship rotation index
         self._ship_index = 0
 
-        _LOGGER.debug(f"Initialized Stardate sensor: {self._attr_name}")
+        # Flag to track if options have been loaded
+        self._options_loaded = False
+
+        _LOGGER.debug("Initialized Stardate sensor: %s", self._attr_name)
 
     def set_options(self, options: Dict[str, Any]) -> None:
         """Set options from config flow."""
@@ -473,9 +476,21 @@ class StardateSensor(AlternativeTimeSensorBase):
             self._show_ship = options.get("show_ship", self._show_ship)
             self._precision = int(options.get("precision", self._precision))
 
-            _LOGGER.debug(f"Stardate sensor options updated: format={self._format}, "
-                         f"show_event={self._show_event}, show_ship={self._show_ship}, "
-                         f"precision={self._precision}")
+            _LOGGER.debug(
+                "Stardate sensor options updated: format=%s, show_event=%s, show_ship=%s, precision=%s",
+                self._format, self._show_event, self._show_ship, self._precision,
+            )
+
+    def _load_options(self) -> None:
+        """Load plugin options after IDs are set."""
+        if self._options_loaded:
+            return
+
+        try:
+            self.set_options(self.get_plugin_options())
+            self._options_loaded = True
+        except Exception as e:
+            _LOGGER.debug("Stardate sensor could not load options yet: %s", e)
 
     @property
     def state(self):
@@ -507,6 +522,16 @@ class StardateSensor(AlternativeTimeSensorBase):
 
         return attrs
 
+    def state_resolution(self) -> float:
+        """Return the smallest time step that changes the formatted stardate."""
+        if self._format == "tng":
+            # 10 units per day, quantized to whole minutes
+            return max(60.0, 8640.0 / (10 ** self._precision))
+        if self._format == "discovery":
+            return 3600.0
+        # TOS and Kelvin only advance once per day
+        return 86400.0
+
     def _calculate_tng_stardate(self, earth_date: datetime) -> float:
         """Calculate TNG-style stardate."""
         base_year = self._stardate_data["base_year"]
@@ -640,10 +665,14 @@ class StardateSensor(AlternativeTimeSensorBase):
 
     def update(self) -> None:
         """Update the sensor."""
+        # Options are loaded on the first update and again after the entry changed
+        if not self._options_loaded:
+            self._load_options()
+
         now = datetime.now()
         self._stardate = self._calculate_stardate(now)
 
         # Set state to formatted stardate
         self._state = self._stardate["formatted"]
 
-        _LOGGER.debug(f"Updated Stardate to {self._state}")
+        _LOGGER.debug("Updated Stardate to %s", self._state)
@@ -21,19 +21,33 @@ PULSARS (6 nearest):
 
 Uses J2000.0 coordinates, proper motions, parallaxes and radial velocities for high precision.
 Data sources: Gaia DR3, VLBI parallax measurements, pulsar timing.
+
+The objects are evaluated together as a StarCatalog (see star_catalog).
+The nearest stars and the closest approaches to the Sun come from the
+same built-in stars, or from a larger CSV export (Gaia/Hipparcos) that is
+imported once into a memory-mapped table. The catalog's k-d tree also
+lists the stars within a search radius and the stars nearest to the
+primary object.
 """
 from __future__ import annotations
 
-import logging
 import math
 from datetime import datetime
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
 from homeassistant.core import HomeAssistant
 
+from ..astro_context import J2000_JD
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
+from ..star_catalog import (
+    CATALOG_CSV,
+    DEFAULT_HORIZON_YEARS,
+    StarCatalog,
+    get_star_catalog,
+)
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CONSTANTS
@@ -286,6 +300,18 @@ STELLAR_DATA = {
     }
 }
 
+# Built-in objects as catalogs (STELLAR_DATA order); the stars alone
+# answer the nearest/closest approach queries without an imported catalog
+OBJECT_IDS = list(STELLAR_DATA)
+OBJECT_CATALOG = StarCatalog.from_objects(STELLAR_DATA)
+STAR_CATALOG = StarCatalog.from_objects({k: v for k, v in STELLAR_DATA.items() if v["category"] == "star"})
+
+# Longest star list in the attributes, and the distance (ly) under which a
+# catalog star is taken to be the primary object itself
+MAX_LISTED_STARS = 50
+NEIGHBOUR_COUNT = 3
+SAME_STAR_LY = 0.01
+
 UPDATE_INTERVAL = 3600
 
 CALENDAR_INFO = {
@@ -363,7 +389,10 @@ CALENDAR_INFO = {
         },
         "show_stars": {"type": "boolean", "default": True, "label": {"en": "Show Stars", "de": "Sterne anzeigen", "es": "Mostrar Estrellas", "fr": "Afficher Étoiles", "it": "Mostra Stelle", "nl": "Sterren Tonen", "pl": "Pokaż Gwiazdy", "pt": "Mostrar Estrelas", "ru": "Показать звёзды", "ja": "恒星を表示", "zh": "显示恒星", "ko": "별 표시"}, "description": {"en": "Include stars in attributes", "de": "Sterne in Attributen einschließen"}},
         "show_pulsars": {"type": "boolean", "default": True, "label": {"en": "Show Pulsars", "de": "Pulsare anzeigen", "es": "Mostrar Púlsares", "fr": "Afficher Pulsars", "it": "Mostra Pulsar", "nl": "Pulsars Tonen", "pl": "Pokaż Pulsary", "pt": "Mostrar Pulsares", "ru": "Показать пульсары", "ja": "パルサーを表示", "zh": "显示脉冲星", "ko": "펄서 표시"}, "description": {"en": "Include pulsars in attributes", "de": "Pulsare in Attributen einschließen"}},
-        "show_motion": {"type": "boolean", "default": True, "label": {"en": "Show Motion Direction", "de": "Bewegungsrichtung anzeigen", "es": "Mostrar Dirección", "fr": "Afficher Direction", "it": "Mostra Direzione", "nl": "Richting Tonen", "pl": "Pokaż Kierunek", "pt": "Mostrar Direção", "ru": "Показать направление", "ja": "移動方向を表示", "zh": "显示方向", "ko": "방향 표시"}, "description": {"en": "Show if object is approaching or receding", "de": "Zeigt an, ob sich das Objekt nähert oder entfernt"}}
+        "show_motion": {"type": "boolean", "default": True, "label": {"en": "Show Motion Direction", "de": "Bewegungsrichtung anzeigen", "es": "Mostrar Dirección", "fr": "Afficher Direction", "it": "Mostra Direzione", "nl": "Richting Tonen", "pl": "Pokaż Kierunek", "pt": "Mostrar Direção", "ru": "Показать направление", "ja": "移動方向を表示", "zh": "显示方向", "ko": "방향 표시"}, "description": {"en": "Show if object is approaching or receding", "de": "Zeigt an, ob sich das Objekt nähert oder entfernt"}},
+        "nearest_count": {"type": "integer", "default": 10, "min": 0, "max": 100, "label": {"en": "Nearest Stars", "de": "Nächste Sterne", "es": "Estrellas Más Cercanas", "fr": "Étoiles les Plus Proches", "it": "Stelle Più Vicine", "nl": "Dichtstbijzijnde Sterren", "pl": "Najbliższe Gwiazdy", "pt": "Estrelas Mais Próximas", "ru": "Ближайшие звёзды", "ja": "最も近い恒星", "zh": "最近的恒星", "ko": "가장 가까운 별"}, "description": {"en": f"How many nearest stars and closest approaches to list (0 = off); uses {CATALOG_CSV} from the config directory if present", "de": f"Wie viele nächste Sterne und engste Annäherungen aufgelistet werden (0 = aus); nutzt {CATALOG_CSV} aus dem Konfigurationsverzeichnis, falls vorhanden"}},
+        "approach_horizon_years": {"type": "integer", "default": int(DEFAULT_HORIZON_YEARS), "min": 1000, "max": 10000000, "label": {"en": "Approach Horizon (years)", "de": "Annäherungshorizont (Jahre)", "es": "Horizonte de Aproximación (años)", "fr": "Horizon d'Approche (années)", "it": "Orizzonte di Avvicinamento (anni)", "nl": "Naderingshorizon (jaren)", "pl": "Horyzont Zbliżeń (lata)", "pt": "Horizonte de Aproximação (anos)", "ru": "Горизонт сближений (лет)", "ja": "接近予測期間（年）", "zh": "接近预测期（年）", "ko": "접근 예측 기간 (년)"}, "description": {"en": "Search closest approaches to the Sun this many years ahead", "de": "Engste Annäherungen an die Sonne so viele Jahre im Voraus suchen"}},
+        "search_radius_ly": {"type": "number", "default": 20, "min": 0, "max": 1000, "label": {"en": "Search Radius (ly)", "de": "Suchradius (Lj)", "es": "Radio de Búsqueda (al)", "fr": "Rayon de Recherche (al)", "it": "Raggio di Ricerca (al)", "nl": "Zoekstraal (lj)", "pl": "Promień Wyszukiwania (ls)", "pt": "Raio de Busca (al)", "ru": "Радиус поиска (св.г.)", "ja": "検索半径（光年）", "zh": "搜索半径（光年）", "ko": "검색 반경 (광년)"}, "description": {"en": "List the stars within this distance of the Sun (0 = off)", "de": "Sterne innerhalb dieser Entfernung von der Sonne auflisten (0 = aus)"}}
     },
 
     "stellar_data": STELLAR_DATA
@@ -373,75 +402,8 @@ CALENDAR_INFO = {
 # CALCULATION FUNCTIONS
 # ============================================
 
-def julian_date(dt: datetime) -> float:
-    year, month = dt.year, dt.month
-    day = dt.day + (dt.hour + dt.minute / 60 + dt.second / 3600) / 24
-    if month <= 2:
-        year -= 1
-        month += 12
-    A = int(year / 100)
-    B = 2 - A + int(A / 4)
-    return int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + B - 1524.5
-
-def years_since_j2000(dt: datetime) -> float:
-    return (julian_date(dt) - 2451545.0) / 365.25
-
-def parallax_to_distance_au(parallax_mas: float) -> float:
-    if parallax_mas <= 0:
-        return float('inf')
-    return (1000.0 / parallax_mas) * PARSEC_IN_AU
-
-def calculate_current_distance(star_data: dict, dt: datetime) -> Tuple[float, float, float, float, float, float, float]:
-    """Calculate current distance with uncertainty.
-
-    Returns:
-        Tuple of (distance_au, distance_ly, distance_pc, radial_change_au,
-                  uncertainty_percent, distance_min_au, distance_max_au)
-    """
-    parallax = star_data["parallax_mas"]
-    parallax_error = star_data.get("parallax_error_mas", 0.0)
-
-    base_distance_au = parallax_to_distance_au(parallax)
-
-    # Calculate uncertainty from parallax error
-    # For parallax: d = 1/π, so δd/d ≈ δπ/π (for small errors)
-    # This gives the relative uncertainty
-    if parallax > 0 and parallax_error > 0:
-        relative_uncertainty = parallax_error / parallax
-        uncertainty_percent = relative_uncertainty * 100
-
-        # Calculate min/max distances (parallax ± error)
-        parallax_min = max(parallax - parallax_error, 0.001)  # Avoid division by zero
-        parallax_max = parallax + parallax_error
-        distance_max_au = parallax_to_distance_au(parallax_min)  # Smaller parallax = larger distance
-        distance_min_au = parallax_to_distance_au(parallax_max)  # Larger parallax = smaller distance
-    else:
-        uncertainty_percent = 0.0
-        distance_min_au = base_distance_au
-        distance_max_au = base_distance_au
-
-    # Add radial velocity contribution
-    years = years_since_j2000(dt)
-    rv_km_s = star_data.get("rv_km_s", 0.0)
-    rv_error = star_data.get("rv_error_km_s", 0.0)
-    rv_au_per_year = rv_km_s * SECONDS_PER_YEAR / KM_PER_AU
-    radial_change_au = rv_au_per_year * years
-
-    # Add RV uncertainty contribution (for long time spans)
-    if abs(years) > 1 and rv_error > 0:
-        rv_uncertainty_au = (rv_error * SECONDS_PER_YEAR / KM_PER_AU) * abs(years)
-        # Combine uncertainties (add in quadrature would be more correct, but this is simpler)
-        distance_min_au = distance_min_au + radial_change_au - rv_uncertainty_au
-        distance_max_au = distance_max_au + radial_change_au + rv_uncertainty_au
-    else:
-        distance_min_au += radial_change_au
-        distance_max_au += radial_change_au
-
-    current_distance_au = base_distance_au + radial_change_au
-
-    return (current_distance_au, current_distance_au / LIGHT_YEAR_IN_AU,
-            current_distance_au / PARSEC_IN_AU, radial_change_au,
-            uncertainty_percent, distance_min_au, distance_max_au)
+def years_since_j2000(jd: float) -> float:
+    return (jd - J2000_JD) / 365.25
 
 def format_distance(distance_au: float, unit: str, precision: str) -> str:
     dp = {"standard": 2, "high": 4, "scientific": 6}.get(precision, 2)
@@ -478,11 +440,22 @@ class StellarDistancesSensor(AlternativeTimeSensorBase):
         self._show_stars = cfg.get("show_stars", {}).get("default", True)
         self._show_pulsars = cfg.get("show_pulsars", {}).get("default", True)
         self._show_motion = cfg.get("show_motion", {}).get("default", True)
+        self._nearest_count = cfg.get("nearest_count", {}).get("default", 10)
+        self._approach_horizon = cfg.get("approach_horizon_years", {}).get("default", DEFAULT_HORIZON_YEARS)
+        self._search_radius = cfg.get("search_radius_ly", {}).get("default", 20)
 
         self._stellar_data = STELLAR_DATA
         self._options_loaded = False
         self._state = None
         self._object_distances = {}
+        self._catalog_store = None
+        self._catalog_source = "builtin"
+        self._catalog_size = len(STAR_CATALOG)
+        self._nearest_stars: List[Dict[str, Any]] = []
+        self._closest_approaches: List[Dict[str, Any]] = []
+        self._stars_within: List[Dict[str, Any]] = []
+        self._stars_within_count = 0
+        self._primary_neighbours: List[Dict[str, Any]] = []
 
     def _load_options(self) -> None:
         if self._options_loaded:
@@ -496,6 +469,9 @@ class StellarDistancesSensor(AlternativeTimeSensorBase):
                 self._show_stars = opts.get("show_stars", self._show_stars)
                 self._show_pulsars = opts.get("show_pulsars", self._show_pulsars)
                 self._show_motion = opts.get("show_motion", self._show_motion)
+                self._nearest_count = int(opts.get("nearest_count", self._nearest_count))
+                self._approach_horizon = float(opts.get("approach_horizon_years", self._approach_horizon))
+                self._search_radius = float(opts.get("search_radius_ly", self._search_radius))
             self._options_loaded = True
         except Exception:
             pass
@@ -503,7 +479,10 @@ class StellarDistancesSensor(AlternativeTimeSensorBase):
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
         self._load_options()
-        self.update()
+        self._catalog_store = get_star_catalog(self._hass)
+        await self._catalog_store.async_load()
+        # Refresh with the loaded catalog (failures go to the circuit breaker)
+        await self._async_timer_tick(None)
 
     def _get_label(self, key: str, default: str = "") -> str:
         labels = CALENDAR_INFO.get("labels", {}).get(key, {})
@@ -525,12 +504,17 @@ class StellarDistancesSensor(AlternativeTimeSensorBase):
         lang = getattr(self._hass.config, "language", "en")
         return notes.get(lang, notes.get(lang.split("-")[0], notes.get("en", "")))
 
-    def _calc_object(self, obj_id: str, now: datetime) -> Dict[str, Any]:
+    def _calc_object(self, obj_id: str, distance: Dict[str, float]) -> Dict[str, Any]:
         obj = self._stellar_data.get(obj_id, {})
         if not obj:
             return {}
 
-        dist_au, dist_ly, dist_pc, radial, uncertainty_pct, dist_min_au, dist_max_au = calculate_current_distance(obj, now)
+        dist_au = distance["distance_au"]
+        dist_ly = dist_au / LIGHT_YEAR_IN_AU
+        dist_pc = dist_au / PARSEC_IN_AU
+        uncertainty_pct = distance["uncertainty_percent"]
+        dist_min_au = distance["distance_min_au"]
+        dist_max_au = distance["distance_max_au"]
         dp = {"standard": 2, "high": 4, "scientific": 6}.get(self._precision, 4)
         rv = obj.get("rv_km_s", 0.0)
         approaching = rv < 0
@@ -569,6 +553,7 @@ class StellarDistancesSensor(AlternativeTimeSensorBase):
             "is_approaching": approaching,
             "motion": self._get_label("approaching" if approaching else "receding"),
             "radial_velocity_km_s": rv,
+            "radial_drift_au": round(distance["radial_change_au"], dp),
             "spectral_type": obj.get("spectral_type", "Unknown"),
             # Uncertainty data
             "uncertainty_percent": round(uncertainty_pct, 3),
@@ -593,14 +578,57 @@ class StellarDistancesSensor(AlternativeTimeSensorBase):
             result["closest_approach_years"] = obj.get("closest_approach_years", 1350000)
         return result
 
+    def _query_catalog(self, years: float) -> None:
+        """List the nearest stars, closest approaches and stars within the search radius."""
+        catalog = self._catalog_store.catalog if self._catalog_store is not None else None
+        if catalog is None:
+            catalog = STAR_CATALOG
+        self._catalog_source = catalog.source
+        self._catalog_size = len(catalog)
+        dp = {"standard": 2, "high": 4, "scientific": 6}.get(self._precision, 4)
+        self._nearest_stars = [
+            {
+                "name": catalog.name(index),
+                "distance_ly": round(distance_au / LIGHT_YEAR_IN_AU, dp),
+                "distance_au": round(distance_au, 0),
+            }
+            for index, distance_au in catalog.nearest(years, self._nearest_count)
+        ]
+        self._closest_approaches = [
+            {
+                "name": catalog.name(approach["index"]),
+                "years_from_now": round(approach["years_from_now"]),
+                "distance_ly": round(approach["distance_au"] / LIGHT_YEAR_IN_AU, dp),
+                "distance_au": round(approach["distance_au"], 0),
+                "speed_km_s": round(approach["speed_km_s"], 1),
+            }
+            for approach in catalog.closest_approaches(years, self._nearest_count, self._approach_horizon)
+        ]
+        within = catalog.within(years, self._search_radius * LIGHT_YEAR_IN_AU) if self._search_radius > 0 else []
+        self._stars_within_count = len(within)
+        self._stars_within = [
+            {"name": catalog.name(index), "distance_ly": round(distance_au / LIGHT_YEAR_IN_AU, dp)}
+            for index, distance_au in within[:MAX_LISTED_STARS]
+        ]
+        # Nearest catalog stars to the primary object (skipping the object itself)
+        self._primary_neighbours = []
+        if self._primary_object in STELLAR_DATA:
+            center = OBJECT_CATALOG.position(OBJECT_IDS.index(self._primary_object), years)
+            self._primary_neighbours = [
+                {"name": catalog.name(index), "distance_ly": round(distance_au / LIGHT_YEAR_IN_AU, dp)}
+                for index, distance_au in catalog.nearest(years, NEIGHBOUR_COUNT + 1, center)
+                if distance_au > SAME_STAR_LY * LIGHT_YEAR_IN_AU
+            ][:NEIGHBOUR_COUNT]
+
     def update(self) -> None:
         if not self._options_loaded:
             self._load_options()
         try:
-            now = datetime.utcnow()
+            years = years_since_j2000(self.astro_context().jd_utc)
+            columns = OBJECT_CATALOG.distances(years)
             all_data = {}
-            for obj_id in self._stellar_data.keys():
-                data = self._calc_object(obj_id, now)
+            for index, obj_id in enumerate(OBJECT_IDS):
+                data = self._calc_object(obj_id, {key: float(column[index]) for key, column in columns.items()})
                 cat = data.get("category", "unknown")
                 if cat == "star" and not self._show_stars:
                     continue
@@ -608,6 +636,7 @@ class StellarDistancesSensor(AlternativeTimeSensorBase):
                     continue
                 all_data[obj_id] = data
             self._object_distances = all_data
+            self._query_catalog(years)
             primary = all_data.get(self._primary_object, {})
             if primary:
                 parts = [f"{primary['name']}: {primary['distance_formatted']}"]
@@ -618,6 +647,7 @@ class StellarDistancesSensor(AlternativeTimeSensorBase):
                 self._state = "Error: Unknown object"
         except Exception as e:
             self._state = f"Error: {e}"
+            raise
 
     @property
     def state(self) -> Optional[str]: return self._state
@@ -676,6 +706,19 @@ class StellarDistancesSensor(AlternativeTimeSensorBase):
             attrs["pulsar_count"] = len(pulsars)
         attrs["total_objects"] = len(self._object_distances)
 
+        if self._nearest_count > 0:
+            attrs["catalog_source"] = self._catalog_source
+            attrs["catalog_size"] = self._catalog_size
+            attrs["nearest_stars"] = self._nearest_stars
+            attrs["closest_approaches"] = self._closest_approaches
+            attrs["approach_horizon_years"] = int(self._approach_horizon)
+        if self._search_radius > 0:
+            attrs["search_radius_ly"] = self._search_radius
+            attrs["stars_within_radius"] = self._stars_within
+            attrs["stars_within_radius_count"] = self._stars_within_count
+        if self._primary_neighbours:
+            attrs["primary_nearest_stars"] = self._primary_neighbours
+
         # Summary of measurement quality
         all_uncertainties = [d["uncertainty_percent"] for d in self._object_distances.values()]
         if all_uncertainties:
@@ -1,15 +1,15 @@
 """Suriyakati Calendar (Thai Buddhist Calendar) implementation - Version 2.5."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -373,7 +373,7 @@ class SuriyakatiCalendarSensor(AlternativeTimeSensorBase):
         # Track if options have been loaded
         self._options_loaded = False
 
-        _LOGGER.debug(f"Initialized Thai Buddhist Calendar sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Thai Buddhist Calendar sensor: %s", self._attr_name)
 
     def _load_options(self) -> None:
         """Load configuration options from config entry."""
@@ -391,16 +391,21 @@ class SuriyakatiCalendarSensor(AlternativeTimeSensorBase):
                 self._show_buddhist_days = options.get("show_buddhist_days", self._show_buddhist_days)
                 self._format = options.get("format", self._format)
 
-                _LOGGER.debug(f"Thai calendar loaded options: language={self._display_language}, "
-                            f"numerals={self._use_thai_numerals}, zodiac={self._show_zodiac}, "
-                            f"color={self._show_day_color}, buddhist={self._show_buddhist_days}, "
-                            f"format={self._format}")
+                _LOGGER.debug(
+                    "Thai calendar loaded options: language=%s, numerals=%s, zodiac=%s, color=%s, buddhist=%s, format=%s",
+                    self._display_language,
+                    self._use_thai_numerals,
+                    self._show_zodiac,
+                    self._show_day_color,
+                    self._show_buddhist_days,
+                    self._format,
+                )
             else:
                 _LOGGER.debug("Thai calendar using default options - no custom options found")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"Thai calendar could not load options yet: {e}")
+            _LOGGER.debug("Thai calendar could not load options yet: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -575,4 +580,4 @@ class SuriyakatiCalendarSensor(AlternativeTimeSensorBase):
         # Set state to formatted date
         self._state = self._thai_date["formatted"]
 
-        _LOGGER.debug(f"Updated Thai Buddhist Calendar to {self._state}")
+        _LOGGER.debug("Updated Thai Buddhist Calendar to %s", self._state)
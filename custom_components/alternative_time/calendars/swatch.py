@@ -1,15 +1,15 @@
 """Swatch Internet Time Calendar implementation - Version 2.9.1."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 try:
     import pytz
@@ -255,8 +255,8 @@ class SwatchTimeSensor(AlternativeTimeSensorBase):
         # Flag to track if options have been loaded
         self._options_loaded = False
 
-        _LOGGER.debug(f"Initialized Swatch Internet Time sensor: {self._attr_name}")
-        _LOGGER.debug(f"  Default Precision: {self._precision}")
+        _LOGGER.debug("Initialized Swatch Internet Time sensor: %s", self._attr_name)
+        _LOGGER.debug("  Default Precision: %s", self._precision)
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -269,13 +269,13 @@ class SwatchTimeSensor(AlternativeTimeSensorBase):
                 # Update configuration from plugin options
                 self._precision = options.get("precision", self._precision)
 
-                _LOGGER.debug(f"Swatch sensor loaded options: precision={self._precision}")
+                _LOGGER.debug("Swatch sensor loaded options: precision=%s", self._precision)
             else:
                 _LOGGER.debug("Swatch sensor using default options - no custom options found")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"Swatch sensor could not load options yet: {e}")
+            _LOGGER.debug("Swatch sensor could not load options yet: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -292,15 +292,12 @@ class SwatchTimeSensor(AlternativeTimeSensorBase):
                     pytz.timezone, self._swatch_data["base_timezone"]
                 )
                 self._bmt_initialized = True
-                _LOGGER.debug(f"Loaded timezone {self._swatch_data['base_timezone']}")
+                _LOGGER.debug("Loaded timezone %s", self._swatch_data['base_timezone'])
             except Exception as e:
-                _LOGGER.warning(f"Could not load timezone {self._swatch_data['base_timezone']}: {e}")
+                _LOGGER.warning("Could not load timezone %s: %s", self._swatch_data['base_timezone'], e)
                 self._bmt = None
                 self._bmt_initialized = True  # Prevent retry
 
-        # Perform initial update
-        self.update()
-
     @property
     def state(self):
         """Return the state of the sensor."""
@@ -327,14 +324,29 @@ class SwatchTimeSensor(AlternativeTimeSensorBase):
 
         return attrs
 
+    def state_resolution(self) -> float:
+        """Return seconds per displayed beat subdivision."""
+        seconds_per_beat = self._swatch_data["seconds_per_beat"]
+        if self._precision == "centibeat":
+            return seconds_per_beat / 100
+        if self._precision == "decibeat":
+            return seconds_per_beat / 10
+        return seconds_per_beat
+
+    def state_origin(self) -> datetime:
+        """Beats count from midnight BMT."""
+        return self._to_bmt(datetime.now(timezone.utc)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def _to_bmt(self, earth_time: datetime) -> datetime:
+        """Convert to BMT (Biel Mean Time)."""
+        if HAS_PYTZ and self._bmt and self._bmt_initialized:
+            return earth_time.astimezone(self._bmt)
+        # Fallback: use UTC+1 as approximation
+        return earth_time.astimezone(timezone(timedelta(hours=1)))
+
     def _calculate_swatch_time(self, earth_time: datetime) -> Dict[str, Any]:
         """Calculate Swatch Internet Time from standard time."""
-        # Get time in BMT (Biel Mean Time)
-        if HAS_PYTZ and self._bmt and self._bmt_initialized:
-            bmt_time = earth_time.astimezone(self._bmt)
-        else:
-            # Fallback: use UTC+1 as approximation
-            bmt_time = earth_time.astimezone(timezone(timedelta(hours=1)))
+        bmt_time = self._to_bmt(earth_time)
 
         # Calculate seconds since midnight BMT
         midnight_bmt = bmt_time.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -391,10 +403,10 @@ class SwatchTimeSensor(AlternativeTimeSensorBase):
             # Set state to formatted Swatch time
             self._state = self._swatch_time.get("formatted", "@000")
 
-            _LOGGER.debug(f"Updated Swatch Internet Time to {self._state}")
-        except Exception as e:
-            _LOGGER.error(f"Error updating Swatch time: {e}", exc_info=True)
+            _LOGGER.debug("Updated Swatch Internet Time to %s", self._state)
+        except Exception:
             self._state = "@ERROR"
+            raise
 
     async def async_update(self) -> None:
         """Update sensor asynchronously."""
@@ -1,15 +1,17 @@
 """TAI (International Atomic Time) Calendar implementation - Version 1.0.0."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..astro_context import AstroContext
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
+from ..timescales import BUILTIN, TAI_MINUS_GPS, TT_MINUS_TAI, get_leap_seconds
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -18,10 +20,9 @@ _LOGGER = logging.getLogger(__name__)
 # Update interval in seconds (1 second for live timestamp)
 UPDATE_INTERVAL = 1
 
-# Current TAI-UTC offset (leap seconds as of 2017-01-01)
-# TAI = UTC + TAI_UTC_OFFSET
-# This value should be updated when new leap seconds are announced
-TAI_UTC_OFFSET = 37  # seconds
+# Latest TAI-UTC offset in the built-in leap second table (seconds)
+# TAI = UTC + TAI_UTC_OFFSET; the sensor looks up the offset per instant
+TAI_UTC_OFFSET = BUILTIN.last_leap_second(float("inf"))["tai_minus_utc"]
 
 # Complete calendar information for auto-discovery
 CALENDAR_INFO = {
@@ -488,7 +489,7 @@ class TaiTimeSensor(AlternativeTimeSensorBase):
     UPDATE_INTERVAL = UPDATE_INTERVAL
 
     # GPS Time offset from TAI (GPS time started on 1980-01-06 with TAI-GPS = 19 seconds)
-    GPS_TAI_OFFSET = 19  # seconds
+    GPS_TAI_OFFSET = int(TAI_MINUS_GPS)  # seconds
 
     def __init__(self, base_name: str, hass: HomeAssistant) -> None:
         """Initialize the TAI time sensor."""
@@ -522,8 +523,8 @@ class TaiTimeSensor(AlternativeTimeSensorBase):
         # Flag to track if options have been loaded
         self._options_loaded = False
 
-        _LOGGER.debug(f"Initialized TAI sensor: {self._attr_name}")
-        _LOGGER.debug(f"  TAI-UTC offset: {self._tai_utc_offset} seconds")
+        _LOGGER.debug("Initialized TAI sensor: %s", self._attr_name)
+        _LOGGER.debug("  TAI-UTC offset: %s seconds", self._tai_utc_offset)
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -538,14 +539,16 @@ class TaiTimeSensor(AlternativeTimeSensorBase):
                 self._show_gps_time = options.get("show_gps_time", self._show_gps_time)
                 self._time_format = options.get("time_format", self._time_format)
 
-                _LOGGER.debug(f"TAI sensor loaded options: utc_offset={self._show_utc_offset}, "
-                            f"gps_time={self._show_gps_time}, format={self._time_format}")
+                _LOGGER.debug(
+                    "TAI sensor loaded options: utc_offset=%s, gps_time=%s, format=%s",
+                    self._show_utc_offset, self._show_gps_time, self._time_format,
+                )
             else:
                 _LOGGER.debug("TAI sensor using default options - no custom options found")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"TAI sensor could not load options yet: {e}")
+            _LOGGER.debug("TAI sensor could not load options yet: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -554,9 +557,6 @@ class TaiTimeSensor(AlternativeTimeSensorBase):
         # Try to load options now that IDs should be set
         self._load_options()
 
-        # Perform initial update
-        self.update()
-
     @property
     def state(self):
         """Return the state of the sensor."""
@@ -585,14 +585,13 @@ class TaiTimeSensor(AlternativeTimeSensorBase):
 
         return attrs
 
-    def _calculate_tai_time(self, utc_time: datetime) -> Dict[str, Any]:
+    def _calculate_tai_time(self, context: AstroContext) -> Dict[str, Any]:
         """Calculate TAI from UTC time."""
+        utc_time = context.when
 
-        # Ensure we're working with UTC
-        if utc_time.tzinfo is None:
-            utc_time = utc_time.replace(tzinfo=timezone.utc)
-        else:
-            utc_time = utc_time.astimezone(timezone.utc)
+        # TAI-UTC at this instant from the leap second table
+        self._tai_utc_offset = context.tai_minus_utc
+        leap_seconds = get_leap_seconds(self._hass)
 
         # Calculate TAI by adding the leap second offset
         tai_time = utc_time + timedelta(seconds=self._tai_utc_offset)
@@ -601,7 +600,7 @@ class TaiTimeSensor(AlternativeTimeSensorBase):
         gps_time = tai_time - timedelta(seconds=self.GPS_TAI_OFFSET)
 
         # Calculate Terrestrial Time (TT = TAI + 32.184 seconds)
-        tt_offset = 32.184
+        tt_offset = TT_MINUS_TAI
         tt_time = tai_time + timedelta(seconds=tt_offset)
 
         # Format based on user preference
@@ -612,12 +611,9 @@ class TaiTimeSensor(AlternativeTimeSensorBase):
         else:  # iso (default)
             formatted = tai_time.strftime("%Y-%m-%dT%H:%M:%S TAI")
 
-        # Calculate Modified Julian Date (MJD)
+        # Julian Date on the TAI scale with this sensor's offset
         # MJD = JD - 2400000.5
-        # JD for J2000.0 = 2451545.0 (2000-01-01 12:00:00 TT)
-        j2000 = datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        days_since_j2000 = (tai_time - j2000).total_seconds() / 86400.0
-        jd = 2451545.0 + days_since_j2000
+        jd = context.jd_utc + self._tai_utc_offset / 86400.0
         mjd = jd - 2400000.5
 
         result = {
@@ -631,6 +627,16 @@ class TaiTimeSensor(AlternativeTimeSensorBase):
             "julian_date": round(jd, 6)
         }
 
+        # Leap second table state
+        next_leap = leap_seconds.next_leap_second(context.timestamp)
+        result["next_leap_second"] = (
+            datetime.fromtimestamp(next_leap["utc"], timezone.utc).isoformat() if next_leap else None
+        )
+        result["leap_second_table"] = leap_seconds.source
+        if leap_seconds.expires is not None:
+            result["leap_second_table_expires"] = datetime.fromtimestamp(leap_seconds.expires, timezone.utc).date().isoformat()
+            result["leap_second_table_expired"] = leap_seconds.expired(context.timestamp)
+
         # Add UTC offset display if enabled
         if self._show_utc_offset:
             result["offset_display"] = f"TAI = UTC + {self._tai_utc_offset}s"
@@ -663,17 +669,12 @@ class TaiTimeSensor(AlternativeTimeSensorBase):
         if not self._options_loaded:
             self._load_options()
 
-        try:
-            now = datetime.now(timezone.utc)
-            self._tai_time = self._calculate_tai_time(now)
+        self._tai_time = self._calculate_tai_time(self.astro_context())
 
-            # Set state to formatted TAI time
-            self._state = self._tai_time.get("formatted", "TAI ERROR")
+        # Set state to formatted TAI time
+        self._state = self._tai_time.get("formatted", "TAI ERROR")
 
-            _LOGGER.debug(f"Updated TAI to {self._state}")
-        except Exception as e:
-            _LOGGER.error(f"Error updating TAI: {e}", exc_info=True)
-            self._state = "TAI ERROR"
+        _LOGGER.debug("Updated TAI to %s", self._state)
 
     async def async_update(self) -> None:
         """Update sensor asynchronously."""
@@ -1,15 +1,15 @@
 """Tamriel Calendar (Elder Scrolls) implementation - Version 3.0."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -443,7 +443,7 @@ class TamrielCalendarSensor(AlternativeTimeSensorBase):
         self._state = None
         self._tamriel_date = {}
 
-        _LOGGER.debug(f"Initialized Tamriel Calendar sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Tamriel Calendar sensor: %s", self._attr_name)
 
     def set_options(self, options: Dict[str, Any]) -> None:
         """Set options from config flow."""
@@ -454,9 +454,10 @@ class TamrielCalendarSensor(AlternativeTimeSensorBase):
             self._show_birthsign = options.get("show_birthsign", self._show_birthsign)
             self._era = options.get("era", self._era)
 
-            _LOGGER.debug(f"Tamriel sensor options updated: show_moons={self._show_moons}, "
-                         f"show_holidays={self._show_holidays}, show_daedric={self._show_daedric}, "
-                         f"show_birthsign={self._show_birthsign}, era={self._era}")
+            _LOGGER.debug(
+                "Tamriel sensor options updated: show_moons=%s, show_holidays=%s, show_daedric=%s, show_birthsign=%s, era=%s",
+                self._show_moons, self._show_holidays, self._show_daedric, self._show_birthsign, self._era,
+            )
 
     @property
     def state(self):
@@ -702,4 +703,4 @@ class TamrielCalendarSensor(AlternativeTimeSensorBase):
         # Example: "4E 225, Morning Star 16 (Tirdas)"
         self._state = f"{self._tamriel_date['full_date']} ({self._tamriel_date['weekday']})"
 
-        _LOGGER.debug(f"Updated Tamriel calendar to {self._state}")
+        _LOGGER.debug("Updated Tamriel calendar to %s", self._state)
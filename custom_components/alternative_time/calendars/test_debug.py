@@ -4,15 +4,15 @@ Version 2.1.0 - Corrected calendar ID
 from __future__ import annotations
 
 import json
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import Lazy, get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -150,7 +150,7 @@ class TestDebugSensor(AlternativeTimeSensorBase):  # Klassenname geändert
             }
         })
 
-        _LOGGER.warning(f"[DEBUG_TEST] Sensor initialized: {self._attr_name}")
+        _LOGGER.debug("[DEBUG_TEST] Sensor initialized: %s", self._attr_name)
 
     def _log_debug(self, event: str, data: Any) -> None:
         """Log debug information."""
@@ -161,9 +161,14 @@ class TestDebugSensor(AlternativeTimeSensorBase):  # Klassenname geändert
             "data": data
         }
         self._debug_log.append(entry)
+        # Only the last entries are exposed as attributes
+        del self._debug_log[:-20]
 
-        # Also log to HA logger with WARNING level so it's visible
-        _LOGGER.warning(f"[DEBUG_TEST] {timestamp} | {event}: {json.dumps(data, default=str)[:500]}")
+        # Serialized only when debug logging is enabled for this module
+        _LOGGER.debug(
+            "[DEBUG_TEST] %s | %s: %s",
+            timestamp, event, Lazy(lambda: json.dumps(data, default=str)[:500]),
+        )
 
     def get_plugin_options(self) -> Dict[str, Any]:
         """Override to add debugging."""
@@ -393,3 +398,4 @@ class TestDebugSensor(AlternativeTimeSensorBase):  # Klassenname geändert
             import traceback
             self._log_debug("traceback", traceback.format_exc())
             self._state = f"Error: {e}"
+            raise
@@ -1,15 +1,15 @@
 """Timezone sensor implementation - Version 2.5.3 - Complete IANA timezone list."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 try:
     import pytz
@@ -359,7 +359,7 @@ class TimezoneSensor(AlternativeTimeSensorBase):
         # Flag für erstes Update
         self._first_update = True
 
-        _LOGGER.debug(f"Initialized Timezone sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Timezone sensor: %s", self._attr_name)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -368,7 +368,7 @@ class TimezoneSensor(AlternativeTimeSensorBase):
         # Lade Optionen beim Hinzufügen
         options = self.get_plugin_options()
         if options:
-            _LOGGER.debug(f"Timezone sensor loaded options in async_added_to_hass: {options}")
+            _LOGGER.debug("Timezone sensor loaded options in async_added_to_hass: %s", options)
             self._timezone_str = options.get("timezone", "UTC")
             self._show_offset = bool(options.get("show_offset", True))
             self._show_dst = bool(options.get("show_dst", True))
@@ -378,7 +378,7 @@ class TimezoneSensor(AlternativeTimeSensorBase):
             # Versuche System-Timezone zu verwenden
             try:
                 self._timezone_str = self._hass.config.time_zone or "UTC"
-                _LOGGER.info(f"Using system timezone: {self._timezone_str}")
+                _LOGGER.info("Using system timezone: %s", self._timezone_str)
             except Exception:
                 self._timezone_str = "UTC"
 
@@ -390,14 +390,14 @@ class TimezoneSensor(AlternativeTimeSensorBase):
                     pytz.timezone, self._timezone_str
                 )
                 self._timezone_initialized = True
-                _LOGGER.info(f"Loaded timezone: {self._timezone_str}")
+                _LOGGER.info("Loaded timezone: %s", self._timezone_str)
 
                 # Update Name mit Timezone
                 calendar_name = self._translate('name', 'World Timezones')
                 self._attr_name = f"{self._base_name} {calendar_name} ({self._timezone_str})"
 
             except Exception as e:
-                _LOGGER.warning(f"Could not load timezone {self._timezone_str}: {e}, using UTC")
+                _LOGGER.warning("Could not load timezone %s: %s, using UTC", self._timezone_str, e)
                 try:
                     self._timezone = await self._hass.async_add_executor_job(
                         pytz.timezone, "UTC"
@@ -539,7 +539,7 @@ class TimezoneSensor(AlternativeTimeSensorBase):
         # Debug beim ersten Update
         if self._first_update:
             if options:
-                _LOGGER.info(f"Timezone sensor options in first update: {options}")
+                _LOGGER.info("Timezone sensor options in first update: %s", options)
             else:
                 _LOGGER.debug("Timezone sensor using defaults (no options configured)")
             self._first_update = False
@@ -554,7 +554,7 @@ class TimezoneSensor(AlternativeTimeSensorBase):
 
             # Prüfe ob Timezone geändert wurde
             if new_timezone != self._timezone_str and HAS_PYTZ:
-                _LOGGER.info(f"Timezone changed from {self._timezone_str} to {new_timezone}")
+                _LOGGER.info("Timezone changed from %s to %s", self._timezone_str, new_timezone)
                 self._timezone_str = new_timezone
                 try:
                     self._timezone = pytz.timezone(self._timezone_str)
@@ -563,7 +563,7 @@ class TimezoneSensor(AlternativeTimeSensorBase):
                     self._attr_name = f"{self._base_name} {calendar_name} ({self._timezone_str})"
                     self._timezone_initialized = True
                 except Exception as e:
-                    _LOGGER.error(f"Failed to load timezone {self._timezone_str}: {e}")
+                    _LOGGER.error("Failed to load timezone %s: %s", self._timezone_str, e)
                     # Fallback to previous or UTC
                     if not self._timezone:
                         try:
@@ -579,9 +579,9 @@ class TimezoneSensor(AlternativeTimeSensorBase):
                 self._tz_info = self._calculate_timezone_info(now_tz)
                 self._state = self._tz_info["full_display"]
             except Exception as e:
-                _LOGGER.error(f"Error calculating timezone info: {e}")
                 self._state = f"Error: {self._timezone_str}"
                 self._tz_info = {"error": str(e)}
+                raise
         else:
             # Fallback without pytz
             now = datetime.now()
@@ -592,4 +592,4 @@ class TimezoneSensor(AlternativeTimeSensorBase):
                 "error": "pytz not available or timezone not loaded"
             }
 
-        _LOGGER.debug(f"Updated Timezone to {self._state}")
+        _LOGGER.debug("Updated Timezone to %s", self._state)
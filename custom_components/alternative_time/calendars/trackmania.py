@@ -3,7 +3,6 @@ Version 1.2 – reads options via get_plugin_options() (no get_config() calls).
 """
 from __future__ import annotations
 
-import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, List
 
@@ -19,9 +18,10 @@ except ImportError:
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -279,6 +279,6 @@ class TrackmaniaEventsSensor(AlternativeTimeSensorBase):
                 self._state = "No events"
 
         except Exception as exc:
-            _LOGGER.exception("Failed to update Trackmania events: %s", exc)
             self._state = "Error"
             self._tm_events = {"error": str(exc)}
+            raise
@@ -1,7 +1,6 @@
 """Unix Timestamp Calendar implementation - Version 2.6."""
 from __future__ import annotations
 
-import logging
 import os
 
 # WICHTIG: Import der Basis-Klasse direkt aus sensor.py
@@ -15,12 +14,14 @@ from homeassistant.core import HomeAssistant
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
+    from ..log_helper import get_logger
     from ..sensor import AlternativeTimeSensorBase
 except ImportError:
     # Fallback für direkten Import
+    from log_helper import get_logger
     from sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -247,7 +248,7 @@ class UnixTimestampSensor(AlternativeTimeSensorBase):
         # Flag to track if options have been loaded
         self._options_loaded = False
 
-        _LOGGER.debug(f"Initialized Unix Timestamp sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Unix Timestamp sensor: %s", self._attr_name)
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -262,14 +263,16 @@ class UnixTimestampSensor(AlternativeTimeSensorBase):
                 self._show_human_readable = options.get("show_human_readable", self._show_human_readable)
                 self._show_milestone = options.get("show_milestone", self._show_milestone)
 
-                _LOGGER.debug(f"Unix sensor loaded options: milliseconds={self._show_milliseconds}, "
-                            f"human_readable={self._show_human_readable}, milestone={self._show_milestone}")
+                _LOGGER.debug(
+                    "Unix sensor loaded options: milliseconds=%s, human_readable=%s, milestone=%s",
+                    self._show_milliseconds, self._show_human_readable, self._show_milestone,
+                )
             else:
                 _LOGGER.debug("Unix sensor using default options - no custom options found")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"Unix sensor could not load options yet: {e}")
+            _LOGGER.debug("Unix sensor could not load options yet: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -402,4 +405,4 @@ class UnixTimestampSensor(AlternativeTimeSensorBase):
         # Set state to Unix timestamp
         self._state = self._unix_time["formatted"]
 
-        _LOGGER.debug(f"Updated Unix Timestamp to {self._state}")
+        _LOGGER.debug("Updated Unix Timestamp to %s", self._state)
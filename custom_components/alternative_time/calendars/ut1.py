@@ -1,25 +1,27 @@
 """UT1 (Universal Time 1) Calendar implementation - Version 1.0.0.
 
-Uses IERS REST API to fetch current UT1-UTC (DUT1) values.
+Interpolates UT1-UTC (DUT1) from the offline IERS Earth orientation
+table (see earth_orientation); the IERS REST API is only queried while
+the table does not cover the current date.
 """
 from __future__ import annotations
 
-import asyncio
-import logging
+import json
+import math
+import urllib.parse
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 
-try:
-    import aiohttp
-    HAS_AIOHTTP = True
-except ImportError:
-    HAS_AIOHTTP = False
-
+from ..astro_context import J2000_JD, MJD_OFFSET, AstroContext, earth_rotation_angle
+from ..earth_orientation import FALLBACK_DUT1, get_eop_store
+from ..iers_client import get_iers_client
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -34,10 +36,6 @@ IERS_API_BASE = "https://datacenter.iers.org/webservice/REST/timescales/RestCont
 # Cache duration for IERS data (in seconds) - DUT1 changes slowly
 IERS_CACHE_DURATION = 3600  # 1 hour
 
-# Fallback DUT1 value if API is unavailable (updated periodically)
-# As of July 2025, DUT1 is approximately +0.1s
-FALLBACK_DUT1 = 0.1
-
 # Complete calendar information for auto-discovery
 CALENDAR_INFO = {
     "id": "ut1",
@@ -448,8 +446,8 @@ class Ut1TimeSensor(AlternativeTimeSensorBase):
         # IERS data cache
         self._dut1_value: float = FALLBACK_DUT1  # Current DUT1 (UT1-UTC) in seconds
         self._dut1_last_fetch: Optional[datetime] = None
-        self._dut1_source: str = "fallback"  # "iers_api", "fallback", "cached"
-        self._iers_fetch_lock = asyncio.Lock()
+        self._dut1_source: str = "fallback"  # "iers_eop", "iers_eop_predicted", "iers_api", "fallback", "cached"
+        self._eop: Optional[Dict[str, Any]] = None
 
         # Initialize state
         self._state = None
@@ -458,8 +456,8 @@ class Ut1TimeSensor(AlternativeTimeSensorBase):
         # Flag to track if options have been loaded
         self._options_loaded = False
 
-        _LOGGER.debug(f"Initialized UT1 sensor: {self._attr_name}")
-        _LOGGER.debug(f"  Initial DUT1: {self._dut1_value}s (source: {self._dut1_source})")
+        _LOGGER.debug("Initialized UT1 sensor: %s", self._attr_name)
+        _LOGGER.debug("  Initial DUT1: %ss (source: %s)", self._dut1_value, self._dut1_source)
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -475,15 +473,16 @@ class Ut1TimeSensor(AlternativeTimeSensorBase):
                 self._time_format = options.get("time_format", self._time_format)
                 self._cache_duration = options.get("cache_duration", self._cache_duration)
 
-                _LOGGER.debug(f"UT1 sensor loaded options: dut1={self._show_dut1}, "
-                            f"utc_compare={self._show_utc_comparison}, format={self._time_format}, "
-                            f"cache={self._cache_duration}s")
+                _LOGGER.debug(
+                    "UT1 sensor loaded options: dut1=%s, utc_compare=%s, format=%s, cache=%ss",
+                    self._show_dut1, self._show_utc_comparison, self._time_format, self._cache_duration,
+                )
             else:
                 _LOGGER.debug("UT1 sensor using default options - no custom options found")
 
             self._options_loaded = True
         except Exception as e:
-            _LOGGER.debug(f"UT1 sensor could not load options yet: {e}")
+            _LOGGER.debug("UT1 sensor could not load options yet: %s", e)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -492,8 +491,9 @@ class Ut1TimeSensor(AlternativeTimeSensorBase):
         # Try to load options now that IDs should be set
         self._load_options()
 
-        # Fetch initial IERS data
-        await self._async_fetch_iers_data()
+        # Load the EOP table (fetch the REST value only without coverage)
+        await get_eop_store(self.hass).async_load()
+        await self._async_refresh_dut1()
 
         # Perform initial update
         await self.async_update()
@@ -528,89 +528,52 @@ class Ut1TimeSensor(AlternativeTimeSensorBase):
 
         return attrs
 
+    async def _async_refresh_dut1(self) -> None:
+        """Keep the EOP table current; fall back to the REST API without coverage."""
+        store = get_eop_store(self.hass)
+        await store.async_refresh()
+        if store.dut1(self.astro_context().jd_utc - MJD_OFFSET) is None:
+            await self._async_fetch_iers_data()
+
     async def _async_fetch_iers_data(self) -> bool:
-        """Fetch DUT1 data from IERS REST API.
+        """Fetch DUT1 from the IERS REST API through the shared client.
 
-        Returns True if data was successfully fetched, False otherwise.
-        """
-        if not HAS_AIOHTTP:
-            _LOGGER.warning("aiohttp not available, using fallback DUT1 value")
-            return False
-
-        # Check if cache is still valid
-        if self._dut1_last_fetch:
-            cache_age = (datetime.now(timezone.utc) - self._dut1_last_fetch).total_seconds()
-            if cache_age < self._cache_duration:
-                _LOGGER.debug(f"Using cached DUT1 value (age: {cache_age:.0f}s)")
-                self._dut1_source = "cached"
-                return True
+        The query time is truncated to the hour, so all sensors and entries
+        share one cached request per cache period.
 
-        # Use lock to prevent multiple simultaneous fetches
-        async with self._iers_fetch_lock:
-            # Double-check cache after acquiring lock
-            if self._dut1_last_fetch:
-                cache_age = (datetime.now(timezone.utc) - self._dut1_last_fetch).total_seconds()
-                if cache_age < self._cache_duration:
-                    return True
+        Returns True if a value is available from the API, False otherwise.
+        """
+        hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        url = f"{IERS_API_BASE}?param=UT1-UTC&datetime={urllib.parse.quote(hour.strftime('%Y-%m-%d %H:%M:%S'))}"
 
+        result = await get_iers_client(self.hass).async_fetch(
+            url, max_age=self._cache_duration, headers={"Accept": "application/json"}
+        )
+        if result:
             try:
-                # Build API URL with proper URL encoding
-                import urllib.parse
-                now = datetime.now(timezone.utc)
-                datetime_str = now.strftime("%Y-%m-%d %H:%M:%S")
-                datetime_encoded = urllib.parse.quote(datetime_str)
-                url = f"{IERS_API_BASE}?param=UT1-UTC&datetime={datetime_encoded}"
-
-                _LOGGER.debug(f"Fetching IERS data from: {url}")
-
-                # Create timeout
-                timeout = aiohttp.ClientTimeout(total=10)
-
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.get(url, headers={"Accept": "application/json"}) as response:
-                        if response.status == 200:
-                            # Try to parse JSON response
-                            try:
-                                data = await response.json()
-                                # The IERS API returns value in seconds
-                                if "value" in data:
-                                    self._dut1_value = float(data["value"])
-                                    self._dut1_last_fetch = datetime.now(timezone.utc)
-                                    self._dut1_source = "iers_api"
-                                    _LOGGER.info(f"Successfully fetched DUT1 from IERS: {self._dut1_value}s")
-                                    return True
-                            except (ValueError, KeyError) as e:
-                                _LOGGER.warning(f"Failed to parse IERS JSON response: {e}")
-                                # Try text parsing as fallback
-                                text = await response.text()
-                                _LOGGER.debug(f"IERS response text: {text[:200]}")
-                        else:
-                            _LOGGER.warning(f"IERS API returned status {response.status}")
-
-            except asyncio.TimeoutError:
-                _LOGGER.warning("IERS API request timed out")
-            except aiohttp.ClientError as e:
-                _LOGGER.warning(f"IERS API request failed: {e}")
-            except Exception as e:
-                _LOGGER.error(f"Unexpected error fetching IERS data: {e}", exc_info=True)
-
-        # If we get here, fetch failed - use fallback
-        if self._dut1_source != "cached":
-            self._dut1_source = "fallback"
-            _LOGGER.info(f"Using fallback DUT1 value: {self._dut1_value}s")
+                # The IERS API returns value in seconds
+                self._dut1_value = float(json.loads(result["text"])["value"])
+                self._dut1_last_fetch = datetime.fromtimestamp(result["fetched_at"], timezone.utc)
+                self._dut1_source = "iers_api"
+                return True
+            except (ValueError, KeyError, TypeError) as e:
+                _LOGGER.warning("Failed to parse IERS JSON response: %s", e)
+                _LOGGER.debug("IERS response text: %s", result["text"][:200])
 
+        # Request failed or backing off - keep the last value
+        if self._dut1_source not in ("iers_api", "cached"):
+            self._dut1_source = "fallback"
+            _LOGGER.info("Using fallback DUT1 value: %ss", self._dut1_value)
+        else:
+            self._dut1_source = "cached"
         return False
 
-    def _calculate_ut1_time(self, utc_time: datetime) -> Dict[str, Any]:
+    def _calculate_ut1_time(self, context: AstroContext) -> Dict[str, Any]:
         """Calculate UT1 from UTC time using DUT1.
 
         UT1 = UTC + DUT1
         """
-        # Ensure we're working with UTC
-        if utc_time.tzinfo is None:
-            utc_time = utc_time.replace(tzinfo=timezone.utc)
-        else:
-            utc_time = utc_time.astimezone(timezone.utc)
+        utc_time = context.when
 
         # Calculate UT1 by adding DUT1 to UTC
         # DUT1 = UT1 - UTC, so UT1 = UTC + DUT1
@@ -624,17 +587,11 @@ class Ut1TimeSensor(AlternativeTimeSensorBase):
         else:  # iso (default)
             formatted = ut1_time.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + " UT1"
 
-        # Calculate Earth Rotation Angle (ERA)
-        # ERA = 2π(0.7790572732640 + 1.00273781191135448 × Tu) radians
-        # where Tu = Julian UT1 date - 2451545.0
-        j2000 = datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        days_since_j2000 = (ut1_time - j2000).total_seconds() / 86400.0
-        tu = days_since_j2000
-
-        import math
-        era_radians = 2 * math.pi * (0.7790572732640 + 1.00273781191135448 * tu)
-        era_radians = era_radians % (2 * math.pi)  # Normalize to [0, 2π]
-        era_degrees = math.degrees(era_radians)
+        # Calculate Earth Rotation Angle (ERA) with this sensor's DUT1
+        jd_ut1 = context.jd_utc + self._dut1_value / 86400.0
+        days_since_j2000 = jd_ut1 - J2000_JD
+        era_degrees = earth_rotation_angle(jd_ut1)
+        era_radians = math.radians(era_degrees)
 
         # Calculate Greenwich Mean Sidereal Time approximation
         # GMST ≈ ERA (for most practical purposes)
@@ -655,6 +612,15 @@ class Ut1TimeSensor(AlternativeTimeSensorBase):
             "days_since_j2000": round(days_since_j2000, 6)
         }
 
+        # Earth orientation from the IERS table
+        if self._eop:
+            result["dut1_predicted"] = self._eop["predicted"]
+            if self._eop["lod_ms"] is not None:
+                result["length_of_day_excess_ms"] = round(self._eop["lod_ms"], 4)
+            if self._eop["polar_motion_x"] is not None:
+                result["polar_motion_x_arcsec"] = round(self._eop["polar_motion_x"], 6)
+                result["polar_motion_y_arcsec"] = round(self._eop["polar_motion_y"], 6)
+
         # Add DUT1 display if enabled
         if self._show_dut1:
             sign = "+" if self._dut1_value >= 0 else ""
@@ -682,16 +648,23 @@ class Ut1TimeSensor(AlternativeTimeSensorBase):
             self._load_options()
 
         try:
-            now = datetime.now(timezone.utc)
-            self._ut1_time = self._calculate_ut1_time(now)
+            context = self.astro_context()
+
+            # Interpolate DUT1 for this instant when the EOP table covers it
+            self._eop = get_eop_store(self.hass).values(context.jd_utc - MJD_OFFSET)
+            if self._eop:
+                self._dut1_value = self._eop["dut1"]
+                self._dut1_source = "iers_eop_predicted" if self._eop["predicted"] else "iers_eop"
+
+            self._ut1_time = self._calculate_ut1_time(context)
 
             # Set state to formatted UT1 time
             self._state = self._ut1_time.get("formatted", "UT1 ERROR")
 
-            _LOGGER.debug(f"Updated UT1 to {self._state} (DUT1: {self._dut1_value}s)")
-        except Exception as e:
-            _LOGGER.error(f"Error updating UT1: {e}", exc_info=True)
+            _LOGGER.debug("Updated UT1 to %s (DUT1: %ss)", self._state, self._dut1_value)
+        except Exception:
             self._state = "UT1 ERROR"
+            raise
 
     async def async_update(self) -> None:
         """Update sensor asynchronously."""
@@ -699,8 +672,8 @@ class Ut1TimeSensor(AlternativeTimeSensorBase):
         if not self._options_loaded:
             self._load_options()
 
-        # Try to refresh IERS data if cache expired
-        await self._async_fetch_iers_data()
+        # Refresh the EOP table or the REST value if due
+        await self._async_refresh_dut1()
 
         # Run time calculation
         await self.hass.async_add_executor_job(self.update)
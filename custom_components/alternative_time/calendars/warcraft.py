@@ -1,15 +1,15 @@
 """World of Warcraft Calendar implementation - Version 2.7."""
 from __future__ import annotations
 
-import logging
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -367,7 +367,7 @@ class WarcraftCalendarSensor(AlternativeTimeSensorBase):
         self._state = None
         self._warcraft_date = {}
 
-        _LOGGER.debug(f"Initialized Warcraft Calendar sensor: {self._attr_name}")
+        _LOGGER.debug("Initialized Warcraft Calendar sensor: %s", self._attr_name)
 
     def _load_options(self) -> None:
         """Load plugin options after IDs are set."""
@@ -378,7 +378,7 @@ class WarcraftCalendarSensor(AlternativeTimeSensorBase):
         plugin_options = self._get_plugin_options()
 
         if plugin_options:
-            _LOGGER.debug(f"Loading Warcraft options: {plugin_options}")
+            _LOGGER.debug("Loading Warcraft options: %s", plugin_options)
 
             # Apply options using set_options method
             self.set_options(
@@ -398,10 +398,10 @@ class WarcraftCalendarSensor(AlternativeTimeSensorBase):
         # Load options after entity is registered
         self._load_options()
 
-        _LOGGER.debug(f"Warcraft Calendar sensor added to hass with options: "
-                     f"faction={self._faction}, region={self._region}, "
-                     f"show_events={self._show_events}, show_moons={self._show_moons}, "
-                     f"show_dragon_aspect={self._show_dragon_aspect}")
+        _LOGGER.debug(
+            "Warcraft Calendar sensor added to hass with options: faction=%s, region=%s, show_events=%s, show_moons=%s, show_dragon_aspect=%s",
+            self._faction, self._region, self._show_events, self._show_moons, self._show_dragon_aspect,
+        )
 
     def set_options(
         self,
@@ -415,24 +415,24 @@ class WarcraftCalendarSensor(AlternativeTimeSensorBase):
         """Set calendar options from config flow."""
         if faction is not None and faction in ["Alliance", "Horde", "Neutral"]:
             self._faction = faction
-            _LOGGER.debug(f"Set faction to: {faction}")
+            _LOGGER.debug("Set faction to: %s", faction)
 
         if region is not None and region in ["Eastern Kingdoms", "Kalimdor", "Northrend",
                                               "Pandaria", "Broken Isles", "Shadowlands", "Dragon Isles"]:
             self._region = region
-            _LOGGER.debug(f"Set region to: {region}")
+            _LOGGER.debug("Set region to: %s", region)
 
         if show_events is not None:
             self._show_events = bool(show_events)
-            _LOGGER.debug(f"Set show_events to: {show_events}")
+            _LOGGER.debug("Set show_events to: %s", show_events)
 
         if show_moons is not None:
             self._show_moons = bool(show_moons)
-            _LOGGER.debug(f"Set show_moons to: {show_moons}")
+            _LOGGER.debug("Set show_moons to: %s", show_moons)
 
         if show_dragon_aspect is not None:
             self._show_dragon_aspect = bool(show_dragon_aspect)
-            _LOGGER.debug(f"Set show_dragon_aspect to: {show_dragon_aspect}")
+            _LOGGER.debug("Set show_dragon_aspect to: %s", show_dragon_aspect)
 
     def _calculate_warcraft_date(self, dt: datetime) -> Dict[str, Any]:
         """Calculate the Warcraft date from a datetime."""
@@ -526,7 +526,7 @@ class WarcraftCalendarSensor(AlternativeTimeSensorBase):
         # Set state to formatted Warcraft date
         self._state = self._warcraft_date["formatted"]
 
-        _LOGGER.debug(f"Updated Warcraft Calendar to {self._state}")
+        _LOGGER.debug("Updated Warcraft Calendar to %s", self._state)
 
     @property
     def state(self) -> str:
@@ -22,16 +22,16 @@ would require a local rift epoch anchor and is not included to keep the sensor l
 """
 from __future__ import annotations
 
-import logging
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 from homeassistant.core import HomeAssistant
 
+from ..log_helper import get_logger
 from ..sensor import AlternativeTimeSensorBase
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 # ============================================
 # CALENDAR METADATA
@@ -313,7 +313,7 @@ class WarhammerImperialCalendarSensor(AlternativeTimeSensorBase):
         plugin_options = self._get_plugin_options()
 
         if plugin_options:
-            _LOGGER.debug(f"Loading Warhammer Imperial options: {plugin_options}")
+            _LOGGER.debug("Loading Warhammer Imperial options: %s", plugin_options)
 
             # Apply options using set_options method
             self.set_options(
@@ -332,9 +332,10 @@ class WarhammerImperialCalendarSensor(AlternativeTimeSensorBase):
         # Load options after entity is registered
         self._load_options()
 
-        _LOGGER.debug(f"Warhammer Imperial sensor added to hass with options: "
-                     f"check={self._check_number}, offset={self._year_offset}, "
-                     f"system={self._system_designator}, method={self._fraction_method}")
+        _LOGGER.debug(
+            "Warhammer Imperial sensor added to hass with options: check=%s, offset=%s, system=%s, method=%s",
+            self._check_number, self._year_offset, self._system_designator, self._fraction_method,
+        )
 
     # -------------------------------
     # Public properties
@@ -382,24 +383,24 @@ class WarhammerImperialCalendarSensor(AlternativeTimeSensorBase):
         if check_number is not None:
             if 0 <= check_number <= 9:
                 self._check_number = int(check_number)
-                _LOGGER.debug(f"Set check_number to: {check_number}")
+                _LOGGER.debug("Set check_number to: %s", check_number)
             else:
-                _LOGGER.warning(f"Invalid check_number: {check_number}, keeping {self._check_number}")
+                _LOGGER.warning("Invalid check_number: %s, keeping %s", check_number, self._check_number)
 
         if year_offset is not None:
             if 0 <= year_offset <= 50000:
                 self._year_offset = int(year_offset)
-                _LOGGER.debug(f"Set year_offset to: {year_offset}")
+                _LOGGER.debug("Set year_offset to: %s", year_offset)
             else:
-                _LOGGER.warning(f"Invalid year_offset: {year_offset}, keeping {self._year_offset}")
+                _LOGGER.warning("Invalid year_offset: %s, keeping %s", year_offset, self._year_offset)
 
         if system_designator is not None:
             self._system_designator = str(system_designator) if system_designator else None
-            _LOGGER.debug(f"Set system_designator to: {system_designator}")
+            _LOGGER.debug("Set system_designator to: %s", system_designator)
 
         if fraction_method is not None and fraction_method in ["precise", "lexicanum"]:
             self._fraction_method = fraction_method
-            _LOGGER.debug(f"Set fraction_method to: {fraction_method}")
+            _LOGGER.debug("Set fraction_method to: %s", fraction_method)
 
     # -------------------------------
     # Calculation methods
@@ -510,10 +511,10 @@ class WarhammerImperialCalendarSensor(AlternativeTimeSensorBase):
             now = datetime.now()
             self._imperial = self._to_imperial(now)
             self._state = self._imperial.format()
-            _LOGGER.debug(f"Updated Imperial Date to {self._state}")
-        except Exception as exc:
-            _LOGGER.exception("Failed to compute Imperial date: %s", exc)
+            _LOGGER.debug("Updated Imperial Date to %s", self._state)
+        except Exception:
             self._state = "Error"
+            raise
 
 
 # ============================================
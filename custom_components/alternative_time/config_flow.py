@@ -24,7 +24,13 @@ from homeassistant.helpers.selector import (
     TextSelectorType,
 )
 
-from .const import DOMAIN
+from .const import (
+    CONF_PERFORMANCE_PROFILE,
+    CONF_UPDATE_INTERVALS,
+    DEFAULT_PERFORMANCE_PROFILE,
+    DOMAIN,
+    PERFORMANCE_PROFILES,
+)
 
 # Fixed category order for the wizard
 FIXED_CATEGORY_ORDER = [
@@ -607,21 +613,107 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self.config_entry = config_entry
+        self._discovered_calendars: Dict[str, Dict[str, Any]] = {}
+        self._calendar_id: str | None = None
+        self._profile: str = config_entry.options.get(
+            CONF_PERFORMANCE_PROFILE, DEFAULT_PERFORMANCE_PROFILE
+        )
+
+    def _lcal(self, info: dict, key: str, default: str = "") -> str:
+        """Get localized value from calendar info."""
+        lang = self.hass.config.language if self.hass else "en"
+        val = (info or {}).get(key, default)
+        if isinstance(val, dict):
+            return str(val.get(lang, val.get("en", default)))
+        return str(val) if val else default
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Manage the options."""
+        """Select the performance profile and a calendar to configure."""
+        calendars = list(self.config_entry.data.get("calendars", []))
+        if not calendars:
+            return self.async_abort(
+                reason="no_options",
+                description_placeholders={"message": "No calendars configured"}
+            )
+
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            self._calendar_id = user_input.get("calendar")
+            self._profile = user_input.get(CONF_PERFORMANCE_PROFILE, self._profile)
+            return await self.async_step_configure_calendar()
 
-        # For now, just show the current configuration
+        try:
+            from .sensor import export_discovered_calendars
+            self._discovered_calendars = await self.hass.async_add_executor_job(
+                export_discovered_calendars
+            )
+        except Exception as e:
+            _LOGGER.debug("Calendar discovery for options flow failed: %s", e)
+            self._discovered_calendars = {}
+
+        options = [
+            {"label": self._lcal(self._discovered_calendars.get(cid, {}), "name", cid), "value": cid}
+            for cid in calendars
+        ]
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema({
-                vol.Optional(
-                    "show_info",
-                    default=self.config_entry.options.get("show_info", True),
-                ): bool,
-            })
+                vol.Required(CONF_PERFORMANCE_PROFILE, default=self._profile): SelectSelector(
+                    SelectSelectorConfig(
+                        options=[
+                            {"label": p.replace("_", " ").title(), "value": p}
+                            for p in PERFORMANCE_PROFILES
+                        ],
+                        mode=SelectSelectorMode.DROPDOWN
+                    )
+                ),
+                vol.Required("calendar", default=calendars[0]): SelectSelector(
+                    SelectSelectorConfig(options=options, mode=SelectSelectorMode.DROPDOWN)
+                ),
+            }),
+            description_placeholders={"title": self.config_entry.title}
+        )
+
+    async def async_step_configure_calendar(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Configure the update interval override for the selected calendar."""
+        cid = self._calendar_id
+        intervals = dict(self.config_entry.options.get(CONF_UPDATE_INTERVALS, {}))
+
+        if user_input is not None:
+            seconds = int(user_input.get("update_interval") or 0)
+            if seconds > 0:
+                intervals[cid] = seconds
+            else:
+                # 0 = automatic (derived from the plugin's display precision)
+                intervals.pop(cid, None)
+            return self.async_create_entry(
+                title="",
+                data={
+                    **self.config_entry.options,
+                    CONF_PERFORMANCE_PROFILE: self._profile,
+                    CONF_UPDATE_INTERVALS: intervals,
+                }
+            )
+
+        info = self._discovered_calendars.get(cid, {})
+        return self.async_show_form(
+            step_id="configure_calendar",
+            data_schema=vol.Schema({
+                vol.Optional("update_interval", default=intervals.get(cid, 0)): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0,
+                        max=86400,
+                        step=1,
+                        mode=NumberSelectorMode.BOX,
+                        unit_of_measurement="s"
+                    )
+                ),
+            }),
+            description_placeholders={
+                "calendar_name": self._lcal(info, "name", cid),
+                "calendar_description": self._lcal(info, "description", "")
+            }
         )
@@ -7,6 +7,64 @@ DOMAIN = "alternative_time"
 DEFAULT_NAME = "Alternative Time"
 DEFAULT_UPDATE_INTERVAL = 60
 
+# Options flow: per-calendar update interval overrides (seconds, 0 = automatic)
+CONF_UPDATE_INTERVALS = "update_intervals"
+
+# Upper bound for intervals derived automatically from a plugin's state
+# resolution. A user override in the options flow may exceed this.
+MAX_AUTO_UPDATE_INTERVAL = 3600
+
+# Circuit breaker for plugins whose update() raises: the retry delay starts
+# at the sensor's update interval and doubles per consecutive failure up to
+# FAILURE_BACKOFF_MAX seconds. Successful updates close the breaker again.
+FAILURE_BACKOFF_MAX = 3600
+
+# Image platform: plugins that render a picture register their sensor in
+# hass.data[DATA_IMAGE_SOURCES][(entry_id, calendar_id)] and announce new
+# renders through SIGNAL_IMAGE_UPDATED.format(entry_id, calendar_id)
+DATA_IMAGE_SOURCES = f"{DOMAIN}_image_sources"
+SIGNAL_IMAGE_UPDATED = f"{DOMAIN}_image_updated_{{}}_{{}}"
+
+# Sent with SIGNAL_ENTRY_UPDATED.format(entry_id) when a config entry's data
+# or options change; sensors then reload their plugin options and reschedule
+SIGNAL_ENTRY_UPDATED = f"{DOMAIN}_entry_updated_{{}}"
+
+# Entry-level performance profile (options flow)
+CONF_PERFORMANCE_PROFILE = "performance_profile"
+DEFAULT_PERFORMANCE_PROFILE = "realtime"
+
+# Applied by the sensor base class to every plugin:
+# - interval_factor / min_interval scale the automatic update interval
+#   (never beyond max(interval, MAX_AUTO_UPDATE_INTERVAL))
+# - attributes: "full" or "minimal" (scalar attributes only)
+# - visualization: False drops generated maps and skips rendering
+PERFORMANCE_PROFILES = {
+    "realtime": {
+        "interval_factor": 1,
+        "min_interval": 1,
+        "attributes": "full",
+        "visualization": True,
+    },
+    "balanced": {
+        "interval_factor": 1,
+        "min_interval": 10,
+        "attributes": "full",
+        "visualization": True,
+    },
+    "low_power": {
+        "interval_factor": 2,
+        "min_interval": 60,
+        "attributes": "minimal",
+        "visualization": False,
+    },
+}
+
+# Attribute keys (substrings) that carry generated visualizations
+VISUALIZATION_ATTRIBUTE_MARKERS = ("svg", "png", "entity_picture", "map_")
+
+# Attributes dropped in the "minimal" attribute profile
+VERBOSE_ATTRIBUTES = ("description", "reference", "config")
+
 # Calendar categories for organization
 CALENDAR_CATEGORIES = [
     "technical",   # Unix, Julian, Decimal, etc.
@@ -0,0 +1,322 @@
+"""Offline store for IERS Earth orientation parameters (EOP).
+
+UT1-UTC (DUT1), length of day and polar motion are published daily by
+the IERS in the fixed-width finals2000A format (Bulletin A rapid values
+plus about 90 days of predictions). The store ingests such files, either
+dropped into the config directory or fetched rarely from the IERS, and
+keeps them as a compact binary table in .storage:
+
+    header: MAGIC, first MJD (int32), row count (int32)
+    rows:   DUT1 (s), LOD (ms), x, y (arcsec) as float32, flags (uint8)
+
+Row i holds the values at 0h UTC of MJD first + i. The table is memory
+mapped, so a lookup reads two rows and interpolates linearly; the
+one-second step of a leap second between two rows is taken out before
+interpolating.
+"""
+from __future__ import annotations
+
+import math
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .iers_client import get_iers_client
+from .log_helper import get_logger
+
+_LOGGER = get_logger(__name__)
+
+DATA_EOP_STORE = f"{DOMAIN}_eop_store"
+
+TABLE_FILE = f".storage/{DOMAIN}.eop.bin"
+
+MAGIC = b"ATEOP001"
+HEADER = struct.Struct("<8sii")
+ROW = struct.Struct("<4fB")
+
+# Flag bits
+FLAG_PREDICTED = 0x01
+
+# finals2000A files picked up from the config directory, oldest data first
+INGEST_FILES = (
+    "finals2000A.all",
+    "finals.all.iau2000.txt",
+    "finals2000A.data",
+    "finals.data.iau2000.txt",
+    "finals2000A.daily",
+    "finals.daily.iau2000.txt",
+)
+
+# Rapid values plus 90 days of predictions, about 180 days
+EOP_URL = "https://datacenter.iers.org/data/latestVersion/finals.daily.iau2000.txt"
+
+# Fetch when the table covers less than this many days ahead
+REFRESH_MARGIN_DAYS = 60
+
+# Minimum time between download attempts (s)
+FETCH_INTERVAL = 86400
+
+# DUT1 (s) assumed where neither the table nor the IERS API cover the
+# instant; about the value of mid 2025 (|DUT1| is kept below 0.9 s)
+FALLBACK_DUT1 = 0.1
+
+# Days between the Unix epoch and MJD 0
+UNIX_EPOCH_MJD = 40587.0
+
+
+def _field(line: str, start: int, end: int) -> Optional[float]:
+    text = line[start:end].strip()
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def parse_finals(lines: Iterable[str]) -> Dict[int, Tuple[float, float, float, float, int]]:
+    """Parse finals2000A lines into MJD -> (dut1, lod, x, y, flags).
+
+    Uses the Bulletin A columns; rows without a UT1-UTC value (beyond the
+    prediction range) are skipped. Missing LOD or polar motion are NaN.
+    """
+    rows: Dict[int, Tuple[float, float, float, float, int]] = {}
+    for line in lines:
+        if len(line) < 68:
+            continue
+        mjd = _field(line, 7, 15)
+        dut1 = _field(line, 58, 68)
+        if mjd is None or dut1 is None:
+            continue
+        lod = _field(line, 79, 86)
+        x = _field(line, 18, 27)
+        y = _field(line, 37, 46)
+        flags = FLAG_PREDICTED if line[57:58] == "P" else 0
+        rows[int(mjd)] = (
+            dut1,
+            math.nan if lod is None else lod,
+            math.nan if x is None else x,
+            math.nan if y is None else y,
+            flags,
+        )
+    return rows
+
+
+def _contiguous(rows: Dict[int, Any]) -> List[int]:
+    """Return the newest run of consecutive MJDs in rows."""
+    days = sorted(rows)
+    start = len(days) - 1
+    while start > 0 and days[start - 1] == days[start] - 1:
+        start -= 1
+    return days[start:]
+
+
+class EarthOrientationStore:
+    """Memory-mapped EOP table with local interpolation."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store (call async_load before use)."""
+        self._hass = hass
+        self._path = hass.config.path(TABLE_FILE)
+        # Guards the mapping; held only to read rows or swap in a new table
+        self._lock = threading.Lock()
+        # Serializes ingests, which build and flush the new file unlocked
+        self._ingest_lock = threading.Lock()
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._first = 0
+        self._count = 0
+        self._loaded = False
+        self._last_fetch = 0.0
+
+    # -------------- table file --------------
+    def _map_file(self) -> Optional[Tuple[Any, mmap.mmap, int, int]]:
+        """Map the table file; a missing or corrupt file means no data."""
+        try:
+            f = open(self._path, "rb")
+        except FileNotFoundError:
+            return None
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            f.close()
+            return None
+        magic, first, count = HEADER.unpack_from(mm, 0) if len(mm) >= HEADER.size else (b"", 0, 0)
+        if magic != MAGIC or len(mm) < HEADER.size + count * ROW.size:
+            _LOGGER.warning("Ignoring invalid EOP table %s", self._path)
+            mm.close()
+            f.close()
+            return None
+        return f, mm, first, count
+
+    def _open(self) -> None:
+        """(Re)map the table file and swap it in."""
+        mapped = self._map_file()
+        with self._lock:
+            self._close()
+            if mapped is not None:
+                self._file, self._map, self._first, self._count = mapped
+
+    def _close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+        self._file, self._map, self._first, self._count = None, None, 0, 0
+
+    def _rows(self) -> Dict[int, Tuple[float, float, float, float, int]]:
+        """Decode the current table (copied under the lock)."""
+        with self._lock:
+            if self._map is None:
+                return {}
+            first = self._first
+            data = self._map[HEADER.size:HEADER.size + self._count * ROW.size]
+        return {first + i: row for i, row in enumerate(ROW.iter_unpack(data))}
+
+    def _write(self, rows: Dict[int, Tuple[float, float, float, float, int]]) -> None:
+        days = _contiguous(rows)
+        data = bytearray(HEADER.pack(MAGIC, days[0], len(days)))
+        for day in days:
+            data += ROW.pack(*rows[day])
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self._path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            # A reader keeps the old mapping until _open swaps the new one in
+            os.replace(tmp, self._path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        self._open()
+
+    def ingest(self, lines: Iterable[str]) -> int:
+        """Merge finals2000A lines into the table (blocking).
+
+        Newer values replace older ones for the same day. Returns the
+        number of parsed rows.
+        """
+        new = parse_finals(lines)
+        if not new:
+            return 0
+        with self._ingest_lock:
+            rows = self._rows()
+            rows.update(new)
+            self._write(rows)
+        _LOGGER.debug("EOP table now covers MJD %d-%d", self._first, self._first + self._count - 1)
+        return len(new)
+
+    def _load(self) -> None:
+        self._open()
+        try:
+            table_mtime = os.path.getmtime(self._path)
+        except OSError:
+            table_mtime = 0.0
+        for name in INGEST_FILES:
+            path = self._hass.config.path(name)
+            try:
+                if os.path.getmtime(path) <= table_mtime:
+                    continue
+                with open(path, encoding="ascii", errors="replace") as f:
+                    count = self.ingest(f)
+                _LOGGER.info("Imported %d EOP rows from %s", count, name)
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                _LOGGER.warning("Could not import EOP file %s: %s", path, e)
+
+    async def async_load(self) -> None:
+        """Map the stored table and import newer files from the config dir."""
+        if self._loaded:
+            return
+        self._loaded = True
+        await self._hass.async_add_executor_job(self._load)
+
+    # -------------- refresh --------------
+    def refresh_due(self, now: Optional[float] = None) -> bool:
+        """Return True if the table runs out soon and no attempt was made lately."""
+        now = time.time() if now is None else now
+        if now - self._last_fetch < FETCH_INTERVAL:
+            return False
+        today = UNIX_EPOCH_MJD + now / 86400.0
+        return self._count == 0 or self._first + self._count - 1 < today + REFRESH_MARGIN_DAYS
+
+    async def async_refresh(self) -> bool:
+        """Download the daily finals file if due; return True on new data."""
+        if not self.refresh_due():
+            return False
+        self._last_fetch = time.time()
+        result = await get_iers_client(self._hass).async_fetch(EOP_URL)
+        if not result or not result["changed"]:
+            return False
+        count = await self._hass.async_add_executor_job(self.ingest, result["text"].splitlines())
+        _LOGGER.info("Downloaded %d EOP rows from IERS", count)
+        return count > 0
+
+    # -------------- lookup --------------
+    @property
+    def coverage(self) -> Optional[Tuple[int, int]]:
+        """First and last MJD in the table, or None without data."""
+        if self._count == 0:
+            return None
+        return self._first, self._first + self._count - 1
+
+    def values(self, mjd: float) -> Optional[Dict[str, Any]]:
+        """Return DUT1, LOD and polar motion at mjd (UTC), or None if not covered."""
+        with self._lock:
+            if self._map is None:
+                return None
+            index = mjd - self._first
+            i = int(math.floor(index))
+            if i < 0 or i >= self._count:
+                return None
+            row0 = ROW.unpack_from(self._map, HEADER.size + i * ROW.size)
+            row1 = ROW.unpack_from(self._map, HEADER.size + (i + 1) * ROW.size) if i + 1 < self._count else row0
+        f = index - i
+        dut1_next = row1[0]
+        # A leap second makes DUT1 jump by +1 s between the two days
+        if dut1_next - row0[0] > 0.5:
+            dut1_next -= 1.0
+        elif dut1_next - row0[0] < -0.5:
+            dut1_next += 1.0
+
+        def lerp(a: float, b: float) -> Optional[float]:
+            value = a + (b - a) * f
+            return None if math.isnan(value) else value
+
+        return {
+            "dut1": row0[0] + (dut1_next - row0[0]) * f,
+            "lod_ms": lerp(row0[1], row1[1]),
+            "polar_motion_x": lerp(row0[2], row1[2]),
+            "polar_motion_y": lerp(row0[3], row1[3]),
+            "predicted": bool((row0[4] | row1[4]) & FLAG_PREDICTED),
+        }
+
+    def dut1(self, mjd: float) -> Optional[float]:
+        """Return UT1-UTC in seconds at mjd (UTC), or None if not covered."""
+        values = self.values(mjd)
+        return values["dut1"] if values else None
+
+    def close(self) -> None:
+        """Unmap the table."""
+        with self._lock:
+            self._close()
+
+
+def get_eop_store(hass: HomeAssistant) -> EarthOrientationStore:
+    """Return the shared EarthOrientationStore, creating it on first use."""
+    store = hass.data.get(DATA_EOP_STORE)
+    if store is None:
+        store = hass.data.setdefault(DATA_EOP_STORE, EarthOrientationStore(hass))
+    return store
@@ -0,0 +1,146 @@
+"""Shared HTTP client for IERS data.
+
+All sensors and config entries fetch IERS resources (the UT1-UTC REST
+value, the finals2000A Earth orientation file) through one IersClient
+per Home Assistant instance. It uses Home Assistant's shared aiohttp
+session and
+
+- joins concurrent requests for the same URL into one (single flight)
+- answers from its cache while the response is younger than max_age
+- revalidates with If-None-Match / If-Modified-Since, so an unchanged
+  file costs a 304 without a body
+- backs off exponentially with jitter after failures and serves the
+  last good response meanwhile
+
+IersClient takes an optional aiohttp session, and hass is only used to
+create the request task. It can therefore run against a local stand-in
+server (e.g. aiohttp.web on 127.0.0.1) with a plain session and any
+object that provides async_create_task.
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import DOMAIN
+from .log_helper import get_logger
+
+_LOGGER = get_logger(__name__)
+
+DATA_IERS_CLIENT = f"{DOMAIN}_iers_client"
+
+REQUEST_TIMEOUT = 30  # seconds
+
+# Retry delay after the first failure, doubled per further failure (s)
+BACKOFF_BASE = 60.0
+BACKOFF_MAX = 6 * 3600.0
+
+
+class IersClient:
+    """Deduplicating, caching HTTP client with conditional requests."""
+
+    def __init__(self, hass: HomeAssistant, session: Optional[aiohttp.ClientSession] = None) -> None:
+        """Initialize the client (session defaults to Home Assistant's)."""
+        self._hass = hass
+        self._session = session
+        # url -> {"text", "etag", "last_modified", "fetched_at"}
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        # url -> (consecutive failures, retry not before)
+        self._failures: Dict[str, Tuple[int, float]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def _result(self, url: str, changed: bool) -> Optional[Dict[str, Any]]:
+        entry = self._cache.get(url)
+        if entry is None:
+            return None
+        return {"text": entry["text"], "fetched_at": entry["fetched_at"], "changed": changed}
+
+    def backoff_remaining(self, url: str) -> float:
+        """Seconds until url may be requested again after failures."""
+        _, retry_at = self._failures.get(url, (0, 0.0))
+        return max(0.0, retry_at - time.time())
+
+    async def async_fetch(
+        self,
+        url: str,
+        max_age: float = 0.0,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Return {"text", "fetched_at", "changed"} for url, or None.
+
+        "changed" is True when this call brought a new body. While backing
+        off, or when the request fails, the last good response is returned
+        with "changed" False (None if there never was one).
+        """
+        entry = self._cache.get(url)
+        if entry is not None and time.time() - entry["fetched_at"] < max_age:
+            return self._result(url, False)
+        if self.backoff_remaining(url) > 0:
+            return self._result(url, False)
+
+        task = self._inflight.get(url)
+        if task is None:
+            task = self._hass.async_create_task(self._async_request(url, headers or {}))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _task: self._inflight.pop(url, None))
+        # A cancelled caller must not cancel the request others are waiting for
+        return await asyncio.shield(task)
+
+    async def _async_request(self, url: str, headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        entry = self._cache.get(url)
+        request_headers = dict(headers)
+        if entry is not None:
+            if entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        session = self._session or async_get_clientsession(self._hass)
+        try:
+            async with session.get(
+                url,
+                headers=request_headers,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            ) as response:
+                if response.status == 304 and entry is not None:
+                    entry["fetched_at"] = time.time()
+                    self._failures.pop(url, None)
+                    _LOGGER.debug("IERS %s not modified", url)
+                    return self._result(url, False)
+                if response.status != 200:
+                    raise aiohttp.ClientResponseError(
+                        response.request_info, response.history, status=response.status
+                    )
+                text = await response.text(errors="replace")
+                changed = entry is None or text != entry["text"]
+                self._cache[url] = {
+                    "text": text,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "fetched_at": time.time(),
+                }
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            failures = self._failures.get(url, (0, 0.0))[0] + 1
+            delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (failures - 1))
+            # Equal jitter: spread retries of many instances over half the delay
+            delay = delay / 2 + random.uniform(0, delay / 2)
+            self._failures[url] = (failures, time.time() + delay)
+            _LOGGER.warning("IERS request %s failed (%s), retrying in %.0fs", url, e, delay)
+            return self._result(url, False)
+
+        self._failures.pop(url, None)
+        return self._result(url, changed)
+
+
+def get_iers_client(hass: HomeAssistant) -> IersClient:
+    """Return the shared IersClient, creating it on first use."""
+    client = hass.data.get(DATA_IERS_CLIENT)
+    if client is None:
+        client = hass.data.setdefault(DATA_IERS_CLIENT, IersClient(hass))
+    return client
@@ -0,0 +1,116 @@
+"""Image platform for Alternative Time Systems.
+
+Calendar plugins that render a picture (IMAGE_CONTENT_TYPE set on the
+sensor class) get an image entity. The bytes stay in the sensor and are
+served on demand through Home Assistant's image proxy, so neither the
+recorder nor websocket subscribers receive them with every state write.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from homeassistant.components.image import ImageEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DATA_IMAGE_SOURCES, SIGNAL_IMAGE_UPDATED
+from .log_helper import get_logger
+from .sensor import async_import_calendar_module, calendar_device_info, get_sensor_class
+
+_LOGGER = get_logger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up image entities for calendars that render pictures."""
+    entry_id = config_entry.entry_id
+    name = config_entry.data.get("name", "Alternative Time")
+
+    entities = []
+    for calendar_id in config_entry.data.get("calendars", []):
+        module = await async_import_calendar_module(hass, calendar_id)
+        sensor_class = get_sensor_class(module) if module else None
+        if not sensor_class or not sensor_class.IMAGE_CONTENT_TYPE:
+            continue
+        info = getattr(module, "CALENDAR_INFO", None) or {}
+        entities.append(
+            AlternativeTimeImage(hass, name, entry_id, calendar_id, info, sensor_class.IMAGE_CONTENT_TYPE)
+        )
+
+    if entities:
+        _LOGGER.debug("Adding %d image entities", len(entities))
+        async_add_entities(entities)
+
+
+class AlternativeTimeImage(ImageEntity):
+    """Picture rendered by a calendar sensor, served on demand."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        base_name: str,
+        entry_id: str,
+        calendar_id: str,
+        info: Dict[str, Any],
+        content_type: str,
+    ) -> None:
+        """Initialize the image entity."""
+        super().__init__(hass)
+        self._entry_id = entry_id
+        self._calendar_id = calendar_id
+        self._info = info
+        self._attr_name = f"{base_name} {self._calendar_name(hass)} Map"
+        self._attr_unique_id = f"{entry_id}_{calendar_id}_image"
+        self._attr_content_type = content_type
+        self._attr_icon = info.get("icon")
+
+    def _calendar_name(self, hass: HomeAssistant) -> str:
+        names = self._info.get("name", self._calendar_id)
+        if not isinstance(names, dict):
+            return str(names)
+        lang = getattr(hass.config, "language", "en") or "en"
+        return names.get(lang) or names.get(lang.split("-")[0]) or names.get("en") or self._calendar_id
+
+    @property
+    def device_info(self):
+        """Group with the calendar's sensor."""
+        return calendar_device_info(self._info)
+
+    def _source(self) -> Optional[Any]:
+        return self.hass.data.get(DATA_IMAGE_SOURCES, {}).get((self._entry_id, self._calendar_id))
+
+    @property
+    def available(self) -> bool:
+        """Return True once the sensor has rendered a picture."""
+        source = self._source()
+        return source is not None and source.image_last_updated is not None
+
+    async def async_added_to_hass(self) -> None:
+        """Follow renders of the source sensor."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_IMAGE_UPDATED.format(self._entry_id, self._calendar_id),
+                self._async_image_updated,
+            )
+        )
+        self._async_image_updated()
+
+    @callback
+    def _async_image_updated(self) -> None:
+        source = self._source()
+        if source is not None:
+            self._attr_image_last_updated = source.image_last_updated
+            self._attr_content_type = source.image_content_type()
+        self.async_write_ha_state()
+
+    async def async_image(self) -> Optional[bytes]:
+        """Return the latest render (kept in memory by the sensor)."""
+        source = self._source()
+        return source.image_bytes() if source is not None else None
@@ -0,0 +1,171 @@
+"""Event-loop lag and CPU accounting for Alternative Time Systems.
+
+A single LoadMonitor per Home Assistant instance collects:
+- loop lag: how late timer callbacks (our own probe and every sensor tick)
+  fire compared to their scheduled time
+- CPU time spent in plugin update() calls
+
+When the lag stays above LAG_DEGRADE_THRESHOLD the monitor switches to
+load shedding: the sensor base class slows fast sensors down to
+SHED_MIN_INTERVAL and heavy renders are deferred. Shedding ends once the
+lag stayed below LAG_RECOVER_THRESHOLD for RECOVERY_PERIOD seconds.
+"""
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .log_helper import get_logger
+
+_LOGGER = get_logger(__name__)
+
+DATA_LOAD_MONITOR = f"{DOMAIN}_load_monitor"
+# Entry id of the config entry that owns the one diagnostic load sensor
+DATA_LOAD_SENSOR_OWNER = f"{DOMAIN}_load_sensor_owner"
+
+# Probe the loop every PROBE_INTERVAL seconds
+PROBE_INTERVAL = 2.0
+
+# Statistics window in seconds
+WINDOW = 60.0
+
+# Lag thresholds in seconds (averaged over LAG_SAMPLE_WINDOW)
+LAG_DEGRADE_THRESHOLD = 0.25
+LAG_RECOVER_THRESHOLD = 0.05
+LAG_SAMPLE_WINDOW = 10.0
+RECOVERY_PERIOD = 30.0
+
+# Sensors updating at or below this interval are slowed while shedding
+SHED_FAST_INTERVAL = 1
+SHED_MIN_INTERVAL = 10
+
+
+class LoadMonitor:
+    """Collect loop lag / CPU samples and decide on load shedding."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the monitor."""
+        self._hass = hass
+        self._lag_samples: Deque[Tuple[float, float]] = deque()
+        self._cpu_samples: Deque[Tuple[float, float]] = deque()
+        self._probe_handle = None
+        self._probe_due: Optional[float] = None
+        self._recovering_since: Optional[float] = None
+        self.shedding = False
+        self.shedding_since: Optional[float] = None
+
+    # -------------- lifecycle --------------
+    @callback
+    def async_start(self) -> None:
+        """Start probing the event loop."""
+        if self._probe_handle is None:
+            self._schedule_probe()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop probing the event loop."""
+        if self._probe_handle is not None:
+            self._probe_handle.cancel()
+            self._probe_handle = None
+
+    def _schedule_probe(self) -> None:
+        loop = self._hass.loop
+        self._probe_due = loop.time() + PROBE_INTERVAL
+        self._probe_handle = loop.call_at(self._probe_due, self._probe)
+
+    @callback
+    def _probe(self) -> None:
+        self.record_lag(self._hass.loop.time() - self._probe_due)
+        self._schedule_probe()
+
+    # -------------- samples --------------
+    def _trim(self, samples: Deque[Tuple[float, float]], now: float) -> None:
+        while samples and samples[0][0] < now - WINDOW:
+            samples.popleft()
+
+    @callback
+    def record_lag(self, lag: float) -> None:
+        """Record how late a timer fired (seconds) and update shedding."""
+        now = time.monotonic()
+        self._lag_samples.append((now, max(0.0, lag)))
+        self._trim(self._lag_samples, now)
+        self._evaluate(now)
+
+    def record_cpu(self, seconds: float) -> None:
+        """Record CPU seconds used by a plugin update (thread-safe)."""
+        self._hass.loop.call_soon_threadsafe(self._add_cpu, time.monotonic(), max(0.0, seconds))
+
+    @callback
+    def _add_cpu(self, ts: float, seconds: float) -> None:
+        self._cpu_samples.append((ts, seconds))
+        self._trim(self._cpu_samples, ts)
+
+    def _recent_lag(self, now: float) -> float:
+        recent = [lag for ts, lag in self._lag_samples if ts >= now - LAG_SAMPLE_WINDOW]
+        return sum(recent) / len(recent) if recent else 0.0
+
+    def _evaluate(self, now: float) -> None:
+        lag = self._recent_lag(now)
+        if not self.shedding:
+            if lag > LAG_DEGRADE_THRESHOLD:
+                self.shedding = True
+                self.shedding_since = now
+                self._recovering_since = None
+                _LOGGER.warning(
+                    "Event loop lag %.0f ms - slowing fast calendars and deferring renders", lag * 1000
+                )
+            return
+
+        if lag < LAG_RECOVER_THRESHOLD:
+            if self._recovering_since is None:
+                self._recovering_since = now
+            elif now - self._recovering_since >= RECOVERY_PERIOD:
+                self.shedding = False
+                self.shedding_since = None
+                self._recovering_since = None
+                _LOGGER.info("Event loop recovered - restoring calendar update rates")
+        else:
+            self._recovering_since = None
+
+    # -------------- policy --------------
+    def shed_interval(self, seconds: int) -> int:
+        """Return the interval to use for a sensor while shedding load."""
+        if self.shedding and seconds <= SHED_FAST_INTERVAL:
+            return SHED_MIN_INTERVAL
+        return seconds
+
+    @property
+    def defer_renders(self) -> bool:
+        """Return True if heavy renders should be postponed."""
+        return self.shedding
+
+    # -------------- statistics --------------
+    def statistics(self) -> Dict[str, Any]:
+        """Return statistics for the last minute."""
+        now = time.monotonic()
+        self._trim(self._lag_samples, now)
+        self._trim(self._cpu_samples, now)
+        lags = [lag for _, lag in self._lag_samples]
+        cpu = sum(seconds for _, seconds in self._cpu_samples)
+        return {
+            "loop_lag_ms": round(self._recent_lag(now) * 1000, 1),
+            "max_loop_lag_ms": round(max(lags) * 1000, 1) if lags else 0.0,
+            "cpu_seconds_last_minute": round(cpu, 3),
+            "cpu_percent_last_minute": round(cpu / WINDOW * 100, 2),
+            "updates_last_minute": len(self._cpu_samples),
+            "load_shedding": self.shedding,
+            "shedding_for_seconds": int(now - self.shedding_since) if self.shedding_since else 0,
+        }
+
+
+def get_load_monitor(hass: HomeAssistant) -> LoadMonitor:
+    """Return the shared LoadMonitor, creating it on first use."""
+    monitor = hass.data.get(DATA_LOAD_MONITOR)
+    if monitor is None:
+        monitor = LoadMonitor(hass)
+        hass.data[DATA_LOAD_MONITOR] = monitor
+    return monitor
@@ -0,0 +1,140 @@
+"""Rate-limited, lazily formatted logging for Alternative Time Systems.
+
+Plugins log from per-tick paths (every second for the fast calendars).
+``get_logger`` returns a drop-in replacement for ``logging.getLogger`` that
+
+- returns immediately when the level is disabled, so %-style messages are
+  never formatted and their arguments never rendered
+- lets at most RATE_LIMIT_BURST records per message template through in
+  each RATE_LIMIT_WINDOW; the rest are counted and reported as
+  "suppressed N similar messages" on the next record that passes
+
+Use %-style arguments (``_LOGGER.debug("Updated to %s", state)``) rather
+than f-strings, and wrap expensive arguments in ``Lazy``.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+# Per message template: RATE_LIMIT_BURST records per RATE_LIMIT_WINDOW seconds
+RATE_LIMIT_WINDOW = 60.0
+RATE_LIMIT_BURST = 10
+
+# Forget templates that have been quiet for a while
+_MAX_TEMPLATES = 256
+
+
+class Lazy:
+    """Defer an expensive log argument until the record is formatted."""
+
+    __slots__ = ("_func", "_args")
+
+    def __init__(self, func: Callable[..., Any], *args: Any) -> None:
+        """Store the callable and its arguments."""
+        self._func = func
+        self._args = args
+
+    def __str__(self) -> str:
+        return str(self._func(*self._args))
+
+    def __repr__(self) -> str:
+        return repr(self._func(*self._args))
+
+
+class RateLimitedLogger:
+    """Wrap a stdlib logger with level short-circuit and per-template limits."""
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        window: float = RATE_LIMIT_WINDOW,
+        burst: int = RATE_LIMIT_BURST,
+    ) -> None:
+        """Initialize the wrapper."""
+        self.logger = logger
+        self._window = window
+        self._burst = burst
+        self._lock = threading.Lock()
+        # (level, template) -> [window_start, emitted, suppressed]
+        self._templates: Dict[Tuple[int, str], list] = {}
+
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802 - logging API
+        """Return True if records of this level would be emitted."""
+        return self.logger.isEnabledFor(level)
+
+    def _admit(self, level: int, msg: str) -> Tuple[bool, int]:
+        """Return (emit, suppressed_count) for a record of this template."""
+        now = time.monotonic()
+        key = (level, msg)
+        with self._lock:
+            entry = self._templates.get(key)
+            if entry is None or now - entry[0] >= self._window:
+                suppressed = entry[2] if entry else 0
+                if len(self._templates) >= _MAX_TEMPLATES:
+                    self._prune(now)
+                self._templates[key] = [now, 1, 0]
+                return True, suppressed
+            if entry[1] < self._burst:
+                entry[1] += 1
+                return True, 0
+            entry[2] += 1
+            return False, 0
+
+    def _prune(self, now: float) -> None:
+        for key in [k for k, v in self._templates.items() if now - v[0] >= self._window]:
+            del self._templates[key]
+        if len(self._templates) >= _MAX_TEMPLATES:
+            self._templates.clear()
+
+    def log(self, level: int, msg: Any, *args: Any, **kwargs: Any) -> None:
+        """Log a record if the level is enabled and the template is not throttled."""
+        if not self.logger.isEnabledFor(level):
+            return
+        template = msg if isinstance(msg, str) else str(msg)
+        emit, suppressed = self._admit(level, template)
+        if not emit:
+            return
+        if suppressed:
+            if not args:
+                template = template.replace("%", "%%")
+            template += " (suppressed %d similar messages)"
+            args = (*args, suppressed)
+        kwargs.setdefault("stacklevel", 2)
+        self.logger.log(level, template, *args, **kwargs)
+
+    def _log_at(self, level: int, msg: Any, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        kwargs.setdefault("stacklevel", 4)
+        self.log(level, msg, *args, **kwargs)
+
+    def debug(self, msg: Any, *args: Any, **kwargs: Any) -> None:
+        """Log at DEBUG level."""
+        self._log_at(logging.DEBUG, msg, args, kwargs)
+
+    def info(self, msg: Any, *args: Any, **kwargs: Any) -> None:
+        """Log at INFO level."""
+        self._log_at(logging.INFO, msg, args, kwargs)
+
+    def warning(self, msg: Any, *args: Any, **kwargs: Any) -> None:
+        """Log at WARNING level."""
+        self._log_at(logging.WARNING, msg, args, kwargs)
+
+    def error(self, msg: Any, *args: Any, **kwargs: Any) -> None:
+        """Log at ERROR level."""
+        self._log_at(logging.ERROR, msg, args, kwargs)
+
+    def exception(self, msg: Any, *args: Any, **kwargs: Any) -> None:
+        """Log at ERROR level with the current exception."""
+        kwargs.setdefault("exc_info", True)
+        self._log_at(logging.ERROR, msg, args, kwargs)
+
+    def critical(self, msg: Any, *args: Any, **kwargs: Any) -> None:
+        """Log at CRITICAL level."""
+        self._log_at(logging.CRITICAL, msg, args, kwargs)
+
+
+def get_logger(name: str) -> RateLimitedLogger:
+    """Return a rate-limited logger for the given module name."""
+    return RateLimitedLogger(logging.getLogger(name))
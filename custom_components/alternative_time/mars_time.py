@@ -0,0 +1,233 @@
+"""Mars time kernel shared by the Mars plugins.
+
+Implements the Mars24 algorithm (Allison & McEwen 2000, Planet. Space
+Sci. 48, 215; updated constants from NASA GISS): Mars Sol Date,
+Coordinated Mars Time, the areocentric solar longitude Ls with the
+planetary perturbation terms, and the equation of time. MarsTime is
+evaluated lazily from a TT Julian Date; AstroContext exposes one per
+tick, so every Mars sensor reads the same MSD and Ls, and local times
+for any number of longitudes cost one addition each.
+
+Seasons start at Ls = 0, 90, 180 and 270 degrees. MarsSeasonTable holds
+the MSD of every such crossing for Mars years FIRST_MARS_YEAR to
+LAST_MARS_YEAR, found once by Newton iteration on the Ls formula, so the
+current season, the next boundary and the Mars year number (Clancy et
+al. 2000: year 1 began 1955-04-11) are bisection lookups.
+"""
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from functools import cached_property
+from typing import Dict, Iterable, List, Optional, Tuple
+
+J2000_JD = 2451545.0
+
+# MSD = (JD_TT - 2451549.5) / SOL_RATIO + MSD_AT_EPOCH
+MSD_EPOCH_JD = 2451549.5
+SOL_RATIO = 1.0274912517  # Earth days per sol
+MSD_AT_EPOCH = 44796.0 - 0.0009626
+
+SOL_SECONDS = SOL_RATIO * 86400.0
+
+# Mean Mars tropical year (sols)
+TROPICAL_YEAR_SOLS = 668.5921
+
+# Mars year whose Ls = 0 falls in 1998 (so Ls ~ 270 at J2000)
+MARS_YEAR_AT_J2000 = 24
+
+# Range of the season table (Mars years, 1955-2142)
+FIRST_MARS_YEAR = 1
+LAST_MARS_YEAR = 100
+
+SEASON_COUNT = 4
+SEASON_SPAN = 90.0
+
+# Newton iteration for the season crossings
+CROSSING_TOLERANCE = 1e-7  # days
+CROSSING_ITERATIONS = 8
+
+# Planetary perturbations of Mars' orbit: amplitude (deg), period (Julian
+# years), phase (deg)
+PERTURBATIONS: Tuple[Tuple[float, float, float], ...] = (
+    (0.0071, 2.2353, 49.409),
+    (0.0057, 2.7543, 168.173),
+    (0.0039, 1.1177, 191.837),
+    (0.0037, 15.7866, 21.736),
+    (0.0021, 2.1354, 15.704),
+    (0.0020, 2.4694, 95.528),
+    (0.0018, 32.8493, 49.095),
+)
+
+
+def msd_from_jd_tt(jd_tt: float) -> float:
+    """Return the Mars Sol Date of a TT Julian Date."""
+    return (jd_tt - MSD_EPOCH_JD) / SOL_RATIO + MSD_AT_EPOCH
+
+
+def jd_tt_from_msd(msd: float) -> float:
+    """Return the TT Julian Date of a Mars Sol Date."""
+    return (msd - MSD_AT_EPOCH) * SOL_RATIO + MSD_EPOCH_JD
+
+
+def equation_of_center(jd_tt: float) -> float:
+    """Return ν - M (true minus mean anomaly) in degrees, perturbations included."""
+    dt = jd_tt - J2000_JD
+    m = math.radians(19.3871 + 0.52402073 * dt)
+    pbs = sum(a * math.cos(math.radians(0.985626 * dt / tau + phi)) for a, tau, phi in PERTURBATIONS)
+    return (
+        (10.691 + 3.0e-7 * dt) * math.sin(m)
+        + 0.623 * math.sin(2.0 * m)
+        + 0.050 * math.sin(3.0 * m)
+        + 0.005 * math.sin(4.0 * m)
+        + 0.0005 * math.sin(5.0 * m)
+        + pbs
+    )
+
+
+def _unwrapped_ls(jd_tt: float) -> float:
+    """Ls in degrees without the modulo, increasing monotonically (0 = MY 24 start)."""
+    return 270.3871 + 0.524038496 * (jd_tt - J2000_JD) + equation_of_center(jd_tt)
+
+
+def solar_longitude(jd_tt: float) -> float:
+    """Return the areocentric solar longitude Ls in degrees [0, 360)."""
+    return _unwrapped_ls(jd_tt) % 360.0
+
+
+def ls_crossing(mars_year: int, ls: float) -> float:
+    """Return the TT Julian Date at which Mars year mars_year reaches ls."""
+    target = 360.0 * (mars_year - MARS_YEAR_AT_J2000) + ls
+    # Start from the mean motion and refine with Newton steps
+    jd = J2000_JD + (target - 270.3871) / 0.524038496
+    for _ in range(CROSSING_ITERATIONS):
+        rate = _unwrapped_ls(jd + 0.5) - _unwrapped_ls(jd - 0.5)
+        step = (_unwrapped_ls(jd) - target) / rate
+        jd -= step
+        if abs(step) < CROSSING_TOLERANCE:
+            break
+    return jd
+
+
+class MarsTime:
+    """Mars time quantities for one instant (TT Julian Date)."""
+
+    def __init__(self, jd_tt: float) -> None:
+        """Initialize for a TT Julian Date."""
+        self.jd_tt = jd_tt
+
+    @cached_property
+    def msd(self) -> float:
+        """Mars Sol Date."""
+        return msd_from_jd_tt(self.jd_tt)
+
+    @cached_property
+    def mtc_hours(self) -> float:
+        """Coordinated Mars Time (mean solar time at 0°) in hours."""
+        return (self.msd % 1.0) * 24.0
+
+    @cached_property
+    def equation_of_center(self) -> float:
+        """ν - M in degrees."""
+        return equation_of_center(self.jd_tt)
+
+    @cached_property
+    def solar_longitude(self) -> float:
+        """Areocentric solar longitude Ls in degrees."""
+        alpha_fms = 270.3871 + 0.524038496 * (self.jd_tt - J2000_JD)
+        return (alpha_fms + self.equation_of_center) % 360.0
+
+    @cached_property
+    def equation_of_time_hours(self) -> float:
+        """True minus mean solar time in hours."""
+        ls = math.radians(self.solar_longitude)
+        eot = 2.861 * math.sin(2.0 * ls) - 0.071 * math.sin(4.0 * ls) + 0.002 * math.sin(6.0 * ls) - self.equation_of_center
+        return eot / 15.0
+
+    @cached_property
+    def subsolar_longitude(self) -> float:
+        """East longitude of the subsolar point in degrees [0, 360)."""
+        return (180.0 - 15.0 * (self.mtc_hours + self.equation_of_time_hours)) % 360.0
+
+    @cached_property
+    def season(self) -> Optional[Dict[str, float]]:
+        """Mars year and season from the season table (see MarsSeasonTable.lookup)."""
+        return season_table().lookup(self.msd)
+
+    def local_mean_time(self, longitude: float) -> float:
+        """Local mean solar time in hours at an east longitude."""
+        return (self.mtc_hours + longitude / 15.0) % 24.0
+
+    def local_true_time(self, longitude: float) -> float:
+        """Local true solar time in hours at an east longitude."""
+        return (self.mtc_hours + longitude / 15.0 + self.equation_of_time_hours) % 24.0
+
+    def local_mean_times(self, longitudes: Iterable[float]) -> List[float]:
+        """Local mean solar times in hours for several east longitudes."""
+        mtc = self.mtc_hours
+        return [(mtc + longitude / 15.0) % 24.0 for longitude in longitudes]
+
+
+def format_hours(hours: float) -> str:
+    """Format hours of a sol as HH:MM:SS."""
+    seconds = int(hours * 3600.0) % 86400
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+class MarsSeasonTable:
+    """Season start MSDs for a range of Mars years, searchable by MSD."""
+
+    def __init__(self, first_year: int = FIRST_MARS_YEAR, last_year: int = LAST_MARS_YEAR) -> None:
+        """Compute every Ls = 0/90/180/270 crossing of the years (blocking, ~10 ms)."""
+        self.first_year = first_year
+        self.last_year = last_year
+        self._msd: List[float] = [
+            msd_from_jd_tt(ls_crossing(year, season * SEASON_SPAN))
+            for year in range(first_year, last_year + 2)
+            for season in range(SEASON_COUNT)
+        ]
+
+    def _index(self, msd: float) -> Optional[int]:
+        index = bisect.bisect_right(self._msd, msd) - 1
+        if index < 0 or index >= (self.last_year - self.first_year + 1) * SEASON_COUNT:
+            return None
+        return index
+
+    def lookup(self, msd: float) -> Optional[Dict[str, float]]:
+        """Return the season at msd, or None outside the table.
+
+        Keys: mars_year, season (0 = northern spring ... 3 = winter),
+        season_start and next_season_start (MSD), sols_until_next_season.
+        """
+        index = self._index(msd)
+        if index is None:
+            return None
+        year, season = divmod(index, SEASON_COUNT)
+        return {
+            "mars_year": self.first_year + year,
+            "season": season,
+            "season_start": self._msd[index],
+            "next_season_start": self._msd[index + 1],
+            "sols_until_next_season": self._msd[index + 1] - msd,
+        }
+
+    def mars_year_start(self, mars_year: int) -> Optional[float]:
+        """Return the MSD at which mars_year began (Ls = 0), or None."""
+        if not self.first_year <= mars_year <= self.last_year + 1:
+            return None
+        return self._msd[(mars_year - self.first_year) * SEASON_COUNT]
+
+
+_SEASON_TABLE: Optional[MarsSeasonTable] = None
+_SEASON_TABLE_LOCK = threading.Lock()
+
+
+def season_table() -> MarsSeasonTable:
+    """Return the shared season table, computing it on first use."""
+    global _SEASON_TABLE
+    if _SEASON_TABLE is None:
+        with _SEASON_TABLE_LOCK:
+            if _SEASON_TABLE is None:
+                _SEASON_TABLE = MarsSeasonTable()
+    return _SEASON_TABLE
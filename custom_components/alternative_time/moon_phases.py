@@ -0,0 +1,291 @@
+"""Moon phase engine shared by the lunar-aware plugins.
+
+True instants of new moon, first quarter, full moon and last quarter
+follow Meeus, Astronomical Algorithms (2nd ed.), ch. 49: the mean phase
+of lunation k plus the periodic terms in the Sun's and Moon's anomalies,
+the Moon's argument of latitude and node, and the fourteen planetary
+arguments (about a minute over 1900-2100). MoonPhaseTable holds every
+such event of a window of TABLE_YEARS around the requested instant as
+UTC timestamps, so the current phase, the Moon's age and the next event
+are a bisection; the shared table moves to a new window only when an
+instant falls outside it.
+
+The phase fraction runs 0 (new) - 0.25 (first quarter) - 0.5 (full) -
+0.75 (last quarter) and is interpolated linearly between the true
+events, so it is exact at each event. The illuminated fraction comes
+from the phase angle of Meeus ch. 48 (low accuracy, ~0.1 %).
+"""
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .timescales import BUILTIN, TT_MINUS_TAI, UNIX_EPOCH_JD, tai_to_utc
+
+J2000_JD = 2451545.0
+SECONDS_PER_DAY = 86400.0
+DAYS_PER_CENTURY = 36525.0
+
+SYNODIC_MONTH = 29.530588861
+# Lunations per Julian year (Meeus 49.2)
+LUNATIONS_PER_YEAR = 12.3685
+
+NEW_MOON, FIRST_QUARTER, FULL_MOON, LAST_QUARTER = range(4)
+PHASE_KEYS = ("new_moon", "first_quarter", "full_moon", "last_quarter")
+
+# Years of events on each side of the instant that (re)builds the table
+TABLE_YEARS = 5
+
+# Periodic terms: (coefficient in days, power of E, multiples of M, M', F, Ω)
+_SHARED_TERMS: Tuple[Tuple[float, int, Tuple[int, int, int, int]], ...] = (
+    (-0.00017, 0, (0, 0, 0, 1)),
+    (-0.00007, 0, (2, 1, 0, 0)),
+    (0.00004, 0, (0, 2, -2, 0)),
+    (0.00004, 0, (3, 0, 0, 0)),
+    (0.00003, 0, (1, 1, -2, 0)),
+    (0.00003, 0, (0, 2, 2, 0)),
+    (-0.00003, 0, (1, 1, 2, 0)),
+    (0.00003, 0, (-1, 1, 2, 0)),
+    (-0.00002, 0, (-1, 1, -2, 0)),
+    (-0.00002, 0, (1, 3, 0, 0)),
+    (0.00002, 0, (0, 4, 0, 0)),
+)
+
+NEW_MOON_TERMS = (
+    (-0.40720, 0, (0, 1, 0, 0)),
+    (0.17241, 1, (1, 0, 0, 0)),
+    (0.01608, 0, (0, 2, 0, 0)),
+    (0.01039, 0, (0, 0, 2, 0)),
+    (0.00739, 1, (-1, 1, 0, 0)),
+    (-0.00514, 1, (1, 1, 0, 0)),
+    (0.00208, 2, (2, 0, 0, 0)),
+    (-0.00111, 0, (0, 1, -2, 0)),
+    (-0.00057, 0, (0, 1, 2, 0)),
+    (0.00056, 1, (1, 2, 0, 0)),
+    (-0.00042, 0, (0, 3, 0, 0)),
+    (0.00042, 1, (1, 0, 2, 0)),
+    (0.00038, 1, (1, 0, -2, 0)),
+    (-0.00024, 1, (-1, 2, 0, 0)),
+) + _SHARED_TERMS
+
+FULL_MOON_TERMS = (
+    (-0.40614, 0, (0, 1, 0, 0)),
+    (0.17302, 1, (1, 0, 0, 0)),
+    (0.01614, 0, (0, 2, 0, 0)),
+    (0.01043, 0, (0, 0, 2, 0)),
+    (0.00734, 1, (-1, 1, 0, 0)),
+    (-0.00515, 1, (1, 1, 0, 0)),
+    (0.00209, 2, (2, 0, 0, 0)),
+    (-0.00111, 0, (0, 1, -2, 0)),
+    (-0.00057, 0, (0, 1, 2, 0)),
+    (0.00056, 1, (1, 2, 0, 0)),
+    (-0.00042, 0, (0, 3, 0, 0)),
+    (0.00042, 1, (1, 0, 2, 0)),
+    (0.00038, 1, (1, 0, -2, 0)),
+    (-0.00024, 1, (-1, 2, 0, 0)),
+) + _SHARED_TERMS
+
+QUARTER_TERMS = (
+    (-0.62801, 0, (0, 1, 0, 0)),
+    (0.17172, 1, (1, 0, 0, 0)),
+    (-0.01183, 1, (1, 1, 0, 0)),
+    (0.00862, 0, (0, 2, 0, 0)),
+    (0.00804, 0, (0, 0, 2, 0)),
+    (0.00454, 1, (-1, 1, 0, 0)),
+    (0.00204, 2, (2, 0, 0, 0)),
+    (-0.00180, 0, (0, 1, -2, 0)),
+    (-0.00070, 0, (0, 1, 2, 0)),
+    (-0.00040, 0, (0, 3, 0, 0)),
+    (-0.00034, 1, (-1, 2, 0, 0)),
+    (0.00032, 1, (1, 0, 2, 0)),
+    (0.00032, 1, (1, 0, -2, 0)),
+    (-0.00028, 2, (2, 1, 0, 0)),
+    (0.00027, 1, (1, 2, 0, 0)),
+    (-0.00017, 0, (0, 0, 0, 1)),
+    (-0.00005, 0, (-1, 1, -2, 0)),
+    (0.00004, 0, (0, 2, 2, 0)),
+    (-0.00004, 0, (1, 1, 2, 0)),
+    (0.00004, 0, (-2, 1, 0, 0)),
+    (0.00003, 0, (1, 1, -2, 0)),
+    (0.00003, 0, (3, 0, 0, 0)),
+    (0.00002, 0, (0, 2, -2, 0)),
+    (0.00002, 0, (-1, 1, 2, 0)),
+    (-0.00002, 0, (1, 3, 0, 0)),
+)
+
+# Planetary arguments A1-A14: (coefficient, constant, rate per lunation)
+PLANETARY_TERMS = (
+    (0.000325, 299.77, 0.107408),
+    (0.000165, 251.88, 0.016321),
+    (0.000164, 251.83, 26.651886),
+    (0.000126, 349.42, 36.412478),
+    (0.000110, 84.66, 18.206239),
+    (0.000062, 141.74, 53.303771),
+    (0.000060, 207.14, 2.453732),
+    (0.000056, 154.84, 7.306860),
+    (0.000047, 34.52, 27.261239),
+    (0.000042, 207.19, 0.121824),
+    (0.000040, 291.34, 1.844379),
+    (0.000037, 161.72, 24.198154),
+    (0.000035, 239.56, 25.513099),
+    (0.000023, 331.55, 3.592518),
+)
+
+
+def _periodic(terms: Sequence, e: float, args: Tuple[float, float, float, float]) -> float:
+    total = 0.0
+    for coefficient, e_power, multiples in terms:
+        angle = sum(m * a for m, a in zip(multiples, args))
+        total += coefficient * e ** e_power * math.sin(angle)
+    return total
+
+
+def phase_jde(k: float) -> float:
+    """Return the TT Julian Date of the phase k (Meeus 49).
+
+    Integer k is a new moon (k = 0 on 2000-01-06); add 0.25, 0.5 or 0.75
+    for first quarter, full moon and last quarter.
+    """
+    t = k / 1236.85
+    t2, t3, t4 = t * t, t * t * t, t * t * t * t
+    jde = 2451550.09766 + SYNODIC_MONTH * k + 0.00015437 * t2 - 0.000000150 * t3 + 0.00000000073 * t4
+    e = 1.0 - 0.002516 * t - 0.0000074 * t2
+    m = math.radians(2.5534 + 29.10535670 * k - 0.0000014 * t2 - 0.00000011 * t3)
+    mp = math.radians(201.5643 + 385.81693528 * k + 0.0107582 * t2 + 0.00001238 * t3 - 0.000000058 * t4)
+    f = math.radians(160.7108 + 390.67050284 * k - 0.0016118 * t2 - 0.00000227 * t3 + 0.000000011 * t4)
+    omega = math.radians(124.7746 - 1.56375588 * k + 0.0020672 * t2 + 0.00000215 * t3)
+    args = (m, mp, f, omega)
+
+    phase = round((k % 1.0) * 4.0) % 4
+    if phase == NEW_MOON:
+        jde += _periodic(NEW_MOON_TERMS, e, args)
+    elif phase == FULL_MOON:
+        jde += _periodic(FULL_MOON_TERMS, e, args)
+    else:
+        w = (
+            0.00306 - 0.00038 * e * math.cos(m) + 0.00026 * math.cos(mp)
+            - 0.00002 * math.cos(mp - m) + 0.00002 * math.cos(mp + m) + 0.00002 * math.cos(2.0 * f)
+        )
+        jde += _periodic(QUARTER_TERMS, e, args) + (w if phase == FIRST_QUARTER else -w)
+
+    a1 = PLANETARY_TERMS[0]
+    jde += a1[0] * math.sin(math.radians(a1[1] + a1[2] * k - 0.009173 * t2))
+    for coefficient, constant, rate in PLANETARY_TERMS[1:]:
+        jde += coefficient * math.sin(math.radians(constant + rate * k))
+    return jde
+
+
+def illuminated_fraction(jd_tt: float) -> float:
+    """Return the illuminated fraction of the Moon's disk (Meeus 48.4)."""
+    t = (jd_tt - J2000_JD) / DAYS_PER_CENTURY
+    d = math.radians(297.8501921 + 445267.1114034 * t)
+    m = math.radians(357.5291092 + 35999.0502909 * t)
+    mp = math.radians(134.9633964 + 477198.8675055 * t)
+    i = (
+        math.pi - d
+        - math.radians(6.289) * math.sin(mp)
+        + math.radians(2.100) * math.sin(m)
+        - math.radians(1.274) * math.sin(2.0 * d - mp)
+        - math.radians(0.658) * math.sin(2.0 * d)
+        - math.radians(0.214) * math.sin(2.0 * mp)
+        - math.radians(0.110) * math.sin(d)
+    )
+    return (1.0 + math.cos(i)) / 2.0
+
+
+def _utc_from_jde(jde: float) -> float:
+    tt = (jde - UNIX_EPOCH_JD) * SECONDS_PER_DAY
+    return tai_to_utc(tt - TT_MINUS_TAI)
+
+
+def _jd_tt(utc: float) -> float:
+    return UNIX_EPOCH_JD + (utc + BUILTIN.tai_minus_utc(utc) + TT_MINUS_TAI) / SECONDS_PER_DAY
+
+
+def phase_octant(phase: float) -> int:
+    """Return the index of the eight-part phase name (0 = new, 2 = first quarter, ...)."""
+    return int(phase * 8.0 + 0.5) % 8
+
+
+class MoonPhaseTable:
+    """Principal moon phases of consecutive lunations as UTC timestamps."""
+
+    def __init__(self, first_k: int, last_k: int) -> None:
+        """Compute the four phases of lunations first_k to last_k (blocking, ~1 ms per year)."""
+        self.first_k = first_k
+        self.last_k = last_k
+        self._utc: List[float] = [
+            _utc_from_jde(phase_jde(k + quarter / 4.0))
+            for k in range(first_k, last_k + 1)
+            for quarter in range(4)
+        ]
+
+    @classmethod
+    def around(cls, utc: float, years: int = TABLE_YEARS) -> "MoonPhaseTable":
+        """Build the table for years on each side of a UTC timestamp."""
+        k = math.floor((utc / SECONDS_PER_DAY + UNIX_EPOCH_JD - 2451550.09766) / SYNODIC_MONTH)
+        span = int(math.ceil(years * LUNATIONS_PER_YEAR))
+        return cls(k - span, k + span)
+
+    def covers(self, utc: float) -> bool:
+        """Return True if the table holds the events before and after utc up to the next new moon."""
+        return self._utc[0] <= utc < self._utc[-4]
+
+    def events(self, start: float, end: float) -> List[Tuple[float, int]]:
+        """Return (UTC timestamp, phase) of the events in [start, end)."""
+        lo = bisect.bisect_left(self._utc, start)
+        hi = bisect.bisect_left(self._utc, end)
+        return [(self._utc[i], i % 4) for i in range(lo, hi)]
+
+    def lookup(self, utc: float) -> Optional[Dict[str, float]]:
+        """Return the Moon's phase at a UTC timestamp, or None outside the table.
+
+        Keys: phase (0-1), phase_index (last principal phase, see
+        PHASE_KEYS), phase_octant, age_days (since the last new moon),
+        illumination (0-1), lunation (k of the current lunation),
+        last_event_utc, next_event_utc, next_phase_index,
+        new_moon_utc and next_new_moon_utc.
+        """
+        if not self.covers(utc):
+            return None
+        index = bisect.bisect_right(self._utc, utc) - 1
+        quarter = index % 4
+        start, end = self._utc[index], self._utc[index + 1]
+        phase = (quarter + (utc - start) / (end - start)) / 4.0
+        new_moon = self._utc[index - quarter]
+        return {
+            "phase": phase,
+            "phase_index": quarter,
+            "phase_octant": phase_octant(phase),
+            "age_days": (utc - new_moon) / SECONDS_PER_DAY,
+            "illumination": illuminated_fraction(_jd_tt(utc)),
+            "lunation": self.first_k + index // 4,
+            "last_event_utc": start,
+            "next_event_utc": end,
+            "next_phase_index": (quarter + 1) % 4,
+            "new_moon_utc": new_moon,
+            "next_new_moon_utc": self._utc[index - quarter + 4],
+        }
+
+
+_TABLE: Optional[MoonPhaseTable] = None
+_TABLE_LOCK = threading.Lock()
+
+
+def phase_table(utc: float) -> MoonPhaseTable:
+    """Return the shared table, rebuilding it around utc if it does not cover it."""
+    global _TABLE
+    table = _TABLE
+    if table is None or not table.covers(utc):
+        with _TABLE_LOCK:
+            table = _TABLE
+            if table is None or not table.covers(utc):
+                table = _TABLE = MoonPhaseTable.around(utc)
+    return table
+
+
+def moon_phase(utc: float) -> Dict[str, float]:
+    """Return the Moon's phase at a UTC timestamp (see MoonPhaseTable.lookup)."""
+    return phase_table(utc).lookup(utc)
@@ -0,0 +1,260 @@
+"""Planetary events: oppositions, conjunctions, elongations and stations.
+
+Events are roots of functions of the geocentric longitude: the angle to
+the Sun (conjunction 0°, opposition 180°), its rate (greatest elongation)
+and the rate of the longitude itself (retrograde stations). A daily grid
+over EVENT_WINDOW_DAYS is evaluated in a few ephemeris batches, sign
+changes are bracketed and then refined by bisection.
+
+Events do not depend on the observer's location, so one cache serves all
+config entries. It is kept in .storage, checked at most once a day and
+only extended by the days that entered the window since, so the cost per
+sensor update stays constant.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .ephemeris import KeplerEphemeris
+from .log_helper import get_logger
+
+_LOGGER = get_logger(__name__)
+
+DATA_PLANET_EVENTS = f"{DOMAIN}_planet_events"
+
+STORAGE_KEY = f"{DOMAIN}.planet_events"
+STORAGE_VERSION = 1
+SAVE_DELAY = 30  # seconds
+
+# Days ahead covered by the cache, and the grid step used to bracket roots
+EVENT_WINDOW_DAYS = 730
+GRID_STEP = 1.0
+
+# Bisection steps after bracketing (1 day / 2**14 ~ 5 s)
+REFINE_ITERATIONS = 14
+
+# Half width of the central difference used for rates (days)
+RATE_STEP = 0.5
+
+# Events of the same body and type closer than this are duplicates (days)
+DUPLICATE_WINDOW = 2.0
+
+EVENT_TYPES = (
+    "opposition",
+    "conjunction",
+    "inferior_conjunction",
+    "superior_conjunction",
+    "greatest_elongation_east",
+    "greatest_elongation_west",
+    "retrograde_start",
+    "retrograde_end",
+)
+
+
+def _wrap(angle: float) -> float:
+    """Normalize an angle to [-180, 180)."""
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+def _rows(values: Any) -> List[List[float]]:
+    return values.tolist() if hasattr(values, "tolist") else values
+
+
+class _Sampler:
+    """Geocentric longitude and solar elongation of all bodies."""
+
+    def __init__(self, ephemeris: KeplerEphemeris, observer: str = "earth") -> None:
+        self._eph = ephemeris
+        self._k = ephemeris.index[observer]
+        self._observer = observer
+
+    def series(self, jds: Sequence[float]) -> Tuple[List[List[float]], ...]:
+        """Return (longitude, elongation, distance, solar distance) at jds.
+
+        Longitude, elongation and distance are observer-centric; elongation
+        is the signed angle from the Sun, east positive.
+        """
+        helio = self._eph.heliocentric(list(jds))
+        geo = self._eph.true_geocentric(helio, self._observer)
+        lon = _rows(geo["longitude"])
+        observer_lon = _rows(helio["longitude"])[self._k]
+        elong = [[_wrap(lo - e - 180.0) for lo, e in zip(row, observer_lon)] for row in lon]
+        return lon, elong, _rows(geo["distance"]), _rows(helio["distance"])
+
+    def rates(self, jds: Sequence[float]) -> Tuple[List[List[float]], List[List[float]]]:
+        """Return the rates of (longitude, elongation) in deg/day at jds."""
+        lon_lo, el_lo, _, _ = self.series([jd - RATE_STEP for jd in jds])
+        lon_hi, el_hi, _, _ = self.series([jd + RATE_STEP for jd in jds])
+        scale = 1.0 / (2.0 * RATE_STEP)
+
+        def diff(lo: List[List[float]], hi: List[List[float]]) -> List[List[float]]:
+            return [[_wrap(b - a) * scale for a, b in zip(ra, rb)] for ra, rb in zip(lo, hi)]
+
+        return diff(lon_lo, lon_hi), diff(el_lo, el_hi)
+
+
+def _bisect(func: Callable[[float], float], a: float, b: float, fa: float) -> float:
+    for _ in range(REFINE_ITERATIONS):
+        m = 0.5 * (a + b)
+        fm = func(m)
+        if (fm < 0.0) == (fa < 0.0):
+            a, fa = m, fm
+        else:
+            b = m
+    return 0.5 * (a + b)
+
+
+def _crossings(values: List[float]) -> List[Tuple[int, int]]:
+    """Return (index, direction) of sign changes; direction +1 for rising.
+
+    Jumps of more than 90° are angle wraps, not roots.
+    """
+    result = []
+    for j in range(len(values) - 1):
+        a, b = values[j], values[j + 1]
+        if (a < 0.0) != (b < 0.0) and abs(b - a) < 90.0:
+            result.append((j, 1 if b >= 0.0 else -1))
+    return result
+
+
+def find_events(ephemeris: KeplerEphemeris, start_jd: float, end_jd: float, observer: str = "earth") -> List[Dict[str, Any]]:
+    """Return the planetary events between start_jd and end_jd, sorted by time.
+
+    Each event is {"body", "type", "jd"} plus "elongation" (deg) for
+    greatest elongations.
+    """
+    sampler = _Sampler(ephemeris, observer)
+    count = max(2, int((end_jd - start_jd) / GRID_STEP) + 1)
+    grid = [start_jd + j * GRID_STEP for j in range(count)]
+    _, elong, _, solar_dist = sampler.series(grid)
+    lon_rate, elong_rate = sampler.rates(grid)
+    k = ephemeris.index[observer]
+    observer_orbit = sum(solar_dist[k]) / count
+
+    def value_at(kind: str, i: int) -> Callable[[float], float]:
+        def func(jd: float) -> float:
+            if kind == "elongation":
+                return sampler.series([jd])[1][i][0]
+            if kind == "opposition":
+                return _wrap(sampler.series([jd])[1][i][0] - 180.0)
+            lon_r, el_r = sampler.rates([jd])
+            return (lon_r if kind == "longitude_rate" else el_r)[i][0]
+        return func
+
+    events: List[Dict[str, Any]] = []
+    for i, body in enumerate(ephemeris.ids):
+        if i == k or ephemeris.is_probe(i):
+            continue
+        # Inner planets have inferior/superior conjunctions and elongations
+        inner = sum(solar_dist[i]) / count < observer_orbit
+
+        def add(kind: str, series: List[float], handler: Callable[[float, int], None]) -> None:
+            func = value_at(kind, i)
+            for j, direction in _crossings(series):
+                jd = _bisect(func, grid[j], grid[j + 1], series[j])
+                handler(jd, direction)
+
+        def on_conjunction(jd: float, _direction: int) -> None:
+            if inner:
+                _, _, dist, solar = sampler.series([jd])
+                kind = "inferior_conjunction" if dist[i][0] < solar[k][0] else "superior_conjunction"
+            else:
+                kind = "conjunction"
+            events.append({"body": body, "type": kind, "jd": jd})
+
+        def on_station(jd: float, direction: int) -> None:
+            events.append({"body": body, "type": "retrograde_end" if direction > 0 else "retrograde_start", "jd": jd})
+
+        add("elongation", elong[i], on_conjunction)
+        add("longitude_rate", lon_rate[i], on_station)
+
+        if inner:
+            def on_elongation(jd: float, direction: int) -> None:
+                value = sampler.series([jd])[1][i][0]
+                # Maximum east of the Sun (rate falls through 0) or west (rate rises)
+                if direction < 0 and value > 0.0:
+                    events.append({"body": body, "type": "greatest_elongation_east", "jd": jd, "elongation": round(value, 1)})
+                elif direction > 0 and value < 0.0:
+                    events.append({"body": body, "type": "greatest_elongation_west", "jd": jd, "elongation": round(-value, 1)})
+
+            add("elongation_rate", elong_rate[i], on_elongation)
+        else:
+            add("opposition", [_wrap(v - 180.0) for v in elong[i]], lambda jd, _d: events.append({"body": body, "type": "opposition", "jd": jd}))
+
+    for event in events:
+        event["jd"] = round(event["jd"], 5)
+    events.sort(key=lambda e: e["jd"])
+    return events
+
+
+class PlanetEventCache:
+    """Upcoming planetary events per accuracy mode, persisted in .storage."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache (call async_load before use)."""
+        self._hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._lock = threading.Lock()
+        # accuracy mode -> {"start": jd, "end": jd, "events": [...]}
+        self._modes: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Load the events found by previous runs."""
+        if self._loaded:
+            return
+        data = await self._store.async_load()
+        if isinstance(data, dict) and isinstance(data.get("modes"), dict):
+            with self._lock:
+                self._modes = data["modes"]
+        self._loaded = True
+
+    def events(self, ephemeris: KeplerEphemeris, jd: float) -> List[Dict[str, Any]]:
+        """Return the cached events from jd on (blocking; call from an executor).
+
+        The window is extended once at least a day has passed since the
+        last search; a clock jump outside the cached range starts over.
+        """
+        with self._lock:
+            entry = self._modes.get(ephemeris.accuracy)
+            if entry is None or not entry["start"] <= jd <= entry["end"]:
+                entry = {"start": jd, "end": jd - GRID_STEP, "events": []}
+
+            end = jd + EVENT_WINDOW_DAYS
+            if end - entry["end"] >= 1.0:
+                found = find_events(ephemeris, entry["end"] - GRID_STEP, end)
+                known = entry["events"]
+                for event in found:
+                    if not any(
+                        e["body"] == event["body"] and e["type"] == event["type"] and abs(e["jd"] - event["jd"]) < DUPLICATE_WINDOW
+                        for e in known
+                    ):
+                        known.append(event)
+                known.sort(key=lambda e: e["jd"])
+                entry = {
+                    "start": jd,
+                    "end": end,
+                    "events": [e for e in known if e["jd"] >= jd - 1.0],
+                }
+                self._modes[ephemeris.accuracy] = entry
+                _LOGGER.debug("Planet events for %s extended to JD %.1f (%d events)", ephemeris.accuracy, end, len(entry["events"]))
+                self._hass.add_job(self._store.async_delay_save, self._data_to_save, SAVE_DELAY)
+
+            return [e for e in entry["events"] if e["jd"] >= jd]
+
+    def _data_to_save(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"modes": {mode: dict(entry) for mode, entry in self._modes.items()}}
+
+
+def get_planet_event_cache(hass: HomeAssistant) -> PlanetEventCache:
+    """Return the shared PlanetEventCache, creating it on first use."""
+    cache = hass.data.get(DATA_PLANET_EVENTS)
+    if cache is None:
+        cache = hass.data.setdefault(DATA_PLANET_EVENTS, PlanetEventCache(hass))
+    return cache
@@ -0,0 +1,108 @@
+"""Optional process pool for CPU-heavy rendering.
+
+Pillow drawing and PNG encoding partly hold the GIL. Run in Home
+Assistant's thread executor, they can stall the event loop thread on
+small multi-core boards. Plugins can instead send a compact, picklable
+job (e.g. the solar system map spec) to a single worker process and get
+encoded bytes back.
+
+The pool starts lazily on the first job, has one worker, and is shut
+down when the last config entry unloads or Home Assistant stops. If the
+worker dies or times out, the caller falls back to rendering in-thread.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .log_helper import get_logger
+
+_LOGGER = get_logger(__name__)
+
+DATA_RENDER_POOL = f"{DOMAIN}_render_pool"
+
+RENDER_WORKERS = 1
+
+# Seconds to wait for a job before falling back to the thread
+RENDER_TIMEOUT = 30
+
+
+class RenderPool:
+    """Lazily started single-worker process pool."""
+
+    def __init__(self) -> None:
+        """Initialize the pool (no process is started yet)."""
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._closed = False
+        # Removes the Home Assistant stop listener (see get_render_pool)
+        self._unsub_stop: Optional[Callable[[], None]] = None
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        with self._lock:
+            if self._closed:
+                return None
+            if self._executor is None:
+                # spawn: forking the multi-threaded Home Assistant process is unsafe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=RENDER_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                _LOGGER.debug("Render worker process started")
+            return self._executor
+
+    def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run func(*args) in the worker and wait for it (blocking).
+
+        Call from an executor thread. Raises RuntimeError if the pool is
+        shut down; worker failures and timeouts propagate so the caller
+        can fall back to rendering in-thread.
+        """
+        executor = self._get_executor()
+        if executor is None:
+            raise RuntimeError("render pool is shut down")
+        try:
+            return executor.submit(func, *args).result(timeout=RENDER_TIMEOUT)
+        except Exception:
+            # A broken or stuck worker is replaced on the next job
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def _on_stop(self, _event: Any) -> None:
+        """Shut down at Home Assistant stop (the one-shot listener is spent)."""
+        with self._lock:
+            self._unsub_stop = None
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stop the worker process and drop the stop listener (blocking)."""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+            unsub, self._unsub_stop = self._unsub_stop, None
+        if unsub is not None:
+            unsub()
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+            _LOGGER.debug("Render worker process stopped")
+
+
+def get_render_pool(hass: HomeAssistant) -> RenderPool:
+    """Return the shared RenderPool, creating it on first use (thread-safe)."""
+    pool = hass.data.get(DATA_RENDER_POOL)
+    if pool is None:
+        created = RenderPool()
+        pool = hass.data.setdefault(DATA_RENDER_POOL, created)
+        if pool is created:
+            # Runs in the executor: shutdown() blocks until the worker exits
+            created._unsub_stop = hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, created._on_stop)
+    return pool
@@ -0,0 +1,147 @@
+"""Daily rise, transit and set times of the Sun and planets.
+
+One sweep per local day evaluates the ephemeris for all bodies at
+SWEEP_STEP_MINUTES intervals in a single batch, converts the geocentric
+ecliptic positions to altitudes at the observer and reads rise/set
+(horizon crossings), transit (hour angle 0) and the dark-sky visibility
+window from the samples, interpolating linearly between them. Sensors
+cache the result and look it up per tick until the day or the location
+changes.
+"""
+from __future__ import annotations
+
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from .ephemeris import HAS_NUMPY, J2000, KeplerEphemeris, np
+
+SWEEP_STEP_MINUTES = 10
+
+# Obliquity of the ecliptic at J2000 (deg); the ephemeris is J2000-based
+OBLIQUITY_J2000 = 23.4392911
+
+# Altitude of the center at rise/set: refraction (planets), plus the
+# solar semi-diameter for the Sun (deg)
+HORIZON_PLANET = -0.5667
+HORIZON_SUN = -0.8333
+
+# A planet counts as observable above this altitude while the Sun is
+# below DARK_SUN_ALTITUDE (civil twilight)
+VISIBLE_ALTITUDE = 5.0
+DARK_SUN_ALTITUDE = -6.0
+
+
+def gmst_degrees(jd: float) -> float:
+    """Greenwich mean sidereal time in degrees (UT1 ~ UTC)."""
+    d = jd - J2000
+    t = d / 36525.0
+    return (280.46061837 + 360.98564736629 * d + 0.000387933 * t * t) % 360.0
+
+
+def _rows(values: Any) -> List[List[float]]:
+    return values.tolist() if hasattr(values, "tolist") else values
+
+
+def _altitudes(lon, lat, lst, latitude: float):
+    """Return (altitude, hour angle) in degrees for [body][instant] inputs."""
+    eps = math.radians(OBLIQUITY_J2000)
+    phi = math.radians(latitude)
+    if HAS_NUMPY:
+        lam, beta = np.radians(np.asarray(lon)), np.radians(np.asarray(lat))
+        ra = np.arctan2(np.sin(lam) * math.cos(eps) - np.tan(beta) * math.sin(eps), np.cos(lam))
+        dec = np.arcsin(np.sin(beta) * math.cos(eps) + np.cos(beta) * math.sin(eps) * np.sin(lam))
+        ha = np.radians(np.asarray(lst))[None, :] - ra
+        alt = np.arcsin(math.sin(phi) * np.sin(dec) + math.cos(phi) * np.cos(dec) * np.cos(ha))
+        return _rows(np.degrees(alt)), _rows((np.degrees(ha) + 180.0) % 360.0 - 180.0)
+
+    alt_rows, ha_rows = [], []
+    for lon_b, lat_b in zip(lon, lat):
+        alt_b, ha_b = [], []
+        for lo, la, st in zip(lon_b, lat_b, lst):
+            lam, beta = math.radians(lo), math.radians(la)
+            ra = math.atan2(math.sin(lam) * math.cos(eps) - math.tan(beta) * math.sin(eps), math.cos(lam))
+            dec = math.asin(math.sin(beta) * math.cos(eps) + math.cos(beta) * math.sin(eps) * math.sin(lam))
+            ha = math.radians(st) - ra
+            alt_b.append(math.degrees(math.asin(math.sin(phi) * math.sin(dec) + math.cos(phi) * math.cos(dec) * math.cos(ha))))
+            ha_b.append((math.degrees(ha) + 180.0) % 360.0 - 180.0)
+        alt_rows.append(alt_b)
+        ha_rows.append(ha_b)
+    return alt_rows, ha_rows
+
+
+def _crossing(values: List[float], level: float, rising: bool) -> Optional[float]:
+    """Return the fractional sample index of the first crossing of level.
+
+    Jumps of 180° or more are hour-angle wraps, not crossings.
+    """
+    for j in range(len(values) - 1):
+        a, b = values[j] - level, values[j + 1] - level
+        if ((a < 0.0 <= b) if rising else (a >= 0.0 > b)) and abs(b - a) < 180.0:
+            return j + (-a / (b - a) if b != a else 0.0)
+    return None
+
+
+def daily_rise_set(
+    ephemeris: KeplerEphemeris,
+    start: datetime,
+    end: datetime,
+    latitude: float,
+    longitude: float,
+    observer: str = "earth",
+) -> Dict[str, Dict[str, Any]]:
+    """Return body id -> rise/transit/set data for the local day [start, end).
+
+    "sun" is included. Times are aware datetimes in start's time zone (None
+    if the event does not happen that day); planets also get the dark-sky
+    visibility window.
+    """
+    # Step in UTC: wall-clock arithmetic on aware datetimes ignores DST
+    step = timedelta(minutes=SWEEP_STEP_MINUTES)
+    start_utc = start.astimezone(timezone.utc)
+    count = int((end.timestamp() - start.timestamp()) / step.total_seconds()) + 1
+    times = [(start_utc + j * step).astimezone(start.tzinfo) for j in range(count)]
+    jd0 = 2440587.5 + start.timestamp() / 86400.0
+    jds = [jd0 + j * SWEEP_STEP_MINUTES / 1440.0 for j in range(count)]
+
+    k = ephemeris.index[observer]
+    helio = ephemeris.heliocentric(jds)
+    geo = ephemeris.true_geocentric(helio, observer)
+    lon, lat = _rows(geo["longitude"]), _rows(geo["latitude"])
+    # The Sun as seen from the observer
+    lon[k] = [(v + 180.0) % 360.0 for v in _rows(helio["longitude"])[k]]
+    lat[k] = [-v for v in _rows(helio["latitude"])[k]]
+
+    lst = [(gmst_degrees(jd) + longitude) % 360.0 for jd in jds]
+    alt, ha = _altitudes(lon, lat, lst, latitude)
+    sun_alt = alt[k]
+
+    def at(index: Optional[float]) -> Optional[datetime]:
+        if index is None:
+            return None
+        return (start_utc + index * step).astimezone(start.tzinfo)
+
+    result: Dict[str, Dict[str, Any]] = {}
+    for i, body in enumerate(ephemeris.ids):
+        if ephemeris.is_probe(i):
+            continue
+        key = "sun" if i == k else body
+        horizon = HORIZON_SUN if i == k else HORIZON_PLANET
+        entry: Dict[str, Any] = {
+            "rise": at(_crossing(alt[i], horizon, True)),
+            "transit": at(_crossing(ha[i], 0.0, True)),
+            "set": at(_crossing(alt[i], horizon, False)),
+            "max_altitude": round(max(alt[i]), 1),
+            "always_up": min(alt[i]) >= horizon,
+            "never_up": max(alt[i]) < horizon,
+        }
+        if i != k:
+            dark = [j for j in range(count) if sun_alt[j] < DARK_SUN_ALTITUDE]
+            visible = [j for j in dark if alt[i][j] > VISIBLE_ALTITUDE]
+            entry["dark_fraction_visible"] = len(visible) / len(dark) if dark else 0.0
+            if visible:
+                best = max(visible, key=lambda j: alt[i][j])
+                entry["best"] = times[best]
+                entry["evening"] = sum(1 for j in visible if times[j].hour >= 12) * 2 >= len(visible)
+        result[key] = entry
+    return result
@@ -2,21 +2,49 @@
 from __future__ import annotations
 
 import asyncio
-import logging
+import functools
+import math
 import os
-from datetime import timedelta
+import time
+from datetime import datetime, timedelta
 from importlib import import_module
 from typing import Any, Dict, List, Optional
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_interval
-
-from .const import DOMAIN
-
-_LOGGER = logging.getLogger(__name__)
+from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
+    async_track_time_interval,
+)
+from homeassistant.util import dt as dt_util
+
+from .astro_context import AstroContext, get_astro_context
+from .const import (
+    CONF_PERFORMANCE_PROFILE,
+    CONF_UPDATE_INTERVALS,
+    DATA_IMAGE_SOURCES,
+    DEFAULT_PERFORMANCE_PROFILE,
+    DOMAIN,
+    FAILURE_BACKOFF_MAX,
+    MAX_AUTO_UPDATE_INTERVAL,
+    PERFORMANCE_PROFILES,
+    SIGNAL_ENTRY_UPDATED,
+    SIGNAL_IMAGE_UPDATED,
+    VERBOSE_ATTRIBUTES,
+    VISUALIZATION_ATTRIBUTE_MARKERS,
+)
+from .load_monitor import DATA_LOAD_MONITOR, DATA_LOAD_SENSOR_OWNER, get_load_monitor
+from .log_helper import get_logger
+
+_LOGGER = get_logger(__name__)
 
 # Global cache for discovered calendars
 _DISCOVERED_CALENDARS_CACHE: Optional[Dict[str, Dict[str, Any]]] = None
@@ -43,12 +71,12 @@ async def async_setup_entry(
 
     # Debug logging für plugin_options
     plugin_options = config_entry.data.get("plugin_options", {})
-    _LOGGER.info(f"=== Setting up Alternative Time '{name}' ===")
-    _LOGGER.debug(f"Config Entry ID: {entry_id[:8]}...")
-    _LOGGER.debug(f"Selected calendars: {selected_calendars}")
-    _LOGGER.info(f"Plugin options available: {list(plugin_options.keys())}")
+    _LOGGER.info("=== Setting up Alternative Time '%s' ===", name)
+    _LOGGER.debug("Config Entry ID: %s...", entry_id[:8])
+    _LOGGER.debug("Selected calendars: %s", selected_calendars)
+    _LOGGER.info("Plugin options available: %s", list(plugin_options.keys()))
     for cal_id, opts in plugin_options.items():
-        _LOGGER.debug(f"  {cal_id}: {opts}")
+        _LOGGER.debug("  %s: %s", cal_id, opts)
 
     if not selected_calendars:
         _LOGGER.warning("No calendars selected")
@@ -65,18 +93,18 @@ async def async_setup_entry(
         _LOGGER.error("No calendars could be discovered!")
         return
 
-    _LOGGER.info(f"Discovered {len(discovered_calendars)} calendars: {list(discovered_calendars.keys())}")
+    _LOGGER.info("Discovered %s calendars: %s", len(discovered_calendars), list(discovered_calendars.keys()))
 
     # Create sensors for selected calendars
     sensors = []
     entities_to_exclude = []  # Track entities for recorder exclusion
 
     for calendar_id in selected_calendars:
-        _LOGGER.debug(f"Processing calendar: {calendar_id}")
+        _LOGGER.debug("Processing calendar: %s", calendar_id)
 
         if calendar_id not in discovered_calendars:
-            _LOGGER.error(f"Calendar '{calendar_id}' is enabled but not found in registry")
-            _LOGGER.debug(f"Available calendars: {list(discovered_calendars.keys())}")
+            _LOGGER.error("Calendar '%s' is enabled but not found in registry", calendar_id)
+            _LOGGER.debug("Available calendars: %s", list(discovered_calendars.keys()))
             continue
 
         calendar_info = discovered_calendars[calendar_id]
@@ -84,30 +112,23 @@ async def async_setup_entry(
         # Debug: Check if we have options for this calendar
         calendar_plugin_options = plugin_options.get(calendar_id, {})
         if calendar_plugin_options:
-            _LOGGER.info(f"Calendar {calendar_id} has options: {calendar_plugin_options}")
+            _LOGGER.info("Calendar %s has options: %s", calendar_id, calendar_plugin_options)
         else:
-            _LOGGER.debug(f"Calendar {calendar_id} has no custom options")
+            _LOGGER.debug("Calendar %s has no custom options", calendar_id)
 
         try:
             # Import the calendar module asynchronously
             module = await async_import_calendar_module(hass, calendar_id)
 
             if not module:
-                _LOGGER.error(f"Failed to import calendar module: {calendar_id}")
+                _LOGGER.error("Failed to import calendar module: %s", calendar_id)
                 continue
 
             # Find the sensor class
-            sensor_class = None
-            for item_name in dir(module):
-                item = getattr(module, item_name)
-                if (isinstance(item, type) and
-                    issubclass(item, AlternativeTimeSensorBase) and
-                    item != AlternativeTimeSensorBase):
-                    sensor_class = item
-                    break
+            sensor_class = get_sensor_class(module)
 
             if not sensor_class:
-                _LOGGER.error(f"No sensor class found in calendar module: {calendar_id}")
+                _LOGGER.error("No sensor class found in calendar module: %s", calendar_id)
                 continue
 
             # Create sensor instance - ALLE Sensoren bekommen nur (base_name, hass)
@@ -118,16 +139,16 @@ async def async_setup_entry(
             sensor._config_entry_id = entry_id  # Store entry ID
 
             # Debug: Verify the sensor can get its options
-            _LOGGER.debug(f"Sensor {calendar_id} initialized:")
-            _LOGGER.debug(f"  - _calendar_id: {sensor._calendar_id}")
-            _LOGGER.debug(f"  - _config_entry_id: {sensor._config_entry_id}")
+            _LOGGER.debug("Sensor %s initialized:", calendar_id)
+            _LOGGER.debug("  - _calendar_id: %s", sensor._calendar_id)
+            _LOGGER.debug("  - _config_entry_id: %s", sensor._config_entry_id)
 
             # Test if sensor can retrieve its options
             test_options = sensor.get_plugin_options()
             if test_options:
-                _LOGGER.info(f"✓ Sensor {calendar_id} successfully retrieved options: {test_options}")
+                _LOGGER.info("✓ Sensor %s successfully retrieved options: %s", calendar_id, test_options)
             else:
-                _LOGGER.debug(f"  Sensor {calendar_id} has no options or using defaults")
+                _LOGGER.debug("  Sensor %s has no options or using defaults", calendar_id)
 
             # WICHTIG: Unique ID muss entry_id enthalten um Kollisionen zu vermeiden
             # Überschreibe die unique_id, die vom Kalender gesetzt wurde
@@ -135,11 +156,11 @@ async def async_setup_entry(
                 # Füge die entry_id zur unique_id hinzu für Eindeutigkeit
                 base_unique_id = sensor._attr_unique_id
                 sensor._attr_unique_id = f"{entry_id}_{base_unique_id}"
-                _LOGGER.debug(f"Set unique_id for {calendar_id}: {sensor._attr_unique_id[:30]}...")
+                _LOGGER.debug("Set unique_id for %s: %s...", calendar_id, sensor._attr_unique_id[:30])
             else:
                 # Falls keine unique_id gesetzt wurde, erstelle eine
                 sensor._attr_unique_id = f"{entry_id}_{name}_{calendar_id}"
-                _LOGGER.debug(f"Created unique_id for {calendar_id}: {sensor._attr_unique_id[:30]}...")
+                _LOGGER.debug("Created unique_id for %s: %s...", calendar_id, sensor._attr_unique_id[:30])
 
             sensors.append(sensor)
 
@@ -148,17 +169,30 @@ async def async_setup_entry(
             if update_interval < 60:  # Exclude sensors that update more than once per minute
                 entities_to_exclude.append(sensor.entity_id)
 
-            _LOGGER.info(f"✓ Created sensor for calendar: {calendar_id}")
+            _LOGGER.info("✓ Created sensor for calendar: %s", calendar_id)
 
         except Exception as e:
-            _LOGGER.error(f"Failed to create sensor for calendar {calendar_id}: {e}")
+            _LOGGER.error("Failed to create sensor for calendar %s: %s", calendar_id, e)
             import traceback
             _LOGGER.debug(traceback.format_exc())
             continue
 
+    # Loop lag / CPU watchdog shared by all entries; the monitor is global,
+    # so only the first entry set up gets the diagnostic sensor
+    monitor = get_load_monitor(hass)
+    monitor.async_start()
+    if hass.data.setdefault(DATA_LOAD_SENSOR_OWNER, entry_id) == entry_id:
+        sensors.append(AlternativeTimeLoadSensor(name, entry_id, monitor))
+    else:
+        # Drop a duplicate registered by earlier versions
+        registry = er.async_get(hass)
+        stale = registry.async_get_entity_id("sensor", DOMAIN, f"{entry_id}_load_monitor")
+        if stale:
+            registry.async_remove(stale)
+
     if sensors:
         async_add_entities(sensors)
-        _LOGGER.info(f"=== Successfully added {len(sensors)} sensors to Home Assistant ===")
+        _LOGGER.info("=== Successfully added %s sensors to Home Assistant ===", len(sensors))
 
         # Register recorder exclusions if needed
         # WICHTIG: Diese Zeile ist auskommentiert, um den Recorder-Fehler zu vermeiden
@@ -184,13 +218,13 @@ async def async_discover_all_calendars(hass: HomeAssistant) -> Dict[str, Dict[st
         calendars_dir = os.path.join(current_dir, "calendars")
 
         if not os.path.exists(calendars_dir):
-            _LOGGER.warning(f"Calendars directory not found: {calendars_dir}")
+            _LOGGER.warning("Calendars directory not found: %s", calendars_dir)
             _DISCOVERED_CALENDARS_CACHE = discovered
             return discovered
 
         # List files asynchronously
         files = await hass.async_add_executor_job(os.listdir, calendars_dir)
-        _LOGGER.debug(f"Found files in calendars directory: {files}")
+        _LOGGER.debug("Found files in calendars directory: %s", files)
 
         for filename in files:
             if filename.endswith(".py") and not filename.startswith("__"):
@@ -208,22 +242,22 @@ async def async_discover_all_calendars(hass: HomeAssistant) -> Dict[str, Dict[st
                         cal_info = module.CALENDAR_INFO
                         cal_id = cal_info.get('id', module_name)
                         discovered[cal_id] = cal_info
-                        _LOGGER.debug(f"Discovered calendar: {cal_id}")
+                        _LOGGER.debug("Discovered calendar: %s", cal_id)
                     elif module:
-                        _LOGGER.debug(f"Module {module_name} has no CALENDAR_INFO")
+                        _LOGGER.debug("Module %s has no CALENDAR_INFO", module_name)
                     else:
-                        _LOGGER.debug(f"Could not import module {module_name}")
+                        _LOGGER.debug("Could not import module %s", module_name)
 
                 except Exception as e:
-                    _LOGGER.warning(f"Failed to discover calendar {module_name}: {e}")
+                    _LOGGER.warning("Failed to discover calendar %s: %s", module_name, e)
                     import traceback
                     _LOGGER.debug(traceback.format_exc())
                     continue
 
         if not discovered:
-            _LOGGER.error(f"No calendars discovered! Directory contents: {files}")
+            _LOGGER.error("No calendars discovered! Directory contents: %s", files)
         else:
-            _LOGGER.info(f"Discovered {len(discovered)} calendars: {list(discovered.keys())}")
+            _LOGGER.info("Discovered %s calendars: %s", len(discovered), list(discovered.keys()))
 
         _DISCOVERED_CALENDARS_CACHE = discovered
         return discovered
@@ -244,27 +278,27 @@ async def async_import_calendar_module(hass: HomeAssistant, module_name: str):
             try:
                 module = import_module(f'.calendars.{module_name}',
                                    package='custom_components.alternative_time')
-                _LOGGER.debug(f"Successfully imported {module_name} via method 1")
+                _LOGGER.debug("Successfully imported %s via method 1", module_name)
                 return module
             except ImportError as e1:
-                _LOGGER.debug(f"Method 1 failed for {module_name}: {e1}")
+                _LOGGER.debug("Method 1 failed for %s: %s", module_name, e1)
                 try:
                     module = import_module(
                         f'custom_components.alternative_time.calendars.{module_name}'
                     )
-                    _LOGGER.debug(f"Successfully imported {module_name} via method 2")
+                    _LOGGER.debug("Successfully imported %s via method 2", module_name)
                     return module
                 except ImportError as e2:
-                    _LOGGER.debug(f"Method 2 failed for {module_name}: {e2}")
+                    _LOGGER.debug("Method 2 failed for %s: %s", module_name, e2)
                     try:
                         module = import_module(module_name)
-                        _LOGGER.debug(f"Successfully imported {module_name} via method 3")
+                        _LOGGER.debug("Successfully imported %s via method 3", module_name)
                         return module
                     except ImportError as e3:
-                        _LOGGER.debug(f"Method 3 failed for {module_name}: {e3}")
+                        _LOGGER.debug("Method 3 failed for %s: %s", module_name, e3)
                         raise e3
         except Exception as e:
-            _LOGGER.error(f"Failed to import calendar module {module_name}: {e}")
+            _LOGGER.error("Failed to import calendar module %s: %s", module_name, e)
             import traceback
             _LOGGER.debug(traceback.format_exc())
             return None
@@ -272,6 +306,31 @@ async def async_import_calendar_module(hass: HomeAssistant, module_name: str):
     return await hass.async_add_executor_job(_import)
 
 
+def get_sensor_class(module) -> Optional[type]:
+    """Return the AlternativeTimeSensorBase subclass defined by a calendar module."""
+    for item_name in dir(module):
+        item = getattr(module, item_name)
+        if (isinstance(item, type) and
+            issubclass(item, AlternativeTimeSensorBase) and
+            item != AlternativeTimeSensorBase):
+            return item
+    return None
+
+
+def calendar_device_info(info: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the category group device for a calendar's CALENDAR_INFO."""
+    category = str(info.get("category") or "uncategorized")
+    if category == "religious":
+        category = "religion"
+    device_name = f"Alternative Time – {category.title()}"
+    return {
+        "identifiers": {(DOMAIN, f"group:{category}")},
+        "manufacturer": "Alternative Time Systems",
+        "model": "Category Group",
+        "name": device_name,
+    }
+
+
 def export_discovered_calendars() -> Dict[str, Dict[str, Any]]:
     """Export discovered calendars for use by config flow.
 
@@ -289,11 +348,11 @@ def export_discovered_calendars() -> Dict[str, Dict[str, Any]]:
     calendars_dir = os.path.join(current_dir, "calendars")
 
     if not os.path.exists(calendars_dir):
-        _LOGGER.warning(f"Calendars directory not found in export: {calendars_dir}")
+        _LOGGER.warning("Calendars directory not found in export: %s", calendars_dir)
         return discovered
 
     files = os.listdir(calendars_dir)
-    _LOGGER.debug(f"Export discovery - found files: {files}")
+    _LOGGER.debug("Export discovery - found files: %s", files)
 
     for filename in files:
         if filename.endswith(".py") and not filename.startswith("__"):
@@ -311,18 +370,18 @@ def export_discovered_calendars() -> Dict[str, Dict[str, Any]]:
                     cal_info = module.CALENDAR_INFO
                     cal_id = cal_info.get('id', module_name)
                     discovered[cal_id] = cal_info
-                    _LOGGER.debug(f"Export discovered: {cal_id}")
+                    _LOGGER.debug("Export discovered: %s", cal_id)
                 else:
-                    _LOGGER.debug(f"Export - no CALENDAR_INFO in {module_name}")
+                    _LOGGER.debug("Export - no CALENDAR_INFO in %s", module_name)
 
             except Exception as e:
-                _LOGGER.debug(f"Export failed for {module_name}: {e}")
+                _LOGGER.debug("Export failed for %s: %s", module_name, e)
                 continue
 
     if not discovered:
-        _LOGGER.error(f"Export - no calendars discovered! Files: {files}")
+        _LOGGER.error("Export - no calendars discovered! Files: %s", files)
     else:
-        _LOGGER.info(f"Export discovered {len(discovered)} calendars")
+        _LOGGER.info("Export discovered %s calendars", len(discovered))
 
     _DISCOVERED_CALENDARS_CACHE = discovered
     return discovered
@@ -340,7 +399,7 @@ async def register_recorder_exclusion(hass: HomeAssistant, entities_to_exclude:
     Note: Diese Funktion ist in neueren Home Assistant Versionen nicht mehr nötig.
     Die Recorder-Konfiguration erfolgt über configuration.yaml oder die UI.
     """
-    _LOGGER.debug(f"Recorder exclusion requested for {len(entities_to_exclude)} entities")
+    _LOGGER.debug("Recorder exclusion requested for %s entities", len(entities_to_exclude))
     # Funktion macht nichts mehr - nur für Rückwärtskompatibilität vorhanden
     pass
 
@@ -348,6 +407,43 @@ async def register_recorder_exclusion(hass: HomeAssistant, entities_to_exclude:
 class AlternativeTimeSensorBase(SensorEntity):
     """Base class for Alternative Time System sensors."""
 
+    # Plugins that render a picture set the MIME type here and implement
+    # image_bytes(); the image platform then serves it through an image
+    # entity instead of putting the picture into state attributes.
+    IMAGE_CONTENT_TYPE: Optional[str] = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Hook plugin attributes and updates into the shared machinery.
+
+        - extra_state_attributes is routed through the performance profile
+          and carries the circuit breaker health
+        - update() is timed (thread CPU) for the load monitor
+        """
+        super().__init_subclass__(**kwargs)
+        prop = cls.__dict__.get("extra_state_attributes")
+        if isinstance(prop, property) and not getattr(prop.fget, "_profiled", False):
+            fget = prop.fget
+
+            def _profiled(self):
+                return self._finalize_attributes(fget(self))
+
+            _profiled._profiled = True
+            cls.extra_state_attributes = property(_profiled, doc=prop.__doc__)
+
+        update = cls.__dict__.get("update")
+        if callable(update) and not getattr(update, "_timed", False):
+
+            @functools.wraps(update)
+            def _timed_update(self, *args, **kwargs):
+                start = time.thread_time()
+                try:
+                    return update(self, *args, **kwargs)
+                finally:
+                    self._record_cpu(time.thread_time() - start)
+
+            _timed_update._timed = True
+            cls.update = _timed_update
+
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Normalized parent attributes as a dict (never None).
@@ -373,30 +469,46 @@ class AlternativeTimeSensorBase(SensorEntity):
         self._calendar_id = None  # Will be set by async_setup_entry
         self._config_entry_id = None  # Will be set by async_setup_entry
 
+        # Circuit breaker for failing updates
+        self._failure_count = 0
+        self._retry_at: Optional[float] = None
+        self._last_error: Optional[str] = None
+
+        # Astronomical context of the running tick (see astro_context)
+        self._astro: Optional[AstroContext] = None
+
         # Set update interval from class attribute if available
         if hasattr(self.__class__, 'UPDATE_INTERVAL'):
             self._update_interval = self.__class__.UPDATE_INTERVAL
         else:
             self._update_interval = 3600  # Default 1 hour
 
+    def astro_context(self) -> AstroContext:
+        """Return the astronomical context of the running tick.
+
+        Outside a scheduler tick (e.g. a direct update() call) a fresh
+        context for the current instant is returned.
+        """
+        return self._astro or AstroContext(dt_util.utcnow())
+
     def get_plugin_options(self) -> Dict[str, Any]:
         """Get plugin options for this sensor with detailed debugging."""
         # Basis-Debug nur wenn wirklich ein Problem besteht
         if not self._config_entry_id or not self._calendar_id:
-            _LOGGER.debug(f"get_plugin_options called for {self.__class__.__name__}")
-            _LOGGER.debug(f"  _config_entry_id: {self._config_entry_id}")
-            _LOGGER.debug(f"  _calendar_id: {self._calendar_id}")
+            _LOGGER.debug("get_plugin_options called for %s", self.__class__.__name__)
+            _LOGGER.debug("  _config_entry_id: %s", self._config_entry_id)
+            _LOGGER.debug("  _calendar_id: %s", self._calendar_id)
 
             if not self._config_entry_id:
-                _LOGGER.warning(f"{self.__class__.__name__}: No config_entry_id set - called too early?")
+                _LOGGER.warning("%s: No config_entry_id set - called too early?", self.__class__.__name__)
             if not self._calendar_id:
-                _LOGGER.warning(f"{self.__class__.__name__}: No calendar_id set - called too early?")
+                _LOGGER.warning("%s: No calendar_id set - called too early?", self.__class__.__name__)
             return {}
 
         config_entry = _CONFIG_ENTRIES.get(self._config_entry_id)
         if not config_entry:
-            _LOGGER.error(f"Config entry {self._config_entry_id} not found in _CONFIG_ENTRIES")
-            _LOGGER.debug(f"Available entries: {list(_CONFIG_ENTRIES.keys())}")
+            _LOGGER.error("Config entry %s not found in _CONFIG_ENTRIES", self._config_entry_id)
+            _LOGGER.debug("Available entries: %s", list(_CONFIG_ENTRIES.keys()))
             return {}
 
         plugin_options = config_entry.data.get("plugin_options", {})
@@ -404,15 +516,242 @@ class AlternativeTimeSensorBase(SensorEntity):
 
         # Nur loggen wenn tatsächlich Optionen vorhanden sind
         if calendar_options:
-            _LOGGER.debug(f"{self.__class__.__name__} ({self._calendar_id}) loaded options: {calendar_options}")
+            _LOGGER.debug(
+                "%s (%s) loaded options: %s",
+                self.__class__.__name__, self._calendar_id, calendar_options,
+            )
 
         return calendar_options
 
+    def _performance_profile(self) -> Dict[str, Any]:
+        """Return the performance profile selected for this entry."""
+        config_entry = _CONFIG_ENTRIES.get(self._config_entry_id) if self._config_entry_id else None
+        name = DEFAULT_PERFORMANCE_PROFILE
+        if config_entry:
+            name = (config_entry.options or {}).get(CONF_PERFORMANCE_PROFILE, name)
+        return PERFORMANCE_PROFILES.get(name, PERFORMANCE_PROFILES[DEFAULT_PERFORMANCE_PROFILE])
+
+    @property
+    def visualization_enabled(self) -> bool:
+        """Return False if the performance profile disables generated images."""
+        return bool(self._performance_profile().get("visualization", True))
+
+    @property
+    def render_deferred(self) -> bool:
+        """Return True while the load monitor asks to postpone heavy renders."""
+        monitor = self._hass.data.get(DATA_LOAD_MONITOR) if self._hass else None
+        return bool(monitor and monitor.defer_renders)
+
+    def _record_cpu(self, seconds: float) -> None:
+        """Report CPU time of an update to the load monitor."""
+        monitor = self._hass.data.get(DATA_LOAD_MONITOR) if self._hass else None
+        if monitor:
+            monitor.record_cpu(seconds)
+
+    def _finalize_attributes(self, attrs: Any) -> Any:
+        """Trim plugin attributes according to the performance profile."""
+        if not isinstance(attrs, dict):
+            return attrs
+        if self._failure_count:
+            attrs = {**attrs, **self._health_attributes()}
+        profile = self._performance_profile()
+        if not profile.get("visualization", True):
+            attrs = {
+                k: v for k, v in attrs.items()
+                if not any(marker in k for marker in VISUALIZATION_ATTRIBUTE_MARKERS)
+            }
+        if profile.get("attributes") == "minimal":
+            attrs = {
+                k: v for k, v in attrs.items()
+                if k not in VERBOSE_ATTRIBUTES
+                and isinstance(v, (str, int, float, bool))
+                and not (isinstance(v, str) and len(v) > 255)
+            }
+        return attrs
+
+    def _health_attributes(self) -> Dict[str, Any]:
+        """Return circuit breaker details while updates are failing."""
+        retry_in = 0
+        if self._retry_at is not None and self._hass:
+            retry_in = max(0, round(self._retry_at - self._hass.loop.time()))
+        return {
+            "health": "degraded",
+            "consecutive_failures": self._failure_count,
+            "last_error": self._last_error,
+            "next_retry_in": retry_in,
+        }
+
+    def _record_update_failure(self, exc: Exception) -> None:
+        """Open the circuit breaker and back off exponentially."""
+        self._failure_count += 1
+        self._last_error = f"{type(exc).__name__}: {exc}"
+        interval = getattr(self, "_scheduled_interval", None) or self._update_interval
+        backoff = min(interval * 2 ** min(self._failure_count - 1, 31), max(interval, FAILURE_BACKOFF_MAX))
+        self._retry_at = self._hass.loop.time() + backoff
+        if self._failure_count == 1:
+            _LOGGER.warning(
+                "Update of %s failed (%s) - retrying with backoff, further failures are logged at debug level",
+                self.name, self._last_error, exc_info=exc,
+            )
+        else:
+            _LOGGER.debug(
+                "Update of %s failed %d times in a row (%s) - next retry in %.0f s",
+                self.name, self._failure_count, self._last_error, backoff,
+            )
+
+    def _record_update_success(self) -> None:
+        """Close the circuit breaker after a successful recovery probe."""
+        if self._failure_count:
+            _LOGGER.info("%s recovered after %d failed updates", self.name, self._failure_count)
+        self._failure_count = 0
+        self._retry_at = None
+        self._last_error = None
+
+    def image_bytes(self) -> Optional[bytes]:
+        """Return the latest rendered picture (IMAGE_CONTENT_TYPE plugins)."""
+        return None
+
+    def image_content_type(self) -> str:
+        """Return the MIME type of image_bytes()."""
+        return self.IMAGE_CONTENT_TYPE or "image/png"
+
+    @property
+    def image_last_updated(self) -> Optional[datetime]:
+        """Return when the picture last changed."""
+        return getattr(self, "_image_last_updated", None)
+
+    def _mark_image_updated(self) -> None:
+        """Record a new render; the image entity is notified after the update."""
+        self._image_last_updated = dt_util.utcnow()
+
+    def _image_source_key(self) -> tuple:
+        return (self._config_entry_id, self._calendar_id)
+
     @property
     def update_interval(self) -> int:
         """Return the update interval in seconds."""
         return self._update_interval
 
+    def state_resolution(self) -> Optional[float]:
+        """Return the smallest time step (seconds) that can change the state.
+
+        Plugins override this when, under their current options, the
+        formatted state changes more slowly than their configured update
+        interval (e.g. a clock without seconds or a value with few decimal
+        places). ``None`` means unknown and keeps the configured interval.
+        """
+        return None
+
+    def state_origin(self) -> datetime:
+        """Return an instant at which a state_resolution() step begins.
+
+        The scheduler fires at origin + n * resolution. The default is
+        midnight in Home Assistant's time zone, which suits plugins that
+        count from the local day; plugins counting in UTC or another zone
+        override it.
+        """
+        return dt_util.start_of_local_day()
+
+    def next_change(self) -> Optional[datetime]:
+        """Return the next known instant (aware UTC) at which the state changes.
+
+        Plugins with exact boundaries (e.g. the start of a season) override
+        this; the scheduler then runs an extra update at that instant
+        instead of catching the change on the next regular tick. ``None``
+        means no such event.
+        """
+        return None
+
+    def _default_update_interval(self) -> int:
+        """Return the plugin's configured interval from CALENDAR_INFO or class constant."""
+        interval = None
+        try:
+            mod = __import__(self.__class__.__module__, fromlist=["CALENDAR_INFO"])
+            info = getattr(mod, "CALENDAR_INFO", {}) or {}
+            interval = info.get("update_interval")
+        except Exception:
+            interval = None
+        if not isinstance(interval, (int, float)):
+            interval = getattr(self.__class__, "UPDATE_INTERVAL", None)
+        try:
+            return max(1, int(interval)) if interval else 3600
+        except Exception:
+            return 3600
+
+    def _user_update_interval(self) -> Optional[int]:
+        """Return the interval override set in the options flow, if any."""
+        config_entry = _CONFIG_ENTRIES.get(self._config_entry_id) if self._config_entry_id else None
+        if not config_entry or not self._calendar_id:
+            return None
+        overrides = (config_entry.options or {}).get(CONF_UPDATE_INTERVALS, {}) or {}
+        try:
+            seconds = int(overrides.get(self._calendar_id) or 0)
+        except (TypeError, ValueError):
+            return None
+        return seconds if seconds > 0 else None
+
+    def _resolve_update_interval(self) -> int:
+        """Return the effective update interval in seconds.
+
+        A user override wins. Otherwise the configured interval is stretched
+        to the plugin's state resolution and scaled by the performance
+        profile, both capped at MAX_AUTO_UPDATE_INTERVAL (or the configured
+        interval if that is longer), so we don't recompute values nobody
+        can see change.
+
+        Also sets _state_step: the resolution whose boundaries the ticks
+        must hit, or None when the interval alone decides.
+        """
+        self._state_step = None
+        override = self._user_update_interval()
+        if override:
+            return override
+
+        configured = self._default_update_interval()
+        ceiling = max(configured, MAX_AUTO_UPDATE_INTERVAL)
+        seconds = configured
+        try:
+            resolution = self.state_resolution()
+        except Exception:
+            resolution = None
+        if resolution and resolution > seconds:
+            seconds = min(int(resolution), ceiling)
+
+        profile = self._performance_profile()
+        scaled = max(seconds * profile.get("interval_factor", 1), profile.get("min_interval", 1))
+        seconds = int(min(max(seconds, scaled), ceiling))
+
+        # Slow down fast sensors while the event loop is overloaded
+        monitor = self._hass.data.get(DATA_LOAD_MONITOR) if self._hass else None
+        if monitor:
+            seconds = monitor.shed_interval(seconds)
+
+        if resolution and resolution >= seconds:
+            self._state_step = float(resolution)
+        return seconds
+
+    def _next_tick_time(self, now: float) -> float:
+        """Return the UTC timestamp of the tick after now.
+
+        Ticks fall on multiples of the interval counted in whole seconds
+        from the Unix epoch, so sensors with the same interval fire
+        together. A stretched sensor also fires at the next boundary of
+        its state resolution (rounded up to the whole second), so a state
+        change is shown when it happens rather than up to one interval
+        later.
+        """
+        interval = self._scheduled_interval
+        due = (math.floor(now / interval) + 1) * interval
+        step = getattr(self, "_state_step", None)
+        if step:
+            try:
+                origin = self.state_origin().timestamp()
+            except Exception:
+                origin = 0.0
+            boundary = origin + (math.floor((now - origin) / step) + 1) * step
+            due = min(due, math.ceil(boundary))
+        return float(due)
+
     @property
     def should_poll(self) -> bool:
         """Return True if entity has to be polled for state."""
@@ -474,64 +813,132 @@ class AlternativeTimeSensorBase(SensorEntity):
                 info = getattr(mod, "CALENDAR_INFO") or {}
         except Exception:
             info = {}
-        category = str(info.get("category") or "uncategorized")
-        if category == "religious":
-            category = "religion"
-        device_name = f"Alternative Time – {category.title()}"
-        return {
-            "identifiers": {(DOMAIN, f"group:{category}")},
-            "manufacturer": "Alternative Time Systems",
-            "model": "Category Group",
-            "name": device_name,
-        }
+        return calendar_device_info(info)
 
     async def async_added_to_hass(self) -> None:
         """Schedule periodic updates in a non-blocking way."""
         # Log when entity is added
-        _LOGGER.debug(f"{self._attr_name} added to Home Assistant")
-
-        # Determine interval from CALENDAR_INFO or class constant
-        interval = None
-        try:
-            mod = __import__(self.__class__.__module__, fromlist=["CALENDAR_INFO"])
-            info = getattr(mod, "CALENDAR_INFO", {}) or {}
-            interval = info.get("update_interval")
-        except Exception:
-            interval = None
-        if not isinstance(interval, (int, float)):
-            interval = getattr(self.__class__, "UPDATE_INTERVAL", None)
-        try:
-            seconds = max(1, int(interval)) if interval else 3600
-        except Exception:
-            seconds = 3600
-
-        _LOGGER.debug(f"{self._attr_name} will update every {seconds} seconds")
+        _LOGGER.debug("%s added to Home Assistant", self._attr_name)
 
         # Avoid platform-wide polling
         self._attr_should_poll = False
 
+        # Serve rendered pictures through the image platform
+        if self.IMAGE_CONTENT_TYPE:
+            self._hass.data.setdefault(DATA_IMAGE_SOURCES, {})[self._image_source_key()] = self
+            self._image_announced = None
+
+        # Reload plugin options when the config entry changes
+        if self._config_entry_id:
+            self.async_on_remove(
+                async_dispatcher_connect(
+                    self._hass, SIGNAL_ENTRY_UPDATED.format(self._config_entry_id), self._async_entry_updated
+                )
+            )
+
         # Start scheduler
-        self._unsub_timer = async_track_time_interval(
-            self._hass, self._async_timer_tick, timedelta(seconds=seconds)
-        )
+        self._scheduling = True
+        self._schedule_next_tick()
 
         # Trigger first run
         self._hass.async_create_task(self._async_timer_tick(None))
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Cancel the scheduled timer when entity is removed."""
-        _LOGGER.debug(f"{self._attr_name} being removed from Home Assistant")
+    async def _async_entry_updated(self) -> None:
+        """Reload plugin options on the next update and reschedule."""
+        if hasattr(self, "_options_loaded"):
+            self._options_loaded = False
+        if getattr(self, "_scheduling", False):
+            await self._async_timer_tick(None)
 
+    def _schedule_next_tick(self, after: Optional[float] = None) -> None:
+        """Arm the one-shot timer for the next aligned tick.
+
+        after is the instant of the tick that just ran, so a timer firing
+        a little early cannot be scheduled for the same instant again. The
+        interval is re-resolved every time, so option changes, the load
+        monitor and the performance profile apply from the next tick.
+        """
         unsub = getattr(self, "_unsub_timer", None)
         if unsub:
-            try:
-                unsub()
-            except Exception:
-                pass
-            self._unsub_timer = None
+            unsub()
+        self._unsub_timer = None
+        if not getattr(self, "_scheduling", False):
+            return
+
+        seconds = self._resolve_update_interval()
+        if seconds != getattr(self, "_scheduled_interval", None):
+            _LOGGER.debug("%s will update every %s seconds", self._attr_name, seconds)
+        self._scheduled_interval = seconds
+
+        now = time.time()
+        due = self._next_tick_time(max(now, after or 0.0))
+        self._next_tick_due = self._hass.loop.time() + (due - now)
+        self._unsub_timer = async_track_point_in_utc_time(
+            self._hass, self._async_timer_tick, dt_util.utc_from_timestamp(due)
+        )
+
+    def _schedule_change_event(self) -> None:
+        """(Re)arm the one-shot update at the plugin's next_change()."""
+        try:
+            when = self.next_change()
+        except Exception:
+            when = None
+        if when == getattr(self, "_change_event_at", None):
+            return
+        unsub = getattr(self, "_unsub_change_event", None)
+        if unsub:
+            unsub()
+        self._unsub_change_event = None
+        self._change_event_at = when
+        if when is not None:
+            _LOGGER.debug("%s will also update at %s", self._attr_name, when)
+            # Fire on the whole second at or after the change, like the ticks
+            self._unsub_change_event = async_track_point_in_utc_time(
+                self._hass, self._async_change_event,
+                dt_util.utc_from_timestamp(math.ceil(when.timestamp())),
+            )
+
+    async def _async_change_event(self, _now) -> None:
+        """Update at a state boundary announced by next_change()."""
+        self._unsub_change_event = None
+        self._change_event_at = None
+        await self._async_timer_tick(None)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the scheduled timer when entity is removed."""
+        _LOGGER.debug("%s being removed from Home Assistant", self._attr_name)
+
+        self._scheduling = False
+        for attr in ("_unsub_timer", "_unsub_change_event"):
+            unsub = getattr(self, attr, None)
+            if unsub:
+                try:
+                    unsub()
+                except Exception:
+                    pass
+                setattr(self, attr, None)
+
+        if self.IMAGE_CONTENT_TYPE:
+            sources = self._hass.data.get(DATA_IMAGE_SOURCES, {})
+            if sources.get(self._image_source_key()) is self:
+                sources.pop(self._image_source_key())
 
     async def _async_timer_tick(self, _now) -> None:
         """Call plugin update without blocking the event loop."""
+        loop_time = self._hass.loop.time()
+        if _now is not None:
+            # Timer-driven tick: report how late it fired
+            monitor = self._hass.data.get(DATA_LOAD_MONITOR)
+            if monitor:
+                monitor.record_lag(loop_time - self._next_tick_due)
+
+        if _now is not None and self._retry_at is not None and loop_time + 0.5 < self._retry_at:
+            # Circuit open: skip timer ticks until the next recovery probe is due
+            self._schedule_next_tick(_now.timestamp())
+            return
+
+        # Timer ticks share the context of their scheduled second
+        self._astro = get_astro_context(self._hass, _now)
         try:
             # Prefer plugin's async_update if available
             if hasattr(self, "async_update") and callable(getattr(self, "async_update")):
@@ -539,9 +946,77 @@ class AlternativeTimeSensorBase(SensorEntity):
             else:
                 await self._hass.async_add_executor_job(getattr(self, "update"))
         except Exception as exc:
-            _LOGGER.debug(f"Scheduled update failed for {self.name}: {exc}")
+            self._record_update_failure(exc)
+        else:
+            self._record_update_success()
         finally:
+            self._astro = None
             try:
                 self.async_write_ha_state()
             except Exception:
                 pass
+            if self.IMAGE_CONTENT_TYPE and self.image_last_updated != getattr(self, "_image_announced", None):
+                self._image_announced = self.image_last_updated
+                async_dispatcher_send(self._hass, SIGNAL_IMAGE_UPDATED.format(*self._image_source_key()))
+
+        # Options may have changed the state resolution or the user override
+        if getattr(self, "_scheduling", False):
+            self._schedule_next_tick(_now.timestamp() if _now is not None else None)
+            self._schedule_change_event()
+
+
+class AlternativeTimeLoadSensor(SensorEntity):
+    """Diagnostic sensor exposing event-loop lag and integration CPU usage."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:speedometer"
+    _attr_should_poll = False
+
+    REFRESH_INTERVAL = 10
+
+    def __init__(self, base_name: str, entry_id: str, monitor) -> None:
+        """Initialize the diagnostic sensor."""
+        self._monitor = monitor
+        self._attr_name = f"{base_name} Loop Lag"
+        self._attr_unique_id = f"{entry_id}_load_monitor"
+        self._statistics: Dict[str, Any] = {}
+        self._unsub_timer = None
+
+    @property
+    def device_info(self):
+        """Group with the other diagnostics of this integration."""
+        return {
+            "identifiers": {(DOMAIN, "group:diagnostics")},
+            "manufacturer": "Alternative Time Systems",
+            "model": "Diagnostics",
+            "name": "Alternative Time – Diagnostics",
+        }
+
+    @property
+    def native_value(self) -> Optional[float]:
+        """Return the recent average loop lag in milliseconds."""
+        return self._statistics.get("loop_lag_ms")
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return CPU and load shedding details."""
+        return {k: v for k, v in self._statistics.items() if k != "loop_lag_ms"}
+
+    async def async_added_to_hass(self) -> None:
+        """Start periodic refresh."""
+        self._unsub_timer = async_track_time_interval(
+            self.hass, self._async_refresh, timedelta(seconds=self.REFRESH_INTERVAL)
+        )
+        await self._async_refresh(None)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop periodic refresh."""
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    async def _async_refresh(self, _now) -> None:
+        self._statistics = self._monitor.statistics()
+        self.async_write_ha_state()
@@ -0,0 +1,428 @@
+"""Layered renderer for the solar system map.
+
+The map has a static part (background, sun, Kuiper belt, month ring,
+orbits and footer) and a dynamic part (planet markers and labels). The
+static layer is built once per (scale, language, orbit radii) and cached;
+every update only appends the marker group. The SVG is drawn in a
+600x600 viewBox, so the requested size only changes the header.
+
+Renderers take a plain "map spec" dict so they can run anywhere (thread
+or worker process) without access to the sensor:
+
+    {
+        "size": 600,
+        "scale": "logarithmic" | "compressed" | "linear",
+        "show_kuiper_belt": bool,
+        "month_names": [12 str],
+        "footer": str,
+        "you_are_here": str,
+        "markers": [{"id", "name", "symbol", "color", "lon", "dist",
+                     "is_earth", "is_dwarf_planet", "is_probe"}, ...],
+    }
+
+"lon" is already rotated so that January is at the top.
+"""
+from __future__ import annotations
+
+import io
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from PIL import Image, ImageDraw, ImageFont  # optional
+except Exception:
+    Image = None
+    ImageDraw = None
+    ImageFont = None
+
+# Geometry of the reference layout (SVG viewBox); other sizes are scaled
+MAP_SIZE = 600
+MAP_MARGIN = 40
+MAX_DISTANCE_AU = 50.0
+
+# Static layers kept per renderer
+STATIC_CACHE_SIZE = 4
+
+# Default minimum marker movement (pixels) that triggers a re-render
+DEFAULT_PIXEL_THRESHOLD = 1.0
+
+# PNG renderer: background images kept (per static layer and size)
+BACKGROUND_CACHE_SIZE = 4
+
+# zlib level for PNG output; 1 encodes several times faster than the
+# default 6 on ARM boards at the cost of a slightly larger file
+PNG_COMPRESS_LEVEL = 1
+
+FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+
+def max_radius(size: int = MAP_SIZE) -> float:
+    """Return the radius of the outermost ring (50 AU) in pixels."""
+    return size / 2 - MAP_MARGIN * size / MAP_SIZE
+
+
+def scale_r(distance: float, scale: str, max_r: float) -> float:
+    """Map a distance in AU to a radius in pixels."""
+    d = max(0.0, float(distance))
+    if scale == "logarithmic":
+        return math.log(d + 1.0) / math.log(MAX_DISTANCE_AU) * max_r
+    if scale == "compressed":
+        return (d ** 0.5) / (MAX_DISTANCE_AU ** 0.5) * max_r
+    return (d / MAX_DISTANCE_AU) * max_r
+
+
+def angle_to_xy(angle_deg: float, radius: float, cx: float, cy: float) -> Tuple[float, float]:
+    """Convert a map angle to x, y (0° = top / 12 o'clock, clockwise)."""
+    rad = math.radians(90.0 - angle_deg)
+    return cx + math.cos(rad) * radius, cy - math.sin(rad) * radius
+
+
+def marker_positions(spec: Dict[str, Any], size: int = MAP_SIZE) -> List[Tuple[str, float, float, float]]:
+    """Return (id, x, y, orbit radius) for every marker at the given size."""
+    c = size / 2
+    max_r = max_radius(size)
+    out = []
+    for m in spec["markers"]:
+        r = scale_r(m["dist"], spec["scale"], max_r)
+        x, y = angle_to_xy(m["lon"], r, c, c)
+        out.append((m["id"], x, y, r))
+    return out
+
+
+def orbit_key(spec: Dict[str, Any], positions: List[Tuple[str, float, float, float]]) -> Tuple:
+    """Orbit radii rounded to half a pixel - orbits change over days, not ticks."""
+    return tuple(
+        (m["id"], round(r * 2) / 2, bool(m.get("is_dwarf_planet")), bool(m.get("is_probe")))
+        for m, (_, _, _, r) in zip(spec["markers"], positions)
+    )
+
+
+def static_key(spec: Dict[str, Any], positions: List[Tuple[str, float, float, float]]) -> Tuple:
+    """Key identifying the static layer of a spec (positions from marker_positions)."""
+    return (
+        spec["scale"],
+        bool(spec.get("show_kuiper_belt")),
+        tuple(spec["month_names"]),
+        spec["footer"],
+        orbit_key(spec, positions),
+    )
+
+
+def moved_beyond(previous: Optional[List[Tuple[str, float, float, float]]],
+                 current: List[Tuple[str, float, float, float]], threshold: float) -> bool:
+    """Return True if any marker moved more than threshold pixels."""
+    if previous is None or len(previous) != len(current):
+        return True
+    for (pid_a, xa, ya, _), (pid_b, xb, yb, _) in zip(previous, current):
+        if pid_a != pid_b or math.hypot(xa - xb, ya - yb) > threshold:
+            return True
+    return False
+
+
+class SvgMapRenderer:
+    """Render the map as SVG, reusing the static layer between updates."""
+
+    def __init__(self) -> None:
+        """Initialize the renderer."""
+        self._static: "OrderedDict[Tuple, str]" = OrderedDict()
+        self._last_key: Optional[Tuple] = None
+        self._last_size: Optional[int] = None
+        self._last_positions: Optional[List[Tuple[str, float, float, float]]] = None
+        self._last_svg: Optional[str] = None
+
+    def render(self, spec: Dict[str, Any], threshold: float = DEFAULT_PIXEL_THRESHOLD) -> Tuple[str, bool]:
+        """Return (svg, changed).
+
+        If the static layer is unchanged and no marker moved by more than
+        threshold pixels, the previous document is returned with
+        changed=False.
+        """
+        size = int(spec.get("size") or MAP_SIZE)
+        positions = marker_positions(spec)
+        key = static_key(spec, positions)
+        if (
+            self._last_svg is not None
+            and key == self._last_key
+            and size == self._last_size
+            and not moved_beyond(self._last_positions, positions, threshold)
+        ):
+            return self._last_svg, False
+
+        static = self._static.get(key)
+        if static is None:
+            static = self._render_static(spec, key)
+            self._static[key] = static
+            while len(self._static) > STATIC_CACHE_SIZE:
+                self._static.popitem(last=False)
+        else:
+            self._static.move_to_end(key)
+
+        svg = "\n".join((
+            self._header(size),
+            static,
+            '<g id="markers">',
+            self._render_markers(spec, positions),
+            "</g>",
+            "</svg>",
+        ))
+        self._last_key = key
+        self._last_size = size
+        self._last_positions = positions
+        self._last_svg = svg
+        return svg, True
+
+    def _header(self, size: int) -> str:
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" '
+            f'viewBox="0 0 {MAP_SIZE} {MAP_SIZE}" role="img" aria-label="Solar System Map">'
+        )
+
+    def _render_static(self, spec: Dict[str, Any], key: Tuple) -> str:
+        width = height = MAP_SIZE
+        cx = cy = MAP_SIZE / 2
+        max_r = max_radius()
+        scale = spec["scale"]
+
+        out = []
+        out.append('<defs>')
+        out.append('<style><![CDATA[')
+        out.append('text{font-family:Arial,system-ui,Segoe UI,Roboto,sans-serif}')
+        out.append('.month-label{font-size:11px;fill:#AAAAAA}')
+        out.append('.planet-label{font-size:10px;fill:#FFFFFF}')
+        out.append('.earth-label{font-size:11px;fill:#4AE24A;font-weight:bold}')
+        out.append('.footer{font-size:10px;fill:#888888}')
+        out.append(']]></style>')
+        out.append('</defs>')
+
+        # Background
+        out.append(f'<rect x="0" y="0" width="{int(width)}" height="{int(height)}" fill="#000022"/>')
+
+        # Sun
+        out.append(f'<circle cx="{cx}" cy="{cy}" r="18" fill="#FFD700" stroke="#FFA500" stroke-width="2"/>')
+        out.append(f'<text x="{cx}" y="{cy + 5}" fill="#000000" font-size="16" text-anchor="middle">☉</text>')
+
+        # Kuiper Belt (if enabled)
+        if spec.get("show_kuiper_belt"):
+            kb_inner = scale_r(30.0, scale, max_r)  # ~30 AU
+            kb_outer = scale_r(50.0, scale, max_r)  # ~50 AU
+            kb_mid = (kb_inner + kb_outer) / 2
+            out.append(f'<circle cx="{cx}" cy="{cy}" r="{kb_inner:.2f}" fill="none" stroke="rgba(102,204,255,0.25)" stroke-width="1"/>')
+            out.append(f'<circle cx="{cx}" cy="{cy}" r="{kb_outer:.2f}" fill="none" stroke="rgba(102,204,255,0.25)" stroke-width="1"/>')
+            out.append(f'<circle cx="{cx}" cy="{cy}" r="{kb_mid:.2f}" fill="none" stroke="rgba(102,204,255,0.15)" stroke-width="{kb_outer - kb_inner:.0f}"/>')
+
+        # Month markers
+        month_names = spec["month_names"]
+        for i in range(12):
+            angle = i * 30.0
+            x1, y1 = angle_to_xy(angle, 25, cx, cy)
+            x2, y2 = angle_to_xy(angle, max_r + 20, cx, cy)
+            out.append(f'<line x1="{x1:.2f}" y1="{y1:.2f}" x2="{x2:.2f}" y2="{y2:.2f}" stroke="#333333" stroke-width="1" stroke-dasharray="4,4"/>')
+            lx, ly = angle_to_xy(angle, max_r + 35, cx, cy)
+            out.append(f'<text x="{lx:.2f}" y="{ly:.2f}" class="month-label" text-anchor="middle" dominant-baseline="middle">{month_names[i]}</text>')
+
+        # Orbits
+        for pid, r, is_dwarf, is_probe in key[-1]:
+            stroke_dash = "4,2" if is_dwarf else "none"
+            stroke_color = "#555555" if is_probe else "#444444"
+            out.append(f'<circle cx="{cx}" cy="{cy}" r="{r:.2f}" fill="none" stroke="{stroke_color}" stroke-width="0.8" stroke-dasharray="{stroke_dash}"/>')
+
+        # Footer
+        footer_text = f"{spec['footer']} · {scale.title()}"
+        out.append(f'<text x="10" y="{height - 10}" class="footer">{footer_text}</text>')
+        return "\n".join(out)
+
+    def _render_markers(self, spec: Dict[str, Any], positions: List[Tuple[str, float, float, float]]) -> str:
+        out = []
+        for it, (_, x, y, _) in zip(spec["markers"], positions):
+            if it["is_earth"]:
+                # Earth with special "You are here" marker
+                out.append(f'<circle cx="{x:.2f}" cy="{y:.2f}" r="8" fill="{it["color"]}" stroke="#00FF00" stroke-width="2"/>')
+                # Position label based on where Earth is
+                label_offset_y = -18 if it["lon"] < 180 else 25
+                out.append(f'<text x="{x:.2f}" y="{y + label_offset_y:.2f}" class="earth-label" text-anchor="middle">{it["symbol"]} {spec["you_are_here"]}</text>')
+            elif it["is_probe"]:
+                # Probes: smaller marker
+                out.append(f'<circle cx="{x:.2f}" cy="{y:.2f}" r="3" fill="{it["color"]}" stroke="#FFFFFF" stroke-width="0.5"/>')
+                out.append(f'<text x="{x:.2f}" y="{y - 8:.2f}" class="planet-label" text-anchor="middle" font-size="8">{it["name"]}</text>')
+            else:
+                # Regular planets
+                planet_radius = 6 if it["id"] in ["jupiter", "saturn"] else 5
+                out.append(f'<circle cx="{x:.2f}" cy="{y:.2f}" r="{planet_radius}" fill="{it["color"]}" stroke="#FFFFFF" stroke-width="1"/>')
+                label = f'{it["symbol"]} {it["name"]}'
+                out.append(f'<text x="{x:.2f}" y="{y - 10:.2f}" class="planet-label" text-anchor="middle">{label}</text>')
+        return "\n".join(out)
+
+
+def _hex_to_rgb(h: str, a: int = 255) -> Tuple[int, int, int, int]:
+    h = h.lstrip("#")
+    return (int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16), a)
+
+
+def _text_size(draw, text: str, font) -> Tuple[int, int]:
+    t = str(text)
+    try:
+        L, T, R, B = draw.textbbox((0, 0), t, font=font)
+        return (R - L, B - T)
+    except Exception:
+        try:
+            return font.getsize(t)
+        except Exception:
+            return (max(1, len(t) * 7), 12)
+
+
+class PngMapRenderer:
+    """Render the map as PNG onto a cached, pre-rendered background.
+
+    Backgrounds are kept per (static layer, size) in an LRU cache; every
+    render copies the background, draws the markers and encodes. Timings
+    of the last render are available in last_timings (milliseconds).
+    """
+
+    def __init__(self) -> None:
+        """Initialize the renderer."""
+        self._backgrounds: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._fonts: Dict[int, Any] = {}
+        self.last_timings: Dict[str, float] = {}
+
+    @staticmethod
+    def available() -> bool:
+        """Return True if Pillow is installed."""
+        return Image is not None and ImageDraw is not None
+
+    def _font(self, px: int):
+        font = self._fonts.get(px)
+        if font is None:
+            try:
+                font = ImageFont.truetype(FONT_PATH, px)
+            except Exception:
+                font = ImageFont.load_default()
+            self._fonts[px] = font
+        return font
+
+    def render(self, spec: Dict[str, Any], size: Optional[int] = None) -> Optional[bytes]:
+        """Return PNG bytes of the map at size x size pixels."""
+        if not self.available():
+            return None
+        size = int(size or spec.get("size") or MAP_SIZE)
+
+        t0 = time.perf_counter()
+        positions = marker_positions(spec, size)
+        key = (static_key(spec, positions), size)
+        background = self._backgrounds.get(key)
+        if background is None:
+            background = self._render_background(spec, key[0], size)
+            self._backgrounds[key] = background
+            while len(self._backgrounds) > BACKGROUND_CACHE_SIZE:
+                self._backgrounds.popitem(last=False)
+        else:
+            self._backgrounds.move_to_end(key)
+        t1 = time.perf_counter()
+
+        img = background.copy()
+        self._draw_markers(img, spec, positions, size)
+        t2 = time.perf_counter()
+
+        buf = io.BytesIO()
+        img.save(buf, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+        t3 = time.perf_counter()
+
+        self.last_timings = {
+            "background_ms": round((t1 - t0) * 1000, 2),
+            "markers_ms": round((t2 - t1) * 1000, 2),
+            "encode_ms": round((t3 - t2) * 1000, 2),
+            "total_ms": round((t3 - t0) * 1000, 2),
+        }
+        return buf.getvalue()
+
+    def _render_background(self, spec: Dict[str, Any], key: Tuple, size: int):
+        k = size / MAP_SIZE
+        cx = cy = size // 2
+        max_r = max_radius(size)
+        scale = spec["scale"]
+
+        img = Image.new("RGBA", (size, size), (0, 0, 34, 255))
+        draw = ImageDraw.Draw(img)
+        font_small = self._font(max(6, round(9 * k)))
+
+        # Sun
+        sun = round(18 * k)
+        draw.ellipse((cx - sun, cy - sun, cx + sun, cy + sun), fill=(255, 215, 0, 255), outline=(255, 165, 0, 255), width=2)
+
+        # Kuiper Belt
+        if spec.get("show_kuiper_belt"):
+            kb_inner = int(scale_r(30.0, scale, max_r))
+            kb_outer = int(scale_r(50.0, scale, max_r))
+            draw.ellipse((cx - kb_inner, cy - kb_inner, cx + kb_inner, cy + kb_inner),
+                         outline=(102, 204, 255, 64), width=1)
+            draw.ellipse((cx - kb_outer, cy - kb_outer, cx + kb_outer, cy + kb_outer),
+                         outline=(102, 204, 255, 64), width=1)
+
+        # Month markers
+        month_names = spec["month_names"]
+        for i in range(12):
+            angle = i * 30.0
+            x1, y1 = angle_to_xy(angle, 25 * k, cx, cy)
+            x2, y2 = angle_to_xy(angle, max_r + 20 * k, cx, cy)
+            draw.line([(int(x1), int(y1)), (int(x2), int(y2))], fill=(51, 51, 51, 255), width=1)
+            lx, ly = angle_to_xy(angle, max_r + 35 * k, cx, cy)
+            tw, th = _text_size(draw, month_names[i], font_small)
+            draw.text((int(lx) - tw // 2, int(ly) - th // 2), month_names[i], fill=(170, 170, 170, 255), font=font_small)
+
+        # Orbits
+        for _, r, _, _ in key[-1]:
+            r = int(r)
+            draw.ellipse((cx - r, cy - r, cx + r, cy + r), outline=(68, 68, 68, 255), width=1)
+
+        # Footer
+        footer_text = f"{spec['footer']} · {scale.title()}"
+        tw, th = _text_size(draw, footer_text, font_small)
+        draw.text((10, size - 10 - th), footer_text, fill=(136, 136, 136, 255), font=font_small)
+        return img
+
+    def _draw_markers(self, img, spec: Dict[str, Any], positions: List[Tuple[str, float, float, float]], size: int) -> None:
+        k = size / MAP_SIZE
+        draw = ImageDraw.Draw(img)
+        font_label = self._font(max(6, round(10 * k)))
+        for it, (_, fx, fy, _) in zip(spec["markers"], positions):
+            x, y = int(fx), int(fy)
+            if it["is_earth"]:
+                planet_r = 8
+            elif it["is_probe"]:
+                planet_r = 3
+            else:
+                planet_r = 6 if it["id"] in ["jupiter", "saturn"] else 5
+            planet_r = max(2, round(planet_r * k))
+            if it["is_earth"]:
+                draw.ellipse((x - planet_r, y - planet_r, x + planet_r, y + planet_r),
+                             fill=_hex_to_rgb(it["color"]),
+                             outline=(0, 255, 0, 255),
+                             width=2)
+                label = f'{it["symbol"]} {spec["you_are_here"]}'
+                tw, th = _text_size(draw, label, font_label)
+                draw.text((x - tw // 2, y - round(18 * k) - th), label, fill=(74, 226, 74, 255), font=font_label)
+            else:
+                draw.ellipse((x - planet_r, y - planet_r, x + planet_r, y + planet_r),
+                             fill=_hex_to_rgb(it["color"]),
+                             outline=(255, 255, 255, 255),
+                             width=1)
+                label = f'{it["symbol"]} {it["name"]}'
+                tw, th = _text_size(draw, label, font_label)
+                draw.text((x - tw // 2, y - round(12 * k) - th), label, fill=(255, 255, 255, 255), font=font_label)
+
+
+# Renderer living in the render worker process (see render_pool)
+_WORKER_PNG_RENDERER: Optional[PngMapRenderer] = None
+
+
+def render_png_in_worker(spec: Dict[str, Any], size: Optional[int] = None) -> Tuple[Optional[bytes], Dict[str, float]]:
+    """Render a PNG in the worker process; returns (png, timings).
+
+    The renderer (and its background cache) persists between jobs.
+    """
+    global _WORKER_PNG_RENDERER
+    if _WORKER_PNG_RENDERER is None:
+        _WORKER_PNG_RENDERER = PngMapRenderer()
+    png = _WORKER_PNG_RENDERER.render(spec, size)
+    return png, _WORKER_PNG_RENDERER.last_timings
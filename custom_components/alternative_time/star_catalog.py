@@ -0,0 +1,633 @@
+"""Star catalog with vectorized distance, drift and close-approach queries.
+
+The built-in objects of the stellar distances plugin are a dozen hand
+picked stars and pulsars. A larger catalog (for example the nearest few
+thousand stars from Gaia DR3 or Hipparcos) can be exported as CSV into
+the config directory as CATALOG_CSV; the store converts it once into a
+compact binary table in .storage:
+
+    header: MAGIC, row count (int32)
+    rows:   source id (int64), RA, Dec (deg), parallax and error (mas),
+            proper motion in RA*cos(Dec) and Dec (mas/yr), radial
+            velocity and error (km/s) as float64, name (24 bytes)
+
+Rows are sorted by parallax, nearest first. The table is memory mapped
+as a numpy record array, so loading costs no parsing and every query
+runs over whole columns: distance, radial drift and uncertainty for all
+stars in one pass, the N nearest stars, and the closest approaches to
+the Sun within a horizon under linear space motion. Positions refer to
+J2000.0. Without numpy the same queries loop over the rows.
+
+Nearest-star and within-radius queries go through a StarIndex, a k-d
+tree over the positions at the epoch it was built. Stars keep moving,
+so a query at a later epoch measures candidates at their current
+positions and widens the pruning bound by the largest drift since the
+build; answers stay exact and the tree is rebuilt only once that drift
+exceeds INDEX_TOLERANCE_LY.
+"""
+from __future__ import annotations
+
+import csv
+import heapq
+import math
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .log_helper import get_logger
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - numpy ships with Home Assistant
+    np = None
+    HAS_NUMPY = False
+
+_LOGGER = get_logger(__name__)
+
+DATA_STAR_CATALOG = f"{DOMAIN}_star_catalog"
+
+TABLE_FILE = f".storage/{DOMAIN}.stars.bin"
+CATALOG_CSV = f"{DOMAIN}_stars.csv"
+
+MAGIC = b"ATSTAR01"
+HEADER = struct.Struct("<8si")
+ROW = struct.Struct("<q8d24s")
+NAME_BYTES = 24
+
+# Stars kept from an import (nearest first)
+MAX_STARS = 20000
+
+FIELDS = ("source_id", "ra", "dec", "parallax", "parallax_error", "pm_ra", "pm_dec", "rv", "rv_error", "name")
+
+if HAS_NUMPY:
+    RECORD_DTYPE = np.dtype([
+        ("source_id", "<i8"), ("ra", "<f8"), ("dec", "<f8"),
+        ("parallax", "<f8"), ("parallax_error", "<f8"),
+        ("pm_ra", "<f8"), ("pm_dec", "<f8"),
+        ("rv", "<f8"), ("rv_error", "<f8"),
+        ("name", f"S{NAME_BYTES}"),
+    ])
+
+# CSV column names accepted for each field (Gaia archive, VizieR Hipparcos)
+CSV_COLUMNS = {
+    "source_id": ("source_id", "hip", "id"),
+    "ra": ("ra", "ra_deg", "radeg", "ra_icrs"),
+    "dec": ("dec", "dec_deg", "dedeg", "de_icrs"),
+    "parallax": ("parallax", "plx", "parallax_mas"),
+    "parallax_error": ("parallax_error", "e_plx", "parallax_error_mas"),
+    "pm_ra": ("pmra", "pm_ra", "pm_ra_mas_yr"),
+    "pm_dec": ("pmdec", "pmde", "pm_dec", "pm_dec_mas_yr"),
+    "rv": ("radial_velocity", "rv", "rv_km_s"),
+    "rv_error": ("radial_velocity_error", "e_rv", "rv_error", "rv_error_km_s"),
+    "name": ("name", "designation"),
+}
+
+PARSEC_IN_AU = 206264.806247
+LIGHT_YEAR_IN_AU = 63241.077
+KM_PER_AU = 149597870.7
+SECONDS_PER_YEAR = 31557600
+MAS_TO_RAD = math.pi / (180 * 3600 * 1000)
+
+AU_PER_YEAR_PER_KM_S = SECONDS_PER_YEAR / KM_PER_AU
+
+# Smallest parallax used for the far end of the error bar (mas)
+MIN_PARALLAX = 0.001
+
+DEFAULT_HORIZON_YEARS = 100000.0
+
+# k-d tree: stars per leaf, and the drift (ly) after which it is rebuilt
+LEAF_SIZE = 16
+INDEX_TOLERANCE_LY = 0.05
+
+SUN = (0.0, 0.0, 0.0)
+
+
+# -------------- single-star formulas --------------
+def parallax_to_distance_au(parallax_mas: float) -> float:
+    """Return the distance in AU for a parallax in mas (inf if not positive)."""
+    if parallax_mas <= 0:
+        return float("inf")
+    return (1000.0 / parallax_mas) * PARSEC_IN_AU
+
+
+def distance_row(
+    parallax: float, parallax_error: float, rv: float, rv_error: float, years: float
+) -> Tuple[float, float, float, float, float]:
+    """Distance of one star years after J2000 under radial drift.
+
+    Returns (distance_au, radial_change_au, uncertainty_percent,
+    distance_min_au, distance_max_au). The range is the parallax error
+    bar, widened by the radial velocity error over the elapsed time.
+    """
+    base = parallax_to_distance_au(parallax)
+    if parallax > 0 and parallax_error > 0:
+        uncertainty = parallax_error / parallax * 100.0
+        distance_min = parallax_to_distance_au(parallax + parallax_error)
+        distance_max = parallax_to_distance_au(max(parallax - parallax_error, MIN_PARALLAX))
+    else:
+        uncertainty = 0.0
+        distance_min = distance_max = base
+    radial = rv * AU_PER_YEAR_PER_KM_S * years
+    spread = rv_error * AU_PER_YEAR_PER_KM_S * abs(years) if abs(years) > 1 and rv_error > 0 else 0.0
+    return base + radial, radial, uncertainty, distance_min + radial - spread, distance_max + radial + spread
+
+
+def space_motion(ra: float, dec: float, parallax: float, pm_ra: float, pm_dec: float, rv: float) -> Tuple[List[float], List[float]]:
+    """Return heliocentric position (AU) at J2000 and velocity (AU/yr)."""
+    ra, dec = math.radians(ra), math.radians(dec)
+    sa, ca, sd, cd = math.sin(ra), math.cos(ra), math.sin(dec), math.cos(dec)
+    distance = parallax_to_distance_au(parallax)
+    v_ra = pm_ra * MAS_TO_RAD * distance
+    v_dec = pm_dec * MAS_TO_RAD * distance
+    v_r = rv * AU_PER_YEAR_PER_KM_S
+    position = [distance * cd * ca, distance * cd * sa, distance * sd]
+    velocity = [
+        v_r * cd * ca - v_ra * sa - v_dec * sd * ca,
+        v_r * cd * sa + v_ra * ca - v_dec * sd * sa,
+        v_r * sd + v_dec * cd,
+    ]
+    return position, velocity
+
+
+def closest_approach(position: Sequence[float], velocity: Sequence[float], start: float, end: float) -> Tuple[float, float]:
+    """Return (epoch, distance) of the minimum distance between start and end.
+
+    Epochs are years since J2000, the motion is linear.
+    """
+    speed2 = sum(v * v for v in velocity)
+    epoch = -sum(p * v for p, v in zip(position, velocity)) / speed2 if speed2 > 0 else start
+    epoch = min(max(epoch, start), end)
+    return epoch, math.sqrt(sum((p + v * epoch) ** 2 for p, v in zip(position, velocity)))
+
+
+# -------------- spatial index --------------
+class StarIndex:
+    """k-d tree over star positions (AU) under linear motion.
+
+    The tree is an implicit median split of an index permutation: node
+    [lo, hi) splits at mid = (lo + hi) // 2 on axis depth % 3, ranges of
+    at most LEAF_SIZE stars are scanned. Positions are kept as Python
+    lists, since a query touches only a few dozen stars.
+    """
+
+    def __init__(self, stars: Sequence[int], positions: Any, velocities: Any, epoch: float) -> None:
+        """Build the tree for stars (catalog indices) with J2000 positions and velocities.
+
+        positions and velocities are (n, 3) numpy arrays or lists of
+        triples covering the whole catalog.
+        """
+        self.epoch = epoch
+        # Split coordinate per node (root 1, children 2n and 2n + 1)
+        self._splits: Dict[int, float] = {}
+        if HAS_NUMPY:
+            stars = np.asarray(stars, dtype=np.int64)
+            with np.errstate(invalid="ignore"):
+                current = positions + velocities * epoch
+            self._max_speed = float(np.sqrt(np.einsum("ij,ij->i", velocities[stars], velocities[stars])).max()) if len(stars) else 0.0
+            self._order = self._build_numpy(stars, current)
+            self._positions = current.tolist()
+            self._velocities = velocities.tolist()
+        else:
+            current = [[p + v * epoch for p, v in zip(pos, vel)] for pos, vel in zip(positions, velocities)]
+            self._max_speed = max((math.sqrt(sum(v * v for v in velocities[i])) for i in stars), default=0.0)
+            self._order = list(stars)
+            self._build_python(current)
+            self._positions = current
+            self._velocities = velocities
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def _build_numpy(self, stars: Any, current: Any) -> List[int]:
+        order = stars.copy()
+        stack = [(0, len(order), 0, 1)]
+        while stack:
+            lo, hi, depth, node = stack.pop()
+            if hi - lo <= LEAF_SIZE:
+                continue
+            mid = (lo + hi) // 2
+            axis = depth % 3
+            block = order[lo:hi]
+            order[lo:hi] = block[np.argpartition(current[block, axis], mid - lo)]
+            self._splits[node] = float(current[order[mid], axis])
+            stack.append((lo, mid, depth + 1, 2 * node))
+            stack.append((mid, hi, depth + 1, 2 * node + 1))
+        return order.tolist()
+
+    def _build_python(self, current: List[List[float]]) -> None:
+        order = self._order
+        stack = [(0, len(order), 0, 1)]
+        while stack:
+            lo, hi, depth, node = stack.pop()
+            if hi - lo <= LEAF_SIZE:
+                continue
+            mid = (lo + hi) // 2
+            axis = depth % 3
+            order[lo:hi] = sorted(order[lo:hi], key=lambda i: current[i][axis])
+            self._splits[node] = current[order[mid]][axis]
+            stack.append((lo, mid, depth + 1, 2 * node))
+            stack.append((mid, hi, depth + 1, 2 * node + 1))
+
+    def drift(self, epoch: float) -> float:
+        """Return the largest distance (AU) a star moved since the build."""
+        return self._max_speed * abs(epoch - self.epoch)
+
+    def _distance2(self, star: int, center: Sequence[float], dt: float) -> float:
+        p, v = self._positions[star], self._velocities[star]
+        return (
+            (p[0] + v[0] * dt - center[0]) ** 2
+            + (p[1] + v[1] * dt - center[1]) ** 2
+            + (p[2] + v[2] * dt - center[2]) ** 2
+        )
+
+    def _search(self, center: Sequence[float], epoch: float, bound: Any, visit: Any) -> None:
+        """Walk the tree near side first; bound() returns the current search radius squared."""
+        dt = epoch - self.epoch
+        slack = self.drift(epoch)
+        order, splits = self._order, self._splits
+
+        def walk(lo: int, hi: int, depth: int, node: int) -> None:
+            if hi - lo <= LEAF_SIZE:
+                for star in order[lo:hi]:
+                    visit(star, self._distance2(star, center, dt))
+                return
+            mid = (lo + hi) // 2
+            diff = center[depth % 3] - splits[node]
+            near, far = ((lo, mid, 2 * node), (mid, hi, 2 * node + 1))
+            if diff >= 0:
+                near, far = far, near
+            walk(near[0], near[1], depth + 1, near[2])
+            gap = abs(diff) - slack
+            if gap <= 0 or gap * gap <= bound():
+                walk(far[0], far[1], depth + 1, far[2])
+
+        walk(0, len(order), 0, 1)
+
+    def nearest(self, center: Sequence[float], count: int, epoch: float) -> List[Tuple[int, float]]:
+        """Return (star, distance_au) of the count stars nearest to center, nearest first."""
+        if count <= 0:
+            return []
+        heap: List[Tuple[float, int]] = []
+
+        def bound() -> float:
+            return -heap[0][0] if len(heap) >= count else math.inf
+
+        def visit(star: int, distance2: float) -> None:
+            if len(heap) < count:
+                heapq.heappush(heap, (-distance2, star))
+            elif distance2 < -heap[0][0]:
+                heapq.heapreplace(heap, (-distance2, star))
+
+        self._search(center, epoch, bound, visit)
+        return [(star, math.sqrt(-d2)) for d2, star in sorted(heap, reverse=True)]
+
+    def within(self, center: Sequence[float], radius: float, epoch: float) -> List[Tuple[int, float]]:
+        """Return (star, distance_au) of all stars within radius (AU) of center, nearest first."""
+        radius2 = radius * radius
+        found: List[Tuple[float, int]] = []
+
+        def visit(star: int, distance2: float) -> None:
+            if distance2 <= radius2:
+                found.append((distance2, star))
+
+        self._search(center, epoch, lambda: radius2, visit)
+        return [(star, math.sqrt(d2)) for d2, star in sorted(found)]
+
+
+# -------------- catalog --------------
+class StarCatalog:
+    """Columns of star data with whole-catalog queries.
+
+    Backed by a numpy record array (possibly memory mapped) or, without
+    numpy, a list of row tuples in FIELDS order.
+    """
+
+    def __init__(self, records: Any, source: str = "builtin") -> None:
+        """Initialize from records in FIELDS order."""
+        self._records = records
+        self.source = source
+        self._motion: Optional[Tuple[Any, Any]] = None
+        self._index: Optional[StarIndex] = None
+        self._index_lock = threading.Lock()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple], source: str = "builtin") -> "StarCatalog":
+        """Build a catalog from row tuples in FIELDS order (names as str)."""
+        rows = [row[:-1] + (row[-1].encode("utf-8")[:NAME_BYTES],) for row in rows]
+        if HAS_NUMPY:
+            return cls(np.array(rows, dtype=RECORD_DTYPE), source)
+        return cls(rows, source)
+
+    @classmethod
+    def from_objects(cls, objects: Mapping[str, Mapping[str, Any]], source: str = "builtin") -> "StarCatalog":
+        """Build a catalog from stellar_distances style object dicts, in order."""
+        return cls.from_rows(
+            (
+                (
+                    index, obj["ra_deg"], obj["dec_deg"],
+                    obj["parallax_mas"], obj.get("parallax_error_mas", 0.0),
+                    obj.get("pm_ra_mas_yr", 0.0), obj.get("pm_dec_mas_yr", 0.0),
+                    obj.get("rv_km_s", 0.0), obj.get("rv_error_km_s", 0.0),
+                    obj.get("name", obj_id),
+                )
+                for index, (obj_id, obj) in enumerate(objects.items())
+            ),
+            source,
+        )
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def name(self, index: int) -> str:
+        """Return the name of the star at index."""
+        name = self._records[index][-1] if not HAS_NUMPY else self._records["name"][index]
+        return bytes(name).rstrip(b"\0").decode("utf-8", errors="replace")
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Return the catalog values of the star at index."""
+        values = dict(zip(FIELDS, self._records[index].tolist() if HAS_NUMPY else self._records[index]))
+        values["name"] = self.name(index)
+        return values
+
+    def _column(self, field: str) -> Any:
+        return self._records[field]
+
+    # -------------- distances --------------
+    def distances(self, years: float) -> Dict[str, Any]:
+        """Distance, radial drift and uncertainty of every star (see distance_row).
+
+        Returns arrays (lists without numpy) keyed distance_au,
+        radial_change_au, uncertainty_percent, distance_min_au and
+        distance_max_au, in catalog order.
+        """
+        keys = ("distance_au", "radial_change_au", "uncertainty_percent", "distance_min_au", "distance_max_au")
+        if not HAS_NUMPY:
+            rows = [distance_row(r[3], r[4], r[7], r[8], years) for r in self._records]
+            return {key: [row[i] for row in rows] for i, key in enumerate(keys)}
+        plx = self._column("parallax")
+        err = self._column("parallax_error")
+        rv_error = self._column("rv_error")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            base = np.where(plx > 0, 1000.0 / plx * PARSEC_IN_AU, np.inf)
+            bounded = (plx > 0) & (err > 0)
+            uncertainty = np.where(bounded, err / plx * 100.0, 0.0)
+            distance_min = np.where(bounded, 1000.0 / (plx + err) * PARSEC_IN_AU, base)
+            distance_max = np.where(bounded, 1000.0 / np.maximum(plx - err, MIN_PARALLAX) * PARSEC_IN_AU, base)
+        radial = self._column("rv") * (AU_PER_YEAR_PER_KM_S * years)
+        if abs(years) > 1:
+            spread = np.where(rv_error > 0, rv_error * (AU_PER_YEAR_PER_KM_S * abs(years)), 0.0)
+        else:
+            spread = 0.0
+        return dict(zip(keys, (base + radial, radial, uncertainty, distance_min + radial - spread, distance_max + radial + spread)))
+
+    # -------------- spatial queries --------------
+    def index(self, years: float) -> StarIndex:
+        """Return the k-d tree, rebuilt if stars drifted more than INDEX_TOLERANCE_LY."""
+        index = self._index
+        if index is None or index.drift(years) > INDEX_TOLERANCE_LY * LIGHT_YEAR_IN_AU:
+            with self._index_lock:
+                index = self._index
+                if index is None or index.drift(years) > INDEX_TOLERANCE_LY * LIGHT_YEAR_IN_AU:
+                    position, velocity = self._space_motion()
+                    if HAS_NUMPY:
+                        stars = np.flatnonzero(np.isfinite(position).all(axis=1))
+                    else:
+                        stars = [i for i, p in enumerate(position) if all(math.isfinite(c) for c in p)]
+                    index = self._index = StarIndex(stars, position, velocity, years)
+        return index
+
+    def position(self, index: int, years: float) -> Tuple[float, float, float]:
+        """Return the heliocentric position (AU) of the star at index."""
+        position, velocity = self._space_motion()
+        return tuple(float(p + v * years) for p, v in zip(position[index], velocity[index]))
+
+    def nearest(self, years: float, count: int, center: Sequence[float] = SUN) -> List[Tuple[int, float]]:
+        """Return (index, distance_au) of the count stars nearest to center, nearest first."""
+        return self.index(years).nearest(center, min(count, len(self)), years)
+
+    def within(self, years: float, radius_au: float, center: Sequence[float] = SUN) -> List[Tuple[int, float]]:
+        """Return (index, distance_au) of the stars within radius_au of center, nearest first."""
+        return self.index(years).within(center, radius_au, years)
+
+    # -------------- space motion --------------
+    def _space_motion(self) -> Tuple[Any, Any]:
+        """Positions (AU) and velocities (AU/yr) at J2000, shape (n, 3)."""
+        if self._motion is not None:
+            return self._motion
+        if not HAS_NUMPY:
+            motion = [space_motion(r[1], r[2], r[3], r[5], r[6], r[7]) for r in self._records]
+            self._motion = ([m[0] for m in motion], [m[1] for m in motion])
+            return self._motion
+        ra = np.radians(self._column("ra"))
+        dec = np.radians(self._column("dec"))
+        sa, ca, sd, cd = np.sin(ra), np.cos(ra), np.sin(dec), np.cos(dec)
+        with np.errstate(divide="ignore"):
+            distance = np.where(self._column("parallax") > 0, 1000.0 / self._column("parallax") * PARSEC_IN_AU, np.inf)
+        v_ra = self._column("pm_ra") * MAS_TO_RAD * distance
+        v_dec = self._column("pm_dec") * MAS_TO_RAD * distance
+        v_r = self._column("rv") * AU_PER_YEAR_PER_KM_S
+        position = distance[:, None] * np.column_stack((cd * ca, cd * sa, sd))
+        velocity = np.column_stack((
+            v_r * cd * ca - v_ra * sa - v_dec * sd * ca,
+            v_r * cd * sa + v_ra * ca - v_dec * sd * sa,
+            v_r * sd + v_dec * cd,
+        ))
+        self._motion = (position, velocity)
+        return self._motion
+
+    def closest_approaches(
+        self, years: float, count: int, horizon: float = DEFAULT_HORIZON_YEARS
+    ) -> List[Dict[str, float]]:
+        """Return the count closest approaches between years and years + horizon.
+
+        Only stars whose distance reaches its minimum after years count.
+        Each entry holds index, years_from_now, distance_au and speed_km_s
+        (heliocentric space velocity), closest first.
+        """
+        if count <= 0 or not len(self):
+            return []
+        end = years + horizon
+        if not HAS_NUMPY:
+            found = []
+            for index, (position, velocity) in enumerate(zip(*self._space_motion())):
+                speed2 = sum(v * v for v in velocity)
+                if not math.isfinite(position[0]) or speed2 == 0:
+                    continue
+                epoch, distance = closest_approach(position, velocity, years, end)
+                if epoch > years:
+                    found.append((distance, index, epoch, math.sqrt(speed2)))
+            best = heapq.nsmallest(count, found)
+        else:
+            position, velocity = self._space_motion()
+            speed2 = np.einsum("ij,ij->i", velocity, velocity)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                epoch = -np.einsum("ij,ij->i", position, velocity) / speed2
+            valid = np.isfinite(epoch) & (epoch > years)
+            index = np.flatnonzero(valid)
+            epoch = np.minimum(epoch[index], end)
+            distance = np.linalg.norm(position[index] + velocity[index] * epoch[:, None], axis=1)
+            order = np.argsort(distance)[:count]
+            best = [(float(distance[o]), int(index[o]), float(epoch[o]), float(math.sqrt(speed2[index[o]]))) for o in order]
+        return [
+            {
+                "index": index,
+                "years_from_now": epoch - years,
+                "distance_au": distance,
+                "speed_km_s": speed / AU_PER_YEAR_PER_KM_S,
+            }
+            for distance, index, epoch, speed in best
+        ]
+
+
+# -------------- CSV import --------------
+def _csv_value(row: Mapping[str, str], field: str) -> Optional[str]:
+    for column in CSV_COLUMNS[field]:
+        value = row.get(column)
+        if value not in (None, ""):
+            return value.strip()
+    return None
+
+
+def parse_catalog_csv(lines: Iterable[str]) -> List[Tuple]:
+    """Parse a CSV export into row tuples (FIELDS order), nearest first.
+
+    The header names columns (case-insensitive, see CSV_COLUMNS); RA, Dec
+    and a positive parallax are required, missing motions count as zero.
+    At most MAX_STARS rows are kept.
+    """
+    reader = csv.DictReader(lines)
+    if reader.fieldnames is None:
+        return []
+    reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+    rows = []
+    for line, row in enumerate(reader):
+        try:
+            ra, dec, parallax = (float(_csv_value(row, field)) for field in ("ra", "dec", "parallax"))
+        except (TypeError, ValueError):
+            continue
+        if parallax <= 0:
+            continue
+        values = []
+        for field in ("parallax_error", "pm_ra", "pm_dec", "rv", "rv_error"):
+            try:
+                values.append(float(_csv_value(row, field) or 0.0))
+            except ValueError:
+                values.append(0.0)
+        source_id = _csv_value(row, "source_id")
+        try:
+            source_id = int(source_id)
+        except (TypeError, ValueError):
+            source_id = line
+        name = _csv_value(row, "name") or str(source_id)
+        rows.append((source_id, ra, dec, parallax, *values, name))
+    rows.sort(key=lambda r: -r[3])
+    return rows[:MAX_STARS]
+
+
+# -------------- store --------------
+class StarCatalogStore:
+    """Memory-mapped star table imported from a CSV export."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store (call async_load before use)."""
+        self._hass = hass
+        self._path = hass.config.path(TABLE_FILE)
+        self._lock = threading.Lock()
+        self._loaded = False
+        self.catalog: Optional[StarCatalog] = None
+
+    def _open(self) -> None:
+        """(Re)map the table file; a missing or corrupt file means no catalog."""
+        self.catalog = None
+        try:
+            size = os.path.getsize(self._path)
+            with open(self._path, "rb") as f:
+                magic, count = HEADER.unpack(f.read(HEADER.size)) if size >= HEADER.size else (b"", 0)
+                if magic != MAGIC or count <= 0 or size < HEADER.size + count * ROW.size:
+                    _LOGGER.warning("Ignoring invalid star table %s", self._path)
+                    return
+                if HAS_NUMPY:
+                    records = np.memmap(f, dtype=RECORD_DTYPE, mode="r", offset=HEADER.size, shape=(count,))
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        records = list(ROW.iter_unpack(mm[HEADER.size:HEADER.size + count * ROW.size]))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            _LOGGER.warning("Could not map star table %s: %s", self._path, e)
+            return
+        self.catalog = StarCatalog(records, source=CATALOG_CSV)
+
+    def _write(self, rows: List[Tuple]) -> None:
+        data = bytearray(HEADER.pack(MAGIC, len(rows)))
+        for row in rows:
+            data += ROW.pack(*row[:-1], row[-1].encode("utf-8")[:NAME_BYTES])
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self._path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self._path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        self._open()
+
+    def ingest(self, lines: Iterable[str]) -> int:
+        """Replace the table with the stars of a CSV export (blocking).
+
+        Returns the number of stars stored.
+        """
+        rows = parse_catalog_csv(lines)
+        if not rows:
+            return 0
+        with self._lock:
+            self._write(rows)
+        return len(rows)
+
+    def _load(self) -> None:
+        with self._lock:
+            self._open()
+        path = self._hass.config.path(CATALOG_CSV)
+        try:
+            if os.path.getmtime(path) <= (os.path.getmtime(self._path) if self.catalog else 0.0):
+                return
+            with open(path, encoding="utf-8", errors="replace", newline="") as f:
+                count = self.ingest(f)
+            _LOGGER.info("Imported %d stars from %s", count, CATALOG_CSV)
+        except FileNotFoundError:
+            return
+        except (OSError, csv.Error) as e:
+            _LOGGER.warning("Could not import star catalog %s: %s", path, e)
+
+    async def async_load(self) -> None:
+        """Map the stored table and import a newer CSV from the config dir."""
+        if self._loaded:
+            return
+        self._loaded = True
+        await self._hass.async_add_executor_job(self._load)
+
+    def close(self) -> None:
+        """Drop the mapped catalog."""
+        with self._lock:
+            self.catalog = None
+
+
+def get_star_catalog(hass: HomeAssistant) -> StarCatalogStore:
+    """Return the shared StarCatalogStore, creating it on first use."""
+    store = hass.data.get(DATA_STAR_CATALOG)
+    if store is None:
+        store = hass.data.setdefault(DATA_STAR_CATALOG, StarCatalogStore(hass))
+    return store
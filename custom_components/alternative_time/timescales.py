@@ -0,0 +1,275 @@
+"""Time-scale conversions driven by a leap-second table.
+
+Instants are seconds since 1970-01-01 on the respective scale (the UTC
+value is a Unix timestamp), so scales differ by plain offsets:
+
+    TAI = UTC + (TAI-UTC)          from the leap-second table
+    TT  = TAI + 32.184 s
+    GPS = TAI - 19 s
+    UT1 = UTC + DUT1               from the Earth orientation store
+    TDB = TT + periodic terms      (Fairhead & Bretagnon, ~10 µs)
+    TCG = TT + L_G (TT - T0)       (IAU 2000 B1.9)
+    TCB = TDB + L_B (TDB - T0) - TDB0  (IAU 2006 B3)
+
+TAI-UTC is looked up by bisection in a LeapSecondTable, so every
+conversion is O(log n); the batch variants take sequences (numpy arrays
+when numpy is available). The built-in table can be replaced by an
+IERS/IETF leap-seconds.list file in the config directory. Before 1972
+UTC used rubber seconds; the table returns the 1972 offset of 10 s.
+"""
+from __future__ import annotations
+
+import bisect
+import calendar
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .log_helper import get_logger
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - numpy ships with Home Assistant
+    np = None
+    HAS_NUMPY = False
+
+_LOGGER = get_logger(__name__)
+
+DATA_LEAP_SECONDS = f"{DOMAIN}_leap_seconds"
+
+LEAP_SECONDS_FILE = "leap-seconds.list"
+
+# Seconds between the NTP epoch (1900) and the Unix epoch (1970)
+NTP_UNIX_OFFSET = 2208988800
+
+UNIX_EPOCH_JD = 2440587.5
+SECONDS_PER_DAY = 86400.0
+
+TT_MINUS_TAI = 32.184
+TAI_MINUS_GPS = 19.0
+
+# IAU defining constants for the coordinate time scales
+L_G = 6.969290134e-10
+L_B = 1.550519768e-8
+TDB0 = -6.55e-5
+T0_JD = 2443144.5003725  # 1977-01-01 00:00:32.184 TAI
+
+# (year, month, TAI-UTC from the first day of that month)
+BUILTIN_LEAP_SECONDS = (
+    (1972, 1, 10), (1972, 7, 11), (1973, 1, 12), (1974, 1, 13),
+    (1975, 1, 14), (1976, 1, 15), (1977, 1, 16), (1978, 1, 17),
+    (1979, 1, 18), (1980, 1, 19), (1981, 7, 20), (1982, 7, 21),
+    (1983, 7, 22), (1985, 7, 23), (1988, 1, 24), (1990, 1, 25),
+    (1991, 1, 26), (1992, 7, 27), (1993, 7, 28), (1994, 7, 29),
+    (1996, 1, 30), (1997, 7, 31), (1999, 1, 32), (2006, 1, 33),
+    (2009, 1, 34), (2012, 7, 35), (2015, 7, 36), (2017, 1, 37),
+)
+
+SCALES = ("utc", "tai", "tt", "gps", "ut1", "tdb", "tcg", "tcb")
+
+
+class LeapSecondTable:
+    """TAI-UTC steps, searchable by UTC or TAI instant."""
+
+    def __init__(
+        self,
+        entries: Iterable[Tuple[float, float]],
+        expires: Optional[float] = None,
+        source: str = "builtin",
+    ) -> None:
+        """Initialize from (UTC timestamp, TAI-UTC) steps."""
+        steps = sorted(entries)
+        if not steps:
+            raise ValueError("empty leap second table")
+        self._utc: List[float] = [t for t, _ in steps]
+        self._offsets: List[float] = [o for _, o in steps]
+        # The same steps on the TAI scale, for the inverse lookup
+        self._tai: List[float] = [t + o for t, o in zip(self._utc, self._offsets)]
+        self.expires = expires
+        self.source = source
+
+    def __len__(self) -> int:
+        return len(self._utc)
+
+    def _index(self, utc: float) -> int:
+        return max(0, bisect.bisect_right(self._utc, utc) - 1)
+
+    def tai_minus_utc(self, utc: float) -> float:
+        """Return TAI-UTC in seconds at a UTC timestamp."""
+        return self._offsets[self._index(utc)]
+
+    def tai_minus_utc_many(self, utc: Sequence[float]) -> Any:
+        """Return TAI-UTC for a sequence of UTC timestamps."""
+        if HAS_NUMPY:
+            index = np.searchsorted(np.asarray(self._utc), np.asarray(utc, dtype=float), side="right") - 1
+            return np.asarray(self._offsets)[np.maximum(index, 0)]
+        return [self.tai_minus_utc(t) for t in utc]
+
+    def utc_from_tai(self, tai: float) -> float:
+        """Return the UTC timestamp of a TAI instant.
+
+        The inserted second 23:59:60 has no Unix timestamp and maps to the
+        following midnight.
+        """
+        index = max(0, bisect.bisect_right(self._tai, tai) - 1)
+        return max(tai - self._offsets[index], self._utc[index])
+
+    def next_leap_second(self, utc: float) -> Optional[Dict[str, float]]:
+        """Return the next announced step after utc, or None."""
+        index = bisect.bisect_right(self._utc, utc)
+        if index >= len(self._utc):
+            return None
+        return {
+            "utc": self._utc[index],
+            "tai_minus_utc": self._offsets[index],
+            "change": self._offsets[index] - self._offsets[index - 1] if index else self._offsets[index],
+        }
+
+    def last_leap_second(self, utc: float) -> Optional[Dict[str, float]]:
+        """Return the latest step at or before utc, or None before the table."""
+        index = bisect.bisect_right(self._utc, utc) - 1
+        if index < 0:
+            return None
+        return {"utc": self._utc[index], "tai_minus_utc": self._offsets[index]}
+
+    def expired(self, utc: float) -> bool:
+        """Return True if the table's validity ended before utc."""
+        return self.expires is not None and utc > self.expires
+
+
+def builtin_table() -> LeapSecondTable:
+    """Return the table compiled into the integration."""
+    return LeapSecondTable(
+        ((calendar.timegm((year, month, 1, 0, 0, 0)), offset) for year, month, offset in BUILTIN_LEAP_SECONDS),
+        source="builtin",
+    )
+
+
+BUILTIN = builtin_table()
+
+
+def parse_leap_seconds_list(lines: Iterable[str], source: str = LEAP_SECONDS_FILE) -> LeapSecondTable:
+    """Parse an IERS/IETF leap-seconds.list file.
+
+    Data lines are "<NTP seconds> <TAI-UTC> # date"; "#@ <NTP seconds>"
+    gives the expiry date.
+    """
+    entries = []
+    expires = None
+    for line in lines:
+        if line.startswith("#@"):
+            parts = line[2:].split()
+            if parts and parts[0].isdigit():
+                expires = int(parts[0]) - NTP_UNIX_OFFSET
+            continue
+        data = line.split("#", 1)[0].split()
+        if len(data) >= 2 and data[0].isdigit():
+            entries.append((int(data[0]) - NTP_UNIX_OFFSET, int(data[1])))
+    return LeapSecondTable(entries, expires=expires, source=source)
+
+
+# -------------- conversions --------------
+def tdb_minus_tt(tt: float) -> float:
+    """TDB - TT in seconds (two leading periodic terms)."""
+    g = math.radians(357.53 + 0.98560028 * (UNIX_EPOCH_JD + tt / SECONDS_PER_DAY - 2451545.0))
+    return 0.001657 * math.sin(g) + 0.000014 * math.sin(2.0 * g)
+
+
+def _seconds_since_t0(scale_seconds: float) -> float:
+    return (UNIX_EPOCH_JD + scale_seconds / SECONDS_PER_DAY - T0_JD) * SECONDS_PER_DAY
+
+
+def convert(utc: float, table: Optional[LeapSecondTable] = None, dut1: float = 0.0) -> Dict[str, float]:
+    """Return a UTC timestamp on every scale in SCALES (seconds since 1970)."""
+    table = table or BUILTIN
+    tai = utc + table.tai_minus_utc(utc)
+    tt = tai + TT_MINUS_TAI
+    tdb = tt + tdb_minus_tt(tt)
+    return {
+        "utc": utc,
+        "tai": tai,
+        "tt": tt,
+        "gps": tai - TAI_MINUS_GPS,
+        "ut1": utc + dut1,
+        "tdb": tdb,
+        "tcg": tt + L_G * _seconds_since_t0(tt),
+        "tcb": tdb + L_B * _seconds_since_t0(tdb) - TDB0,
+    }
+
+
+def convert_many(utc: Sequence[float], scale: str, table: Optional[LeapSecondTable] = None, dut1: float = 0.0) -> Any:
+    """Convert a sequence of UTC timestamps to one scale.
+
+    Returns a numpy array when numpy is available, else a list.
+    """
+    if scale not in SCALES:
+        raise ValueError(f"unknown time scale {scale!r}")
+    table = table or BUILTIN
+    if not HAS_NUMPY:
+        return [convert(t, table, dut1)[scale] for t in utc]
+    utc = np.asarray(utc, dtype=float)
+    if scale == "utc":
+        return utc
+    if scale == "ut1":
+        return utc + dut1
+    tai = utc + table.tai_minus_utc_many(utc)
+    if scale == "tai":
+        return tai
+    if scale == "gps":
+        return tai - TAI_MINUS_GPS
+    tt = tai + TT_MINUS_TAI
+    if scale == "tt":
+        return tt
+    if scale == "tcg":
+        return tt + L_G * (UNIX_EPOCH_JD + tt / SECONDS_PER_DAY - T0_JD) * SECONDS_PER_DAY
+    g = np.radians(357.53 + 0.98560028 * (UNIX_EPOCH_JD + tt / SECONDS_PER_DAY - 2451545.0))
+    tdb = tt + 0.001657 * np.sin(g) + 0.000014 * np.sin(2.0 * g)
+    if scale == "tdb":
+        return tdb
+    return tdb + L_B * (UNIX_EPOCH_JD + tdb / SECONDS_PER_DAY - T0_JD) * SECONDS_PER_DAY - TDB0
+
+
+def tai_to_utc(tai: float, table: Optional[LeapSecondTable] = None) -> float:
+    """Return the UTC timestamp of a TAI instant."""
+    return (table or BUILTIN).utc_from_tai(tai)
+
+
+def to_jd(seconds: float) -> float:
+    """Return the Julian Date of an instant given in seconds since 1970."""
+    return UNIX_EPOCH_JD + seconds / SECONDS_PER_DAY
+
+
+# -------------- shared table --------------
+def _load_table(path: str) -> LeapSecondTable:
+    try:
+        with open(path, encoding="ascii", errors="replace") as f:
+            table = parse_leap_seconds_list(f)
+    except FileNotFoundError:
+        return BUILTIN
+    except (OSError, ValueError) as e:
+        _LOGGER.warning("Could not read %s, using built-in leap seconds: %s", path, e)
+        return BUILTIN
+    if table.last_leap_second(float("inf"))["utc"] < BUILTIN.last_leap_second(float("inf"))["utc"]:
+        _LOGGER.warning("%s is older than the built-in leap second table, ignoring it", path)
+        return BUILTIN
+    _LOGGER.debug("Loaded %d leap seconds from %s", len(table), path)
+    return table
+
+
+async def async_load_leap_seconds(hass: HomeAssistant) -> LeapSecondTable:
+    """Load leap-seconds.list from the config directory (once)."""
+    table = hass.data.get(DATA_LEAP_SECONDS)
+    if table is None:
+        table = await hass.async_add_executor_job(_load_table, hass.config.path(LEAP_SECONDS_FILE))
+        table = hass.data.setdefault(DATA_LEAP_SECONDS, table)
+    return table
+
+
+def get_leap_seconds(hass: Optional[HomeAssistant]) -> LeapSecondTable:
+    """Return the loaded leap second table, or the built-in one."""
+    if hass is None:
+        return BUILTIN
+    return hass.data.get(DATA_LEAP_SECONDS, BUILTIN)